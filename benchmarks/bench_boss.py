@@ -0,0 +1,93 @@
+"""Boss hit-zone benchmark: tree descent vs. testing every part.
+
+Fires shots at points spread over the whole-boss circle (the collision
+sweep only hands over shots that reach it) and compares the hit-zone tree
+with a loop that tests every live part, by circle tests and time per shot.
+Runs against an intact boss and one with half its parts destroyed.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_boss [--shots 20000]
+"""
+
+import argparse
+import math
+import random
+import time
+
+from bork.boss import BOSS_RADIUS, HIT_TREE, Boss
+from bork.collision import circle_circle
+
+SHOT_RADIUS = 0.0  # projectiles query with their position, as in the simulation
+
+
+def shots(count: int, boss: Boss) -> list[tuple[float, float]]:
+    """Points spread evenly over the whole-boss circle."""
+    rng = random.Random(count)
+    points = []
+    for _ in range(count):
+        r = BOSS_RADIUS * math.sqrt(rng.random())
+        a = rng.uniform(0, 2 * math.pi)
+        points.append((boss.x + r * math.cos(a), boss.y + r * math.sin(a)))
+    return points
+
+
+def every_part(boss: Boss, x: float, y: float) -> tuple[int | None, int]:
+    """The nearest overlapping live part by testing each one, and the tests."""
+    best, best_distance, tests = None, math.inf, 0
+    for part in boss.live_parts():
+        tests += 1
+        px, py = boss.part_position(part)
+        radius = boss.tree.parts[part]["radius"]
+        if circle_circle(px, py, radius, x, y, SHOT_RADIUS):
+            distance = math.hypot(px - x, py - y)
+            if distance < best_distance:
+                best, best_distance = part, distance
+    return best, tests
+
+
+def run(label: str, boss: Boss, points: list[tuple[float, float]]) -> None:
+    """Time both lookups over the same shots and check they agree."""
+    tests = boss.tests
+    start = time.perf_counter()
+    tree_hits = [boss.hit_part(x, y, SHOT_RADIUS) for x, y in points]
+    tree_time = (time.perf_counter() - start) / len(points)
+    tree_tests = (boss.tests - tests) / len(points)
+
+    loop_tests = 0
+    start = time.perf_counter()
+    loop_hits = []
+    for x, y in points:
+        hit, tests = every_part(boss, x, y)
+        loop_hits.append(hit)
+        loop_tests += tests
+    loop_time = (time.perf_counter() - start) / len(points)
+    if tree_hits != loop_hits:
+        raise SystemExit(f"{label}: tree and loop disagree")
+    print(
+        f"{label:<10}{len(boss.live_parts()):>6}{tree_tests:>8.1f}"
+        f"{loop_tests / len(points):>8.1f}{tree_time * 1e6:>9.2f}"
+        f"{loop_time * 1e6:>9.2f}"
+    )
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--shots", type=int, default=20000)
+    args = parser.parse_args()
+
+    boss = Boss(600, 300)
+    boss.update(0.37)  # mid-sway, so parts are off their rest pose
+    points = shots(args.shots, boss)
+    print(f"{'boss':<10}{'parts':>6}{'tree':>8}{'loop':>8}{'tree us':>9}{'loop us':>9}")
+    run("intact", boss, points)
+    for part in boss.live_parts()[::2]:
+        if part != HIT_TREE.core:
+            boss.destroy_part(part)
+    run("damaged", boss, points)
+    print("(tree/loop: circle tests per shot)")
+
+
+if __name__ == "__main__":
+    main()
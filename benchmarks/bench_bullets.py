@@ -0,0 +1,91 @@
+"""Enemy bullet benchmark: per-frame move/cull/hit-test cost by bullet count.
+
+Times one frame of BulletStore work (advance, cull off-screen, AABB then
+circle test against the player) and compares the hit test with a
+per-bullet Python loop using circle_circle. The target is 5,000 bullets
+in under 1 ms; the script exits non-zero when it is missed.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_bullets [--frames 500]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from bork.bullets import BulletStore
+from bork.collision import circle_circle
+from bork.constants import (
+    ENEMY_BULLET_RADIUS,
+    PLAYER_BULLET_HITBOX,
+    SCREEN_HEIGHT,
+    SCREEN_WIDTH,
+)
+
+COUNTS = (100, 1000, 5000, 20000)
+BUDGET = 0.001  # seconds per frame at 5,000 bullets
+DT = 1 / 60
+
+
+def make_store(count: int) -> BulletStore:
+    """A store of slow bullets spread over the screen (none leave it)."""
+    rng = np.random.default_rng(count)
+    store = BulletStore()
+    store.spawn_many(
+        rng.uniform(100, SCREEN_WIDTH - 100, count),
+        rng.uniform(100, SCREEN_HEIGHT - 100, count),
+        rng.uniform(-5, 5, count),
+        rng.uniform(-5, 5, count),
+    )
+    return store
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=500)
+    args = parser.parse_args()
+
+    px, py = 100.0, SCREEN_HEIGHT / 2
+    print(f"{'bullets':>8}{'frame us':>10}{'hit us':>9}{'loop us':>10}")
+    over = False
+    for count in COUNTS:
+        store = make_store(count)
+        start = time.perf_counter()
+        for _ in range(args.frames):
+            store.update(DT)
+            store.hits_circle(px, py, PLAYER_BULLET_HITBOX)
+        frame = (time.perf_counter() - start) / args.frames
+
+        start = time.perf_counter()
+        for _ in range(args.frames):
+            store.hits_circle(px, py, PLAYER_BULLET_HITBOX)
+        hit = (time.perf_counter() - start) / args.frames
+
+        xs = store.x[: store.count].tolist()
+        ys = store.y[: store.count].tolist()
+        loops = max(1, args.frames // 20)
+        start = time.perf_counter()
+        for _ in range(loops):
+            [
+                i
+                for i, (x, y) in enumerate(zip(xs, ys))
+                if circle_circle(
+                    x, y, ENEMY_BULLET_RADIUS, px, py, PLAYER_BULLET_HITBOX
+                )
+            ]
+        loop = (time.perf_counter() - start) / loops
+
+        print(f"{count:>8}{frame * 1e6:>10.1f}{hit * 1e6:>9.1f}{loop * 1e6:>10.1f}")
+        if count == 5000:
+            over = frame >= BUDGET
+            verdict = "OVER BUDGET" if over else "OK"
+            print(f"         5,000 bullets: {frame * 1e3:.3f} ms/frame ({verdict})")
+    if over:
+        raise SystemExit(f"5,000 bullets over the {BUDGET * 1e3:.0f} ms budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""Collision benchmark: layered sort-and-sweep world vs. per-pair nested scans.
+
+Each frame moves projectiles right and enemies left (as in play), then
+finds shot/enemy and player/enemy contacts. The naive side is the old
+O(N*M) loops; the world side syncs all groups, re-sorts the nearly sorted
+bodies and sweeps once.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_collision [--frames 60]
+"""
+
+import argparse
+import random
+import time
+
+from bork.collision import CollisionWorld, circle_circle, point_in_circle
+from bork.constants import (
+    ENEMY_SIZE,
+    ENEMY_SPEED,
+    LAYER_ENEMY,
+    LAYER_PLAYER,
+    LAYER_PLAYER_SHOT,
+    PLAYER_SHIP_SIZE,
+    PROJECTILE_SPEED,
+    SCREEN_HEIGHT,
+    SCREEN_WIDTH,
+)
+from bork.enemy import Enemy
+from bork.player import Player
+from bork.projectile import Projectile
+
+CASES = ((20, 30), (100, 200), (300, 600), (1000, 2000))
+DT = 1 / 60
+
+
+def naive_frame(player: Player, shots: list, enemies: list) -> int:
+    """Nested scans, one per entity pair type."""
+    contacts = 0
+    for proj in shots:
+        for enemy in enemies:
+            if point_in_circle(proj.x, proj.y, enemy.x, enemy.y, ENEMY_SIZE):
+                contacts += 1
+    for enemy in enemies:
+        if circle_circle(
+            enemy.x, enemy.y, ENEMY_SIZE, player.x, player.y, PLAYER_SHIP_SIZE
+        ):
+            contacts += 1
+    return contacts
+
+
+def world_frame(world: CollisionWorld, player: Player, shots, enemies) -> int:
+    """One sync, incremental sort and sweep for every layer pair."""
+    world.update(
+        (
+            ((player,), LAYER_PLAYER, LAYER_ENEMY, PLAYER_SHIP_SIZE),
+            (shots, LAYER_PLAYER_SHOT, LAYER_ENEMY, 0.0),
+            (enemies, LAYER_ENEMY, LAYER_PLAYER | LAYER_PLAYER_SHOT, ENEMY_SIZE),
+        )
+    )
+    return len(world.contacts(LAYER_PLAYER_SHOT, LAYER_ENEMY)) + len(
+        world.contacts(LAYER_PLAYER, LAYER_ENEMY)
+    )
+
+
+def _move(shots: list, enemies: list) -> None:
+    """Scroll shots right and enemies left, wrapping at the screen edges."""
+    for p in shots:
+        p.x = (p.x + PROJECTILE_SPEED * DT) % SCREEN_WIDTH
+    for e in enemies:
+        e.x = (e.x - ENEMY_SPEED * DT) % SCREEN_WIDTH
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=60)
+    args = parser.parse_args()
+
+    print(
+        f"{'shots':>7}{'enemies':>9}{'naive ms':>11}{'world ms':>10}"
+        f"{'speedup':>9}{'tests/f':>10}{'swaps/f':>9}"
+    )
+    for n_shots, n_enemies in CASES:
+        timings = []
+        for use_world in (False, True):
+            rng = random.Random(1)
+            player = Player(SCREEN_WIDTH * 0.1, SCREEN_HEIGHT / 2)
+            shots = [
+                Projectile(rng.uniform(0, SCREEN_WIDTH), rng.uniform(0, SCREEN_HEIGHT))
+                for _ in range(n_shots)
+            ]
+            enemies = [
+                Enemy(rng.uniform(0, SCREEN_WIDTH), y, "straight", y)
+                for y in (rng.uniform(0, SCREEN_HEIGHT) for _ in range(n_enemies))
+            ]
+            world = CollisionWorld()
+            world_frame(world, player, shots, enemies)  # initial sort
+            world.swaps = world.pairs_tested = 0
+            elapsed = 0.0
+            for _ in range(args.frames):
+                _move(shots, enemies)
+                start = time.perf_counter()
+                if use_world:
+                    world_frame(world, player, shots, enemies)
+                else:
+                    naive_frame(player, shots, enemies)
+                elapsed += time.perf_counter() - start
+            timings.append(elapsed / args.frames)
+        naive, swept = timings
+        print(
+            f"{n_shots:>7}{n_enemies:>9}{naive * 1000:>11.2f}{swept * 1000:>10.2f}"
+            f"{naive / swept:>8.1f}x{world.pairs_tested // args.frames:>10}"
+            f"{world.swaps // args.frames:>9}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Entity removal benchmark: swap-remove store vs. rebuilding lists.
+
+Each frame kills a few random entities out of N, the way collision does.
+The list side rebuilds the whole list with an index-set comprehension (the
+old approach); the store side destroys each handle in O(1).
+
+Run from the repository root:
+
+    python -m benchmarks.bench_ecs [--frames 200]
+"""
+
+import argparse
+import random
+import time
+
+from bork.ecs import Registry
+from bork.enemy import Enemy
+
+CASES = (100, 1000, 10_000)
+KILLS_PER_FRAME = 5
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'entities':>9}{'list us':>10}{'store us':>10}{'speedup':>9}")
+    for n in CASES:
+        rng = random.Random(1)
+        enemies = [Enemy(i, 0, "straight", 0) for i in range(n)]
+        start = time.perf_counter()
+        for _ in range(args.frames):
+            dead = set(rng.sample(range(len(enemies)), KILLS_PER_FRAME))
+            enemies = [e for i, e in enumerate(enemies) if i not in dead]
+            enemies.extend(Enemy(0, 0, "straight", 0) for _ in dead)
+        rebuild = (time.perf_counter() - start) / args.frames
+
+        rng = random.Random(1)
+        registry = Registry()
+        store = registry.store(Enemy)
+        for i in range(n):
+            registry.spawn(Enemy(i, 0, "straight", 0))
+        start = time.perf_counter()
+        for _ in range(args.frames):
+            dead = rng.sample(range(len(store)), KILLS_PER_FRAME)
+            for handle in [store.owners[i] for i in dead]:
+                registry.destroy(handle)
+            for _ in dead:
+                registry.spawn(Enemy(0, 0, "straight", 0))
+        swap = (time.perf_counter() - start) / args.frames
+
+        print(f"{n:>9}{rebuild * 1e6:>10.1f}{swap * 1e6:>10.1f}{rebuild / swap:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
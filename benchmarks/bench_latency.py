@@ -0,0 +1,121 @@
+"""Input latency benchmark: press-to-screen time under each pacing setup.
+
+Runs the simulation through the real FramePacer and LatencyTracker on a
+model display, with no window. Each frame spends RENDER_COST seconds
+"drawing". With vsync the swap blocks until the next vblank, half an
+interval out of phase with arcade's clock. Key presses arrive at random
+times and are stamped with when they arrived. The scheduled rows sleep
+to the next clock tick, as pyglet does; the late rows let the pacer wait.
+
+Reports press-to-tick and press-to-swap percentiles and how far past its
+target the pacer woke.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_latency [--seconds 5]
+"""
+
+import argparse
+import random
+import time
+
+from bork.autopilot import autopilot_actions
+from bork.constants import ACTION_FIRE, TARGET_FPS
+from bork.latency import FramePacer, LatencyTracker, percentile
+from bork.simulation import Simulation
+
+RENDER_COST = 0.004  # seconds of simulated drawing per frame
+PRESS_GAP = 0.05  # mean seconds between key presses
+SETUPS = (
+    ("scheduled", "sleep", False),
+    ("scheduled", "sleep", True),
+    ("late", "sleep", True),
+    ("late", "hybrid", True),
+    ("late", "spin", True),
+    ("late", "hybrid", False),
+)
+
+
+def busy(seconds: float) -> None:
+    """Spin for `seconds` (the model's GPU work)."""
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def run(mode: str, wait: str, vsync: bool, seconds: float) -> None:
+    """Play `seconds` of frames with one setup and print the latencies."""
+    interval = 1.0 / TARGET_FPS
+    pacer = FramePacer(mode, wait, vsync, interval)
+    tracker = LatencyTracker(samples=100_000)
+    sim = Simulation(seed=1)
+    rng = random.Random(1)
+    start = time.perf_counter()
+    vblank_phase = start + interval / 2
+    next_tick = start
+    next_press = start + rng.expovariate(1 / PRESS_GAP)
+    held = False
+
+    def poll() -> None:
+        """Deliver the presses that have arrived, stamped with their time."""
+        nonlocal next_press, held
+        now = time.perf_counter()
+        while next_press <= now:
+            if held:
+                tracker.release(ACTION_FIRE)
+            tracker.press(ACTION_FIRE, next_press)
+            held = True
+            next_press += rng.expovariate(1 / PRESS_GAP)
+
+    frames = 0
+    while time.perf_counter() - start < seconds:
+        if mode == "scheduled":
+            next_tick += interval
+            remaining = next_tick - time.perf_counter()
+            if remaining > 0:
+                time.sleep(remaining)
+            poll()
+        dt = pacer.begin_frame(interval, poll)
+        actions = autopilot_actions(sim) | ({ACTION_FIRE} if held else set())
+        sim.update(dt, actions)
+        tracker.consumed(actions)
+        held = False
+        busy(RENDER_COST)
+        pacer.before_swap()
+        if vsync:
+            now = time.perf_counter()
+            vblanks = int((now - vblank_phase) / interval) + 1
+            busy(vblank_phase + vblanks * interval - now)
+        pacer.after_swap()
+        tracker.presented()
+        frames += 1
+
+    ms = 1000
+    to_tick, to_photon = tracker.to_tick, tracker.to_photon
+    print(
+        f"{mode:<10}{wait:<7}{'on' if vsync else 'off':<6}"
+        f"{frames / seconds:>6.1f}{percentile(to_tick, 0.5) * ms:>8.1f}"
+        f"{percentile(to_photon, 0.5) * ms:>8.1f}"
+        f"{percentile(to_photon, 0.95) * ms:>8.1f}"
+        f"{percentile(to_photon, 0.99) * ms:>8.1f}"
+        f"{percentile(pacer.overshoot, 0.99) * ms:>9.2f}"
+    )
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=5.0)
+    args = parser.parse_args()
+
+    print(
+        f"{'pacing':<10}{'wait':<7}{'vsync':<6}{'fps':>6}{'tick50':>8}"
+        f"{'scr50':>8}{'scr95':>8}{'scr99':>8}{'wake99':>9}"
+    )
+    for mode, wait, vsync in SETUPS:
+        run(mode, wait, vsync, args.seconds)
+    print("(milliseconds; wake99 is how late the pacer woke, p99)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Music synthesis benchmark: pattern render cost and the pattern cache.
+
+Renders the theme's order list with and without the content-hash cache,
+reports the real-time factor (seconds of audio per second of CPU), and
+times `MusicStreamer.read()`, the only call the audio driver makes.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_music [--loops 5]
+"""
+
+import argparse
+import time
+
+from bork.constants import MUSIC_SAMPLE_RATE
+from bork.music import MusicStreamer, PatternCache, render_pattern, row_samples
+from bork.songs import THEME
+
+READ_BYTES = 4096  # a typical driver request
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--loops", type=int, default=5)
+    args = parser.parse_args()
+
+    order = THEME["order"] * args.loops
+    audio = len(order) * 16 * row_samples(THEME) / MUSIC_SAMPLE_RATE
+
+    start = time.perf_counter()
+    for name in order:
+        render_pattern(THEME["patterns"][name], THEME)
+    uncached = time.perf_counter() - start
+
+    cache = PatternCache()
+    start = time.perf_counter()
+    for name in order:
+        cache.render(THEME["patterns"][name], THEME, MUSIC_SAMPLE_RATE)
+    cached = time.perf_counter() - start
+
+    print(f"{len(order)} patterns, {audio:.1f} s of audio")
+    print(f"{'':<10}{'ms total':>10}{'ms/pattern':>12}{'x realtime':>12}")
+    for label, spent in (("uncached", uncached), ("cached", cached)):
+        print(
+            f"{label:<10}{spent * 1000:>10.1f}{spent / len(order) * 1000:>12.3f}"
+            f"{audio / spent:>12.0f}"
+        )
+    print(f"cache: {cache.misses} synthesized, {cache.hits} hits")
+
+    streamer = MusicStreamer(THEME)
+    for _ in order:
+        streamer.fill()
+    reads = 0
+    start = time.perf_counter()
+    while streamer.buffered_seconds > 0:
+        streamer.read(READ_BYTES)
+        reads += 1
+    per_read = (time.perf_counter() - start) / reads
+    print(f"read({READ_BYTES}): {per_read * 1e6:.1f} us")
+
+
+if __name__ == "__main__":
+    main()
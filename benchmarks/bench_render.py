@@ -0,0 +1,157 @@
+"""Headless render benchmark: draw-call/state counts with CPU and GPU timings.
+
+Renders scripted scenes through `BorkGame.on_draw` (world into the offscreen
+framebuffer, then composite and HUD) on a hidden window backed by a software
+GL context, and reports per-subsystem counters from RenderStats.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_render [--frames 120] [--resolution retro]
+"""
+
+import os
+
+# Must be set before arcade/pyglet are imported
+os.environ.setdefault("ARCADE_HEADLESS", "1")
+os.environ.setdefault("LIBGL_ALWAYS_SOFTWARE", "1")
+
+import argparse
+import random
+import time
+import warnings
+
+from bork.compositor import add_resolution_arguments
+from bork.constants import (
+    PLAYER_START_X,
+    PLAYER_START_Y,
+    SCREEN_FLASH_COLOR,
+    SCREEN_HEIGHT,
+    SCREEN_WIDTH,
+    STATE_GAME_OVER,
+)
+from bork.enemy import Enemy
+from bork.explosions import create_enemy_explosion, create_player_explosion
+from bork.game import BorkGame
+from bork.powerup import Powerup
+from bork.screen_effects import ScreenFlash, ScreenShake
+from bork.weapons import fire_volley
+
+
+def scene_idle(game: BorkGame) -> None:
+    """Starfield, player and HUD only."""
+
+
+def scene_wave(game: BorkGame) -> None:
+    """A busy combat frame: enemies, bullets, projectiles and a powerup."""
+    for i in range(20):
+        y = SCREEN_HEIGHT * (0.2 + 0.03 * i)
+        game.sim.spawn(Enemy(400 + i * 25, y, "sine", y))
+    for i in range(10):
+        for proj in fire_volley("spread3", 150 + i * 75, PLAYER_START_Y):
+            game.sim.spawn(proj)
+    for i in range(300):
+        game.sim.bullets.spawn(300 + (i * 37) % 600, 40 + (i * 53) % 460, -100, 0)
+    game.sim.spawn(Powerup(700, SCREEN_HEIGHT * 0.7, "speed"))
+    game.sim.scoring.multiplier = 2.5
+    game.sim.scoring.combo = 12
+
+
+def scene_explosions(game: BorkGame) -> None:
+    """A full particle pool from overlapping explosions."""
+    for _ in range(25):
+        x = random.uniform(200, SCREEN_WIDTH - 100)
+        y = random.uniform(100, SCREEN_HEIGHT - 100)
+        game.particle_system.add(create_enemy_explosion(x, y))
+        game.score_popups.spawn(x, y, 100)
+    game.particle_system.add(create_player_explosion(PLAYER_START_X, PLAYER_START_Y))
+
+
+def scene_death(game: BorkGame) -> None:
+    """Game over frame with flash, shake and the player explosion."""
+    scene_explosions(game)
+    game.screen_flash = ScreenFlash(SCREEN_FLASH_COLOR, 10.0, 1.0)
+    game.screen_shake = ScreenShake(6.0, 10.0)
+    game.sim.state = STATE_GAME_OVER
+
+
+SCENES = {
+    "idle": scene_idle,
+    "wave": scene_wave,
+    "explosions": scene_explosions,
+    "death": scene_death,
+}
+
+
+def run_scene(game: BorkGame, name: str, frames: int) -> None:
+    """Render one scene repeatedly and print averaged counters."""
+    random.seed(1234)
+    game.setup()
+    SCENES[name](game)
+    stats = game.render_stats
+
+    # Warm up caches (text labels, shader programs) before measuring
+    for _ in range(5):
+        game.on_draw()
+    game.ctx.finish()
+
+    totals: dict[str, list[float]] = {}
+    start = time.perf_counter()
+    for _ in range(frames):
+        game.on_draw()
+        for section_name, section in stats.last_frame.items():
+            row = totals.setdefault(section_name, [0.0] * 7)
+            row[0] += section.draw_calls
+            row[1] += section.vertices
+            row[2] += section.blend_changes
+            row[3] += section.projection_changes
+            row[4] += section.framebuffer_binds
+            row[5] += section.cpu_time
+            row[6] += section.gpu_time
+    game.ctx.finish()
+    wall = (time.perf_counter() - start) / frames
+
+    print(f"\n== {name}  ({frames} frames, {wall * 1000:.2f} ms/frame wall)")
+    print(
+        f"{'section':<12}{'draws':>7}{'verts':>9}{'blend':>7}{'proj':>6}"
+        f"{'fbo':>5}{'cpu ms':>9}{'gpu ms':>9}"
+    )
+    grand = [0.0] * 7
+    for section_name, row in totals.items():
+        avg = [v / frames for v in row]
+        grand = [g + a for g, a in zip(grand, avg)]
+        _print_row(section_name, avg)
+    _print_row("TOTAL", grand)
+
+
+def _print_row(name: str, row: list[float]) -> None:
+    """Print one averaged counter row."""
+    print(
+        f"{name:<12}{row[0]:>7.0f}{row[1]:>9.0f}{row[2]:>7.0f}{row[3]:>6.0f}"
+        f"{row[4]:>5.0f}{row[5] * 1000:>9.3f}{row[6] * 1000:>9.3f}"
+    )
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=120)
+    parser.add_argument("--scene", choices=sorted(SCENES), action="append")
+    parser.add_argument(
+        "--no-gpu-timing", action="store_true", help="skip GL timer queries"
+    )
+    add_resolution_arguments(parser)
+    args = parser.parse_args()
+
+    warnings.simplefilter("ignore")  # arcade warns about draw_text speed
+    game = BorkGame(resolution=args.resolution, native_hud=not args.virtual_hud)
+    game.quality.enabled = False  # keep the scenes at a fixed tier
+    game.finish_loading()
+    game.render_stats.install(game, gpu_timing=not args.no_gpu_timing)
+    print(f"GL renderer: {game.ctx.info.RENDERER} ({game.ctx.gl_version})")
+    print(f"World framebuffer: {game.compositor.size[0]}x{game.compositor.size[1]}")
+    for name in args.scene or SCENES:
+        run_scene(game, name, args.frames)
+
+
+if __name__ == "__main__":
+    main()
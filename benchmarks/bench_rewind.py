@@ -0,0 +1,70 @@
+"""Rewind benchmark: history memory, per-tick record cost and rewind time.
+
+Plays a scripted session through the Simulation, recording every tick
+into a RewindBuffer, and compares its memory with keeping a full
+snapshot per tick. Then repeatedly rewinds and replays a window.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_rewind [--seconds 60] [--rewind 10]
+"""
+
+import argparse
+import time
+
+from bork.autopilot import autopilot_actions
+from bork.constants import TARGET_FPS
+from bork.rewind import RewindBuffer
+from bork.simulation import Simulation
+from bork.snapshot import take_snapshot
+
+DT = 1 / TARGET_FPS
+
+
+def play(sim: Simulation, buffer: RewindBuffer, ticks: int) -> tuple[float, int]:
+    """Step and record; returns record seconds and full-snapshot bytes."""
+    record_time = 0.0
+    full_bytes = 0
+    for _ in range(ticks):
+        sim.update(DT, autopilot_actions(sim))
+        start = time.perf_counter()
+        buffer.record(sim, DT)
+        record_time += time.perf_counter() - start
+        full_bytes += len(take_snapshot(sim))
+    return record_time, full_bytes
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=60.0)
+    parser.add_argument("--rewind", type=float, default=10.0)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    sim = Simulation(seed=1)
+    buffer = RewindBuffer()
+    ticks = int(args.seconds * TARGET_FPS)
+    record_time, full_bytes = play(sim, buffer, ticks)
+    print(f"recorded {buffer.frames} ticks ({buffer.frames / TARGET_FPS:.1f}s)")
+    print(f"  rewind buffer   {buffer.size / 1024:9.1f} KB")
+    print(f"  full snapshots  {full_bytes / 1024:9.1f} KB")
+    print(f"  record          {record_time / ticks * 1e6:9.1f} us/tick")
+
+    window = int(args.rewind * TARGET_FPS)
+    worst = 0.0
+    total = 0.0
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        buffer.rewind(sim, window)
+        elapsed = time.perf_counter() - start
+        worst = max(worst, elapsed)
+        total += elapsed
+        play(sim, buffer, window)
+    print(f"rewind {args.rewind:.0f}s x{args.repeat}")
+    print(f"  mean            {total / args.repeat * 1000:9.3f} ms")
+    print(f"  worst           {worst * 1000:9.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
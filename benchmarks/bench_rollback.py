@@ -0,0 +1,100 @@
+"""Rollback benchmark: frame cost when every frame has to resimulate.
+
+Drives one RollbackSession whose remote inputs arrive a fixed number of
+frames late and change every frame, so every arrival is a misprediction
+and rolls back that far (the worst case a peer at the stall limit can
+cause). Reports per-frame time against the frame budget, with no lag as
+the baseline.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_rollback [--seconds 20]
+"""
+
+import argparse
+import time
+
+from bork.autopilot import autopilot_actions
+from bork.constants import (
+    ACTION_DOWN,
+    ACTION_FIRE,
+    ACTION_UP,
+    NETPLAY_MAX_ROLLBACK,
+    TARGET_FPS,
+)
+from bork.net import InputPacket, encode_packet
+from bork.rollback import RollbackSession, encode_actions
+from bork.simulation import Simulation
+
+# Remote input alternates every frame, so a repeated guess is always wrong
+REMOTE_INPUTS = (
+    encode_actions({ACTION_FIRE, ACTION_UP}),
+    encode_actions({ACTION_FIRE, ACTION_DOWN}),
+)
+
+
+class LatePeer:
+    """A transport whose peer's inputs arrive `lag` frames late."""
+
+    def __init__(self, lag: int) -> None:
+        self.lag = lag
+        self.inbox: list[bytes] = []
+
+    def send(self, data: bytes) -> None:
+        pass
+
+    def receive(self) -> list[bytes]:
+        inbox, self.inbox = self.inbox, []
+        return inbox
+
+    def deliver(self, session: RollbackSession) -> None:
+        """Queue the remote inputs up to `lag` frames behind the session."""
+        start = session.remote_confirmed
+        end = session.frame + session.input_delay - self.lag
+        if end > start:
+            inputs = bytes(REMOTE_INPUTS[f % 2] for f in range(start, end))
+            ack = session.frame + session.input_delay
+            self.inbox.append(encode_packet(InputPacket(ack, 0, 0, start, inputs)))
+
+
+def run(lag: int, ticks: int) -> None:
+    """Play `ticks` frames with the given lag and print the frame times."""
+    peer = LatePeer(lag)
+    session = RollbackSession(Simulation(seed=1, players=2), 0, peer, seed=1)
+    times = []
+    for _ in range(ticks):
+        peer.deliver(session)
+        actions = autopilot_actions(session.sim)
+        start = time.perf_counter()
+        session.advance(actions)
+        times.append(time.perf_counter() - start)
+    times.sort()
+    budget = 1.0 / TARGET_FPS
+    mean = sum(times) / len(times)
+    p99 = times[int(len(times) * 0.99)]
+    worst = times[-1]
+    stats = session.stats
+    print(
+        f"{lag:>4}{stats.max_depth:>7}{mean * 1000:>9.2f}{p99 * 1000:>9.2f}"
+        f"{worst * 1000:>9.2f}{worst / budget:>9.0%}{stats.stalls:>8}"
+    )
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=20.0)
+    args = parser.parse_args()
+
+    ticks = int(args.seconds * TARGET_FPS)
+    print(
+        f"{'lag':>4}{'depth':>7}{'mean ms':>9}{'p99 ms':>9}{'worst':>9}"
+        f"{'budget':>9}{'stalls':>8}"
+    )
+    for lag in (0, NETPLAY_MAX_ROLLBACK // 2, NETPLAY_MAX_ROLLBACK - 1):
+        run(lag, ticks)
+    print(f"(budget: worst frame as a share of {1000 / TARGET_FPS:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
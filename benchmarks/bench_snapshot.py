@@ -0,0 +1,67 @@
+"""Snapshot benchmark: blob size and take/restore time against entity count.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_snapshot [--repeat 200]
+"""
+
+import argparse
+import random
+import time
+
+from bork.constants import SCREEN_HEIGHT, SCREEN_WIDTH
+from bork.enemy import Enemy
+from bork.powerup import Powerup
+from bork.projectile import Projectile
+from bork.simulation import Simulation
+from bork.snapshot import restore_snapshot, take_snapshot
+
+ENTITY_COUNTS = (0, 10, 100, 1000, 5000)
+
+
+def populate(sim: Simulation, count: int) -> None:
+    """Fill the simulation with `count` entities split across the lists."""
+    rng = random.Random(count)
+    for i in range(count):
+        x = rng.uniform(0, SCREEN_WIDTH)
+        y = rng.uniform(0, SCREEN_HEIGHT)
+        if i % 10 == 9:
+            sim.spawn(Powerup(x, y, "speed"))
+        elif i % 2:
+            sim.spawn(Enemy(x, y, rng.choice(("straight", "sine")), y))
+        else:
+            sim.spawn(Projectile(x, y))
+
+
+def measure(count: int, repeat: int) -> tuple[int, float, float]:
+    """Return blob size and mean take/restore seconds for one entity count."""
+    sim = Simulation(seed=1)
+    populate(sim, count)
+    target = Simulation()
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        blob = take_snapshot(sim)
+    take = (time.perf_counter() - start) / repeat
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        restore_snapshot(target, blob)
+    restore = (time.perf_counter() - start) / repeat
+    return len(blob), take, restore
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'entities':>9}{'bytes':>10}{'take ms':>10}{'restore ms':>12}")
+    for count in ENTITY_COUNTS:
+        size, take, restore = measure(count, args.repeat)
+        print(f"{count:>9}{size:>10}{take * 1000:>10.3f}{restore * 1000:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
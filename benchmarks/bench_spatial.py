@@ -0,0 +1,86 @@
+"""Spatial query benchmark: grid index vs. a naive scan for homing targets.
+
+For each enemy/missile mix, times one frame of targeting: every missile
+asks for its nearest enemy ahead of it and for enemies within a blast
+radius. The grid timing includes the per-frame rebuild.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_spatial [--repeat 20]
+"""
+
+import argparse
+import random
+import time
+
+from bork.constants import SCREEN_HEIGHT, SCREEN_WIDTH
+from bork.enemy import Enemy
+from bork.spatial import SpatialGrid
+
+CASES = ((50, 100), (200, 500), (500, 2000), (1000, 5000))
+BLAST_RADIUS = 60.0
+
+
+def naive_frame(enemies: list[Enemy], missiles: list[tuple[float, float]]) -> None:
+    """O(N*M) nearest-ahead and radius scans."""
+    r2 = BLAST_RADIUS * BLAST_RADIUS
+    for mx, my in missiles:
+        best_d2 = float("inf")
+        for e in enemies:
+            dx = e.x - mx
+            dy = e.y - my
+            d2 = dx * dx + dy * dy
+            if dx >= 0 and d2 < best_d2:
+                best_d2 = d2
+        [e for e in enemies if (e.x - mx) ** 2 + (e.y - my) ** 2 <= r2]
+
+
+def grid_frame(
+    grid: SpatialGrid, enemies: list[Enemy], missiles: list[tuple[float, float]]
+) -> None:
+    """Rebuild once, then batched nearest-ahead and radius queries."""
+    grid.rebuild(enemies)
+    grid.nearest_many(missiles, k=1, ahead=True)
+    grid.query_radius_many(missiles, BLAST_RADIUS)
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    print(
+        f"{'enemies':>8}{'missiles':>10}{'naive ms':>11}{'grid ms':>10}{'speedup':>9}"
+    )
+    for n_enemies, n_missiles in CASES:
+        enemies = [
+            Enemy(rng.uniform(0, SCREEN_WIDTH), y, "straight", y)
+            for y in (rng.uniform(0, SCREEN_HEIGHT) for _ in range(n_enemies))
+        ]
+        missiles = [
+            (rng.uniform(0, SCREEN_WIDTH), rng.uniform(0, SCREEN_HEIGHT))
+            for _ in range(n_missiles)
+        ]
+        grid = SpatialGrid()
+
+        repeat = max(1, args.repeat * 100_000 // (n_enemies * n_missiles))
+        start = time.perf_counter()
+        for _ in range(repeat):
+            naive_frame(enemies, missiles)
+        naive = (time.perf_counter() - start) / repeat
+
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            grid_frame(grid, enemies, missiles)
+        indexed = (time.perf_counter() - start) / args.repeat
+
+        print(
+            f"{n_enemies:>8}{n_missiles:>10}{naive * 1000:>11.2f}"
+            f"{indexed * 1000:>10.2f}{naive / indexed:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Spawn benchmark: worst per-tick spawn cost, bursts queued vs. all at once.
+
+For each burst size, one run builds and spawns the whole burst in a
+single tick; the other builds it ahead (as the wave spawner pre-warms)
+and lets the spawn queue activate SPAWN_BUDGET per tick. Reports the
+worst tick and how many ticks the burst took to enter. A final run plays
+normal waves and reports the worst spawn tick from the simulation's
+own stats.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_spawn [--repeats 200]
+"""
+
+import argparse
+import time
+
+from bork.constants import SCREEN_HEIGHT, SPAWN_BUDGET
+from bork.simulation import Simulation
+from bork.spawn_queue import offscreen_formation
+
+BURSTS = (10, 50, 200)
+DT = 1 / 60
+
+
+def all_at_once(count: int) -> float:
+    """Seconds to build and spawn a burst within one tick."""
+    sim = Simulation(seed=count)
+    start = time.perf_counter()
+    for enemy in offscreen_formation(count, SCREEN_HEIGHT / 2):
+        sim.spawn(enemy)
+    return time.perf_counter() - start
+
+
+def queued(count: int) -> tuple[float, int]:
+    """Worst per-tick spawn time and ticks taken, through the spawn queue."""
+    sim = Simulation(seed=count)
+    sim.wave_spawner.timer = 1e9  # only the burst
+    sim.spawn_queue.extend(offscreen_formation(count, SCREEN_HEIGHT / 2))
+    ticks = 0
+    while sim.spawn_queue.pending:
+        sim.update(DT, set())
+        ticks += 1
+    return sim.spawn_queue.stats.worst_time, ticks
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeats", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'burst':>6}{'at once us':>12}{'queued us':>11}{'ticks':>7}")
+    for count in BURSTS:
+        once = min(all_at_once(count) for _ in range(args.repeats))
+        runs = [queued(count) for _ in range(args.repeats)]
+        worst = min(worst for worst, _ in runs)
+        ticks = runs[0][1]
+        print(f"{count:>6}{once * 1e6:>12.1f}{worst * 1e6:>11.1f}{ticks:>7}")
+    print(f"(best of {args.repeats} runs; budget {SPAWN_BUDGET} per tick)")
+
+    sim = Simulation(seed=1)
+    for _ in range(60 * 60):
+        sim.update(DT, set())
+    stats = sim.spawn_queue.stats
+    print(
+        f"waves, 60 s: {stats.spawned} spawned, worst tick {stats.worst_count}"
+        f" enemies / {stats.worst_time * 1e6:.1f} us"
+    )
+
+
+if __name__ == "__main__":
+    main()
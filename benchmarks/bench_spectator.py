@@ -0,0 +1,124 @@
+"""Spectator benchmark: stream size and game-side cost per tick.
+
+Plays an autopilot game and a dense crowd while streaming to 0, 8 and 32
+connected spectators. Reports bytes per tick against the frame budget and
+the time the game thread spends encoding and publishing each tick, which
+should not grow with the number of spectators.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_spectator [--seconds 20]
+"""
+
+import argparse
+import socket
+import threading
+import time
+from collections.abc import Callable
+
+from bork.autopilot import autopilot_actions
+from bork.constants import (
+    SCREEN_HEIGHT,
+    SPECTATOR_ENCODE_BUDGET,
+    SPECTATOR_FRAME_BUDGET,
+    TARGET_FPS,
+)
+from bork.simulation import Simulation
+from bork.spawn_queue import offscreen_formation
+from bork.spectator import SpectatorServer
+from bork.stream import StreamEncoder
+
+
+def autopilot() -> tuple[Simulation, Callable[[], set[str]]]:
+    """A normal game flown by the autopilot."""
+    sim = Simulation(seed=7)
+    return sim, lambda: autopilot_actions(sim)
+
+
+def crowd() -> tuple[Simulation, Callable[[], set[str]]]:
+    """A hundred enemies on screen at once under spread fire."""
+    sim = Simulation(seed=7)
+    sim.wave_spawner.timer = 1e9
+    sim.player.weapon = "spread5"
+    sim.spawn_queue.extend(offscreen_formation(100, SCREEN_HEIGHT / 2, rows=10))
+    return sim, lambda: {"fire"}
+
+
+SCENARIOS = {"autopilot": autopilot, "crowd": crowd}
+IDLE = 0.001  # seconds slept between ticks, outside the timed section
+
+
+def drain(sockets: list[socket.socket], stop: threading.Event) -> None:
+    """Read and discard everything the spectators are sent."""
+    for sock in sockets:
+        sock.settimeout(0.01)
+    while not stop.is_set():
+        for sock in sockets:
+            try:
+                sock.recv(65536)
+            except (TimeoutError, OSError):
+                pass
+
+
+def run(name: str, spectators: int, ticks: int) -> None:
+    """Stream `ticks` of one scenario to `spectators` clients and print costs."""
+    server = SpectatorServer(0)
+    sockets = [
+        socket.create_connection(("127.0.0.1", server.port)) for _ in range(spectators)
+    ]
+    stop = threading.Event()
+    reader = threading.Thread(target=drain, args=(sockets, stop), daemon=True)
+    reader.start()
+    while len(server.clients) < spectators:
+        time.sleep(0.001)
+
+    sim, actions = SCENARIOS[name]()
+    encoder = StreamEncoder()
+    dt = 1.0 / TARGET_FPS
+    times = []
+    for _ in range(ticks):
+        sim.update(dt, actions())
+        start = time.perf_counter()
+        server.publish(encoder.encode(sim))
+        times.append(time.perf_counter() - start)
+        # The game idles between frames; let the sender thread run here too
+        time.sleep(IDLE)
+
+    stop.set()
+    reader.join()
+    server.close()
+    for sock in sockets:
+        sock.close()
+    times.sort()
+    stats = encoder.stats
+    mean = sum(times) / len(times)
+    p99 = times[int(len(times) * 0.99)]
+    print(
+        f"{name:<10}{spectators:>5}{stats.mean_bytes:>8.0f}{stats.peak_bytes:>7}"
+        f"{stats.peak_bytes / SPECTATOR_FRAME_BUDGET:>8.0%}{mean * 1000:>9.3f}"
+        f"{p99 * 1000:>9.3f}{p99 / SPECTATOR_ENCODE_BUDGET:>8.0%}{server.resyncs:>8}"
+    )
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=20.0)
+    args = parser.parse_args()
+
+    ticks = int(args.seconds * TARGET_FPS)
+    print(
+        f"{'scenario':<10}{'specs':>5}{'mean B':>8}{'peak B':>7}{'budget':>8}"
+        f"{'mean ms':>9}{'p99 ms':>9}{'budget':>8}{'resyncs':>8}"
+    )
+    for name in SCENARIOS:
+        for spectators in (0, 8, 32):
+            run(name, spectators, ticks)
+    print(
+        f"(budgets: peak frame vs. {SPECTATOR_FRAME_BUDGET} B, "
+        f"p99 encode+publish vs. {SPECTATOR_ENCODE_BUDGET * 1000:.1f} ms)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""Startup benchmark: cold import time of the logic modules vs. the full game.
+
+Each measurement runs in a fresh interpreter, so nothing is cached in
+sys.modules. The logic modules must import within IMPORT_BUDGET (the
+script exits non-zero otherwise); about 65 ms of that is numpy, which the
+enemy bullets need. Also reports whether arcade/pyglet were pulled in,
+and then times a headless game launch: window open, first frame drawn, and every
+asset loaded (the loading screen drawing frames meanwhile).
+
+Run from the repository root:
+
+    python -m benchmarks.bench_startup [--repeat 10] [--timeline]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+TARGETS = (
+    "bork.simulation",
+    "bork.snapshot",
+    "bork.rewind",
+    "bork.game",
+)
+# Median cold import of each logic module (not bork.game); numpy alone is
+# ~65 ms of the ~100 ms these take
+IMPORT_BUDGET = 0.2  # seconds
+
+PROBE = """
+import sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(elapsed, 'arcade' in sys.modules, 'pyglet' in sys.modules)
+"""
+
+
+LAUNCH_PROBE = """
+import time
+start = time.perf_counter()
+import json, warnings
+warnings.simplefilter("ignore")
+from bork.game import BorkGame
+imported = time.perf_counter() - start
+game = BorkGame()
+game.setup()
+while game.loading:
+    game.on_update(1 / 60)
+    game.on_draw()
+game.music.stop()
+timeline = game.timeline
+offset = timeline.origin - start
+print(json.dumps({
+    "import": imported,
+    "window": offset + timeline.first("window open").start,
+    "first frame": offset + game.first_frame,
+    "loaded": offset + game.loader.loaded_at,
+    "frames": game.loader.frames,
+    "timeline": timeline.format(),
+}))
+"""
+LAUNCH_PHASES = ("import", "window", "first frame", "loaded")
+
+
+def measure(module: str) -> tuple[float, bool, bool]:
+    """Import `module` in a fresh interpreter; returns seconds and GUI flags."""
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE.format(module=module)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    elapsed, arcade, pyglet = result.stdout.split()
+    return float(elapsed), arcade == "True", pyglet == "True"
+
+
+def measure_launch() -> dict:
+    """Launch the game headless in a fresh interpreter until it has loaded."""
+    result = subprocess.run(
+        [sys.executable, "-c", LAUNCH_PROBE],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "ARCADE_HEADLESS": "1"},
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument(
+        "--timeline", action="store_true", help="print the last launch's timeline"
+    )
+    args = parser.parse_args()
+
+    print(f"{'module':<18}{'median ms':>11}{'min ms':>9}  arcade  pyglet")
+    over = []
+    for module in TARGETS:
+        runs = [measure(module) for _ in range(args.repeat)]
+        times = [run[0] for run in runs]
+        _, arcade, pyglet = runs[0]
+        median = statistics.median(times)
+        print(
+            f"{module:<18}{median * 1000:>11.1f}"
+            f"{min(times) * 1000:>9.1f}  {arcade!s:<6}  {pyglet!s:<6}"
+        )
+        if module != "bork.game" and median > IMPORT_BUDGET:
+            over.append(module)
+
+    # Launches are timed from interpreter start; the first one may build the
+    # atlas cache, later ones load it
+    launches = [measure_launch() for _ in range(args.repeat)]
+    print(f"\n{'game launch':<18}{'median ms':>11}{'min ms':>9}")
+    for phase in LAUNCH_PHASES:
+        times = [launch[phase] for launch in launches]
+        print(
+            f"{phase:<18}{statistics.median(times) * 1000:>11.1f}"
+            f"{min(times) * 1000:>9.1f}"
+        )
+    frames = statistics.median(launch["frames"] for launch in launches)
+    print(f"loading frames    {frames:>11.0f}")
+    if args.timeline:
+        print()
+        print(launches[-1]["timeline"])
+    if over:
+        raise SystemExit(
+            f"OVER BUDGET: {', '.join(over)} imported in more than"
+            f" {IMPORT_BUDGET * 1000:.0f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+"""Asset loading: decode on a thread pool, finish on the main thread.
+
+An asset is a decode step (file reads, decompression, rasterizing, synthesis;
+runs on a worker thread) and an optional finish step (GPU uploads and
+anything else that must happen on the GL thread). While the game is in its
+loading state it calls `update()` once per frame, which runs finish steps
+until ASSET_FRAME_BUDGET is used up, always at least one so loading keeps
+moving. The window keeps drawing the whole time.
+
+Every step is recorded in a StartupTimeline, next to marks such as the
+first frame, so time-to-first-frame can be read off and watched as the
+asset list grows.
+"""
+
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from bork.constants import ASSET_FRAME_BUDGET, ASSET_WORKERS
+
+
+class TimelineEntry:
+    """One span (or instant mark) of startup work."""
+
+    def __init__(self, label: str, start: float, end: float, thread: str) -> None:
+        self.label = label
+        self.start = start  # seconds since the timeline's origin
+        self.end = end
+        self.thread = thread
+
+
+class StartupTimeline:
+    """Spans and marks from startup, in seconds since the timeline was made.
+
+    Worker threads add spans concurrently; list appends are atomic.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        self.clock = clock
+        self.origin = clock()
+        self.entries: list[TimelineEntry] = []
+
+    def now(self) -> float:
+        """Seconds since the origin."""
+        return self.clock() - self.origin
+
+    def mark(self, label: str) -> float:
+        """Record an instant; returns its time."""
+        t = self.now()
+        self.entries.append(TimelineEntry(label, t, t, threading.current_thread().name))
+        return t
+
+    def span(self, label: str, start: float) -> None:
+        """Record work that began at `start` (from `now()`) and ends now."""
+        self.entries.append(
+            TimelineEntry(label, start, self.now(), threading.current_thread().name)
+        )
+
+    def first(self, label: str) -> TimelineEntry | None:
+        """The earliest entry with this label, if any."""
+        matches = [entry for entry in self.entries if entry.label == label]
+        return min(matches, key=lambda entry: entry.start) if matches else None
+
+    def format(self) -> str:
+        """The timeline as a table, ordered by start time."""
+        lines = [f"{'start ms':>9}{'took ms':>9}  {'thread':<16}what"]
+        for entry in sorted(self.entries, key=lambda entry: entry.start):
+            took = (entry.end - entry.start) * 1000
+            lines.append(
+                f"{entry.start * 1000:>9.1f}{took:>9.1f}  {entry.thread:<16}"
+                f"{entry.label}"
+            )
+        return "\n".join(lines)
+
+
+class Asset:
+    """A queued asset and where it is in loading."""
+
+    def __init__(
+        self,
+        name: str,
+        decode: Callable[[], object],
+        finish: Callable[[object], None] | None,
+        weight: float,
+    ) -> None:
+        self.name = name
+        self.decode = decode
+        self.finish = finish
+        self.weight = weight  # share of the progress bar
+        self.future: Future | None = None
+        self.finished = False
+
+
+class AssetLoader:
+    """Decodes queued assets in parallel and finishes them frame by frame."""
+
+    def __init__(
+        self,
+        timeline: StartupTimeline,
+        workers: int = ASSET_WORKERS,
+        budget: float = ASSET_FRAME_BUDGET,
+    ) -> None:
+        self.timeline = timeline
+        self.workers = workers
+        self.budget = budget  # seconds of finish work per frame
+        self.assets: list[Asset] = []
+        self.frames = 0  # update() calls until done
+        self.loaded_at: float | None = None  # timeline time everything was ready
+        self._executor: ThreadPoolExecutor | None = None
+
+    def add(
+        self,
+        name: str,
+        decode: Callable[[], object],
+        finish: Callable[[object], None] | None = None,
+        weight: float = 1.0,
+    ) -> None:
+        """Queue an asset; `finish` gets the decoded value on the main thread."""
+        if self._executor is not None:
+            raise RuntimeError("assets must be added before start()")
+        self.assets.append(Asset(name, decode, finish, weight))
+
+    def start(self) -> None:
+        """Submit every decode step to the worker pool (returns immediately)."""
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="bork-assets"
+        )
+        for asset in self.assets:
+            asset.future = self._executor.submit(self._decode, asset)
+
+    def _decode(self, asset: Asset) -> object:
+        """Worker thread: run one decode step and time it."""
+        start = self.timeline.now()
+        try:
+            return asset.decode()
+        finally:
+            self.timeline.span(f"decode {asset.name}", start)
+
+    @property
+    def done(self) -> bool:
+        """Every asset decoded and finished."""
+        return all(asset.finished for asset in self.assets)
+
+    @property
+    def progress(self) -> float:
+        """0..1 by weight; decoding and finishing each count for half."""
+        total = sum(asset.weight for asset in self.assets)
+        if total == 0:
+            return 1.0
+        loaded = 0.0
+        for asset in self.assets:
+            if asset.finished:
+                loaded += asset.weight
+            elif asset.future is not None and asset.future.done():
+                loaded += asset.weight / 2
+        return loaded / total
+
+    def update(self) -> bool:
+        """Finish decoded assets within the frame budget; True when all are.
+
+        A failed decode re-raises here, on the main thread.
+        """
+        if self._executor is None:
+            self.start()
+        if self.done:
+            return self._check_done()
+        self.frames += 1
+        deadline = self.timeline.clock() + self.budget
+        finished_one = False
+        for asset in self.assets:
+            if asset.finished or not asset.future.done():
+                continue
+            if finished_one and self.timeline.clock() >= deadline:
+                break
+            self._finish(asset)
+            finished_one = True
+        return self._check_done()
+
+    def wait(self) -> None:
+        """Block until everything is loaded, ignoring the frame budget."""
+        if self._executor is None:
+            self.start()
+        for asset in self.assets:
+            if not asset.finished:
+                self._finish(asset)
+        self._check_done()
+
+    def _finish(self, asset: Asset) -> None:
+        """Run one asset's finish step on the calling (main) thread."""
+        value = asset.future.result()
+        if asset.finish is not None:
+            start = self.timeline.now()
+            asset.finish(value)
+            self.timeline.span(f"finish {asset.name}", start)
+        asset.finished = True
+
+    def _check_done(self) -> bool:
+        """Mark completion once and release the worker threads."""
+        if not self.done:
+            return False
+        if self.loaded_at is None:
+            self._executor.shutdown(wait=False)
+            self.loaded_at = self.timeline.mark("assets loaded")
+        return True
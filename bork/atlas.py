@@ -0,0 +1,250 @@
+"""Shape atlas: every sprite shape rasterized once into a single image.
+
+The ship, enemy diamond, powerup discs (one per letter), lives chevrons
+and the white particle/star shapes are drawn with Pillow (supersampled for
+smooth edges) and shelf-packed into one RGBA image. Shapes are keyed by
+name; colours and sizes come from the constants, and white shapes are
+tinted per sprite at draw time.
+
+The atlas is saved as one PNG whose text chunks hold the region table and
+the content hash of everything that went into it, so a later launch with
+the same constants loads it in a single read. Changing a size or colour
+changes the hash, and the stale file is replaced.
+"""
+
+import hashlib
+import json
+import math
+import os
+from pathlib import Path
+
+import PIL
+from PIL import Image, ImageDraw, ImageFont
+from PIL.PngImagePlugin import PngInfo
+
+from bork.constants import (
+    ATLAS_CACHE_DIR,
+    ATLAS_PADDING,
+    ATLAS_SUPERSAMPLE,
+    ATLAS_TINT_SIZE,
+    ATLAS_WIDTH,
+    COLOR_PLAYER,
+    COLOR_PLAYER_2,
+    ENEMY_COLOR,
+    ENEMY_SIZE,
+    HUD_DIM,
+    HUD_LIVES_ICON_SIZE,
+    HUD_PRIMARY,
+    PLAYER_SHIP_SIZE,
+    POWERUP_COLOR,
+    POWERUP_FONT_SIZE,
+    POWERUP_LABELS,
+    POWERUP_PULSE_AMOUNT,
+    POWERUP_SIZE,
+    POWERUP_TEXT_COLOR,
+)
+
+ATLAS_VERSION = 1  # bump when rasterization changes without a constant changing
+WHITE = (255, 255, 255)
+
+# Region: x, y (from the top), width, height in pixels
+Region = tuple[int, int, int, int]
+
+
+def atlas_specs() -> dict[str, dict]:
+    """Shape name -> what to draw, derived from the constants."""
+    tint = [ATLAS_TINT_SIZE, ATLAS_TINT_SIZE]
+    icon = [HUD_LIVES_ICON_SIZE, HUD_LIVES_ICON_SIZE]
+    # Powerups are drawn at their largest pulse and scaled down
+    disc = math.ceil(2 * POWERUP_SIZE * (1 + POWERUP_PULSE_AMOUNT))
+    specs = {
+        "player": {
+            "shape": "ship",
+            "size": [2 * PLAYER_SHIP_SIZE, round(1.4 * PLAYER_SHIP_SIZE)],
+            "color": COLOR_PLAYER,
+        },
+        "player2": {
+            "shape": "ship",
+            "size": [2 * PLAYER_SHIP_SIZE, round(1.4 * PLAYER_SHIP_SIZE)],
+            "color": COLOR_PLAYER_2,
+        },
+        "enemy": {
+            "shape": "diamond",
+            "size": [2 * ENEMY_SIZE, 2 * ENEMY_SIZE],
+            "color": ENEMY_COLOR,
+        },
+        "circle": {"shape": "circle", "size": tint, "color": WHITE},
+        "square": {"shape": "square", "size": tint, "color": WHITE},
+        "triangle": {"shape": "triangle", "size": tint, "color": WHITE},
+        "chevron": {"shape": "chevron", "size": icon, "color": HUD_PRIMARY},
+        "chevron_dim": {"shape": "chevron", "size": icon, "color": HUD_DIM},
+    }
+    for kind, label in POWERUP_LABELS.items():
+        specs[f"powerup_{kind}"] = {
+            "shape": "circle",
+            "size": [disc, disc],
+            "color": POWERUP_COLOR,
+            "label": label,
+            "label_color": POWERUP_TEXT_COLOR,
+            "font_size": POWERUP_FONT_SIZE * (1 + POWERUP_PULSE_AMOUNT),
+        }
+    return specs
+
+
+def atlas_key(specs: dict[str, dict]) -> str:
+    """Content hash of the specs and everything else that shapes the pixels."""
+    content = json.dumps(
+        {
+            "version": ATLAS_VERSION,
+            "pillow": PIL.__version__,
+            "width": ATLAS_WIDTH,
+            "padding": ATLAS_PADDING,
+            "supersample": ATLAS_SUPERSAMPLE,
+            "specs": specs,
+        },
+        sort_keys=True,
+    )
+    return hashlib.blake2b(content.encode(), digest_size=8).hexdigest()
+
+
+def rasterize(spec: dict) -> Image.Image:
+    """Draw one shape at its final size with anti-aliased edges."""
+    width, height = spec["size"]
+    k = ATLAS_SUPERSAMPLE
+    big = Image.new("RGBA", (width * k, height * k), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(big)
+    right, bottom = width * k - 1, height * k - 1
+    mid_x, mid_y = right / 2, bottom / 2
+    color = (*spec["color"], 255)
+    shape = spec["shape"]
+    if shape == "ship":  # nose pointing right
+        draw.polygon([(right, mid_y), (0, 0), (0, bottom)], fill=color)
+    elif shape == "diamond":
+        draw.polygon(
+            [(0, mid_y), (mid_x, 0), (right, mid_y), (mid_x, bottom)], fill=color
+        )
+    elif shape == "circle":
+        draw.ellipse([0, 0, right, bottom], fill=color)
+    elif shape == "square":
+        draw.rectangle([0, 0, right, bottom], fill=color)
+    elif shape == "triangle":  # apex up
+        draw.polygon([(mid_x, 0), (0, bottom), (right, bottom)], fill=color)
+    elif shape == "chevron":
+        draw.polygon(
+            [(0, bottom * 0.15), (right, mid_y), (0, bottom * 0.85)], fill=color
+        )
+    else:
+        raise ValueError(f"unknown atlas shape {shape!r}")
+    if "label" in spec:
+        font = ImageFont.load_default(size=spec["font_size"] * k)
+        label_color = (*spec["label_color"], 255)
+        draw.text(
+            (mid_x, mid_y),
+            spec["label"],
+            fill=label_color,
+            font=font,
+            anchor="mm",
+            stroke_width=k // 2,  # bold
+            stroke_fill=label_color,
+        )
+    # Downsample with premultiplied alpha so edges keep their colour
+    small = big.convert("RGBa").resize((width, height), Image.Resampling.LANCZOS)
+    return small.convert("RGBA")
+
+
+def pack(sizes: dict[str, tuple[int, int]]) -> tuple[dict[str, Region], int]:
+    """Shelf-pack rectangles, tallest first; returns regions and atlas height."""
+    regions: dict[str, Region] = {}
+    x = shelf = ATLAS_PADDING
+    shelf_height = 0
+    for name in sorted(sizes, key=lambda n: (-sizes[n][1], n)):
+        width, height = sizes[name]
+        if width + 2 * ATLAS_PADDING > ATLAS_WIDTH:
+            raise ValueError(f"atlas shape {name!r} is wider than the atlas")
+        if x + width + ATLAS_PADDING > ATLAS_WIDTH:
+            shelf += shelf_height + ATLAS_PADDING
+            x, shelf_height = ATLAS_PADDING, 0
+        regions[name] = (x, shelf, width, height)
+        x += width + ATLAS_PADDING
+        shelf_height = max(shelf_height, height)
+    return regions, shelf + shelf_height + ATLAS_PADDING
+
+
+class ShapeAtlas:
+    """The packed atlas image and where each shape sits in it."""
+
+    def __init__(
+        self,
+        image: Image.Image,
+        regions: dict[str, Region],
+        key: str,
+        from_cache: bool = False,
+    ) -> None:
+        self.image = image
+        self.regions = regions
+        self.key = key
+        self.from_cache = from_cache  # loaded from disk rather than generated
+
+    def crop(self, name: str) -> Image.Image:
+        """The pixels of one shape."""
+        x, y, width, height = self.regions[name]
+        return self.image.crop((x, y, x + width, y + height))
+
+
+def build_atlas(specs: dict[str, dict]) -> ShapeAtlas:
+    """Rasterize and pack every shape."""
+    shapes = {name: rasterize(spec) for name, spec in specs.items()}
+    regions, height = pack({name: shape.size for name, shape in shapes.items()})
+    image = Image.new("RGBA", (ATLAS_WIDTH, height), (0, 0, 0, 0))
+    for name, shape in shapes.items():
+        image.paste(shape, regions[name][:2])
+    return ShapeAtlas(image, regions, atlas_key(specs))
+
+
+def cache_dir() -> Path:
+    """Directory the atlas is cached in."""
+    return Path(os.environ.get("BORK_CACHE_DIR", ATLAS_CACHE_DIR)).expanduser()
+
+
+def load_atlas(
+    directory: Path | None = None, specs: dict[str, dict] | None = None
+) -> ShapeAtlas:
+    """The atlas from the cache if its hash matches, else build and cache it."""
+    specs = atlas_specs() if specs is None else specs
+    directory = cache_dir() if directory is None else directory
+    key = atlas_key(specs)
+    path = directory / f"atlas-{key}.png"
+    try:
+        with Image.open(path) as image:
+            image.load()
+            if image.text.get("key") == key and image.mode == "RGBA":
+                regions = {
+                    name: tuple(region)
+                    for name, region in json.loads(image.text["regions"]).items()
+                }
+                if set(regions) == set(specs):
+                    return ShapeAtlas(image, regions, key, from_cache=True)
+    except (OSError, ValueError, KeyError):
+        pass  # missing or unreadable: regenerate
+
+    atlas = build_atlas(specs)
+    save_atlas(atlas, directory)
+    return atlas
+
+
+def save_atlas(atlas: ShapeAtlas, directory: Path) -> None:
+    """Write the atlas (replacing older versions); a read-only cache is fine."""
+    path = directory / f"atlas-{atlas.key}.png"
+    info = PngInfo()
+    info.add_text("key", atlas.key)
+    info.add_text("regions", json.dumps(atlas.regions))
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        partial = path.with_suffix(".tmp")
+        atlas.image.save(partial, format="PNG", pnginfo=info)
+        os.replace(partial, path)
+        for stale in directory.glob("atlas-*.png"):
+            if stale != path:
+                stale.unlink()
+    except OSError:
+        pass
@@ -0,0 +1,30 @@
+"""Scripted player for soak runs and benchmarks.
+
+Fires constantly and lines up with the nearest enemy ahead, weaving up
+and down when there is none. It plays badly enough to die and restart
+regularly, which is what a soak run wants to exercise.
+"""
+
+from bork.constants import (
+    ACTION_DOWN,
+    ACTION_FIRE,
+    ACTION_UP,
+    AUTOPILOT_DEADZONE,
+    AUTOPILOT_WEAVE_TICKS,
+)
+from bork.simulation import Simulation
+
+
+def autopilot_actions(sim: Simulation, index: int = 0) -> set[str]:
+    """Input actions for the next tick, for ship `index`."""
+    player = sim.players[index]
+    target = sim.enemy_grid().nearest(player.x, player.y, ahead=True)
+    if target:
+        dy = target[0].y - player.y
+        if dy > AUTOPILOT_DEADZONE:
+            return {ACTION_FIRE, ACTION_UP}
+        if dy < -AUTOPILOT_DEADZONE:
+            return {ACTION_FIRE, ACTION_DOWN}
+        return {ACTION_FIRE}
+    leg = (sim.tick // AUTOPILOT_WEAVE_TICKS) % 2
+    return {ACTION_FIRE, ACTION_UP if leg else ACTION_DOWN}
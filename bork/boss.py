@@ -0,0 +1,224 @@
+"""Boss entity: a hull of destructible parts behind a hit-zone tree.
+
+Every part is a circle in boss-local coordinates. The parts form a fixed
+three-level bounding-volume hierarchy: a circle around the whole boss, one
+around each part group and one per part. A query only descends into nodes
+it overlaps, so a shot that reaches the boss tests a few circles instead
+of every part (one that misses never gets past the collision sweep, which
+uses the whole-boss circle).
+
+The bounds are built once from the rest pose, padded by each part's sway,
+so parts can animate inside them without the tree being rebuilt, and the
+boss moving only shifts the query into local coordinates. Each boss keeps
+a count of live parts under every node, so destroyed parts and groups
+drop out of queries.
+"""
+
+import math
+
+from bork.collision import circle_circle
+from bork.constants import (
+    BOSS_BOB_AMPLITUDE,
+    BOSS_BOB_FREQUENCY,
+    BOSS_FIRE_DELAY,
+    BOSS_FIRE_INTERVAL,
+    BOSS_GROUPS,
+    BOSS_PART_KINDS,
+    BOSS_SPEED,
+    BOSS_STOP_X,
+    BOSS_SWAY_FREQUENCY,
+)
+
+
+def part_specs() -> list[dict]:
+    """Every boss part, in group order, from the constants."""
+    return [
+        {"group": group, "kind": kind, "x": x, "y": y, **BOSS_PART_KINDS[kind]}
+        for group, parts in BOSS_GROUPS.items()
+        for kind, x, y in parts
+    ]
+
+
+class HitNode:
+    """A bounding circle (boss-local) over child nodes, or over one part."""
+
+    def __init__(
+        self,
+        x: float,
+        y: float,
+        radius: float,
+        children: list["HitNode"],
+        part: int | None = None,
+    ) -> None:
+        self.x = x
+        self.y = y
+        self.radius = radius
+        self.children = children
+        self.part = part  # part index for leaves
+        self.id = 0  # position in HitTree.nodes
+
+
+def enclosing(
+    children: list[HitNode], x: float | None = None, y: float | None = None
+) -> tuple[float, float, float]:
+    """A circle around child circles, centred on their bounding box unless given."""
+    if x is None or y is None:
+        x = (
+            min(c.x - c.radius for c in children)
+            + max(c.x + c.radius for c in children)
+        ) / 2
+        y = (
+            min(c.y - c.radius for c in children)
+            + max(c.y + c.radius for c in children)
+        ) / 2
+    radius = max(math.hypot(c.x - x, c.y - y) + c.radius for c in children)
+    return x, y, radius
+
+
+class HitTree:
+    """Whole boss -> part groups -> parts, built once per layout.
+
+    The root is centred on the boss origin, so its radius is the body
+    radius the collision sweep uses.
+    """
+
+    def __init__(self, parts: list[dict]) -> None:
+        self.parts = parts
+        groups: dict[str, list[HitNode]] = {}
+        for index, part in enumerate(parts):
+            leaf = HitNode(
+                part["x"], part["y"], part["radius"] + part["sway"], [], index
+            )
+            groups.setdefault(part["group"], []).append(leaf)
+        group_nodes = [
+            HitNode(*enclosing(leaves), leaves) for leaves in groups.values()
+        ]
+        self.root = HitNode(*enclosing(group_nodes, 0.0, 0.0), group_nodes)
+        self.nodes: list[HitNode] = []
+        # Per part: ids of the nodes from the root down to its leaf
+        self.paths: list[list[int]] = [[] for _ in parts]
+        self._number(self.root, [])
+        self.core = next(i for i, p in enumerate(parts) if p["kind"] == "core")
+        self.turrets = [i for i, p in enumerate(parts) if p["kind"] == "turret"]
+
+    def _number(self, node: HitNode, path: list[int]) -> None:
+        """Assign node ids depth-first and record each part's path."""
+        node.id = len(self.nodes)
+        self.nodes.append(node)
+        path = [*path, node.id]
+        if node.part is not None:
+            self.paths[node.part] = path
+        for child in node.children:
+            self._number(child, path)
+
+    def live_counts(self, hp: list[int]) -> list[int]:
+        """Live parts under each node for the given part hit points."""
+        live = [0] * len(self.nodes)
+        for part, path in enumerate(self.paths):
+            if hp[part] > 0:
+                for node_id in path:
+                    live[node_id] += 1
+        return live
+
+
+HIT_TREE = HitTree(part_specs())
+BOSS_RADIUS = HIT_TREE.root.radius
+
+
+class Boss:
+    """Enters from the right, stops and bobs; its turrets fire in volleys."""
+
+    def __init__(self, x: float, y: float, tree: HitTree = HIT_TREE) -> None:
+        self.x = x
+        self.y = y
+        self.base_y = y  # center of the bob
+        self.time_alive = 0.0
+        self.fire_timer = BOSS_FIRE_DELAY
+        self.tree = tree
+        self.hp: list[int] = [part["hp"] for part in tree.parts]
+        self.live: list[int] = tree.live_counts(self.hp)
+        self.tests = 0  # hit-tree circle tests by queries, for benchmarks/tests
+
+    def update(self, dt: float) -> bool:
+        """Move and animate. Returns True on ticks where a volley comes due."""
+        self.time_alive += dt
+        if self.x > BOSS_STOP_X:
+            self.x = max(BOSS_STOP_X, self.x - BOSS_SPEED * dt)
+        self.y = self.base_y + BOSS_BOB_AMPLITUDE * math.sin(
+            BOSS_BOB_FREQUENCY * self.time_alive * 2 * math.pi
+        )
+        self.fire_timer -= dt
+        if self.fire_timer <= 0:
+            self.fire_timer += BOSS_FIRE_INTERVAL
+            return True
+        return False
+
+    def part_offset(self, part: int) -> tuple[float, float]:
+        """A part's current boss-local position (rest pose plus sway)."""
+        spec = self.tree.parts[part]
+        sway = spec["sway"] * math.sin(
+            BOSS_SWAY_FREQUENCY * self.time_alive * 2 * math.pi + part
+        )
+        return spec["x"], spec["y"] + sway
+
+    def part_position(self, part: int) -> tuple[float, float]:
+        """A part's current world position."""
+        dx, dy = self.part_offset(part)
+        return self.x + dx, self.y + dy
+
+    def hit_part(self, x: float, y: float, radius: float) -> int | None:
+        """The live part nearest (x, y) whose circle overlaps a query circle."""
+        tree = self.tree
+        live = self.live
+        parts = tree.parts
+        lx = x - self.x
+        ly = y - self.y
+        best: int | None = None
+        best_distance = math.inf
+        tests = 0
+        stack = [tree.root]
+        while stack:
+            node = stack.pop()
+            if not live[node.id]:
+                continue
+            tests += 1
+            part = node.part
+            if part is None:
+                if circle_circle(node.x, node.y, node.radius, lx, ly, radius):
+                    stack.extend(node.children)
+                continue
+            # Leaf: exact test at the part's animated position
+            px, py = self.part_offset(part)
+            if circle_circle(px, py, parts[part]["radius"], lx, ly, radius):
+                distance = math.hypot(px - lx, py - ly)
+                if distance < best_distance:
+                    best, best_distance = part, distance
+        self.tests += tests
+        return best
+
+    def damage(self, part: int) -> bool:
+        """Take one hit on a live part; True if that destroyed it."""
+        self.hp[part] -= 1
+        if self.hp[part] > 0:
+            return False
+        self.destroy_part(part)
+        return True
+
+    def destroy_part(self, part: int) -> None:
+        """Knock out a part, taking it out of the live counts."""
+        self.hp[part] = 0
+        for node_id in self.tree.paths[part]:
+            self.live[node_id] -= 1
+
+    def live_parts(self) -> list[int]:
+        """Indices of the parts still standing."""
+        return [i for i, hp in enumerate(self.hp) if hp > 0]
+
+    def live_turrets(self) -> list[int]:
+        """Indices of the turrets still standing."""
+        return [i for i in self.tree.turrets if self.hp[i] > 0]
+
+    @property
+    def defeated(self) -> bool:
+        """True once the core is destroyed."""
+        return self.hp[self.tree.core] <= 0
@@ -0,0 +1,125 @@
+"""Boss spawning, stepping and hit-tree collision for the simulation.
+
+A boss is one body in the CollisionWorld (its whole-boss circle). The
+functions here resolve those broad-phase contacts against its hit tree:
+a shot damages the nearest live part it touches, and a ship that touches
+a live part is hit. Each takes the Simulation it works on.
+"""
+
+from typing import TYPE_CHECKING
+
+from bork.boss import BOSS_RADIUS, Boss
+from bork.constants import (
+    LAYER_BOSS,
+    LAYER_PLAYER,
+    LAYER_PLAYER_SHOT,
+    PLAYER_SHIP_SIZE,
+    SCREEN_HEIGHT,
+    SCREEN_WIDTH,
+)
+from bork.events import EVENT_BOSS_KILLED, EVENT_BOSS_PART_DESTROYED, GameEvent
+from bork.projectile import Projectile
+
+if TYPE_CHECKING:
+    from bork.simulation import Simulation
+
+
+def spawn_due_boss(sim: "Simulation") -> None:
+    """Bring on the boss once the wave spawner says one is due."""
+    spawner = sim.wave_spawner
+    if spawner.boss_due:
+        spawner.boss_due = False
+        sim.spawn(Boss(SCREEN_WIDTH + BOSS_RADIUS, SCREEN_HEIGHT / 2))
+
+
+def update_bosses(sim: "Simulation", dt: float) -> None:
+    """Step every boss; a volley fires from every turret still standing."""
+    bosses = sim.bosses
+    sim.entities_updated += len(bosses)
+    for boss in bosses:
+        if boss.update(dt) and boss.x < SCREEN_WIDTH:
+            for part in boss.live_turrets():
+                sim._fire_at_player(*boss.part_position(part))
+
+
+def hit_boss_part(
+    sim: "Simulation", boss: Boss, x: float, y: float, radius: float
+) -> int | None:
+    """`boss.hit_part`, counting its circle tests toward `sim.boss_tests`."""
+    tests = boss.tests
+    part = boss.hit_part(x, y, radius)
+    sim.boss_tests += boss.tests - tests
+    return part
+
+
+def check_projectile_boss_collisions(sim: "Simulation") -> None:
+    """Resolve shots inside a boss's circle against its hit tree.
+
+    Contacts are taken in projectile store order. A shot damages the
+    nearest live part it touches and hits each boss at most once
+    (piercing shots carry on through). Destroying the core destroys the
+    boss along with every part still standing.
+    """
+    contacts = sim.collision_world.contacts(LAYER_PLAYER_SHOT, LAYER_BOSS)
+    if not contacts:
+        return
+    projectiles = sim.registry.store(Projectile)
+    bosses = sim.registry.store(Boss)
+    shot_index = {id(p): i for i, p in enumerate(projectiles.items)}
+    boss_index = {id(b): i for i, b in enumerate(bosses.items)}
+    # Shots already spent on enemies this tick are gone from the store
+    pairs = sorted(
+        (shot_index[id(proj)], boss_index[id(boss)])
+        for proj, boss in contacts
+        if id(proj) in shot_index
+    )
+    dead: list[int] = []
+    for pi, bi in pairs:
+        proj = projectiles.items[pi]
+        boss = bosses.items[bi]
+        handle = bosses.owners[bi]
+        if boss.defeated or (proj.hits is not None and handle in proj.hits):
+            continue
+        part = hit_boss_part(sim, boss, proj.x, proj.y, 0.0)
+        if part is None:
+            continue
+        if boss.damage(part):
+            _boss_part_destroyed(sim, boss, part)
+            if boss.defeated:
+                _boss_killed(sim, boss)
+                dead.append(handle)
+        if proj.register_hit(handle):
+            dead.append(projectiles.owners[pi])
+
+    for handle in dead:
+        sim.registry.destroy(handle)
+
+
+def check_boss_player_collisions(sim: "Simulation") -> None:
+    """Hit a ship that touches a live part of a boss."""
+    contacts = sim.collision_world.contacts(LAYER_PLAYER, LAYER_BOSS)
+    if not contacts:
+        return
+    for player, boss in contacts:
+        if player.is_invulnerable or boss.defeated:
+            continue
+        if hit_boss_part(sim, boss, player.x, player.y, PLAYER_SHIP_SIZE) is not None:
+            sim._hit_player(player)
+
+
+def _boss_part_destroyed(sim: "Simulation", boss: Boss, part: int) -> None:
+    """Score a destroyed boss part."""
+    points = sim.scoring.register_kill(boss.tree.parts[part]["points"])
+    x, y = boss.part_position(part)
+    sim.events.append(
+        GameEvent(EVENT_BOSS_PART_DESTROYED, x, y, points, sim.scoring.combo)
+    )
+
+
+def _boss_killed(sim: "Simulation", boss: Boss) -> None:
+    """Blow up every part still standing (unscored), then the boss."""
+    for part in boss.live_parts():
+        boss.destroy_part(part)
+        x, y = boss.part_position(part)
+        sim.events.append(GameEvent(EVENT_BOSS_PART_DESTROYED, x, y))
+    sim.events.append(GameEvent(EVENT_BOSS_KILLED, boss.x, boss.y))
@@ -0,0 +1,135 @@
+"""Enemy bullets stored as parallel numpy arrays.
+
+Bullet patterns mean thousands of live bullets, so instead of one object
+per bullet the store keeps x/y/vx/vy columns plus a serial id per bullet.
+Movement, culling and the player hit test are each one vectorized pass.
+Removal compacts the arrays in order and new bullets are appended at the
+end, the same ordering rule the entity lists follow.
+"""
+
+import numpy as np
+
+from bork.constants import (
+    ENEMY_BULLET_CAPACITY,
+    ENEMY_BULLET_RADIUS,
+    SCREEN_HEIGHT,
+    SCREEN_WIDTH,
+)
+
+
+class BulletStore:
+    """Structure-of-arrays pool of enemy bullets."""
+
+    def __init__(self, capacity: int = ENEMY_BULLET_CAPACITY) -> None:
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.vx = np.zeros(capacity)
+        self.vy = np.zeros(capacity)
+        self.ids = np.zeros(capacity, dtype=np.int64)
+        self.count = 0
+        self.next_id = 0
+        self.grows = 0  # array reallocations, for benchmarks/tests
+        self.tested = 0  # bullets hit-tested, for benchmarks/tests
+
+    def __len__(self) -> int:
+        return self.count
+
+    def spawn(self, x: float, y: float, vx: float, vy: float) -> None:
+        """Append one bullet."""
+        if self.count == len(self.x):
+            self._grow(self.count + 1)
+        i = self.count
+        self.x[i] = x
+        self.y[i] = y
+        self.vx[i] = vx
+        self.vy[i] = vy
+        self.ids[i] = self.next_id
+        self.next_id += 1
+        self.count += 1
+
+    def spawn_many(
+        self, x: np.ndarray, y: np.ndarray, vx: np.ndarray, vy: np.ndarray
+    ) -> None:
+        """Append a batch of bullets (e.g. a whole pattern volley)."""
+        n = len(x)
+        if self.count + n > len(self.x):
+            self._grow(self.count + n)
+        end = self.count + n
+        self.x[self.count : end] = x
+        self.y[self.count : end] = y
+        self.vx[self.count : end] = vx
+        self.vy[self.count : end] = vy
+        self.ids[self.count : end] = np.arange(self.next_id, self.next_id + n)
+        self.next_id += n
+        self.count = end
+
+    def _grow(self, needed: int) -> None:
+        """Double capacity until `needed` bullets fit."""
+        self.grows += 1
+        capacity = max(1, len(self.x))
+        while capacity < needed:
+            capacity *= 2
+        for name in ("x", "y", "vx", "vy", "ids"):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[: self.count] = old[: self.count]
+            setattr(self, name, new)
+
+    def advance(self, dt: float) -> None:
+        """Move every bullet by its velocity."""
+        n = self.count
+        self.x[:n] += self.vx[:n] * dt
+        self.y[:n] += self.vy[:n] * dt
+
+    def cull(self) -> None:
+        """Remove bullets that have left the screen."""
+        n = self.count
+        r = ENEMY_BULLET_RADIUS
+        x = self.x[:n]
+        y = self.y[:n]
+        inside = (x >= -r) & (x <= SCREEN_WIDTH + r) & (y >= -r)
+        inside &= y <= SCREEN_HEIGHT + r
+        if not inside.all():
+            self.keep(inside)
+
+    def update(self, dt: float) -> None:
+        """Move bullets and drop those off-screen."""
+        self.advance(dt)
+        self.cull()
+
+    def hits_circle(self, cx: float, cy: float, radius: float) -> np.ndarray:
+        """Indices of bullets overlapping a circle.
+
+        A cheap box test over all bullets rejects almost everything; only
+        the survivors get the exact circle test.
+        """
+        n = self.count
+        self.tested += n
+        reach = radius + ENEMY_BULLET_RADIUS
+        dx = self.x[:n] - cx
+        dy = self.y[:n] - cy
+        candidates = np.flatnonzero((np.abs(dx) <= reach) & (np.abs(dy) <= reach))
+        if len(candidates) == 0:
+            return candidates
+        cdx = dx[candidates]
+        cdy = dy[candidates]
+        return candidates[cdx * cdx + cdy * cdy <= reach * reach]
+
+    def remove(self, indices: np.ndarray) -> None:
+        """Remove bullets by index, keeping the rest in order."""
+        if len(indices) == 0:
+            return
+        mask = np.ones(self.count, dtype=bool)
+        mask[indices] = False
+        self.keep(mask)
+
+    def keep(self, mask: np.ndarray) -> None:
+        """Compact the store down to the bullets where `mask` is True."""
+        kept = int(np.count_nonzero(mask))
+        for column in (self.x, self.y, self.vx, self.vy, self.ids):
+            column[:kept] = column[: self.count][mask]
+        self.count = kept
+
+    def clear(self) -> None:
+        """Remove all bullets."""
+        self.count = 0
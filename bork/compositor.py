@@ -0,0 +1,199 @@
+"""Offscreen world framebuffer with a single post-effect composite pass.
+
+The world framebuffer can be smaller than the window (a fixed virtual
+resolution). The composite then scales it up by the largest whole factor
+that fits, with nearest filtering, so every world pixel becomes an equal
+block. Fill cost no longer grows with the window.
+"""
+
+import argparse
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+import arcade
+from arcade.gl import NEAREST
+from arcade.gl.geometry import quad_2d_fs
+
+from bork.constants import RETRO_RESOLUTION
+
+VERTEX_SHADER = """
+#version 330
+in vec2 in_vert;
+in vec2 in_uv;
+out vec2 v_uv;
+void main() {
+    gl_Position = vec4(in_vert, 0.0, 1.0);
+    v_uv = in_uv;
+}
+"""
+
+FRAGMENT_SHADER = """
+#version 330
+uniform sampler2D u_world;
+uniform vec2 u_offset;      // shake offset in UV units
+uniform vec3 u_background;  // shown where shake exposes the edge
+uniform vec4 u_flash;       // rgb tint, a = strength
+uniform float u_vignette;   // 0 disables
+uniform sampler2D u_overlay;
+uniform bool u_has_overlay; // HUD at the virtual resolution, over the effects
+in vec2 v_uv;
+out vec4 f_color;
+void main() {
+    vec2 uv = v_uv - u_offset;
+    vec3 color = u_background;
+    if (uv.x >= 0.0 && uv.x <= 1.0 && uv.y >= 0.0 && uv.y <= 1.0) {
+        color = texture(u_world, uv).rgb;
+    }
+    color = mix(color, u_flash.rgb, u_flash.a);
+    float edge = smoothstep(0.45, 0.95, length(v_uv - 0.5) * 1.41421);
+    color *= 1.0 - u_vignette * edge;
+    if (u_has_overlay) {
+        vec4 overlay = texture(u_overlay, v_uv);  // premultiplied by blending
+        color = overlay.rgb + color * (1.0 - overlay.a);
+    }
+    f_color = vec4(color, 1.0);
+}
+"""
+
+
+def integer_viewport(
+    source: tuple[int, int], target: tuple[int, int]
+) -> tuple[int, int, int, int]:
+    """Viewport for `source` scaled by the largest whole factor in `target`.
+
+    Centred; a source larger than the target is drawn 1:1 and cropped.
+    """
+    width, height = source
+    scale = max(1, min(target[0] // width, target[1] // height))
+    width, height = width * scale, height * scale
+    return (target[0] - width) // 2, (target[1] - height) // 2, width, height
+
+
+def parse_resolution(text: str) -> tuple[int, int] | None:
+    """A --resolution value: "native" (None), "retro" or WIDTHxHEIGHT."""
+    if text == "native":
+        return None
+    if text == "retro":
+        return RETRO_RESOLUTION
+    try:
+        width, height = (int(part) for part in text.split("x"))
+    except ValueError:
+        width = height = 0
+    if width <= 0 or height <= 0:
+        raise ValueError(f"expected native, retro or WIDTHxHEIGHT, got {text!r}")
+    return width, height
+
+
+def resolution_arg(text: str) -> tuple[int, int] | None:
+    """argparse type for --resolution."""
+    try:
+        return parse_resolution(text)
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(str(error)) from None
+
+
+def add_resolution_arguments(parser: argparse.ArgumentParser) -> None:
+    """The --resolution and --virtual-hud options."""
+    parser.add_argument(
+        "--resolution",
+        type=resolution_arg,
+        default=None,
+        metavar="native|retro|WxH",
+        help="draw the world at this size and scale it up by whole pixels",
+    )
+    parser.add_argument(
+        "--virtual-hud",
+        action="store_true",
+        help="draw the HUD at the --resolution size too",
+    )
+
+
+class WorldCompositor:
+    """Renders the world offscreen, then composites it with post effects.
+
+    Shake, flash and vignette are uniforms of one fullscreen pass, so the
+    world pass never touches the projection and no overlay quads are drawn.
+    With `overlay` the HUD gets a transparent framebuffer of the same size,
+    blended over the effects in that pass (so it is neither shaken nor
+    flashed).
+    """
+
+    def __init__(
+        self,
+        ctx: arcade.ArcadeContext,
+        size: tuple[int, int],
+        background: tuple[int, int, int],
+        overlay: bool = False,
+    ) -> None:
+        self.ctx = ctx
+        self.size = size
+        self.background = background
+        self.texture = ctx.texture(size, components=4, filter=(NEAREST, NEAREST))
+        self.fbo = ctx.framebuffer(color_attachments=[self.texture])
+        self.overlay_texture = None
+        self.overlay_fbo = None
+        if overlay:
+            self.overlay_texture = ctx.texture(
+                size, components=4, filter=(NEAREST, NEAREST)
+            )
+            self.overlay_fbo = ctx.framebuffer(color_attachments=[self.overlay_texture])
+        self.program = ctx.program(
+            vertex_shader=VERTEX_SHADER, fragment_shader=FRAGMENT_SHADER
+        )
+        self.program["u_world"] = 0
+        self.program["u_overlay"] = 1
+        self.program["u_has_overlay"] = overlay
+        self.quad = quad_2d_fs()
+        self.shake: tuple[float, float] = (0.0, 0.0)  # pixels
+        self.flash_color: tuple[int, int, int] = (255, 255, 255)
+        self.flash_alpha: int = 0  # 0-255
+        self.vignette: float = 0.0
+
+    @contextmanager
+    def world_pass(self) -> Iterator[None]:
+        """Clear the world framebuffer and bind it for the enclosed draws."""
+        self.fbo.clear(color=self.background)
+        with self.fbo.activate():
+            yield
+
+    @contextmanager
+    def overlay_pass(self) -> Iterator[None]:
+        """Clear the overlay framebuffer and bind it for the enclosed draws."""
+        self.overlay_fbo.clear(color=(0, 0, 0, 0))
+        with self.overlay_fbo.activate():
+            yield
+
+    def set_shake(self, x: float, y: float) -> None:
+        """Set the shake offset in framebuffer pixels, snapped to whole pixels."""
+        self.shake = (round(x), round(y))
+
+    def set_flash(self, color: tuple[int, int, int], alpha: int) -> None:
+        """Set the flash tint for this frame (alpha 0 disables it)."""
+        self.flash_color = color
+        self.flash_alpha = alpha
+
+    def draw(self) -> None:
+        """Composite the world texture onto the active framebuffer.
+
+        It fills the largest whole multiple of the world size that fits,
+        centred; any border is cleared to the background.
+        """
+        target = self.ctx.active_framebuffer
+        full = target.viewport
+        viewport = integer_viewport(self.size, full[2:])
+        if viewport != (0, 0, *full[2:]):
+            target.clear(color=self.background)
+        w, h = self.size
+        self.program["u_offset"] = (self.shake[0] / w, self.shake[1] / h)
+        self.program["u_background"] = tuple(c / 255 for c in self.background)
+        self.program["u_flash"] = (
+            *(c / 255 for c in self.flash_color),
+            self.flash_alpha / 255,
+        )
+        self.program["u_vignette"] = self.vignette
+        self.texture.use(0)
+        if self.overlay_texture is not None:
+            self.overlay_texture.use(1)
+        target.viewport = viewport
+        self.quad.render(self.program)
+        target.viewport = full
@@ -3,6 +3,8 @@ SCREEN_WIDTH = 960
 SCREEN_HEIGHT = 540
 SCREEN_TITLE = "B.O.R.K."
 TARGET_FPS = 60
+# --resolution retro: world pixels drawn, scaled up by whole pixels
+RETRO_RESOLUTION = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
 
 # Player
 PLAYER_ACCELERATION = 600.0  # pixels/sec^2
@@ -11,6 +13,7 @@ PLAYER_MAX_SPEED = 350.0  # pixels/sec
 PLAYER_SHIP_SIZE = 20  # half-width of the ship triangle
 PLAYER_START_X = 100
 PLAYER_START_Y = SCREEN_HEIGHT // 2
+COOP_PLAYER_SPACING = 80.0  # y gap between co-op ships at the start
 
 # Projectiles
 PROJECTILE_SPEED = 700.0  # pixels/sec
@@ -18,6 +21,66 @@ PROJECTILE_LENGTH = 16
 PROJECTILE_WIDTH = 3
 SHOOT_COOLDOWN = 0.18  # seconds between shots
 
+# Weapons: one projectile per angle in a volley (degrees, 0 = straight ahead).
+# pierce = extra enemies a shot passes through; wave_* adds a sine wobble.
+WEAPONS: dict[str, dict] = {
+    "blaster": {
+        "label": "BLASTER",
+        "angles": [0.0],
+        "speed": PROJECTILE_SPEED,
+        "cooldown": SHOOT_COOLDOWN,
+        "pierce": 0,
+        "wave_amplitude": 0.0,
+        "wave_frequency": 0.0,
+    },
+    "spread3": {
+        "label": "SPREAD x3",
+        "angles": [-10.0, 0.0, 10.0],
+        "speed": 650.0,
+        "cooldown": 0.24,
+        "pierce": 0,
+        "wave_amplitude": 0.0,
+        "wave_frequency": 0.0,
+    },
+    "spread5": {
+        "label": "SPREAD x5",
+        "angles": [-20.0, -10.0, 0.0, 10.0, 20.0],
+        "speed": 600.0,
+        "cooldown": 0.3,
+        "pierce": 0,
+        "wave_amplitude": 0.0,
+        "wave_frequency": 0.0,
+    },
+    "piercer": {
+        "label": "PIERCE",
+        "angles": [0.0],
+        "speed": 900.0,
+        "cooldown": 0.3,
+        "pierce": 3,
+        "wave_amplitude": 0.0,
+        "wave_frequency": 0.0,
+    },
+    "rapid": {
+        "label": "RAPID",
+        "angles": [0.0],
+        "speed": 800.0,
+        "cooldown": 0.07,
+        "pierce": 0,
+        "wave_amplitude": 0.0,
+        "wave_frequency": 0.0,
+    },
+    "wave": {
+        "label": "WAVE",
+        "angles": [0.0],
+        "speed": 550.0,
+        "cooldown": 0.16,
+        "pierce": 0,
+        "wave_amplitude": 24.0,  # pixels
+        "wave_frequency": 3.0,  # oscillations per second
+    },
+}
+DEFAULT_WEAPON = "blaster"
+
 # Starfield
 STAR_LAYER_COUNT = 2
 STAR_COUNTS = [60, 30]  # back layer (dim/slow), front layer (bright/fast)
@@ -30,11 +93,84 @@ ENEMY_SPEED = 150.0  # pixels/sec (horizontal, leftward)
 ENEMY_SIZE = 15  # half-width for collision and drawing
 ENEMY_COLOR = (255, 60, 60)  # distinct red
 
+# Enemy bullets
+ENEMY_FIRE_DELAY = 1.2  # seconds after spawning before an enemy first fires
+ENEMY_FIRE_INTERVAL = 2.5  # seconds between shots
+ENEMY_BULLET_SPEED = 220.0  # pixels/sec, aimed at the player when fired
+ENEMY_BULLET_RADIUS = 4.0
+ENEMY_BULLET_COLOR = (255, 170, 60)  # orange, distinct from enemy red
+ENEMY_BULLET_CAPACITY = 1024  # initial array size (doubles when full)
+PLAYER_BULLET_HITBOX = 6.0  # player radius vs. bullets (smaller than the ship)
+
+# Entity-component store: low bits of a handle index a slot, the rest
+# count how often that slot has been reused
+ECS_INDEX_BITS = 20
+
+# Spatial index (homing and tracking queries)
+SPATIAL_CELL_SIZE = 64.0  # pixels per grid cell, a few enemy widths
+
+# Collision layers (bit flags). A body touches bodies whose layer is in its
+# mask (or whose mask includes its layer).
+LAYER_PLAYER = 1
+LAYER_PLAYER_SHOT = 2
+LAYER_ENEMY = 4
+LAYER_POWERUP = 8
+LAYER_BOSS = 16
+
+# Boss: a hull of destructible parts in boss-local coordinates (+x right,
+# +y up), grouped for the hit-zone tree. Destroying the core kills the boss;
+# destroyed turrets stop firing. Sway is how far a part bobs (px) as the
+# boss animates.
+BOSS_PART_KINDS = {
+    "core": {"radius": 22, "hp": 40, "points": 2000, "sway": 0.0},
+    "armor": {"radius": 13, "hp": 6, "points": 50, "sway": 0.0},
+    "hull": {"radius": 16, "hp": 12, "points": 100, "sway": 2.0},
+    "turret": {"radius": 11, "hp": 10, "points": 250, "sway": 6.0},
+}
+# Parts are grouped by where they sit (not by kind), so each group's
+# bounding circle stays tight
+BOSS_GROUPS = {  # group -> (part kind, x, y) per part
+    "core": [("core", 10, 0)],
+    "nose": [("armor", -42, 0), ("armor", -40, 26), ("armor", -40, -26)],
+    "upper_wing": [("armor", -34, 52), ("hull", -6, 44), ("turret", 4, 76)],
+    "lower_wing": [("armor", -34, -52), ("hull", -6, -44), ("turret", 4, -76)],
+    "upper_spine": [
+        ("hull", 24, 48),
+        ("hull", 54, 40),
+        ("hull", 78, 24),
+        ("turret", 36, 80),
+        ("turret", 68, 66),
+    ],
+    "lower_spine": [
+        ("hull", 24, -48),
+        ("hull", 54, -40),
+        ("hull", 78, -24),
+        ("turret", 36, -80),
+        ("turret", 68, -66),
+    ],
+}
+BOSS_COLORS = {
+    "core": (255, 220, 100),
+    "armor": (120, 140, 160),
+    "hull": (150, 60, 90),
+    "turret": (255, 60, 60),
+}
+BOSS_EVERY_CYCLES = 2  # a boss after every this many rounds of the waves
+BOSS_SPEED = 60.0  # pixels/sec while entering
+BOSS_STOP_X = 800.0  # where the boss stops and starts to bob
+BOSS_BOB_AMPLITUDE = 90.0  # pixels
+BOSS_BOB_FREQUENCY = 0.15  # oscillations per second
+BOSS_SWAY_FREQUENCY = 1.5  # part sway oscillations per second
+BOSS_FIRE_DELAY = 2.0  # seconds after spawning before the turrets first fire
+BOSS_FIRE_INTERVAL = 1.6  # seconds between turret volleys
+
 # Waves
 WAVE_START_DELAY = 3.0  # seconds before first wave
 WAVE_PAUSE = 2.0  # seconds between waves
 ENEMIES_PER_WAVE = 5
 ENEMY_SPAWN_SPACING = 0.3  # seconds between each enemy in a wave
+SPAWN_BUDGET = 4  # queued enemies activated per tick at most
+SPAWN_PREWARM_PER_TICK = 2  # next-wave enemies built per tick during a pause
 
 # Sine wave pattern
 SINE_AMPLITUDE = 80.0  # pixels
@@ -50,6 +186,18 @@ POWERUP_SPEED = 100.0  # pixels/sec (slower than enemies)
 POWERUP_SIZE = 18  # radius
 POWERUP_COLOR = (255, 220, 0)  # yellow
 POWERUP_TEXT_COLOR = (0, 0, 0)  # black letter
+POWERUP_FONT_SIZE = 14
+
+# Powerup kinds: a speed boost or a weapon from WEAPONS, with their letters
+POWERUP_KINDS = ["speed", "spread3", "spread5", "piercer", "rapid", "wave"]
+POWERUP_LABELS = {
+    "speed": "S",
+    "spread3": "3",
+    "spread5": "5",
+    "piercer": "P",
+    "rapid": "R",
+    "wave": "W",
+}
 
 # Powerup spawn
 POWERUP_SPAWN_DELAY = 1.0  # seconds after wave 3 completes
@@ -65,6 +213,17 @@ POWERUP_PULSE_AMOUNT = 0.15  # scale varies ±15%
 # Particles
 PARTICLE_POOL_SIZE = 500  # max concurrent particles
 
+# Particle priority classes (higher classes survive pool pressure)
+PARTICLE_PRIORITY_LOW = 0  # routine enemy pops
+PARTICLE_PRIORITY_NORMAL = 1  # pickups and general effects
+PARTICLE_PRIORITY_HIGH = 2  # player death and other set pieces
+PARTICLE_PRIORITY_BUDGET = {  # max share of the pool each class may occupy
+    PARTICLE_PRIORITY_LOW: 0.5,
+    PARTICLE_PRIORITY_NORMAL: 1.0,
+    PARTICLE_PRIORITY_HIGH: 1.0,
+}
+PARTICLE_THIN_THRESHOLD = 0.6  # pool fill at which low-priority bursts thin out
+
 # Enemy explosion
 ENEMY_EXPLOSION_COUNT = (12, 20)  # min, max particles
 ENEMY_EXPLOSION_SPEED = (100, 300)  # px/sec
@@ -90,6 +249,7 @@ POWERUP_BURST_COLOR_END = (255, 255, 200)  # fade to light yellow
 SCREEN_FLASH_DURATION = 0.1  # full brightness seconds
 SCREEN_FLASH_FADE = 0.2  # fade-out seconds
 SCREEN_FLASH_COLOR = (255, 255, 255)  # white
+SCREEN_FLASH_PEAK_ALPHA = 180  # strong but not fully opaque
 
 # Screen shake
 SCREEN_SHAKE_INTENSITY = 6.0  # pixels
@@ -129,7 +289,7 @@ HUD_SCORE_FONT_SIZE = 24
 HUD_LABEL_FONT_SIZE = 12
 HUD_MULTI_FONT_SIZE = 16
 HUD_COMBO_FONT_SIZE = 14
-HUD_LIVES_FONT_SIZE = 16
+HUD_LIVES_ICON_SIZE = 12  # px, chevron per remaining life
 HUD_POWERUP_FONT_SIZE = 11
 HUD_ZONE_FONT_SIZE = 12
 HUD_MILESTONE_FONT_SIZE = 28
@@ -143,12 +303,187 @@ SCORE_POPUP_DURATION = 0.5  # seconds
 SCORE_POPUP_RISE_SPEED = 60.0  # pixels per second upward
 SCORE_POPUP_FONT_SIZE = 14
 
+# Quality governor (tiers ordered best first)
+QUALITY_TIERS = [
+    {
+        "name": "HIGH",
+        "star_density": 1.0,  # fraction of STAR_COUNTS per layer
+        "particle_multiplier": 1.0,  # scales explosion particle counts
+        "score_popups": True,  # floating "+100" text at kills
+        "text_effects": True,  # HUD multiplier pulse and milestone text
+        "shake": 1.0,  # screen shake intensity multiplier
+        "flash": 1.0,  # screen flash alpha multiplier
+    },
+    {
+        "name": "MEDIUM",
+        "star_density": 0.6,
+        "particle_multiplier": 0.6,
+        "score_popups": True,
+        "text_effects": True,
+        "shake": 0.6,
+        "flash": 0.6,
+    },
+    {
+        "name": "LOW",
+        "star_density": 0.35,
+        "particle_multiplier": 0.3,
+        "score_popups": False,
+        "text_effects": False,
+        "shake": 0.0,
+        "flash": 0.4,
+    },
+]
+QUALITY_WINDOW_FRAMES = 90  # rolling window of frame times
+QUALITY_FRAME_BUDGET = 1.0 / TARGET_FPS  # seconds of work per frame
+QUALITY_DOWNGRADE_RATIO = 0.9  # step down when average exceeds this * budget
+QUALITY_UPGRADE_RATIO = 0.5  # step up when average stays below this * budget
+QUALITY_UPGRADE_HOLD = 5.0  # seconds of headroom required before stepping up
+QUALITY_CHANGE_COOLDOWN = 2.0  # seconds after a tier change before re-evaluating
+
+# Rewind (practice mode)
+REWIND_KEYFRAME_INTERVAL = 60  # ticks between full snapshots
+REWIND_MAX_BYTES = 8 * 1024 * 1024  # memory ceiling for stored history
+REWIND_STEP_TICKS = 3 * TARGET_FPS  # history rewound per Backspace press
+
+# Debug overlay
+DEBUG_OVERLAY_FONT_SIZE = 10
+DEBUG_OVERLAY_COLOR = (180, 255, 180)
+
 # Game state
 STATE_PLAYING = "playing"
 STATE_GAME_OVER = "game_over"
 
+# Input actions (the simulation reads these, never raw key codes)
+ACTION_UP = "up"
+ACTION_DOWN = "down"
+ACTION_LEFT = "left"
+ACTION_RIGHT = "right"
+ACTION_FIRE = "fire"
+
+# Autopilot (soak runs, benchmarks)
+AUTOPILOT_DEADZONE = 8.0  # px of vertical misalignment before steering
+AUTOPILOT_WEAVE_TICKS = 45  # ticks per up/down leg when no target is ahead
+
+# Soak test
+SOAK_SAMPLE_INTERVAL = 60.0  # seconds of wall time between samples
+SOAK_RESTART_DELAY = 2.0  # seconds the game-over screen shows before restarting
+SOAK_WARMUP = 600.0  # seconds before samples count toward growth flags
+SOAK_TOP_ALLOCATORS = 10  # tracemalloc lines listed per sample
+SOAK_TRACEMALLOC_FRAMES = 1  # traceback depth recorded per allocation
+SOAK_GROWTH_WINDOW = 6  # trailing samples checked for monotonic growth
+SOAK_GROWTH_MIN = 0.10  # minimum relative growth across the window to flag
+
+# Sound effects: file, volume, concurrent voice cap, priority and what a
+# trigger does when the sound's own voices are all busy ("oldest" steals
+# the oldest one, "drop" keeps the playing voices). When SOUND_MAX_VOICES
+# are busy overall, a trigger may only steal from a lower priority.
+SOUND_MAX_VOICES = 8
+SOUNDS = {
+    "shot": {
+        "file": ":resources:sounds/laser2.wav",
+        "volume": 0.25,
+        "voices": 3,
+        "priority": 0,
+        "steal": "oldest",
+    },
+    "enemy_explosion": {
+        "file": ":resources:sounds/explosion2.wav",
+        "volume": 0.5,
+        "voices": 4,
+        "priority": 1,
+        "steal": "oldest",
+    },
+    "powerup": {
+        "file": ":resources:sounds/upgrade1.wav",
+        "volume": 0.6,
+        "voices": 1,
+        "priority": 2,
+        "steal": "drop",
+    },
+    "player_hit": {
+        "file": ":resources:sounds/hurt3.wav",
+        "volume": 0.8,
+        "voices": 1,
+        "priority": 3,
+        "steal": "drop",
+    },
+}
+SOUND_MERGE_GAIN = 0.15  # extra volume per duplicate trigger merged in a frame
+SOUND_MAX_VOLUME = 1.0
+SOUND_NULL_DURATION = 0.5  # seconds a silent (null backend) voice lasts
+
+# Music (chiptune synthesizer)
+MUSIC_SAMPLE_RATE = 22050
+MUSIC_LOOKAHEAD = 4.0  # seconds of audio kept rendered ahead of playback
+MUSIC_VOLUME = 0.35
+MUSIC_CACHE_SIZE = 32  # rendered patterns kept, keyed by content hash
+MUSIC_RELEASE = 0.004  # seconds of fade at the end of each note (no clicks)
+# Channel waveforms with gain and note decay per second (pulse channels add
+# a duty cycle; noise hits decay by token: "x" closed hat, "o" snare)
+MUSIC_VOICES = {
+    "pulse1": {"wave": "pulse", "duty": 0.25, "gain": 0.30, "decay": 1.5},
+    "pulse2": {"wave": "pulse", "duty": 0.125, "gain": 0.18, "decay": 6.0},
+    "triangle": {"wave": "triangle", "gain": 0.50, "decay": 0.0},
+    "noise": {"wave": "noise", "gain": 0.22},
+}
+MUSIC_NOISE_HITS = {"x": 30.0, "o": 8.0}
+
+# Shape atlas: every sprite shape rasterized once into one image, cached on
+# disk under a hash of the constants it depends on
+ATLAS_CACHE_DIR = "~/.cache/bork"  # the BORK_CACHE_DIR environment variable wins
+ATLAS_WIDTH = 256  # px; shelves are added downward as needed
+ATLAS_PADDING = 2  # px of transparent border around each region
+ATLAS_SUPERSAMPLE = 4  # shapes are drawn this much larger, then downsampled
+ATLAS_TINT_SIZE = 32  # px; white shapes tinted per sprite (particles, stars)
+
+# High scores: append-only record log plus an index of the top scores and
+# per-player bests
+HIGH_SCORE_DIR = "~/.local/share/bork"  # the BORK_DATA_DIR environment variable wins
+HIGH_SCORE_LOG = "scores.log"
+HIGH_SCORE_INDEX = "scores.idx"
+HIGH_SCORE_TOP_N = 10
+
+# Asset loading: decode steps run on worker threads, finish steps (GPU
+# uploads) on the main thread within a per-frame budget
+ASSET_WORKERS = 4
+ASSET_FRAME_BUDGET = 0.004  # seconds of finish work per loading frame
+LOADING_BAR_WIDTH = 320  # px
+LOADING_BAR_HEIGHT = 6  # px
+
+# Netplay: two-player co-op over UDP with rollback. Both peers simulate at
+# TARGET_FPS with the same seed; local input takes effect after the input
+# delay and the remote player's input is predicted until it arrives
+NETPLAY_PORT = 7420  # player 1 listens here, player 2 on the next port
+NETPLAY_INPUT_DELAY = 2  # frames
+NETPLAY_MAX_ROLLBACK = 8  # frames simulated past the last confirmed input
+NETPLAY_CHECKSUM_INTERVAL = 30  # frames between desync checks
+NETPLAY_MAX_INPUTS = 64  # unacknowledged inputs resent per packet
+NETPLAY_HELLO_INTERVAL = 0.1  # seconds between handshake packets
+NETPLAY_TIMEOUT = 10.0  # seconds without hearing from the peer
+
+# Spectator stream: quantized keyframes plus per-tick deltas to local
+# spectator clients over TCP
+SPECTATOR_PORT = 7430
+SPECTATOR_KEYFRAME_INTERVAL = 60  # ticks between full frames
+SPECTATOR_QUANTUM = 0.25  # px per position step on the wire
+SPECTATOR_CLIENT_BUFFER = 256 * 1024  # bytes queued per client before a resync
+SPECTATOR_INTERP_DELAY = 2  # ticks a client draws behind the newest frame
+SPECTATOR_HISTORY = 16  # decoded ticks a client keeps for interpolation
+SPECTATOR_FRAME_BUDGET = 4096  # bytes per tick the stream must stay under
+SPECTATOR_ENCODE_BUDGET = 0.001  # seconds per tick to encode a frame
+
+# Input latency and frame pacing
+LATENCY_SAMPLES = 240  # recent key presses kept for the percentiles
+PACING_MODES = ("scheduled", "late")  # arcade's clock, or wait then sample
+PACING_WAITS = ("sleep", "hybrid", "spin")  # how the late pacer waits
+PACING_SPIN_MARGIN = 0.002  # seconds before a deadline a hybrid wait spins
+PACING_SAFETY = 0.001  # seconds of slack on top of the work estimate
+PACING_WORK_WINDOW = 30  # recent frames whose longest work time is the estimate
+PACING_POLL_RATE = 1 / 1000  # arcade update rate while the pacer waits itself
+
 # Colors
 COLOR_BACKGROUND = (5, 5, 15)
 COLOR_PLAYER = (0, 200, 255)
+COLOR_PLAYER_2 = (255, 150, 40)
 COLOR_LASER = (255, 80, 80)
 COLOR_STAR = (255, 255, 255)
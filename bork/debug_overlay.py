@@ -0,0 +1,103 @@
+"""Toggleable debug overlay showing frame timing and engine stats."""
+
+from typing import TYPE_CHECKING
+
+import arcade
+
+from bork.constants import (
+    DEBUG_OVERLAY_COLOR,
+    DEBUG_OVERLAY_FONT_SIZE,
+    HUD_MARGIN,
+    TARGET_FPS,
+)
+
+if TYPE_CHECKING:
+    from bork.game import BorkGame
+
+
+class DebugOverlay:
+    """Text overlay in the bottom-left corner, hidden by default."""
+
+    def __init__(self) -> None:
+        self.visible: bool = False
+        self.fps: float = 0.0
+
+    def toggle(self) -> None:
+        """Show or hide the overlay."""
+        self.visible = not self.visible
+
+    def update(self, dt: float) -> None:
+        """Smooth the FPS readout."""
+        if dt > 0:
+            self.fps += (1.0 / dt - self.fps) * 0.1
+
+    def draw(self, lines: list[str]) -> None:
+        """Draw an FPS line followed by the given stat lines."""
+        if not self.visible:
+            return
+        y = HUD_MARGIN
+        for line in reversed([f"FPS {self.fps:5.1f}", *lines]):
+            arcade.draw_text(
+                line,
+                HUD_MARGIN,
+                y,
+                DEBUG_OVERLAY_COLOR,
+                font_size=DEBUG_OVERLAY_FONT_SIZE,
+                anchor_x="left",
+                anchor_y="bottom",
+            )
+            y += DEBUG_OVERLAY_FONT_SIZE + 6
+
+
+def debug_lines(game: "BorkGame") -> list[str]:
+    """Build the stat lines shown in the debug overlay for a game."""
+    dropped = sum(game.particle_system.dropped.values()) + sum(
+        game.particle_system.thinned.values()
+    )
+    avg_ms = game.quality.average * 1000
+    rewind_s = game.rewind.frames / TARGET_FPS
+    atlas_source = "cached" if game.atlas.from_cache else "generated"
+    sound = game.sound
+    merged = sum(sound.merged.values())
+    cut = sum(sound.stolen.values())
+    lost = sum(sound.dropped.values())
+    lines = [
+        f"Quality {game.quality.tier['name']} ({avg_ms:.1f} ms avg)",
+        f"Particles {game.particle_system.count} (dropped {dropped})",
+        f"Rewind {rewind_s:.1f}s ({game.rewind.size // 1024} KB)",
+        f"Atlas {len(game.atlas.regions)} shapes ({atlas_source})",
+        f"Voices {len(sound.voices)} (merged {merged} cut {cut} dropped {lost})",
+    ]
+    lines.append(game.timing.debug_line())
+    spawns = game.sim.spawn_queue.stats
+    lines.append(
+        f"Spawns worst {spawns.worst_count}/tick {spawns.worst_time * 1000:.2f} ms"
+        f" (queued {len(game.sim.spawn_queue.pending)}"
+        f" peak {spawns.peak_pending})"
+    )
+    if game.netplay is not None:
+        lines.append(game.netplay.debug_line())
+    if game.spectators is not None:
+        lines.append(game.spectators.debug_line())
+    music = game.music
+    cache = music.cache
+    lines.append(
+        f"Music {music.buffered_seconds:.1f}s ahead (synth {cache.misses}"
+        f" cached {cache.hits} underruns {music.underruns})"
+    )
+    first_frame = game.timeline.now() if game.first_frame is None else game.first_frame
+    lines.append(
+        f"Startup first frame {first_frame * 1000:.0f} ms,"
+        f" loaded {game.loader.loaded_at * 1000:.0f} ms"
+        f" ({game.loader.frames} frames)"
+    )
+    if game.render_stats.installed:
+        total = game.render_stats.totals()
+        lines.append(
+            f"Draws {total.draw_calls}  verts {total.vertices}"
+            f"  blend {total.blend_changes}  proj {total.projection_changes}"
+        )
+        for name, section in game.render_stats.last_frame.items():
+            if section.draw_calls:
+                lines.append(f"  {name:<11} {section.draw_calls:4d} draws")
+    return lines
@@ -0,0 +1,190 @@
+"""Minimal entity-component store with generational handles.
+
+An entity is only a handle: a slot index in the low bits and that slot's
+generation above them. Destroying an entity bumps its slot's generation,
+so handles kept elsewhere (piercing hit sets, targets) stop resolving
+instead of pointing at whatever reuses the slot.
+
+Each component type lives in a ComponentStore: a dense list of components,
+a parallel list of owner handles and a slot -> position map. Removal moves
+the last component into the hole, so it is O(1) and the dense lists never
+have gaps. Iteration order is not spawn order, but it is deterministic.
+"""
+
+from collections.abc import Iterator
+from typing import Generic, TypeVar
+
+from bork.constants import ECS_INDEX_BITS
+
+T = TypeVar("T")
+
+INDEX_MASK = (1 << ECS_INDEX_BITS) - 1
+
+
+def handle_index(handle: int) -> int:
+    """Slot index of a handle."""
+    return handle & INDEX_MASK
+
+
+def handle_generation(handle: int) -> int:
+    """Generation of a handle."""
+    return handle >> ECS_INDEX_BITS
+
+
+class ComponentStore(Generic[T]):
+    """Dense storage for one component type, with swap-remove deletion."""
+
+    def __init__(self) -> None:
+        self.items: list[T] = []  # dense components; iterate this
+        self.owners: list[int] = []  # handle owning items[i]
+        self.version = 0  # bumped on every structural change
+        self._position: dict[int, int] = {}  # slot index -> dense position
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.items)
+
+    def __contains__(self, handle: int) -> bool:
+        position = self._position.get(handle & INDEX_MASK)
+        return position is not None and self.owners[position] == handle
+
+    def add(self, handle: int, component: T) -> None:
+        """Attach a component to an entity that does not have one yet."""
+        slot = handle & INDEX_MASK
+        if slot in self._position:
+            raise ValueError(f"entity {handle} already has this component")
+        self._position[slot] = len(self.items)
+        self.items.append(component)
+        self.owners.append(handle)
+        self.version += 1
+
+    def extend(self, handles: list[int], components: list[T]) -> None:
+        """Attach one component to each of several new entities at once."""
+        for handle in handles:
+            if handle & INDEX_MASK in self._position:
+                raise ValueError(f"entity {handle} already has this component")
+        start = len(self.items)
+        for offset, handle in enumerate(handles):
+            self._position[handle & INDEX_MASK] = start + offset
+        self.items.extend(components)
+        self.owners.extend(handles)
+        self.version += 1
+
+    def get(self, handle: int) -> T | None:
+        """The entity's component, or None if it has none (or is stale)."""
+        position = self._position.get(handle & INDEX_MASK)
+        if position is None or self.owners[position] != handle:
+            return None
+        return self.items[position]
+
+    def remove(self, handle: int) -> T | None:
+        """Detach and return the entity's component by swapping in the last one."""
+        slot = handle & INDEX_MASK
+        position = self._position.get(slot)
+        if position is None or self.owners[position] != handle:
+            return None
+        component = self.items[position]
+        last_item = self.items.pop()
+        last_owner = self.owners.pop()
+        del self._position[slot]
+        if position < len(self.items):
+            self.items[position] = last_item
+            self.owners[position] = last_owner
+            self._position[last_owner & INDEX_MASK] = position
+        self.version += 1
+        return component
+
+    def reset(self, items: list[T], owners: list[int]) -> None:
+        """Replace the contents wholesale (restores and rewind replay)."""
+        self.items = items
+        self.owners = owners
+        self._position = {h & INDEX_MASK: i for i, h in enumerate(owners)}
+        self.version += 1
+
+
+class Registry:
+    """Allocates generational entity handles and owns the component stores."""
+
+    def __init__(self) -> None:
+        self.generations: list[int] = []  # per slot
+        self.free: list[int] = []  # reusable slots, last freed first
+        self.stores: dict[type, ComponentStore] = {}
+        self.version = 0  # bumped on every create/destroy
+        self.created = 0  # handles allocated, for benchmarks/tests
+
+    def create(self) -> int:
+        """Allocate a new entity handle."""
+        if self.free:
+            slot = self.free.pop()
+        else:
+            slot = len(self.generations)
+            if slot > INDEX_MASK:
+                raise OverflowError("out of entity slots")
+            self.generations.append(0)
+        self.version += 1
+        self.created += 1
+        return self.generations[slot] << ECS_INDEX_BITS | slot
+
+    def alive(self, handle: int) -> bool:
+        """True while the entity has not been destroyed."""
+        slot = handle & INDEX_MASK
+        return (
+            slot < len(self.generations)
+            and self.generations[slot] == handle >> ECS_INDEX_BITS
+        )
+
+    def destroy(self, handle: int) -> bool:
+        """Remove an entity and all its components. False if already gone."""
+        slot = handle & INDEX_MASK
+        if (
+            slot >= len(self.generations)
+            or self.generations[slot] != handle >> ECS_INDEX_BITS
+        ):
+            return False
+        for store in self.stores.values():
+            store.remove(handle)
+        self.generations[slot] += 1
+        self.free.append(slot)
+        self.version += 1
+        return True
+
+    def store(self, component_type: type[T]) -> ComponentStore[T]:
+        """The store for a component type, created on first use."""
+        store = self.stores.get(component_type)
+        if store is None:
+            store = self.stores[component_type] = ComponentStore()
+        return store
+
+    def spawn(self, *components: object) -> int:
+        """Create an entity with the given components (one per type)."""
+        handle = self.create()
+        for component in components:
+            self.store(type(component)).add(handle, component)
+        return handle
+
+    def spawn_many(self, components: list[T]) -> list[int]:
+        """Create one entity per component, all of one type, in a single extend."""
+        handles = [self.create() for _ in components]
+        if components:
+            self.store(type(components[0])).extend(handles, components)
+        return handles
+
+    def get(self, handle: int, component_type: type[T]) -> T | None:
+        """Shortcut for store(component_type).get(handle)."""
+        store = self.stores.get(component_type)
+        return None if store is None else store.get(handle)
+
+    def view(self, *component_types: type) -> Iterator[tuple]:
+        """Yield (handle, component, ...) for entities having all the types.
+
+        Iterates the smallest store and looks the others up, so a view over
+        a rare component stays cheap however many entities exist.
+        """
+        stores = [self.store(t) for t in component_types]
+        driver = min(stores, key=len)
+        for handle in list(driver.owners):
+            components = tuple(s.get(handle) for s in stores)
+            if all(c is not None for c in components):
+                yield (handle, *components)
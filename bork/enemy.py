@@ -2,10 +2,9 @@
 
 import math
 
-import arcade
-
 from bork.constants import (
-    ENEMY_COLOR,
+    ENEMY_FIRE_DELAY,
+    ENEMY_FIRE_INTERVAL,
     ENEMY_SIZE,
     ENEMY_SPEED,
     SINE_AMPLITUDE,
@@ -22,27 +21,25 @@ class Enemy:
         self.pattern = pattern  # "straight" or "sine"
         self.base_y = base_y  # center Y for sine oscillation
         self.time_alive = 0.0
+        self.fire_timer = ENEMY_FIRE_DELAY
+
+    def update(self, dt: float) -> bool:
+        """Move leftward (sine oscillation if pattern is 'sine').
 
-    def update(self, dt: float) -> None:
-        """Move leftward. Apply sine oscillation if pattern is 'sine'."""
+        Returns True on ticks where the enemy's fire timer comes due.
+        """
         self.x -= ENEMY_SPEED * dt
         self.time_alive += dt
         if self.pattern == "sine":
             self.y = self.base_y + SINE_AMPLITUDE * math.sin(
                 SINE_FREQUENCY * self.time_alive * 2 * math.pi
             )
+        self.fire_timer -= dt
+        if self.fire_timer <= 0:
+            self.fire_timer += ENEMY_FIRE_INTERVAL
+            return True
+        return False
 
     def is_off_screen(self) -> bool:
         """Return True if past the left edge of the screen."""
         return self.x < -ENEMY_SIZE
-
-    def draw(self) -> None:
-        """Draw the enemy as a diamond shape."""
-        s = ENEMY_SIZE
-        points = [
-            (self.x - s, self.y),  # left
-            (self.x, self.y + s),  # top
-            (self.x + s, self.y),  # right
-            (self.x, self.y - s),  # bottom
-        ]
-        arcade.draw_polygon_filled(points, ENEMY_COLOR)
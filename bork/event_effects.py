@@ -0,0 +1,88 @@
+"""Presentation reactions to simulation events.
+
+Each GameEvent gets its sound, particles, score popup, combo milestone,
+flash or shake, scaled by the game's current quality tier.
+"""
+
+from typing import TYPE_CHECKING
+
+from bork.constants import (
+    COMBO_MILESTONES,
+    POWERUP_COLOR,
+    SCREEN_FLASH_COLOR,
+    SCREEN_FLASH_DURATION,
+    SCREEN_FLASH_FADE,
+    SCREEN_FLASH_PEAK_ALPHA,
+    SCREEN_SHAKE_DURATION,
+    SCREEN_SHAKE_INTENSITY,
+)
+from bork.events import (
+    EVENT_BOSS_KILLED,
+    EVENT_BOSS_PART_DESTROYED,
+    EVENT_ENEMY_KILLED,
+    EVENT_PLAYER_FIRED,
+    EVENT_PLAYER_HIT,
+    EVENT_POWERUP_COLLECTED,
+    GameEvent,
+)
+from bork.explosions import (
+    create_enemy_explosion,
+    create_player_explosion,
+    create_powerup_burst,
+)
+from bork.screen_effects import ScreenFlash, ScreenShake
+
+if TYPE_CHECKING:
+    from bork.game import BorkGame
+
+
+def play_event_effects(game: "BorkGame", event: GameEvent) -> None:
+    """Spawn the cosmetic effects for one simulation event.
+
+    Game over is left to the caller, which records the score.
+    """
+    tier = game.quality.tier
+    if event.kind == EVENT_PLAYER_FIRED:
+        game.sound.trigger("shot")
+    elif event.kind == EVENT_ENEMY_KILLED:
+        game.sound.trigger("enemy_explosion")
+        game.particle_system.add(
+            create_enemy_explosion(event.x, event.y, tier["particle_multiplier"])
+        )
+        if tier["score_popups"]:
+            game.score_popups.spawn(event.x, event.y, event.points)
+        milestone = COMBO_MILESTONES.get(event.combo)
+        if milestone:
+            game.hud.trigger_milestone(milestone)
+    elif event.kind == EVENT_BOSS_PART_DESTROYED:
+        game.sound.trigger("enemy_explosion")
+        game.particle_system.add(
+            create_enemy_explosion(event.x, event.y, tier["particle_multiplier"])
+        )
+        if event.points and tier["score_popups"]:
+            game.score_popups.spawn(event.x, event.y, event.points)
+    elif event.kind in (EVENT_PLAYER_HIT, EVENT_BOSS_KILLED):
+        game.sound.trigger(
+            "player_hit" if event.kind == EVENT_PLAYER_HIT else "enemy_explosion"
+        )
+        game.particle_system.add(
+            create_player_explosion(event.x, event.y, tier["particle_multiplier"])
+        )
+        if tier["flash"] > 0:
+            game.screen_flash = ScreenFlash(
+                SCREEN_FLASH_COLOR,
+                SCREEN_FLASH_DURATION,
+                SCREEN_FLASH_FADE,
+                int(SCREEN_FLASH_PEAK_ALPHA * tier["flash"]),
+            )
+        if tier["shake"] > 0:
+            game.screen_shake = ScreenShake(
+                SCREEN_SHAKE_INTENSITY * tier["shake"], SCREEN_SHAKE_DURATION
+            )
+    elif event.kind == EVENT_POWERUP_COLLECTED:
+        game.sound.trigger("powerup")
+        game.particle_system.add(
+            create_powerup_burst(
+                event.x, event.y, POWERUP_COLOR, tier["particle_multiplier"]
+            )
+        )
@@ -0,0 +1,27 @@
+"""GameEvents: what happened during a simulation tick, for presentation.
+
+The simulation appends these to `Simulation.events` as it steps; the
+game reacts to them with particles, popups, sounds and HUD milestones.
+"""
+
+# GameEvent kinds
+EVENT_ENEMY_KILLED = "enemy_killed"
+EVENT_PLAYER_HIT = "player_hit"
+EVENT_POWERUP_COLLECTED = "powerup_collected"
+EVENT_PLAYER_FIRED = "player_fired"
+EVENT_GAME_OVER = "game_over"  # points = final score
+EVENT_BOSS_PART_DESTROYED = "boss_part_destroyed"
+EVENT_BOSS_KILLED = "boss_killed"
+
+
+class GameEvent:
+    """Something that happened during an update, for presentation to react to."""
+
+    def __init__(
+        self, kind: str, x: float, y: float, points: int = 0, combo: int = 0
+    ) -> None:
+        self.kind = kind
+        self.x = x
+        self.y = y
+        self.points = points
+        self.combo = combo
@@ -11,6 +11,9 @@ from bork.constants import (
     ENEMY_EXPLOSION_LIFETIME,
     ENEMY_EXPLOSION_SIZE,
     ENEMY_EXPLOSION_SPEED,
+    PARTICLE_PRIORITY_HIGH,
+    PARTICLE_PRIORITY_LOW,
+    PARTICLE_PRIORITY_NORMAL,
     PLAYER_EXPLOSION_COLOR_END,
     PLAYER_EXPLOSION_COUNT,
     PLAYER_EXPLOSION_LIFETIME,
@@ -25,9 +28,14 @@ from bork.constants import (
 from bork.particles import Particle
 
 
-def create_enemy_explosion(x: float, y: float) -> list[Particle]:
+def _scaled_count(count: int, scale: float) -> int:
+    """Apply a quality multiplier to a particle count (never below one)."""
+    return max(1, round(count * scale))
+
+
+def create_enemy_explosion(x: float, y: float, scale: float = 1.0) -> list[Particle]:
     """Create a radial burst of particles for an enemy death."""
-    count = random.randint(*ENEMY_EXPLOSION_COUNT)
+    count = _scaled_count(random.randint(*ENEMY_EXPLOSION_COUNT), scale)
     particles: list[Particle] = []
     for _ in range(count):
         angle = random.uniform(0, 2 * math.pi)
@@ -49,14 +57,15 @@ def create_enemy_explosion(x: float, y: float) -> list[Particle]:
                 1.0,
                 lifetime,
                 shape,
+                PARTICLE_PRIORITY_LOW,
             )
         )
     return particles
 
 
-def create_player_explosion(x: float, y: float) -> list[Particle]:
+def create_player_explosion(x: float, y: float, scale: float = 1.0) -> list[Particle]:
     """Create a large dramatic burst for player death."""
-    count = random.randint(*PLAYER_EXPLOSION_COUNT)
+    count = _scaled_count(random.randint(*PLAYER_EXPLOSION_COUNT), scale)
     particles: list[Particle] = []
     for _ in range(count):
         angle = random.uniform(0, 2 * math.pi)
@@ -77,16 +86,17 @@ def create_player_explosion(x: float, y: float) -> list[Particle]:
                 0.0,
                 lifetime,
                 "triangle",
+                PARTICLE_PRIORITY_HIGH,
             )
         )
     return particles
 
 
 def create_powerup_burst(
-    x: float, y: float, color: tuple[int, int, int]
+    x: float, y: float, color: tuple[int, int, int], scale: float = 1.0
 ) -> list[Particle]:
     """Create a uniform ring burst for powerup collection."""
-    count = random.randint(*POWERUP_BURST_COUNT)
+    count = _scaled_count(random.randint(*POWERUP_BURST_COUNT), scale)
     particles: list[Particle] = []
     for i in range(count):
         angle = (2 * math.pi * i) / count
@@ -107,6 +117,7 @@ def create_powerup_burst(
                 size_start * 0.5,
                 lifetime,
                 "circle",
+                PARTICLE_PRIORITY_NORMAL,
             )
         )
     return particles
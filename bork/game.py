@@ -1,95 +1,237 @@
 """B.O.R.K. — main game window and loop."""
 
+import argparse
+import time
+from collections.abc import Callable
+from functools import partial
+
 import arcade
 
-from bork.collision import circle_circle, point_in_circle
+from bork.assets import AssetLoader, StartupTimeline
+from bork.atlas import ShapeAtlas, load_atlas
+from bork.compositor import WorldCompositor, add_resolution_arguments
 from bork.constants import (
     COLOR_BACKGROUND,
-    COMBO_MILESTONES,
-    ENEMY_SIZE,
-    PLAYER_SHIP_SIZE,
-    PLAYER_START_X,
-    PLAYER_START_Y,
-    POINTS_BASIC_ENEMY,
-    POWERUP_COLOR,
-    POWERUP_SIZE,
-    POWERUP_SPAWN_DELAY,
-    POWERUP_SPAWN_Y,
-    RESPAWN_INVULNERABLE_TIME,
+    REWIND_STEP_TICKS,
     SCREEN_FLASH_COLOR,
-    SCREEN_FLASH_DURATION,
-    SCREEN_FLASH_FADE,
     SCREEN_HEIGHT,
-    SCREEN_SHAKE_DURATION,
-    SCREEN_SHAKE_INTENSITY,
     SCREEN_TITLE,
     SCREEN_WIDTH,
-    SPEED_BOOST_MULTIPLIER,
-    STARTING_LIVES,
     STATE_GAME_OVER,
     STATE_PLAYING,
 )
-from bork.enemy import Enemy
-from bork.explosions import (
-    create_enemy_explosion,
-    create_player_explosion,
-    create_powerup_burst,
-)
+from bork.debug_overlay import DebugOverlay, debug_lines
+from bork.event_effects import play_event_effects
+from bork.events import EVENT_GAME_OVER
 from bork.hud import HUD
+from bork.input import KEY_BINDINGS, actions_for
+from bork.latency import (
+    FramePacer,
+    FrameTiming,
+    add_pacing_arguments,
+    pacer_from_args,
+)
+from bork.music import MusicStreamer
+from bork.music_source import play_music
+from bork.netplay import SessionStepper
 from bork.particles import ParticleSystem
-from bork.player import Player
-from bork.powerup import Powerup
-from bork.projectile import Projectile
+from bork.quality import QualityGovernor
+from bork.render_stats import RenderStats
+from bork.renderers import (
+    SpriteBatch,
+    draw_bosses,
+    draw_bullets,
+    draw_enemies,
+    draw_particles,
+    draw_players,
+    draw_powerups,
+    draw_projectile,
+    draw_starfield,
+    load_textures,
+)
+from bork.rewind import RewindBuffer
+from bork.rollback import RollbackSession
 from bork.score_popup import ScorePopupManager
-from bork.scoring import ScoringSystem
+from bork.scores import HighScores, ScoreRecord, player_name
 from bork.screen_effects import ScreenFlash, ScreenShake
+from bork.simulation import Simulation
+from bork.songs import THEME
+from bork.sound import ArcadeBackend, SoundManager
+from bork.spectator import SpectatorFeed, add_feed_arguments, feed_from_args
 from bork.starfield import Starfield
-from bork.wave_spawner import WaveSpawner
 
 
 class BorkGame(arcade.Window):
-    """Main game window managing the core loop."""
-
-    def __init__(self) -> None:
-        super().__init__(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE)
+    """Main game window: input, presentation effects and drawing.
+
+    Gameplay state lives in `self.sim`; its events become particles,
+    popups, sounds, flash and shake through `play_event_effects`. Music is
+    synthesized on its own thread and never touches the frame loop.
+
+    Assets load in the background while a loading screen is drawn; the
+    game starts once the loader has finished everything.
+
+    With a netplay session the simulation is the session's two-player one,
+    stepped at the fixed rollback rate; rewind, restart and score
+    recording are off. With a spectator feed every tick is published to it.
+
+    The pacer decides when each frame samples input, and key presses are
+    timed to the tick that applies them and to the buffer swap after it.
+
+    With a virtual `resolution` the world is drawn at that size and scaled
+    up by whole pixels; the HUD stays native unless `native_hud` is off.
+    """
+
+    def __init__(
+        self,
+        session: RollbackSession | None = None,
+        spectators: SpectatorFeed | None = None,
+        pacer: FramePacer | None = None,
+        resolution: tuple[int, int] | None = None,
+        native_hud: bool = True,
+    ) -> None:
+        # Startup is timed from here (time-to-first-frame, asset loading)
+        self.timeline: StartupTimeline = StartupTimeline()
+        self.timing: FrameTiming = FrameTiming(pacer, KEY_BINDINGS)
+        pacer = self.timing.pacer
+        super().__init__(
+            SCREEN_WIDTH,
+            SCREEN_HEIGHT,
+            SCREEN_TITLE,
+            update_rate=pacer.update_rate,
+            draw_rate=pacer.update_rate,
+            vsync=pacer.vsync,
+        )
+        self.timeline.mark("window open")
         arcade.set_background_color(COLOR_BACKGROUND)
-        self.player: Player | None = None
-        self.projectiles: list[Projectile] = []
-        self.enemies: list[Enemy] = []
+        self.netplay = None if session is None else SessionStepper(session)
+        self.sim: Simulation = session.sim if session else Simulation()
+        self.spectators = spectators
+        self.rewind: RewindBuffer = RewindBuffer()
         self.starfield: Starfield | None = None
-        self.wave_spawner: WaveSpawner | None = None
         self.keys_pressed: set[int] = set()
-        self.state: str = STATE_PLAYING
+        # When set, drives the game instead of the keyboard (soak runs)
+        self.autopilot: Callable[[Simulation], set[str]] | None = None
         self.particle_system: ParticleSystem = ParticleSystem()
         self.screen_flash: ScreenFlash | None = None
         self.screen_shake: ScreenShake | None = None
-        self.powerups: list[Powerup] = []
-        self.powerup_spawn_timer: float = 0.0
-        self.scoring: ScoringSystem = ScoringSystem()
-        self.hud: HUD = HUD()
+        # Every shape is rasterized once (or loaded from the disk cache) by
+        # the asset loader, which fills this dict in place; the batches and
+        # the HUD share it
+        self.atlas: ShapeAtlas | None = None
+        self.textures: dict[str, arcade.Texture] = {}
+        self.batches: dict[str, SpriteBatch] = {
+            name: SpriteBatch(self.textures)
+            for name in (
+                "starfield",
+                "enemies",
+                "bosses",
+                "powerups",
+                "player",
+                "particles",
+            )
+        }
+        self.hud: HUD = HUD(self.textures)
         self.score_popups: ScorePopupManager = ScorePopupManager()
-        self.lives: int = STARTING_LIVES
+        self.quality: QualityGovernor = QualityGovernor()
+        self.debug_overlay: DebugOverlay = DebugOverlay()
+        self.frame_start: float = 0.0
+        self.frame_dt: float = 0.0
+        self.render_stats: RenderStats = RenderStats()
+        self.sound: SoundManager = SoundManager(ArcadeBackend())
+        self.music: MusicStreamer = MusicStreamer(THEME)
+        self.music_player = None
+        # Scores are written by a background thread; rewound (practice) and
+        # autopilot runs are not recorded
+        self.high_scores: HighScores = HighScores()
+        self.player_name: str = player_name()
+        self.practice: bool = False
+        self.score_note: str = ""  # game over line under the final score
+        self.compositor: WorldCompositor = WorldCompositor(
+            self.ctx,
+            resolution or self.get_framebuffer_size(),
+            COLOR_BACKGROUND,
+            overlay=resolution is not None and not native_hud,
+        )
+        self.first_frame: float | None = None  # timeline time of the first draw
+        self.loader: AssetLoader = AssetLoader(self.timeline)
+        self._queue_assets()
+        self.loader.start()
+
+    @property
+    def loading(self) -> bool:
+        """Still in the loading state."""
+        return self.loader.loaded_at is None
+
+    def _queue_assets(self) -> None:
+        """Queue everything the game needs before its first playing frame."""
+        loader = self.loader
+        loader.add("atlas", self._decode_atlas, self._upload_atlas, weight=2.0)
+        for path in self.sound.files():
+            loader.add(
+                f"sound {path}",
+                partial(self.sound.backend.load, path),
+                partial(self.sound.store, path),
+            )
+        # The first pattern is rendered ahead so playback starts without
+        # an underrun
+        loader.add("music", self.music.fill, self._start_music)
+        loader.add("high scores", self.high_scores.load)
+
+    def _decode_atlas(self) -> tuple[ShapeAtlas, dict[str, arcade.Texture]]:
+        """Worker thread: load or build the atlas and wrap its shapes."""
+        atlas = load_atlas()
+        return atlas, load_textures(atlas)
+
+    def _upload_atlas(
+        self, loaded: tuple[ShapeAtlas, dict[str, arcade.Texture]]
+    ) -> None:
+        """Main thread: copy the shapes into the GPU texture atlas."""
+        self.atlas, textures = loaded
+        for texture in textures.values():
+            self.ctx.default_atlas.add(texture)
+        self.textures.update(textures)
+
+    def _start_music(self, _: object) -> None:
+        """Main thread: start the render thread and the audio player."""
+        self.music_player = play_music(self.music)
+
+    def finish_loading(self) -> None:
+        """Load everything now, blocking (benchmarks and soak runs)."""
+        self.loader.wait()
 
     def setup(self) -> None:
         """Initialize game state."""
-        self.player = Player(PLAYER_START_X, PLAYER_START_Y)
-        self.projectiles = []
-        self.enemies = []
-        self.starfield = Starfield()
-        self.wave_spawner = WaveSpawner()
-        self.state = STATE_PLAYING
+        if self.netplay is None:
+            self.sim.setup()
+        self.rewind.clear()
+        self.starfield = Starfield(self.quality.tier["star_density"])
         self.particle_system = ParticleSystem()
         self.screen_flash = None
         self.screen_shake = None
-        self.powerups = []
-        self.powerup_spawn_timer = 0.0
-        self.scoring = ScoringSystem()
-        self.hud = HUD()
+        self.hud = HUD(self.textures)
         self.score_popups = ScorePopupManager()
-        self.lives = STARTING_LIVES
+        self.practice = False
+        self.score_note = ""
+        self._apply_quality()
+
+    def _apply_quality(self) -> None:
+        """Push the current quality tier into long-lived subsystems."""
+        tier = self.quality.tier
+        self.starfield.set_density(tier["star_density"])
+        self.hud.text_effects = tier["text_effects"]
 
     def on_update(self, dt: float) -> None:
-        """Update all game entities."""
+        """Step the simulation and update presentation effects."""
+        # Late pacing waits here, then takes in input that arrived meanwhile
+        dt = self.timing.begin_frame(dt, self.dispatch_events)
+        self.frame_start = time.perf_counter()
+        self.frame_dt = dt
+        self.debug_overlay.update(dt)
+        if self.loading:
+            self.loader.update()
+            return
+
         # Starfield always scrolls (even during game over)
         self.starfield.update(dt)
 
@@ -104,260 +246,206 @@ class BorkGame(arcade.Window):
             if self.screen_shake.is_done:
                 self.screen_shake = None
 
-        # Update scoring, HUD, and popups even during game over
-        self.scoring.update(dt)
+        # Update HUD and popups even during game over
         self.hud.update(dt)
         self.score_popups.update(dt)
 
-        if self.state != STATE_PLAYING:
-            return
-
-        self.player.update(dt, self.keys_pressed)
-        self.player.shoot_timer -= dt
-
-        # Update projectiles and remove off-screen ones
-        for proj in self.projectiles:
-            proj.update(dt)
-        self.projectiles = [p for p in self.projectiles if not p.is_off_screen()]
-
-        # Spawn enemies from wave spawner
-        enemy = self.wave_spawner.update(dt)
-        if enemy is not None:
-            self.enemies.append(enemy)
-
-        # Update enemies and remove off-screen ones
-        for e in self.enemies:
-            e.update(dt)
-        self.enemies = [e for e in self.enemies if not e.is_off_screen()]
-
-        # Powerup spawn signal from wave spawner
-        if self.wave_spawner.powerup_spawn_due:
-            self.powerup_spawn_timer = POWERUP_SPAWN_DELAY
-            self.wave_spawner.powerup_spawn_due = False
-
-        # Powerup spawn timer
-        if self.powerup_spawn_timer > 0:
-            self.powerup_spawn_timer -= dt
-            if self.powerup_spawn_timer <= 0:
-                self.powerups.append(
-                    Powerup(
-                        SCREEN_WIDTH + POWERUP_SIZE,
-                        SCREEN_HEIGHT * POWERUP_SPAWN_Y,
-                        "speed",
-                    )
-                )
-
-        # Update powerups and remove off-screen ones
-        for p in self.powerups:
-            p.update(dt)
-        self.powerups = [p for p in self.powerups if not p.is_off_screen()]
-
-        # Continuous shooting while Space is held
-        if arcade.key.SPACE in self.keys_pressed:
-            self._try_shoot()
-
-        # Collision: projectiles vs enemies
-        self._check_projectile_enemy_collisions()
-
-        # Collision: enemies vs player
-        self._check_enemy_player_collisions()
-
-        # Collision: powerups vs player
-        self._check_powerup_player_collisions()
-
-    def _check_projectile_enemy_collisions(self) -> None:
-        """Remove projectiles and enemies that collide, award score."""
-        hit_projectiles: set[int] = set()
-        hit_enemies: set[int] = set()
-
-        for pi, proj in enumerate(self.projectiles):
-            for ei, enemy in enumerate(self.enemies):
-                if ei in hit_enemies:
-                    continue
-                if point_in_circle(proj.x, proj.y, enemy.x, enemy.y, ENEMY_SIZE):
-                    hit_projectiles.add(pi)
-                    hit_enemies.add(ei)
-                    self.particle_system.add(create_enemy_explosion(enemy.x, enemy.y))
-                    # Score the kill
-                    points = self.scoring.register_kill(POINTS_BASIC_ENEMY)
-                    self.score_popups.spawn(enemy.x, enemy.y, points)
-                    # Check combo milestones
-                    milestone = COMBO_MILESTONES.get(self.scoring.combo)
-                    if milestone:
-                        self.hud.trigger_milestone(milestone)
-                    break  # one projectile can only hit one enemy
-
-        self.projectiles = [
-            p for i, p in enumerate(self.projectiles) if i not in hit_projectiles
-        ]
-        self.enemies = [e for i, e in enumerate(self.enemies) if i not in hit_enemies]
-
-    def _check_enemy_player_collisions(self) -> None:
-        """Check if any enemy touches the player."""
-        if self.player.is_invulnerable:
-            return
-
-        for enemy in self.enemies:
-            if circle_circle(
-                enemy.x,
-                enemy.y,
-                ENEMY_SIZE,
-                self.player.x,
-                self.player.y,
-                PLAYER_SHIP_SIZE,
-            ):
-                self.particle_system.add(
-                    create_player_explosion(self.player.x, self.player.y)
-                )
-                self.screen_flash = ScreenFlash(
-                    SCREEN_FLASH_COLOR, SCREEN_FLASH_DURATION, SCREEN_FLASH_FADE
-                )
-                self.screen_shake = ScreenShake(
-                    SCREEN_SHAKE_INTENSITY, SCREEN_SHAKE_DURATION
-                )
-                self.lives -= 1
-                if self.lives <= 0:
-                    self.state = STATE_GAME_OVER
-                else:
-                    # Respawn player
-                    self.player.x = PLAYER_START_X
-                    self.player.y = PLAYER_START_Y
-                    self.player.vx = 0.0
-                    self.player.vy = 0.0
-                    self.player.invulnerable_timer = RESPAWN_INVULNERABLE_TIME
-                return
-
-    def _check_powerup_player_collisions(self) -> None:
-        """Check if player collects any powerup."""
-        remaining: list[Powerup] = []
-        for p in self.powerups:
-            if circle_circle(
-                p.x,
-                p.y,
-                POWERUP_SIZE,
-                self.player.x,
-                self.player.y,
-                PLAYER_SHIP_SIZE,
-            ):
-                # Apply effect (no stacking)
-                if self.player.speed_multiplier <= 1.0:
-                    self.player.speed_multiplier = SPEED_BOOST_MULTIPLIER
-                self.particle_system.add(create_powerup_burst(p.x, p.y, POWERUP_COLOR))
+        if self.autopilot is not None:
+            actions = self.autopilot(self.sim)
+        else:
+            actions = actions_for(self.keys_pressed)
+        if self.netplay is not None:
+            for _ in self.netplay.advance(dt, actions):
+                self._after_tick()
+        else:
+            self.sim.update(dt, actions)
+            self.timing.ticked(actions, self.sim.events)
+            self.rewind.record(self.sim, dt)
+            self._after_tick()
+        self.sound.update(dt)
+
+    def _after_tick(self) -> None:
+        """Stream the tick to spectators and react to its events."""
+        if self.spectators is not None:
+            self.spectators.publish(self.sim)
+        for event in self.sim.events:
+            if event.kind == EVENT_GAME_OVER:
+                self._record_score(event.points)
             else:
-                remaining.append(p)
-        self.powerups = remaining
+                play_event_effects(self, event)
 
-    def _get_active_powerups(self) -> list[str]:
-        """Build list of active powerup names for HUD display."""
-        powerups: list[str] = []
-        if self.player.speed_multiplier > 1.0:
-            powerups.append("speed")
-        return powerups
+    def _record_score(self, score: int) -> None:
+        """Hand the finished game to the score writer and set the note."""
+        if self.autopilot is not None:
+            return
+        if self.netplay is not None:
+            self.score_note = "Co-op run (not recorded)"
+            return
+        if self.practice:
+            self.score_note = "Practice run (not recorded)"
+            return
+        best = self.high_scores.index.best(self.player_name)
+        self.high_scores.submit(
+            ScoreRecord(self.player_name, score, time.time(), self.sim.tick)
+        )
+        if best is None or score > best:
+            self.score_note = "New personal best!"
+        else:
+            self.score_note = f"Best: {best:,}"
 
     def on_draw(self) -> None:
-        """Draw all game entities."""
-        self.clear()
-
-        # Apply screen shake offset
+        """Draw all game entities (or the loading screen)."""
+        if self.loading:
+            self.clear()
+            self.hud.draw_loading(self.loader.progress)
+            self._mark_first_frame()
+            return
+        sim = self.sim
+        stats = self.render_stats
+        batches = self.batches
+        stats.begin_frame()
+        with self.compositor.world_pass():
+            stats.section("starfield")
+            draw_starfield(self.starfield, batches["starfield"])
+
+            stats.section("enemies")
+            draw_enemies(sim.enemies, batches["enemies"])
+
+            stats.section("bosses")
+            draw_bosses(sim.bosses, batches["bosses"])
+
+            stats.section("powerups")
+            draw_powerups(sim.powerups, batches["powerups"])
+
+            stats.section("player")
+            if sim.state == STATE_PLAYING:
+                draw_players(sim.players, batches["player"])
+
+            stats.section("projectiles")
+            for proj in sim.projectiles:
+                draw_projectile(proj)
+
+            stats.section("bullets")
+            draw_bullets(sim.bullets)
+
+            stats.section("particles")
+            draw_particles(self.particle_system, batches["particles"])
+
+            # Score popups in world space (affected by shake)
+            stats.section("popups")
+            self.score_popups.draw()
+
+        # A HUD at the virtual resolution goes into the compositor's overlay
+        compositor = self.compositor
+        if compositor.overlay_fbo is not None:
+            stats.section("hud")
+            with compositor.overlay_pass():
+                self._draw_hud()
+
+        # Shake and flash are applied in the composite pass
+        stats.section("composite")
         shake_x, shake_y = 0.0, 0.0
         if self.screen_shake:
             shake_x, shake_y = self.screen_shake.get_offset()
-        if shake_x != 0.0 or shake_y != 0.0:
-            self.ctx.projection_2d = (
-                -shake_x,
-                SCREEN_WIDTH - shake_x,
-                -shake_y,
-                SCREEN_HEIGHT - shake_y,
-            )
-
-        self.starfield.draw()
-
-        for enemy in self.enemies:
-            enemy.draw()
-
-        for p in self.powerups:
-            p.draw()
-
-        if self.state == STATE_PLAYING:
-            self.player.draw()
-
-        for proj in self.projectiles:
-            proj.draw()
+        ratio = compositor.size[0] / SCREEN_WIDTH  # world texels per point
+        compositor.set_shake(shake_x * ratio, shake_y * ratio)
+        if self.screen_flash:
+            compositor.set_flash(self.screen_flash.color, self.screen_flash.alpha)
+        else:
+            compositor.set_flash(SCREEN_FLASH_COLOR, 0)
+        compositor.draw()
 
-        self.particle_system.draw()
+        # Native HUD (drawn without shake)
+        if compositor.overlay_fbo is None:
+            stats.section("hud")
+            self._draw_hud()
 
-        # Score popups in world space (affected by shake)
-        self.score_popups.draw()
+        stats.section("overlay")
+        if self.debug_overlay.visible:
+            self.debug_overlay.draw(debug_lines(self))
 
-        # Reset projection after world drawing
-        if shake_x != 0.0 or shake_y != 0.0:
-            self.ctx.projection_2d = (0, SCREEN_WIDTH, 0, SCREEN_HEIGHT)
+        stats.end_frame()
+        self._mark_first_frame()
 
-        # Screen flash overlay (drawn without shake)
-        if self.screen_flash:
-            self.screen_flash.draw()
+        if self.quality.record(time.perf_counter() - self.frame_start, self.frame_dt):
+            self._apply_quality()
 
-        # HUD (drawn without shake)
+    def _draw_hud(self) -> None:
+        """Score, lives and powerups, plus the game over screen."""
+        sim = self.sim
         self.hud.draw(
-            self.scoring.score,
-            self.scoring.multiplier,
-            self.scoring.combo,
-            self.lives,
-            self._get_active_powerups(),
+            sim.scoring.score,
+            sim.scoring.multiplier,
+            sim.scoring.combo,
+            sim.lives,
+            sim.active_powerups(),
         )
-
-        # Game over overlay
-        if self.state == STATE_GAME_OVER:
-            arcade.draw_text(
-                "GAME OVER",
-                SCREEN_WIDTH / 2,
-                SCREEN_HEIGHT / 2 + 20,
-                arcade.color.WHITE,
-                font_size=36,
-                anchor_x="center",
-                anchor_y="center",
-            )
-            arcade.draw_text(
-                f"Final Score: {self.scoring.score:,}",
-                SCREEN_WIDTH / 2,
-                SCREEN_HEIGHT / 2 - 20,
-                arcade.color.LIGHT_GRAY,
-                font_size=18,
-                anchor_x="center",
-                anchor_y="center",
-            )
-            arcade.draw_text(
-                "Press R to restart",
-                SCREEN_WIDTH / 2,
-                SCREEN_HEIGHT / 2 - 50,
-                arcade.color.LIGHT_GRAY,
-                font_size=16,
-                anchor_x="center",
-                anchor_y="center",
-            )
+        if sim.state == STATE_GAME_OVER:
+            self.hud.draw_game_over(sim.scoring.score, self.score_note)
+
+    def flip(self) -> None:
+        """Swap buffers, timing the swap for pacing and input latency."""
+        self.timing.swap(super().flip)
+
+    def _mark_first_frame(self) -> None:
+        """Record when the first frame finished drawing."""
+        if self.first_frame is None:
+            self.first_frame = self.timeline.mark("first frame")
+
+    def on_close(self) -> None:
+        """Stop the music thread before the window goes."""
+        if self.music_player is not None:
+            self.music_player.pause()
+        self.music.stop()
+        self.high_scores.close()
+        if self.spectators is not None:
+            self.spectators.close()
+        super().on_close()
 
     def on_key_press(self, key: int, modifiers: int) -> None:
         """Track key presses."""
         self.keys_pressed.add(key)
-
-        if self.state == STATE_GAME_OVER and key == arcade.key.R:
+        if self.netplay is None:
+            self.timing.key_pressed(key)
+
+        if key == arcade.key.F3:
+            self.debug_overlay.toggle()
+        elif key == arcade.key.F4:
+            if self.render_stats.installed:
+                self.render_stats.uninstall()
+            else:
+                self.render_stats.install(self)
+        elif key == arcade.key.BACKSPACE and self.netplay is None:
+            # Practice mode: jump back a few seconds
+            self.rewind.rewind(self.sim, REWIND_STEP_TICKS)
+            self.practice = True
+
+        if (
+            self.sim.state == STATE_GAME_OVER
+            and key == arcade.key.R
+            and self.netplay is None
+        ):
             self.setup()
 
     def on_key_release(self, key: int, modifiers: int) -> None:
         """Track key releases."""
         self.keys_pressed.discard(key)
-
-    def _try_shoot(self) -> None:
-        """Fire a projectile if cooldown allows."""
-        if self.player.can_shoot():
-            nose_x = self.player.x + PLAYER_SHIP_SIZE
-            self.projectiles.append(Projectile(nose_x, self.player.y))
-            self.player.reset_shoot_timer()
+        self.timing.key_released(key, actions_for(self.keys_pressed))
 
 
 def main() -> None:
     """Entry point."""
-    game = BorkGame()
+    parser = argparse.ArgumentParser(description=SCREEN_TITLE)
+    add_feed_arguments(parser)
+    add_pacing_arguments(parser)
+    add_resolution_arguments(parser)
+    args = parser.parse_args()
+    game = BorkGame(
+        spectators=feed_from_args(args),
+        pacer=pacer_from_args(args),
+        resolution=args.resolution,
+        native_hud=not args.virtual_hud,
+    )
     game.setup()
     arcade.run()
 
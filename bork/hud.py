@@ -11,7 +11,7 @@ from bork.constants import (
     HUD_COMBO_FONT_SIZE,
     HUD_DIM,
     HUD_LABEL_FONT_SIZE,
-    HUD_LIVES_FONT_SIZE,
+    HUD_LIVES_ICON_SIZE,
     HUD_MARGIN,
     HUD_MILESTONE_FONT_SIZE,
     HUD_MULTI_FONT_SIZE,
@@ -21,20 +21,27 @@ from bork.constants import (
     HUD_PRIMARY,
     HUD_SCORE_FONT_SIZE,
     HUD_ZONE_FONT_SIZE,
+    LOADING_BAR_HEIGHT,
+    LOADING_BAR_WIDTH,
     POWERUP_COLOR,
     SCREEN_HEIGHT,
     SCREEN_WIDTH,
     STARTING_LIVES,
 )
+from bork.renderers import SpriteBatch
 
 
 class HUD:
     """Sci-fi heads-up display for score, multiplier, combo, lives, powerups."""
 
-    def __init__(self) -> None:
+    def __init__(self, textures: dict[str, arcade.Texture] | None = None) -> None:
+        self.lives_batch = SpriteBatch(
+            {} if textures is None else textures  # chevrons from the atlas
+        )
         self.milestone_text: str = ""
         self.milestone_timer: float = 0.0
         self.multi_pulse_timer: float = 0.0
+        self.text_effects: bool = True  # pulse and milestone text (quality tier)
 
     def update(self, dt: float) -> None:
         """Update animations (milestone fade, multiplier pulse)."""
@@ -92,7 +99,11 @@ class HUD:
         """Draw multiplier indicator with pulse when active."""
         if multiplier <= 1.0:
             return
-        pulse = math.sin(self.multi_pulse_timer * HUD_MULTI_PULSE_SPEED * 2 * math.pi)
+        pulse = 0.0
+        if self.text_effects:
+            pulse = math.sin(
+                self.multi_pulse_timer * HUD_MULTI_PULSE_SPEED * 2 * math.pi
+            )
         alpha = int(255 * (0.7 + HUD_MULTI_PULSE_AMOUNT * pulse))
         alpha = max(0, min(255, alpha))
         color = (*HUD_ACCENT[:3], alpha)
@@ -125,7 +136,7 @@ class HUD:
         )
 
     def _draw_lives(self, lives: int) -> None:
-        """Draw lives as chevron icons, lost lives as dim outlines."""
+        """Draw lives as chevron icons, lost lives dimmed."""
         base_x = SCREEN_WIDTH - HUD_MARGIN - 140
         y = SCREEN_HEIGHT - HUD_MARGIN - 18
         arcade.draw_text(
@@ -137,17 +148,12 @@ class HUD:
             anchor_x="left",
             anchor_y="top",
         )
+        half = HUD_LIVES_ICON_SIZE / 2
+        self.lives_batch.begin()
         for i in range(STARTING_LIVES):
-            color = HUD_PRIMARY if i < lives else HUD_DIM
-            arcade.draw_text(
-                "\u25b8",
-                base_x + i * 20,
-                y,
-                color,
-                font_size=HUD_LIVES_FONT_SIZE,
-                anchor_x="left",
-                anchor_y="top",
-            )
+            name = "chevron" if i < lives else "chevron_dim"
+            self.lives_batch.add(name, base_x + i * 20 + half, y - half - 2)
+        self.lives_batch.draw()
 
     def _draw_powerups(self, active_powerups: list[str]) -> None:
         """Draw active powerup indicators in brackets."""
@@ -182,7 +188,7 @@ class HUD:
 
     def _draw_milestone(self) -> None:
         """Draw combo milestone text centered on screen."""
-        if self.milestone_timer <= 0:
+        if self.milestone_timer <= 0 or not self.text_effects:
             return
         alpha = int(255 * min(self.milestone_timer / COMBO_MILESTONE_FADE, 1.0))
         color = (*HUD_ACCENT[:3], alpha)
@@ -196,3 +202,68 @@ class HUD:
             anchor_x="center",
             anchor_y="center",
         )
+
+    def draw_game_over(self, score: int, note: str = "") -> None:
+        """Draw the game over banner with the final score and a note below."""
+        arcade.draw_text(
+            "GAME OVER",
+            SCREEN_WIDTH / 2,
+            SCREEN_HEIGHT / 2 + 20,
+            arcade.color.WHITE,
+            font_size=36,
+            anchor_x="center",
+            anchor_y="center",
+        )
+        arcade.draw_text(
+            f"Final Score: {score:,}",
+            SCREEN_WIDTH / 2,
+            SCREEN_HEIGHT / 2 - 20,
+            arcade.color.LIGHT_GRAY,
+            font_size=18,
+            anchor_x="center",
+            anchor_y="center",
+        )
+        if note:
+            arcade.draw_text(
+                note,
+                SCREEN_WIDTH / 2,
+                SCREEN_HEIGHT / 2 - 48,
+                HUD_ACCENT,
+                font_size=14,
+                anchor_x="center",
+                anchor_y="center",
+            )
+        arcade.draw_text(
+            "Press R to restart",
+            SCREEN_WIDTH / 2,
+            SCREEN_HEIGHT / 2 - 80,
+            arcade.color.LIGHT_GRAY,
+            font_size=16,
+            anchor_x="center",
+            anchor_y="center",
+        )
+
+    def draw_loading(self, progress: float) -> None:
+        """Draw the loading screen: a label and a progress bar (0..1)."""
+        left = (SCREEN_WIDTH - LOADING_BAR_WIDTH) / 2
+        bottom = SCREEN_HEIGHT / 2 - LOADING_BAR_HEIGHT / 2
+        arcade.draw_text(
+            f"LOADING {progress:.0%}",
+            SCREEN_WIDTH / 2,
+            bottom + 24,
+            HUD_PRIMARY,
+            font_size=HUD_LABEL_FONT_SIZE,
+            anchor_x="center",
+            anchor_y="center",
+        )
+        arcade.draw_lbwh_rectangle_outline(
+            left, bottom, LOADING_BAR_WIDTH, LOADING_BAR_HEIGHT, HUD_DIM
+        )
+        if progress > 0:
+            arcade.draw_lbwh_rectangle_filled(
+                left,
+                bottom,
+                LOADING_BAR_WIDTH * progress,
+                LOADING_BAR_HEIGHT,
+                HUD_PRIMARY,
+            )
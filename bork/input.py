@@ -0,0 +1,30 @@
+"""Keyboard bindings: maps arcade key codes to simulation input actions."""
+
+import arcade
+
+from bork.constants import (
+    ACTION_DOWN,
+    ACTION_FIRE,
+    ACTION_LEFT,
+    ACTION_RIGHT,
+    ACTION_UP,
+)
+
+KEY_BINDINGS: dict[int, str] = {
+    arcade.key.UP: ACTION_UP,
+    arcade.key.W: ACTION_UP,
+    arcade.key.DOWN: ACTION_DOWN,
+    arcade.key.S: ACTION_DOWN,
+    arcade.key.LEFT: ACTION_LEFT,
+    arcade.key.A: ACTION_LEFT,
+    arcade.key.RIGHT: ACTION_RIGHT,
+    arcade.key.D: ACTION_RIGHT,
+    arcade.key.SPACE: ACTION_FIRE,
+}
+
+
+def actions_for(
+    keys_pressed: set[int], bindings: dict[int, str] = KEY_BINDINGS
+) -> set[str]:
+    """Return the set of actions held down by the pressed keys."""
+    return {bindings[key] for key in keys_pressed if key in bindings}
@@ -0,0 +1,270 @@
+"""Input-to-photon latency measurement and frame pacing.
+
+LatencyTracker follows each key press through the frame loop. It stamps
+the press when the event is handled, again when the first simulation
+tick that applies its action has run, and again when the buffer swap
+after that tick returns. For fire, FrameTiming only counts a tick that
+fired a shot, so a press during the weapon cooldown is timed to the shot
+it gets. It keeps recent samples of both legs for percentiles.
+
+FramePacer decides when a frame starts:
+
+- "scheduled" leaves it to arcade's clock. Input is sampled whenever the
+  clock fires, however long before the next present that is.
+- "late" runs the window loop unthrottled and waits inside the frame
+  until just before its present time, then polls input and steps. The
+  wait ends the longest recent work time (plus PACING_SAFETY) before the
+  present. Present times come from the swap itself with vsync, since the
+  swap returns at the vblank; otherwise from a fixed grid of intervals.
+
+The late wait can sleep, spin, or sleep and then spin for the last
+PACING_SPIN_MARGIN seconds. Sleep alone can overshoot by a scheduler
+quantum.
+
+FrameTiming hooks both into a window's frame loop, key handlers and
+buffer swap, and adds their command-line options.
+"""
+
+import argparse
+import time
+from collections import deque
+from collections.abc import Callable, Iterable
+
+from bork.constants import (
+    ACTION_FIRE,
+    LATENCY_SAMPLES,
+    PACING_MODES,
+    PACING_POLL_RATE,
+    PACING_SAFETY,
+    PACING_SPIN_MARGIN,
+    PACING_WAITS,
+    PACING_WORK_WINDOW,
+    TARGET_FPS,
+)
+from bork.events import EVENT_PLAYER_FIRED, GameEvent
+
+
+def percentile(samples: Iterable[float], fraction: float) -> float:
+    """The sample `fraction` of the way up the sorted samples (0.0 if none)."""
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+class LatencyTracker:
+    """Times key presses to the tick that applies them and to the screen."""
+
+    def __init__(
+        self,
+        samples: int = LATENCY_SAMPLES,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self.clock = clock
+        self.pending: dict[str, float] = {}  # action -> press time, not yet ticked
+        self.in_flight: list[float] = []  # press times ticked but not yet shown
+        self.to_tick: deque[float] = deque(maxlen=samples)
+        self.to_photon: deque[float] = deque(maxlen=samples)
+        self.missed = 0  # presses released before any tick saw them
+
+    def press(self, action: str, when: float | None = None) -> None:
+        """An input for `action` went down (at `when`, default now)."""
+        self.pending.setdefault(action, self.clock() if when is None else when)
+
+    def release(self, action: str) -> None:
+        """The action is no longer held; a press no tick saw is lost."""
+        if self.pending.pop(action, None) is not None:
+            self.missed += 1
+
+    def consumed(self, actions: set[str]) -> None:
+        """A simulation tick just ran with these actions."""
+        if not self.pending:
+            return
+        now = self.clock()
+        for action in [action for action in self.pending if action in actions]:
+            pressed = self.pending.pop(action)
+            self.to_tick.append(now - pressed)
+            self.in_flight.append(pressed)
+
+    def presented(self) -> None:
+        """A buffer swap just returned; everything ticked is on screen."""
+        if not self.in_flight:
+            return
+        now = self.clock()
+        self.to_photon.extend(now - pressed for pressed in self.in_flight)
+        self.in_flight.clear()
+
+
+class FramePacer:
+    """Chooses when each frame samples input (see the module docstring)."""
+
+    def __init__(
+        self,
+        mode: str = "scheduled",
+        wait: str = "hybrid",
+        vsync: bool = False,
+        interval: float = 1.0 / TARGET_FPS,
+        clock: Callable[[], float] = time.perf_counter,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if mode not in PACING_MODES:
+            raise ValueError(f"unknown pacing mode {mode!r}")
+        if wait not in PACING_WAITS:
+            raise ValueError(f"unknown wait strategy {wait!r}")
+        self.mode = mode
+        self.wait = wait
+        self.vsync = vsync
+        self.interval = interval
+        self.clock = clock
+        self.sleep = sleep
+        self.work: deque[float] = deque(maxlen=PACING_WORK_WINDOW)
+        self.present_at: float | None = None  # when this frame should be shown
+        self.frame_start: float | None = None
+        # Late wakeups past the sample time, for benchmarks and the overlay
+        self.overshoot: deque[float] = deque(maxlen=LATENCY_SAMPLES)
+
+    @property
+    def update_rate(self) -> float:
+        """The arcade update and draw rate for this mode."""
+        return self.interval if self.mode == "scheduled" else PACING_POLL_RATE
+
+    @property
+    def lead(self) -> float:
+        """How long before the present time a late frame starts.
+
+        Until a frame has been timed this is a whole interval, so the
+        first frames start at once.
+        """
+        return max(self.work, default=self.interval) + PACING_SAFETY
+
+    def begin_frame(self, dt: float, poll: Callable[[], None] | None = None) -> float:
+        """Start a frame; returns the dt to simulate.
+
+        In late mode this waits for the frame's sample time and then calls
+        `poll` to take in input that arrived during the wait.
+        """
+        now = self.clock()
+        if self.mode == "late":
+            if self.present_at is not None:
+                target = self.present_at - self.lead
+                if target > now:
+                    self.wait_until(target)
+                    self.overshoot.append(self.clock() - target)
+            if poll is not None:
+                poll()
+            now = self.clock()
+            if self.frame_start is not None:
+                dt = now - self.frame_start
+        self.frame_start = now
+        return dt
+
+    def before_swap(self) -> None:
+        """The frame's work is done; the buffer swap is next."""
+        if self.frame_start is not None:
+            self.work.append(self.clock() - self.frame_start)
+
+    def after_swap(self) -> None:
+        """The swap returned; set when the next frame should be shown."""
+        now = self.clock()
+        if self.vsync or self.present_at is None:
+            # A blocking swap returns at the vblank: the next one is an
+            # interval on
+            self.present_at = now + self.interval
+        else:
+            self.present_at += self.interval
+            if self.present_at < now:
+                self.present_at = now + self.interval  # fell behind: rebase
+
+    def wait_until(self, target: float) -> None:
+        """Block until `target` with the configured strategy."""
+        if self.wait != "spin":
+            margin = PACING_SPIN_MARGIN if self.wait == "hybrid" else 0.0
+            remaining = target - margin - self.clock()
+            if remaining > 0:
+                self.sleep(remaining)
+        if self.wait != "sleep":
+            while self.clock() < target:
+                pass
+
+
+class FrameTiming:
+    """Drives a FramePacer and a LatencyTracker from a window's frame loop."""
+
+    def __init__(
+        self,
+        pacer: FramePacer | None = None,
+        bindings: dict[int, str] | None = None,
+        tracker: LatencyTracker | None = None,
+    ) -> None:
+        self.pacer = pacer or FramePacer()
+        self.bindings = bindings or {}  # key code -> action
+        self.latency = tracker or LatencyTracker()
+
+    def begin_frame(self, dt: float, poll: Callable[[], None]) -> float:
+        """Start a frame (see FramePacer.begin_frame); the dt to simulate."""
+        return self.pacer.begin_frame(dt, poll)
+
+    def ticked(self, actions: set[str], events: list[GameEvent]) -> None:
+        """A simulation tick just ran with these actions and raised `events`.
+
+        Fire only counts as applied when the tick fired a shot.
+        """
+        if ACTION_FIRE in actions and not any(
+            event.kind == EVENT_PLAYER_FIRED for event in events
+        ):
+            actions = actions - {ACTION_FIRE}
+        self.latency.consumed(actions)
+
+    def swap(self, flip: Callable[[], None]) -> None:
+        """Swap buffers with `flip`, timing it for pacing and latency."""
+        self.pacer.before_swap()
+        flip()
+        self.pacer.after_swap()
+        self.latency.presented()
+
+    def key_pressed(self, key: int) -> None:
+        """Start timing the action bound to `key`, if any."""
+        action = self.bindings.get(key)
+        if action is not None:
+            self.latency.press(action)
+
+    def key_released(self, key: int, held: set[str]) -> None:
+        """Drop the press of `key`'s action unless another held key has it."""
+        action = self.bindings.get(key)
+        if action is not None and action not in held:
+            self.latency.release(action)
+
+    def debug_line(self) -> str:
+        """Latency percentiles and the pacing mode for the debug overlay."""
+        pacer = self.pacer
+        latency = self.latency
+        return (
+            f"Latency p50 {percentile(latency.to_photon, 0.5) * 1000:.1f}"
+            f" p99 {percentile(latency.to_photon, 0.99) * 1000:.1f} ms to screen"
+            f" ({percentile(latency.to_tick, 0.5) * 1000:.1f} to tick,"
+            f" missed {latency.missed}) {pacer.mode}"
+            + (f"/{pacer.wait}" if pacer.mode == "late" else "")
+            + (" vsync" if pacer.vsync else "")
+        )
+
+
+def add_pacing_arguments(parser: argparse.ArgumentParser) -> None:
+    """The game's --pacing, --wait and --vsync options."""
+    parser.add_argument(
+        "--pacing",
+        choices=PACING_MODES,
+        default="scheduled",
+        help="late: wait until just before each frame is due, then read input",
+    )
+    parser.add_argument(
+        "--wait",
+        choices=PACING_WAITS,
+        default="hybrid",
+        help="how late pacing waits (hybrid sleeps, then spins the last moment)",
+    )
+    parser.add_argument("--vsync", action="store_true", help="sync swaps to vblank")
+
+
+def pacer_from_args(args: argparse.Namespace) -> FramePacer:
+    """A FramePacer for the pacing options."""
+    return FramePacer(args.pacing, args.wait, args.vsync)
@@ -0,0 +1,245 @@
+"""Procedural chiptune music: tracker-style patterns synthesized with NumPy.
+
+A song is tempo data, a set of named patterns and an order list. A pattern
+has one row string per channel (two pulse voices, a triangle and a noise
+channel), with space-separated tokens:
+
+    "A4"   start a note (sharps as "C#4")
+    "."    hold the previous note (or rest) for another row
+    "-"    silence
+    "x"    noise hit, short; "o" noise hit, long (noise channel only)
+
+Rendered patterns are cached by a hash of their content and the render
+settings, so a section repeated in the order list (or identical patterns
+under different names) is synthesized once. MusicStreamer renders the
+order list on a background thread, staying MUSIC_LOOKAHEAD seconds ahead,
+and `read()` hands out PCM without ever waiting for synthesis.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict, deque
+
+import numpy as np
+
+from bork.constants import (
+    MUSIC_CACHE_SIZE,
+    MUSIC_LOOKAHEAD,
+    MUSIC_NOISE_HITS,
+    MUSIC_RELEASE,
+    MUSIC_SAMPLE_RATE,
+    MUSIC_VOICES,
+    MUSIC_VOLUME,
+)
+
+_NOTE_NAMES = ("C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B")
+_HOLD = "."
+_REST = "-"
+
+
+def note_frequency(token: str) -> float:
+    """Frequency in Hz of a note token such as "A4" or "C#5" (A4 = 440)."""
+    name, octave = token[:-1], int(token[-1])
+    semitone = _NOTE_NAMES.index(name) + 12 * (octave + 1)
+    return 440.0 * 2 ** ((semitone - 69) / 12)
+
+
+def row_samples(song: dict, sample_rate: int = MUSIC_SAMPLE_RATE) -> int:
+    """Samples per pattern row at the song's tempo."""
+    return round(sample_rate * 60 / song["tempo"] / song["rows_per_beat"])
+
+
+def _segments(row: str) -> list[tuple[int, int, str]]:
+    """Split a channel's tokens into (start row, rows, token) notes."""
+    segments: list[tuple[int, int, str]] = []
+    current: list | None = None
+    for index, token in enumerate(row.split()):
+        if token == _HOLD:
+            if current is not None:
+                current[1] += 1
+            continue
+        current = None
+        if token != _REST:
+            current = [index, 1, token]
+            segments.append(current)
+    return [tuple(segment) for segment in segments]
+
+
+def _waveform(
+    spec: dict, token: str, n: int, start: int, sample_rate: int
+) -> np.ndarray:
+    """One note's raw waveform, before the envelope."""
+    if spec["wave"] == "noise":
+        # Seeded by position so a pattern always renders the same way
+        return np.random.default_rng(start).uniform(-1.0, 1.0, n)
+    phase = note_frequency(token) * np.arange(n) / sample_rate % 1.0
+    if spec["wave"] == "pulse":
+        return np.where(phase < spec["duty"], 1.0, -1.0)
+    return 4.0 * np.abs(phase - 0.5) - 1.0  # triangle
+
+
+def render_pattern(
+    pattern: dict[str, str],
+    song: dict,
+    sample_rate: int = MUSIC_SAMPLE_RATE,
+    voices: dict[str, dict] = MUSIC_VOICES,
+) -> np.ndarray:
+    """Mix one pattern into float32 samples in -1..1."""
+    step = row_samples(song, sample_rate)
+    rows = max(len(row.split()) for row in pattern.values())
+    out = np.zeros(rows * step, dtype=np.float32)
+    release = max(1, int(MUSIC_RELEASE * sample_rate))
+    for channel, row in pattern.items():
+        spec = voices[channel]
+        for start_row, length, token in _segments(row):
+            start = start_row * step
+            n = length * step
+            wave = _waveform(spec, token, n, start, sample_rate)
+            decay = (
+                MUSIC_NOISE_HITS[token] if spec["wave"] == "noise" else spec["decay"]
+            )
+            envelope = np.exp(-decay * np.arange(n) / sample_rate)
+            envelope[-release:] *= np.linspace(1.0, 0.0, min(release, n))
+            out[start : start + n] += spec["gain"] * wave * envelope
+    return out
+
+
+def to_pcm16(samples: np.ndarray, volume: float = 1.0) -> bytes:
+    """Scale, clip and convert float samples to signed 16-bit PCM bytes."""
+    scaled = np.clip(samples * volume, -1.0, 1.0) * 32767
+    return scaled.astype("<i2").tobytes()
+
+
+def pattern_key(pattern: dict[str, str], song: dict, sample_rate: int) -> bytes:
+    """Content hash of everything that affects a pattern's rendering."""
+    content = json.dumps(
+        [pattern, song["tempo"], song["rows_per_beat"], sample_rate, MUSIC_VOICES],
+        sort_keys=True,
+    )
+    return hashlib.blake2b(content.encode(), digest_size=16).digest()
+
+
+class PatternCache:
+    """Rendered patterns keyed by content hash, least recently used evicted."""
+
+    def __init__(self, max_entries: int = MUSIC_CACHE_SIZE) -> None:
+        self.max_entries = max_entries
+        self.entries: OrderedDict[bytes, np.ndarray] = OrderedDict()
+        self.hits = 0
+        self.misses = 0  # patterns actually synthesized
+
+    def render(
+        self, pattern: dict[str, str], song: dict, sample_rate: int
+    ) -> np.ndarray:
+        """The pattern's samples, synthesized only on a cache miss."""
+        key = pattern_key(pattern, song, sample_rate)
+        samples = self.entries.get(key)
+        if samples is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return samples
+        self.misses += 1
+        samples = render_pattern(pattern, song, sample_rate)
+        self.entries[key] = samples
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return samples
+
+
+class MusicStreamer:
+    """Renders a song's order list, looping, on a background thread.
+
+    The thread sleeps while MUSIC_LOOKAHEAD seconds are buffered. `read()`
+    is called by the audio driver and never waits: if the buffer runs dry
+    it pads with silence and counts an underrun.
+    """
+
+    def __init__(
+        self,
+        song: dict,
+        sample_rate: int = MUSIC_SAMPLE_RATE,
+        lookahead: float = MUSIC_LOOKAHEAD,
+        volume: float = MUSIC_VOLUME,
+        cache: PatternCache | None = None,
+    ) -> None:
+        self.song = song
+        self.sample_rate = sample_rate
+        self.volume = volume
+        self.cache = cache or PatternCache()
+        self.position = 0  # next index into the order list
+        self.underruns = 0
+        self._lookahead_bytes = int(lookahead * sample_rate) * 2
+        self._chunks: deque[bytes] = deque()
+        self._offset = 0  # bytes of the first chunk already read
+        self._buffered = 0  # unread bytes across all chunks
+        self._ready = threading.Condition()
+        self._stopping = False
+        self._thread: threading.Thread | None = None
+
+    @property
+    def buffered_seconds(self) -> float:
+        """Audio rendered but not yet read."""
+        return self._buffered / 2 / self.sample_rate
+
+    def start(self) -> None:
+        """Start the render thread (returns immediately)."""
+        if self._thread is not None:
+            return
+        self._stopping = False
+        self._thread = threading.Thread(
+            target=self._run, name="bork-music", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the render thread and wait for it to exit."""
+        with self._ready:
+            self._stopping = True
+            self._ready.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        """Render thread: keep the look-ahead buffer topped up."""
+        while True:
+            with self._ready:
+                self._ready.wait_for(
+                    lambda: self._stopping or self._buffered < self._lookahead_bytes
+                )
+                if self._stopping:
+                    return
+            self.fill()
+
+    def fill(self) -> None:
+        """Render the next pattern in the order list into the buffer."""
+        order = self.song["order"]
+        name = order[self.position % len(order)]
+        self.position = (self.position + 1) % len(order)
+        samples = self.cache.render(
+            self.song["patterns"][name], self.song, self.sample_rate
+        )
+        pcm = to_pcm16(samples, self.volume)
+        with self._ready:
+            self._chunks.append(pcm)
+            self._buffered += len(pcm)
+
+    def read(self, num_bytes: int) -> bytes:
+        """Up to `num_bytes` of PCM, padded with silence on underrun."""
+        out = bytearray()
+        with self._ready:
+            while len(out) < num_bytes and self._chunks:
+                chunk = self._chunks[0]
+                take = min(num_bytes - len(out), len(chunk) - self._offset)
+                out += chunk[self._offset : self._offset + take]
+                self._offset += take
+                if self._offset == len(chunk):
+                    self._chunks.popleft()
+                    self._offset = 0
+            self._buffered -= len(out)
+            self._ready.notify()
+        if len(out) < num_bytes:
+            self.underruns += 1
+            out += bytes(num_bytes - len(out))
+        return bytes(out)
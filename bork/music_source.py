@@ -0,0 +1,39 @@
+"""pyglet audio source that streams PCM from a MusicStreamer."""
+
+from pyglet.media import Player
+from pyglet.media.codecs.base import AudioData, AudioFormat, Source
+
+from bork.music import MusicStreamer
+
+
+class StreamerSource(Source):
+    """Endless mono 16-bit source; pyglet's audio thread pulls from it."""
+
+    def __init__(self, streamer: MusicStreamer) -> None:
+        self.streamer = streamer
+        self.audio_format = AudioFormat(
+            channels=1, sample_size=16, sample_rate=streamer.sample_rate
+        )
+
+    def get_audio_data(
+        self, num_bytes: int, compensation_time: float = 0.0
+    ) -> AudioData:
+        """The next `num_bytes` (rounded down to whole samples) of music."""
+        data = self.streamer.read(int(num_bytes) & ~1)
+        return AudioData(data, len(data))
+
+    def seek(self, timestamp: float) -> None:
+        """A live stream cannot seek; playback continues where it is."""
+
+    def is_precise(self) -> bool:
+        """Every request gets exactly the bytes asked for."""
+        return True
+
+
+def play_music(streamer: MusicStreamer) -> Player:
+    """Start the streamer's render thread and play it; returns the player."""
+    streamer.start()
+    player = Player()
+    player.queue(StreamerSource(streamer))
+    player.play()
+    return player
@@ -0,0 +1,189 @@
+"""UDP transport and packet format for netplay, plus a loss/latency shim.
+
+Every packet starts with a magic and a kind:
+
+    HELLO  player index, seed, input delay (handshake; repeated until the
+           peer answers)
+    INPUT  the next remote frame this side still needs (an ack), the
+           newest desync checksum (frame, crc32), then every local input
+           the peer has not acknowledged, from a start frame on
+
+Inputs are resent until acknowledged, so a lost packet costs nothing but
+the time until the next one; nothing is ever retransmitted on a timer.
+
+LossyTransport wraps a transport and drops or delays outgoing packets by a
+seeded RNG, so loss and latency can be reproduced on localhost.
+"""
+
+import heapq
+import random
+import socket
+import struct
+import time
+from collections.abc import Callable
+
+_HEADER = struct.Struct("<4sB")
+_HELLO = struct.Struct("<BQB")  # player index, seed, input delay
+# ack, checksum frame, checksum, first input frame, input count
+_INPUT = struct.Struct("<IIIIH")
+NETPLAY_MAGIC = b"BKNP"
+PACKET_HELLO = 0
+PACKET_INPUT = 1
+MAX_DATAGRAM = 1500
+
+
+class Hello:
+    """Handshake: who the sender is and the settings it will play with."""
+
+    def __init__(self, player: int, seed: int, input_delay: int) -> None:
+        self.player = player
+        self.seed = seed
+        self.input_delay = input_delay
+
+
+class InputPacket:
+    """A run of one player's inputs plus the sender's ack and checksum."""
+
+    def __init__(
+        self,
+        ack: int,
+        checksum_frame: int,
+        checksum: int,
+        start: int,
+        inputs: bytes,
+    ) -> None:
+        self.ack = ack  # next frame of the receiver's input the sender needs
+        self.checksum_frame = checksum_frame  # 0 when there is none yet
+        self.checksum = checksum
+        self.start = start  # frame of inputs[0]
+        self.inputs = inputs  # one action bitmask byte per frame
+
+
+def encode_packet(packet: Hello | InputPacket) -> bytes:
+    """Serialize a packet."""
+    if isinstance(packet, Hello):
+        return _HEADER.pack(NETPLAY_MAGIC, PACKET_HELLO) + _HELLO.pack(
+            packet.player, packet.seed, packet.input_delay
+        )
+    return (
+        _HEADER.pack(NETPLAY_MAGIC, PACKET_INPUT)
+        + _INPUT.pack(
+            packet.ack,
+            packet.checksum_frame,
+            packet.checksum,
+            packet.start,
+            len(packet.inputs),
+        )
+        + packet.inputs
+    )
+
+
+def decode_packet(data: bytes) -> Hello | InputPacket | None:
+    """Parse a packet; None for anything malformed or foreign."""
+    try:
+        magic, kind = _HEADER.unpack_from(data)
+        if magic != NETPLAY_MAGIC:
+            return None
+        if kind == PACKET_HELLO:
+            return Hello(*_HELLO.unpack_from(data, _HEADER.size))
+        if kind == PACKET_INPUT:
+            *fields, count = _INPUT.unpack_from(data, _HEADER.size)
+            start = _HEADER.size + _INPUT.size
+            inputs = data[start : start + count]
+            if len(inputs) != count:
+                return None
+            return InputPacket(*fields, inputs)
+    except struct.error:
+        return None
+    return None
+
+
+class UdpTransport:
+    """A non-blocking UDP socket talking to one peer."""
+
+    def __init__(
+        self, port: int, peer: tuple[str, int], host: str = "127.0.0.1"
+    ) -> None:
+        self.peer = peer
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind((host, port))
+        self.sock.setblocking(False)
+        self.sent = 0
+        self.received = 0
+
+    @property
+    def port(self) -> int:
+        """The bound local port (useful after binding port 0)."""
+        return self.sock.getsockname()[1]
+
+    def send(self, data: bytes) -> None:
+        """Send a datagram to the peer; a full or refused socket drops it."""
+        try:
+            self.sock.sendto(data, self.peer)
+            self.sent += 1
+        except OSError:
+            pass
+
+    def receive(self) -> list[bytes]:
+        """Every datagram waiting from the peer."""
+        packets = []
+        while True:
+            try:
+                data, address = self.sock.recvfrom(MAX_DATAGRAM)
+            except (BlockingIOError, ConnectionRefusedError):
+                return packets
+            if address == self.peer:
+                packets.append(data)
+                self.received += 1
+
+    def close(self) -> None:
+        """Release the socket."""
+        self.sock.close()
+
+
+class LossyTransport:
+    """Drops and delays outgoing packets of another transport, reproducibly."""
+
+    def __init__(
+        self,
+        inner: UdpTransport,
+        loss: float = 0.0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        seed: int | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.inner = inner
+        self.loss = loss  # probability a packet is dropped
+        self.latency = latency  # seconds each packet is held
+        self.jitter = jitter  # extra random delay, 0..jitter seconds
+        self.rng = random.Random(seed)
+        self.clock = clock
+        self.dropped = 0
+        self._held: list[tuple[float, int, bytes]] = []  # (due, serial, data)
+        self._serial = 0
+
+    def send(self, data: bytes) -> None:
+        """Drop the packet, or hold it until its delivery time."""
+        if self.rng.random() < self.loss:
+            self.dropped += 1
+            return
+        due = self.clock() + self.latency + self.rng.uniform(0.0, self.jitter)
+        heapq.heappush(self._held, (due, self._serial, data))
+        self._serial += 1
+        self.flush()
+
+    def flush(self) -> None:
+        """Pass on every held packet whose time has come."""
+        now = self.clock()
+        while self._held and self._held[0][0] <= now:
+            self.inner.send(heapq.heappop(self._held)[2])
+
+    def receive(self) -> list[bytes]:
+        """Deliver due packets, then read what has arrived."""
+        self.flush()
+        return self.inner.receive()
+
+    def close(self) -> None:
+        """Close the wrapped transport (held packets are lost)."""
+        self.inner.close()
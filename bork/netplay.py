@@ -0,0 +1,159 @@
+"""Two-player co-op over UDP: run one of these per player.
+
+Player 1 listens on the base port and player 2 on the next one; each
+sends to the other's. Both must use the same seed. --loss and --latency
+route outgoing packets through a LossyTransport to rehearse a bad link on
+localhost.
+
+With --headless the ship is flown by the autopilot for --frames frames;
+the run then waits until both sides hold every input, prints the frame
+and the CRC32 of the final state, and exits 1 if a desync was detected.
+Two headless runs with the same seed must print the same checksum.
+
+Run from the repository root (two terminals):
+
+    python -m bork.netplay --player 1 [--peer HOST] [--seed 1]
+    python -m bork.netplay --player 2 [--peer HOST] [--seed 1]
+"""
+
+import argparse
+import sys
+import time
+from collections.abc import Iterator
+
+from bork.autopilot import autopilot_actions
+from bork.constants import NETPLAY_INPUT_DELAY, NETPLAY_PORT, NETPLAY_TIMEOUT
+from bork.net import LossyTransport, UdpTransport
+from bork.rollback import RollbackSession
+from bork.simulation import Simulation
+
+LINGER = 0.5  # seconds a finished headless run keeps answering its peer
+
+
+class SessionStepper:
+    """Steps a RollbackSession by whole fixed ticks of a window's frame time."""
+
+    def __init__(self, session: RollbackSession) -> None:
+        self.session = session
+        self.pending = 0.0  # wall time not yet stepped by the session
+
+    def advance(self, dt: float, actions: set[str]) -> Iterator[None]:
+        """Add `dt` of wall time and yield after each tick it steps.
+
+        Stops early while waiting on the peer; at most `max_rollback` ticks
+        of time are kept owing.
+        """
+        session = self.session
+        step = session.dt
+        self.pending = min(self.pending + dt, session.max_rollback * step)
+        while self.pending >= step:
+            if not session.advance(actions):
+                break  # waiting on the peer
+            self.pending -= step
+            yield
+
+    def debug_line(self) -> str:
+        """Frame, lead and rollback stats for the debug overlay."""
+        session = self.session
+        net = session.stats
+        desync = session.desync_frame
+        return (
+            f"Netplay frame {session.frame} ahead {session.frames_ahead}"
+            f" (rollbacks {net.rollbacks} deepest {net.max_depth}"
+            f" stalls {net.stalls})"
+            + ("" if desync is None else f" DESYNC at {desync}")
+        )
+
+
+def open_session(args: argparse.Namespace) -> RollbackSession:
+    """Bind the local port, wrap it in the shim if asked, and handshake."""
+    local = args.player - 1
+    transport = UdpTransport(
+        args.port + local, (args.peer, args.port + 1 - local), host=args.bind
+    )
+    if args.loss or args.latency:
+        transport = LossyTransport(
+            transport, args.loss, args.latency, args.latency / 2, seed=args.player
+        )
+    session = RollbackSession(
+        Simulation(seed=args.seed, players=2),
+        local,
+        transport,
+        args.seed,
+        input_delay=args.delay,
+    )
+    session.connect()
+    return session
+
+
+def run_headless(session: RollbackSession, frames: int, paced: bool) -> int:
+    """Autopilot `frames` frames, settle with the peer; the final checksum."""
+    step = session.dt
+    next_tick = time.monotonic()
+    while session.frame < frames:
+        if not session.advance(autopilot_actions(session.sim, session.local)):
+            time.sleep(0.001)
+            continue
+        if paced:
+            next_tick += step
+            time.sleep(max(0.0, next_tick - time.monotonic()))
+    deadline = time.monotonic() + NETPLAY_TIMEOUT
+    while not session.settled(frames):
+        if time.monotonic() > deadline:
+            raise TimeoutError("peer never confirmed the last frames")
+        session.idle()
+        time.sleep(0.001)
+    # Keep acknowledging so the peer can settle too
+    linger = time.monotonic() + LINGER
+    while time.monotonic() < linger:
+        session.idle()
+        time.sleep(0.002)
+    return session.checksum()
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--player", type=int, choices=(1, 2), required=True)
+    parser.add_argument("--peer", default="127.0.0.1", help="the other player's host")
+    parser.add_argument("--bind", default="127.0.0.1", help="local address to bind")
+    parser.add_argument("--port", type=int, default=NETPLAY_PORT, help="base port")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--delay", type=int, default=NETPLAY_INPUT_DELAY)
+    parser.add_argument("--loss", type=float, default=0.0, help="drop probability")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds one way")
+    parser.add_argument(
+        "--headless", action="store_true", help="autopilot without a window"
+    )
+    parser.add_argument("--frames", type=int, default=600, help="headless run length")
+    parser.add_argument(
+        "--unpaced", action="store_true", help="headless: don't wait for TARGET_FPS"
+    )
+    args = parser.parse_args()
+
+    session = open_session(args)
+    if args.headless:
+        checksum = run_headless(session, args.frames, not args.unpaced)
+        stats = session.stats
+        print(
+            f"frame {session.frame} checksum {checksum:08x}"
+            f" rollbacks {stats.rollbacks} resimulated {stats.resimulated}"
+            f" stalls {stats.stalls} checks {stats.checks}",
+            flush=True,
+        )
+        if session.desync_frame is not None:
+            print(f"desync at frame {session.desync_frame}", file=sys.stderr)
+            sys.exit(1)
+        return
+
+    import arcade
+
+    from bork.game import BorkGame
+
+    game = BorkGame(session)
+    game.setup()
+    arcade.run()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,16 @@
 """Particle and ParticleSystem for visual effects."""
 
-import arcade
+from collections import deque
+from collections.abc import Iterator
+from itertools import chain
 
-from bork.constants import PARTICLE_POOL_SIZE
+from bork.constants import (
+    PARTICLE_POOL_SIZE,
+    PARTICLE_PRIORITY_BUDGET,
+    PARTICLE_PRIORITY_LOW,
+    PARTICLE_PRIORITY_NORMAL,
+    PARTICLE_THIN_THRESHOLD,
+)
 
 
 class Particle:
@@ -20,6 +28,7 @@ class Particle:
         size_end: float,
         lifetime: float,
         shape: str,
+        priority: int = PARTICLE_PRIORITY_NORMAL,
     ) -> None:
         self.x = x
         self.y = y
@@ -31,6 +40,7 @@ class Particle:
         self.size_end = size_end
         self.lifetime = lifetime
         self.shape = shape  # "square", "triangle", "circle"
+        self.priority = priority  # PARTICLE_PRIORITY_* class
         self.age = 0.0
 
     @property
@@ -65,50 +75,112 @@ class Particle:
         self.y += self.vy * dt
         self.age += dt
 
-    def draw(self) -> None:
-        """Draw the particle as its configured shape."""
-        s = self.size
-        if s <= 0:
-            return
-        c = self.color
-        if self.shape == "circle":
-            arcade.draw_circle_filled(self.x, self.y, s, c)
-        elif self.shape == "square":
-            arcade.draw_lrbt_rectangle_filled(
-                self.x - s, self.x + s, self.y - s, self.y + s, c
-            )
-        elif self.shape == "triangle":
-            arcade.draw_triangle_filled(
-                self.x,
-                self.y + s,
-                self.x - s,
-                self.y - s,
-                self.x + s,
-                self.y - s,
-                c,
-            )
-
 
 class ParticleSystem:
-    """Manages a pool of particles with automatic cleanup."""
+    """Manages a priority-budgeted pool of particles with automatic cleanup.
+
+    Each priority class is capped at a share of the pool. When the pool is
+    full, a burst may evict the oldest particles of strictly lower classes;
+    low-priority bursts are thinned at spawn time once the pool nears capacity.
+    """
 
     def __init__(self, max_particles: int = PARTICLE_POOL_SIZE) -> None:
-        self.particles: list[Particle] = []
         self.max_particles = max_particles
+        self.pools: dict[int, deque[Particle]] = {
+            priority: deque() for priority in sorted(PARTICLE_PRIORITY_BUDGET)
+        }
+        self.class_limits: dict[int, int] = {
+            priority: int(max_particles * share)
+            for priority, share in PARTICLE_PRIORITY_BUDGET.items()
+        }
+        self.dropped: dict[int, int] = dict.fromkeys(self.pools, 0)
+        self.thinned: dict[int, int] = dict.fromkeys(self.pools, 0)
+        self.evicted: dict[int, int] = dict.fromkeys(self.pools, 0)
+        # Work done, for benchmarks/tests
+        self.admitted = 0
+        self.integrated = 0
+        self.rebuilds = 0
+
+    @property
+    def particles(self) -> Iterator[Particle]:
+        """All active particles, lowest priority first (drawn underneath)."""
+        return chain.from_iterable(self.pools.values())
+
+    @property
+    def count(self) -> int:
+        """Number of active particles across all classes."""
+        return sum(len(pool) for pool in self.pools.values())
 
     def add(self, particles: list[Particle]) -> None:
-        """Add particles to the system, trimming oldest if over limit."""
-        self.particles.extend(particles)
-        if len(self.particles) > self.max_particles:
-            self.particles = self.particles[-self.max_particles :]
+        """Add particles, enforcing per-class budgets and thinning low bursts."""
+        by_priority: dict[int, list[Particle]] = {}
+        for p in particles:
+            by_priority.setdefault(p.priority, []).append(p)
+        for priority in sorted(by_priority, reverse=True):
+            self._add_burst(priority, by_priority[priority])
+
+    def _add_burst(self, priority: int, burst: list[Particle]) -> None:
+        """Admit one same-priority burst into its pool."""
+        pool = self.pools[priority]
+        requested = len(burst)
+
+        if priority == PARTICLE_PRIORITY_LOW:
+            burst = self._thin(burst)
+            self.thinned[priority] += requested - len(burst)
+
+        wanted = min(len(burst), max(0, self.class_limits[priority] - len(pool)))
+        free = self.max_particles - self.count
+        if free < wanted:
+            free += self._evict_below(priority, wanted - free)
+        room = max(0, min(wanted, free))
+        if room < len(burst):
+            self.dropped[priority] += len(burst) - room
+            burst = burst[:room]
+        pool.extend(burst)
+        self.admitted += len(burst)
+
+    def _thin(self, burst: list[Particle]) -> list[Particle]:
+        """Keep an evenly spaced subset of a burst based on pool fill."""
+        fill = self.count / self.max_particles if self.max_particles else 1.0
+        if fill < PARTICLE_THIN_THRESHOLD:
+            return burst
+        keep_ratio = max(0.0, (1.0 - fill) / (1.0 - PARTICLE_THIN_THRESHOLD))
+        keep = int(len(burst) * keep_ratio)
+        if keep <= 0:
+            return []
+        step = len(burst) / keep
+        return [burst[int(i * step)] for i in range(keep)]
+
+    def _evict_below(self, priority: int, needed: int) -> int:
+        """Evict up to `needed` oldest particles from lower classes."""
+        freed = 0
+        for lower in sorted(self.pools):
+            if lower >= priority or freed >= needed:
+                break
+            pool = self.pools[lower]
+            n = min(len(pool), needed - freed)
+            if n:
+                for _ in range(n):
+                    pool.popleft()  # oldest first, O(1) each
+                self.evicted[lower] += n
+                freed += n
+        return freed
+
+    def reset_counters(self) -> None:
+        """Zero the dropped/thinned/evicted counters."""
+        for counters in (self.dropped, self.thinned, self.evicted):
+            for priority in counters:
+                counters[priority] = 0
 
     def update(self, dt: float) -> None:
-        """Update all particles and remove dead ones."""
-        for p in self.particles:
-            p.update(dt)
-        self.particles = [p for p in self.particles if not p.is_dead]
-
-    def draw(self) -> None:
-        """Draw all active particles."""
-        for p in self.particles:
-            p.draw()
+        """Update all particles and remove dead ones.
+
+        A pool is only rebuilt on ticks where one of its particles died.
+        """
+        for priority, pool in self.pools.items():
+            for p in pool:
+                p.update(dt)
+            self.integrated += len(pool)
+            if any(p.is_dead for p in pool):
+                self.pools[priority] = deque(p for p in pool if not p.is_dead)
+                self.rebuilds += 1
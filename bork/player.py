@@ -2,15 +2,19 @@
 
 import math
 
-import arcade
-
 from bork.constants import (
-    COLOR_PLAYER,
-    INVULNERABLE_BLINK_RATE,
+    ACTION_DOWN,
+    ACTION_LEFT,
+    ACTION_RIGHT,
+    ACTION_UP,
+    COOP_PLAYER_SPACING,
+    DEFAULT_WEAPON,
     PLAYER_ACCELERATION,
     PLAYER_FRICTION,
     PLAYER_MAX_SPEED,
     PLAYER_SHIP_SIZE,
+    PLAYER_START_X,
+    PLAYER_START_Y,
     SCREEN_HEIGHT,
     SCREEN_WIDTH,
     SHOOT_COOLDOWN,
@@ -29,14 +33,15 @@ class Player:
         self.shoot_timer = 0.0
         self.speed_multiplier = 1.0
         self.invulnerable_timer: float = 0.0
+        self.weapon: str = DEFAULT_WEAPON  # key into WEAPONS
 
     @property
     def is_invulnerable(self) -> bool:
         """Return True if player is in invulnerability period."""
         return self.invulnerable_timer > 0.0
 
-    def update(self, dt: float, keys_pressed: set[int]) -> None:
-        """Update position based on input, friction, and bounds."""
+    def update(self, dt: float, actions: set[str]) -> None:
+        """Update position based on input actions, friction, and bounds."""
         if self.invulnerable_timer > 0:
             self.invulnerable_timer -= dt
             if self.invulnerable_timer < 0:
@@ -45,13 +50,13 @@ class Player:
         # Apply acceleration from input
         ax = 0.0
         ay = 0.0
-        if arcade.key.RIGHT in keys_pressed or arcade.key.D in keys_pressed:
+        if ACTION_RIGHT in actions:
             ax += PLAYER_ACCELERATION
-        if arcade.key.LEFT in keys_pressed or arcade.key.A in keys_pressed:
+        if ACTION_LEFT in actions:
             ax -= PLAYER_ACCELERATION
-        if arcade.key.UP in keys_pressed or arcade.key.W in keys_pressed:
+        if ACTION_UP in actions:
             ay += PLAYER_ACCELERATION
-        if arcade.key.DOWN in keys_pressed or arcade.key.S in keys_pressed:
+        if ACTION_DOWN in actions:
             ay -= PLAYER_ACCELERATION
 
         # Normalize diagonal input so it doesn't exceed acceleration magnitude
@@ -84,26 +89,21 @@ class Player:
         self.x = max(PLAYER_SHIP_SIZE, min(SCREEN_WIDTH - PLAYER_SHIP_SIZE, self.x))
         self.y = max(PLAYER_SHIP_SIZE, min(SCREEN_HEIGHT - PLAYER_SHIP_SIZE, self.y))
 
-    def draw(self) -> None:
-        """Draw the ship as a right-pointing triangle."""
-        if self.is_invulnerable:
-            if int(self.invulnerable_timer * INVULNERABLE_BLINK_RATE * 2) % 2 == 0:
-                return
-        s = PLAYER_SHIP_SIZE
-        arcade.draw_triangle_filled(
-            self.x + s,
-            self.y,  # nose (right)
-            self.x - s,
-            self.y + s * 0.7,  # top-left
-            self.x - s,
-            self.y - s * 0.7,  # bottom-left
-            COLOR_PLAYER,
-        )
-
     def can_shoot(self) -> bool:
         """Return True if shoot cooldown has elapsed."""
         return self.shoot_timer <= 0.0
 
-    def reset_shoot_timer(self) -> None:
-        """Reset the shoot cooldown timer."""
-        self.shoot_timer = SHOOT_COOLDOWN
+    def reset_shoot_timer(self, cooldown: float = SHOOT_COOLDOWN) -> None:
+        """Reset the shoot cooldown timer (to the weapon's cooldown)."""
+        self.shoot_timer = cooldown
+
+
+def player_start(index: int, count: int) -> tuple[float, float]:
+    """Where ship `index` of `count` starts and respawns (stacked on y)."""
+    offset = (index - (count - 1) / 2) * COOP_PLAYER_SPACING
+    return PLAYER_START_X, PLAYER_START_Y - offset
+
+
+def new_players(count: int) -> list[Player]:
+    """Fresh ships at their starting positions."""
+    return [Player(*player_start(i, count)) for i in range(count)]
@@ -1,17 +1,6 @@
 """Collectible powerup that drifts leftward with a pulse animation."""
 
-import math
-
-import arcade
-
-from bork.constants import (
-    POWERUP_COLOR,
-    POWERUP_PULSE_AMOUNT,
-    POWERUP_PULSE_SPEED,
-    POWERUP_SIZE,
-    POWERUP_SPEED,
-    POWERUP_TEXT_COLOR,
-)
+from bork.constants import POWERUP_SIZE, POWERUP_SPEED
 
 
 class Powerup:
@@ -31,21 +20,3 @@ class Powerup:
     def is_off_screen(self) -> bool:
         """Return True if past the left edge."""
         return self.x < -POWERUP_SIZE
-
-    def draw(self) -> None:
-        """Draw as a pulsing yellow circle with black letter."""
-        pulse = 1.0 + POWERUP_PULSE_AMOUNT * math.sin(
-            self.time_alive * POWERUP_PULSE_SPEED * 2 * math.pi
-        )
-        r = POWERUP_SIZE * pulse
-        arcade.draw_circle_filled(self.x, self.y, r, POWERUP_COLOR)
-        arcade.draw_text(
-            "S",
-            self.x,
-            self.y,
-            POWERUP_TEXT_COLOR,
-            font_size=14,
-            bold=True,
-            anchor_x="center",
-            anchor_y="center",
-        )
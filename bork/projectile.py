@@ -1,38 +1,66 @@
-"""Laser projectile fired by the player."""
+"""Projectiles fired by the player's weapons."""
 
-import arcade
+import math
 
 from bork.constants import (
-    COLOR_LASER,
     PROJECTILE_LENGTH,
     PROJECTILE_SPEED,
-    PROJECTILE_WIDTH,
+    SCREEN_HEIGHT,
     SCREEN_WIDTH,
 )
 
 
 class Projectile:
-    """A single laser projectile moving rightward."""
+    """A single shot with its own velocity, optional pierce and wave motion."""
 
-    def __init__(self, x: float, y: float) -> None:
+    def __init__(
+        self,
+        x: float,
+        y: float,
+        vx: float = PROJECTILE_SPEED,
+        vy: float = 0.0,
+        pierce: int = 0,
+        wave_amplitude: float = 0.0,
+        wave_frequency: float = 0.0,
+    ) -> None:
         self.x = x
         self.y = y
+        self.vx = vx
+        self.vy = vy
+        self.pierce = pierce  # enemies it can still pass through
+        self.wave_amplitude = wave_amplitude
+        self.wave_frequency = wave_frequency
+        self.base_y = y  # path center when wobbling
+        self.time_alive = 0.0
+        self.hits: set[int] | None = None  # handles of enemies already pierced
 
     def update(self, dt: float) -> None:
-        """Move the projectile rightward."""
-        self.x += PROJECTILE_SPEED * dt
+        """Move along the velocity, wobbling around the path for wave shots."""
+        self.x += self.vx * dt
+        self.base_y += self.vy * dt
+        self.time_alive += dt
+        if self.wave_amplitude:
+            self.y = self.base_y + self.wave_amplitude * math.sin(
+                self.wave_frequency * self.time_alive * 2 * math.pi
+            )
+        else:
+            self.y = self.base_y
+
+    def register_hit(self, handle: int) -> bool:
+        """Record a hit on an enemy. Returns True when the shot is used up."""
+        if self.pierce <= 0:
+            return True
+        self.pierce -= 1
+        if self.hits is None:
+            self.hits = set()
+        self.hits.add(handle)
+        return False
 
     def is_off_screen(self) -> bool:
-        """Return True if past the right edge of the screen."""
-        return self.x > SCREEN_WIDTH + PROJECTILE_LENGTH
-
-    def draw(self) -> None:
-        """Draw the laser bolt as a small filled rectangle."""
-        half_w = PROJECTILE_WIDTH / 2
-        arcade.draw_lrbt_rectangle_filled(
-            self.x - PROJECTILE_LENGTH / 2,
-            self.x + PROJECTILE_LENGTH / 2,
-            self.y - half_w,
-            self.y + half_w,
-            COLOR_LASER,
+        """Return True once the shot has left the screen on any side."""
+        return (
+            self.x > SCREEN_WIDTH + PROJECTILE_LENGTH
+            or self.x < -PROJECTILE_LENGTH
+            or self.y > SCREEN_HEIGHT + PROJECTILE_LENGTH
+            or self.y < -PROJECTILE_LENGTH
         )
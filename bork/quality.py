@@ -0,0 +1,84 @@
+"""Adaptive quality governor driven by measured frame time."""
+
+from collections import deque
+
+from bork.constants import (
+    QUALITY_CHANGE_COOLDOWN,
+    QUALITY_DOWNGRADE_RATIO,
+    QUALITY_FRAME_BUDGET,
+    QUALITY_TIERS,
+    QUALITY_UPGRADE_HOLD,
+    QUALITY_UPGRADE_RATIO,
+    QUALITY_WINDOW_FRAMES,
+)
+
+
+class QualityGovernor:
+    """Steps quality tiers down when frames run over budget, and back up.
+
+    Frame times are averaged over a rolling window. Hysteresis comes from
+    the gap between the downgrade and upgrade thresholds, the hold time
+    required before stepping up, and a cooldown after every change.
+    """
+
+    def __init__(
+        self,
+        tiers: list[dict] = QUALITY_TIERS,
+        budget: float = QUALITY_FRAME_BUDGET,
+        window: int = QUALITY_WINDOW_FRAMES,
+    ) -> None:
+        self.tiers = tiers
+        self.budget = budget
+        self.frame_times: deque[float] = deque(maxlen=window)
+        self.enabled = True  # False pins the current tier
+        self.tier_index = 0
+        self.cooldown = 0.0
+        self.headroom_time = 0.0
+
+    @property
+    def tier(self) -> dict:
+        """Settings for the current tier."""
+        return self.tiers[self.tier_index]
+
+    @property
+    def average(self) -> float:
+        """Average frame time over the window (0.0 if empty)."""
+        if not self.frame_times:
+            return 0.0
+        return sum(self.frame_times) / len(self.frame_times)
+
+    def record(self, frame_time: float, dt: float) -> bool:
+        """Record one frame's work time and elapsed wall time (dt).
+
+        Returns True if the tier changed.
+        """
+        self.frame_times.append(frame_time)
+        if not self.enabled:
+            return False
+        if self.cooldown > 0:
+            self.cooldown -= dt
+            return False
+        if len(self.frame_times) < self.frame_times.maxlen:
+            return False
+
+        avg = self.average
+        if avg > self.budget * QUALITY_DOWNGRADE_RATIO:
+            self.headroom_time = 0.0
+            if self.tier_index < len(self.tiers) - 1:
+                self._set_tier(self.tier_index + 1)
+                return True
+        elif avg < self.budget * QUALITY_UPGRADE_RATIO:
+            self.headroom_time += dt
+            if self.tier_index > 0 and self.headroom_time >= QUALITY_UPGRADE_HOLD:
+                self._set_tier(self.tier_index - 1)
+                return True
+        else:
+            self.headroom_time = 0.0
+        return False
+
+    def _set_tier(self, index: int) -> None:
+        """Switch tier and restart measurement."""
+        self.tier_index = index
+        self.frame_times.clear()
+        self.cooldown = QUALITY_CHANGE_COOLDOWN
+        self.headroom_time = 0.0
@@ -0,0 +1,192 @@
+"""Per-frame draw-call, vertex and GL state counters, broken down by subsystem.
+
+Counting works by wrapping the few arcade/pyglet entry points every draw
+goes through (geometry renders, text label draws, blend toggles, projection
+and framebuffer changes) while the stats are installed. When not installed,
+`section()` is a cheap no-op, so the game can leave the calls in place.
+"""
+
+import time
+
+import arcade
+import pyglet
+from arcade.gl import Framebuffer, Geometry
+
+
+def _text_vertices(text: arcade.Text) -> int:
+    """Vertices of the glyph quads a label's pyglet layout actually holds."""
+    return sum(vertex_list.count for vertex_list in text._label._vertex_lists)
+
+
+class SectionStats:
+    """Counters for one subsystem over one frame."""
+
+    def __init__(self) -> None:
+        self.draw_calls = 0
+        self.vertices = 0
+        self.blend_changes = 0
+        self.projection_changes = 0
+        self.framebuffer_binds = 0
+        self.cpu_time = 0.0  # seconds
+        self.gpu_time = 0.0  # seconds (only with gpu_timing)
+
+    def add(self, other: "SectionStats") -> None:
+        """Accumulate another section's counters into this one."""
+        self.draw_calls += other.draw_calls
+        self.vertices += other.vertices
+        self.blend_changes += other.blend_changes
+        self.projection_changes += other.projection_changes
+        self.framebuffer_binds += other.framebuffer_binds
+        self.cpu_time += other.cpu_time
+        self.gpu_time += other.gpu_time
+
+
+class RenderStats:
+    """Collects SectionStats per named subsystem for each frame."""
+
+    def __init__(self) -> None:
+        self.installed = False
+        self.gpu_timing = False
+        self.sections: dict[str, SectionStats] = {}
+        self.last_frame: dict[str, SectionStats] = {}
+        self.current: SectionStats | None = None
+        self._section_start = 0.0
+        self._query = None
+        self._ctx: arcade.ArcadeContext | None = None
+        self._restore: list[tuple[object, str, object]] = []
+
+    def install(self, window: arcade.Window, gpu_timing: bool = False) -> None:
+        """Start counting by wrapping the draw and state entry points."""
+        if self.installed:
+            return
+        self.installed = True
+        self.gpu_timing = gpu_timing
+        self._ctx = window.ctx
+        stats = self
+
+        original_render = Geometry.render
+
+        def render(geometry, program, *, mode=None, first=0, vertices=None, **kw):
+            section = stats.current
+            if section is not None:
+                section.draw_calls += 1
+                section.vertices += vertices or geometry.num_vertices
+            return original_render(
+                geometry, program, mode=mode, first=first, vertices=vertices, **kw
+            )
+
+        original_text_draw = arcade.Text.draw
+
+        def text_draw(text: arcade.Text) -> None:
+            section = stats.current
+            if section is not None:
+                section.draw_calls += 1
+                section.vertices += _text_vertices(text)
+            original_text_draw(text)
+
+        original_use = Framebuffer.use
+
+        def fbo_use(fbo, *args, **kwargs):
+            if stats.current is not None:
+                stats.current.framebuffer_binds += 1
+            return original_use(fbo, *args, **kwargs)
+
+        ctx = window.ctx
+        original_enable = ctx.enable
+        original_disable = ctx.disable
+
+        def enable(*flags: int) -> None:
+            if stats.current is not None and ctx.BLEND in flags:
+                stats.current.blend_changes += 1
+            original_enable(*flags)
+
+        def disable(*flags: int) -> None:
+            if stats.current is not None and ctx.BLEND in flags:
+                stats.current.blend_changes += 1
+            original_disable(*flags)
+
+        owner = _property_owner(type(window), "projection")
+        original_projection = owner.__dict__["projection"]
+
+        def set_projection(win, matrix) -> None:
+            if stats.current is not None:
+                stats.current.projection_changes += 1
+            original_projection.fset(win, matrix)
+
+        self._patch(Geometry, "render", render)
+        self._patch(arcade.Text, "draw", text_draw)
+        self._patch(Framebuffer, "use", fbo_use)
+        self._patch(ctx, "enable", enable)
+        self._patch(ctx, "disable", disable)
+        self._patch(
+            owner, "projection", property(original_projection.fget, set_projection)
+        )
+
+    def uninstall(self) -> None:
+        """Stop counting and restore the original entry points."""
+        self._finish_section()
+        for target, name, original in reversed(self._restore):
+            if original is None:
+                delattr(target, name)
+            else:
+                setattr(target, name, original)
+        self._restore = []
+        self.installed = False
+        self.current = None
+
+    def _patch(self, target: object, name: str, replacement: object) -> None:
+        """Replace an attribute, remembering how to undo it."""
+        original = vars(target).get(name)
+        self._restore.append((target, name, original))
+        setattr(target, name, replacement)
+
+    def begin_frame(self) -> None:
+        """Start a new frame of counters."""
+        if not self.installed:
+            return
+        self.sections = {}
+        self.section("other")
+
+    def section(self, name: str) -> None:
+        """Attribute subsequent draws to the named subsystem."""
+        if not self.installed:
+            return
+        self._finish_section()
+        self.current = self.sections.setdefault(name, SectionStats())
+        if self.gpu_timing:
+            self._query = self._ctx.query(samples=False, primitives=False)
+            self._query.__enter__()
+        self._section_start = time.perf_counter()
+
+    def _finish_section(self) -> None:
+        """Close timing for the current section."""
+        if self.current is None:
+            return
+        self.current.cpu_time += time.perf_counter() - self._section_start
+        if self._query is not None:
+            self._query.__exit__(None, None, None)
+            self.current.gpu_time += self._query.time_elapsed / 1e9
+            self._query = None
+        self.current = None
+
+    def end_frame(self) -> None:
+        """Close the frame and publish its counters as `last_frame`."""
+        if not self.installed:
+            return
+        self._finish_section()
+        self.last_frame = self.sections
+
+    def totals(self) -> SectionStats:
+        """Sum of all sections in the last completed frame."""
+        total = SectionStats()
+        for section in self.last_frame.values():
+            total.add(section)
+        return total
+
+
+def _property_owner(cls: type, name: str) -> type:
+    """Return the class in `cls`'s MRO that defines property `name`."""
+    for klass in cls.__mro__:
+        if isinstance(klass.__dict__.get(name), property):
+            return klass
+    return pyglet.window.BaseWindow
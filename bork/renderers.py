@@ -0,0 +1,209 @@
+"""Arcade drawing for simulation entities and background effects.
+
+Entity and effect modules hold state only; everything that touches arcade
+lives here, so gameplay code imports without arcade or a GL context.
+Shapes come pre-rasterized from the shape atlas and each layer is drawn as
+one batched SpriteList; projectiles and bullets stay primitives.
+"""
+
+import math
+
+import arcade
+
+from bork.atlas import ShapeAtlas
+from bork.boss import Boss
+from bork.bullets import BulletStore
+from bork.constants import (
+    ATLAS_TINT_SIZE,
+    BOSS_COLORS,
+    COLOR_LASER,
+    COLOR_STAR,
+    ENEMY_BULLET_COLOR,
+    ENEMY_BULLET_RADIUS,
+    INVULNERABLE_BLINK_RATE,
+    POWERUP_PULSE_AMOUNT,
+    POWERUP_PULSE_SPEED,
+    PROJECTILE_LENGTH,
+    PROJECTILE_WIDTH,
+)
+from bork.enemy import Enemy
+from bork.particles import ParticleSystem
+from bork.player import Player
+from bork.powerup import Powerup
+from bork.projectile import Projectile
+from bork.starfield import Starfield
+
+
+class SpriteBatch:
+    """Pooled sprites from the shape atlas, drawn as one SpriteList.
+
+    Sprites are reused from frame to frame: `begin()` rewinds the pool,
+    `add()` places the next sprite and `draw()` trims what this frame did
+    not use and issues a single draw call.
+    """
+
+    def __init__(self, textures: dict[str, arcade.Texture]) -> None:
+        self.textures = textures
+        self.sprites = arcade.SpriteList(lazy=True)
+        self._used = 0
+
+    def begin(self) -> None:
+        """Start filling the batch for a new frame."""
+        self._used = 0
+
+    def add(
+        self,
+        name: str,
+        x: float,
+        y: float,
+        scale: float = 1.0,
+        color: tuple[int, int, int, int] = (255, 255, 255, 255),
+    ) -> None:
+        """Place the next sprite: an atlas shape, scaled and tinted."""
+        texture = self.textures[name]
+        if self._used < len(self.sprites):
+            sprite = self.sprites[self._used]
+            if sprite.texture is not texture:
+                sprite.texture = texture
+        else:
+            sprite = arcade.Sprite(texture)
+            self.sprites.append(sprite)
+        sprite.position = (x, y)
+        sprite.scale = scale
+        sprite.color = color
+        self._used += 1
+
+    def draw(self) -> None:
+        """Drop unused sprites and draw the rest."""
+        while len(self.sprites) > self._used:
+            self.sprites.pop()
+        if self._used:
+            self.sprites.draw()
+
+
+def load_textures(atlas: ShapeAtlas) -> dict[str, arcade.Texture]:
+    """One arcade texture per atlas shape."""
+    return {
+        name: arcade.Texture(
+            atlas.crop(name),
+            hash=f"bork-atlas-{atlas.key}-{name}",
+            hit_box_algorithm=arcade.hitbox.algo_bounding_box,
+        )
+        for name in atlas.regions
+    }
+
+
+# Atlas shape per player index (co-op)
+PLAYER_SHAPES = ("player", "player2")
+
+
+def draw_players(players: list[Player], batch: SpriteBatch) -> None:
+    """Draw every ship (blinking when invulnerable)."""
+    batch.begin()
+    for player, shape in zip(players, PLAYER_SHAPES):
+        blink = int(player.invulnerable_timer * INVULNERABLE_BLINK_RATE * 2)
+        if not player.is_invulnerable or blink % 2 == 1:
+            batch.add(shape, player.x, player.y)
+    batch.draw()
+
+
+def draw_enemies(enemies: list[Enemy], batch: SpriteBatch) -> None:
+    """Draw every enemy as a diamond."""
+    batch.begin()
+    for enemy in enemies:
+        batch.add("enemy", enemy.x, enemy.y)
+    batch.draw()
+
+
+# Atlas shape per boss part kind (tinted with BOSS_COLORS)
+BOSS_SHAPES = {
+    "core": "circle",
+    "armor": "square",
+    "hull": "square",
+    "turret": "circle",
+}
+
+
+def draw_bosses(bosses: list[Boss], batch: SpriteBatch) -> None:
+    """Draw every live boss part at its animated position."""
+    batch.begin()
+    for boss in bosses:
+        parts = boss.tree.parts
+        for index in boss.live_parts():
+            kind = parts[index]["kind"]
+            x, y = boss.part_position(index)
+            batch.add(
+                BOSS_SHAPES[kind],
+                x,
+                y,
+                2 * parts[index]["radius"] / ATLAS_TINT_SIZE,
+                (*BOSS_COLORS[kind], 255),
+            )
+    batch.draw()
+
+
+def draw_projectile(proj: Projectile) -> None:
+    """Draw the laser bolt as a thick line along its direction of travel."""
+    if proj.vy == 0.0:
+        half_w = PROJECTILE_WIDTH / 2
+        arcade.draw_lrbt_rectangle_filled(
+            proj.x - PROJECTILE_LENGTH / 2,
+            proj.x + PROJECTILE_LENGTH / 2,
+            proj.y - half_w,
+            proj.y + half_w,
+            COLOR_LASER,
+        )
+        return
+    scale = PROJECTILE_LENGTH / 2 / math.hypot(proj.vx, proj.vy)
+    dx = proj.vx * scale
+    dy = proj.vy * scale
+    arcade.draw_line(
+        proj.x - dx,
+        proj.y - dy,
+        proj.x + dx,
+        proj.y + dy,
+        COLOR_LASER,
+        PROJECTILE_WIDTH,
+    )
+
+
+def draw_bullets(bullets: BulletStore) -> None:
+    """Draw all enemy bullets as square points in a single draw call."""
+    n = bullets.count
+    if n == 0:
+        return
+    points = list(zip(bullets.x[:n].tolist(), bullets.y[:n].tolist()))
+    arcade.draw_points(points, ENEMY_BULLET_COLOR, ENEMY_BULLET_RADIUS * 2)
+
+
+def draw_powerups(powerups: list[Powerup], batch: SpriteBatch) -> None:
+    """Draw each powerup as a pulsing disc with its kind's letter."""
+    batch.begin()
+    for powerup in powerups:
+        pulse = 1.0 + POWERUP_PULSE_AMOUNT * math.sin(
+            powerup.time_alive * POWERUP_PULSE_SPEED * 2 * math.pi
+        )
+        # The atlas disc is drawn at the largest pulse
+        scale = pulse / (1.0 + POWERUP_PULSE_AMOUNT)
+        batch.add(f"powerup_{powerup.kind}", powerup.x, powerup.y, scale)
+    batch.draw()
+
+
+def draw_particles(system: ParticleSystem, batch: SpriteBatch) -> None:
+    """Draw all active particles as tinted shapes, higher priorities on top."""
+    batch.begin()
+    for pool in system.pools.values():
+        for p in pool:
+            s = p.size
+            if s > 0:
+                batch.add(p.shape, p.x, p.y, 2 * s / ATLAS_TINT_SIZE, p.color)
+    batch.draw()
+
+
+def draw_starfield(starfield: Starfield, batch: SpriteBatch) -> None:
+    """Draw each star as a tinted circle."""
+    batch.begin()
+    for star in starfield.stars:
+        color = (*COLOR_STAR, star.alpha)
+        batch.add("circle", star.x, star.y, 2 * star.size / ATLAS_TINT_SIZE, color)
+    batch.draw()
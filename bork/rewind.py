@@ -0,0 +1,333 @@
+"""Rewind history: periodic snapshot keyframes plus compact per-tick deltas.
+
+A delta stores only what cannot be recomputed: the core block (players,
+scoring, spawner, lives), the RNG state and entity allocator if
+they changed, and for each component store how its dense order was
+rearranged. Store order only changes by swap-removes and appends, so the
+new order is a prefix shared with the previous tick followed by a short
+tail; each tail entry names the previous position it came from or marks a
+freshly spawned entity, whose full record and handle follow. Replaying a
+delta is: step the previous components by the recorded dt, rebuild the
+order, fill in the new entities. Enemy bullets only ever drop items or
+append new ones, so their section is removed indices plus appended rows.
+Enemies waiting in the spawn queue follow as a full block (usually empty).
+
+A few survivors also change outside `update()` (a piercing projectile spends
+pierce on a hit, a boss part loses hit points). Stores with a revision function
+get a section with full records for survivors whose revision moved; replay
+swaps those in after stepping.
+"""
+
+import struct
+import sys
+from collections import deque
+
+import numpy as np
+
+from bork.boss import Boss
+from bork.constants import (
+    REWIND_KEYFRAME_INTERVAL,
+    REWIND_MAX_BYTES,
+    STATE_PLAYING,
+)
+from bork.ecs import Registry
+from bork.enemy import Enemy
+from bork.powerup import Powerup
+from bork.projectile import Projectile
+from bork.simulation import Simulation
+from bork.snapshot import (
+    RNG_SIZE,
+    core_size,
+    pack_allocator,
+    pack_bosses,
+    pack_bullets,
+    pack_core,
+    pack_enemies,
+    pack_handles,
+    pack_powerups,
+    pack_projectiles,
+    pack_rng,
+    restore_snapshot,
+    take_snapshot,
+    unpack_allocator,
+    unpack_bosses,
+    unpack_bullets_into,
+    unpack_core,
+    unpack_enemies,
+    unpack_handles,
+    unpack_pending,
+    unpack_powerups,
+    unpack_projectiles,
+    unpack_rng,
+)
+
+# dt, survivors were stepped this tick, RNG state follows the core block,
+# the entity allocator ends the delta
+_DELTA = struct.Struct("<d???")
+_INDEX_COUNT = struct.Struct("<H")
+_NEW = 0xFFFF  # order entry for an entity spawned this tick
+_BULLET_COUNT = struct.Struct("<I")
+_BULLET_INDEX = np.dtype("<u4")
+
+# Component types with their record packers and, for stores whose
+# survivors can change outside update(), a revision function
+ENTITY_STORES = (
+    (Projectile, pack_projectiles, unpack_projectiles, lambda p: p.pierce),
+    (Enemy, pack_enemies, unpack_enemies, None),
+    (Powerup, pack_powerups, unpack_powerups, None),
+    (Boss, pack_bosses, unpack_bosses, lambda b: tuple(b.hp)),
+)
+
+
+class Segment:
+    """One keyframe and the deltas recorded after it."""
+
+    def __init__(self, keyframe: bytes) -> None:
+        self.keyframe = keyframe
+        self.deltas: list[bytes] = []
+        self.size = sys.getsizeof(keyframe)
+
+    @property
+    def frames(self) -> int:
+        """Number of ticks this segment can restore."""
+        return 1 + len(self.deltas)
+
+
+class RewindBuffer:
+    """Ring buffer of recent simulation history under a memory ceiling.
+
+    Call `record()` after every `Simulation.update()`. When the stored
+    history exceeds `max_bytes`, the oldest keyframe and its deltas go.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = REWIND_MAX_BYTES,
+        keyframe_interval: int = REWIND_KEYFRAME_INTERVAL,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.keyframe_interval = keyframe_interval
+        self.segments: deque[Segment] = deque()
+        self.size = 0  # bytes held by keyframes and deltas
+        self._previous: dict[type, list[int]] = {}  # owner handles per store
+        self._previous_revisions: dict[type, list] = {}
+        self._previous_bullets: np.ndarray = np.zeros(0, dtype=np.int64)
+        self._previous_state = STATE_PLAYING
+        self._previous_rng: tuple | None = None
+        self._previous_allocator: tuple[Registry | None, int] = (None, 0)
+
+    @property
+    def frames(self) -> int:
+        """Number of recorded ticks currently available."""
+        return sum(segment.frames for segment in self.segments)
+
+    def clear(self) -> None:
+        """Drop all history."""
+        self.segments.clear()
+        self.size = 0
+        self._previous = {}
+        self._previous_revisions = {}
+        self._previous_bullets = np.zeros(0, dtype=np.int64)
+        self._previous_rng = None
+        self._previous_allocator = (None, 0)
+
+    def record(self, sim: Simulation, dt: float) -> None:
+        """Store the state after one simulation tick of length dt."""
+        rng_state = sim.rng.getstate()
+        segment = self.segments[-1] if self.segments else None
+        if segment is None or segment.frames >= self.keyframe_interval:
+            segment = Segment(take_snapshot(sim))
+            self.segments.append(segment)
+            self.size += segment.size
+        else:
+            delta = self._encode_delta(sim, dt, rng_state != self._previous_rng)
+            segment.deltas.append(delta)
+            size = sys.getsizeof(delta)
+            segment.size += size
+            self.size += size
+        self._remember(sim, rng_state)
+
+        while self.size > self.max_bytes and len(self.segments) > 1:
+            self.size -= self.segments.popleft().size
+
+    def rewind(self, sim: Simulation, ticks: int) -> int:
+        """Restore the state from `ticks` recorded ticks ago.
+
+        History newer than that point is discarded, so recording carries
+        on from the restored state. Returns the number of ticks actually
+        rewound, which is limited by what is stored.
+        """
+        if not self.segments:
+            return 0
+        ticks = max(0, min(ticks, self.frames - 1))
+        target = self.frames - 1 - ticks
+
+        for index, segment in enumerate(self.segments):
+            if target < segment.frames:
+                break
+            target -= segment.frames
+        while len(self.segments) > index + 1:
+            self.size -= self.segments.pop().size
+        freed = sum(sys.getsizeof(delta) for delta in segment.deltas[target:])
+        del segment.deltas[target:]
+        segment.size -= freed
+        self.size -= freed
+
+        self._replay(sim, segment)
+        self._remember(sim, sim.rng.getstate())
+        return ticks
+
+    def _encode_delta(self, sim: Simulation, dt: float, rng_changed: bool) -> bytes:
+        """Pack what changed since the previous recorded tick."""
+        advanced = self._previous_state == STATE_PLAYING
+        registry = sim.registry
+        allocator_changed = (registry, registry.version) != self._previous_allocator
+        parts = [
+            _DELTA.pack(dt, advanced, rng_changed, allocator_changed),
+            pack_core(sim),
+        ]
+        if rng_changed:
+            parts.append(pack_rng(sim.rng))
+        for component_type, pack, _, revision in ENTITY_STORES:
+            store = registry.store(component_type)
+            items = store.items
+            owners = store.owners
+            previous = self._previous[component_type]
+            prefix = _common_prefix(previous, owners)
+            sources: list[int] = []
+            if prefix < len(owners):
+                position = {h: i for i, h in enumerate(previous)}
+                sources = [position.get(h, _NEW) for h in owners[prefix:]]
+            parts.append(_INDEX_COUNT.pack(prefix))
+            parts.append(_INDEX_COUNT.pack(len(sources)))
+            parts.append(struct.pack(f"<{len(sources)}H", *sources))
+            if revision is not None:
+                revisions = self._previous_revisions[component_type]
+                changed = [
+                    j for j in range(prefix) if revision(items[j]) != revisions[j]
+                ]
+                changed += [
+                    prefix + k
+                    for k, src in enumerate(sources)
+                    if src != _NEW and revision(items[prefix + k]) != revisions[src]
+                ]
+                parts.append(_INDEX_COUNT.pack(len(changed)))
+                parts.append(struct.pack(f"<{len(changed)}H", *changed))
+                parts.append(pack([items[j] for j in changed]))
+            new = [prefix + k for k, src in enumerate(sources) if src == _NEW]
+            parts.append(pack([items[j] for j in new]))
+            parts.append(pack_handles([owners[j] for j in new]))
+
+        bullets = sim.bullets
+        alive = np.isin(self._previous_bullets, bullets.ids[: bullets.count])
+        removed = np.flatnonzero(~alive).astype(_BULLET_INDEX)
+        parts.append(_BULLET_COUNT.pack(len(removed)))
+        parts.append(removed.tobytes())
+        parts.append(pack_bullets(bullets, len(alive) - len(removed)))
+        parts.append(pack_enemies(sim.spawn_queue.pending))
+        if allocator_changed:
+            parts.append(pack_allocator(registry))
+        return b"".join(parts)
+
+    def _replay(self, sim: Simulation, segment: Segment) -> None:
+        """Restore a segment's keyframe and apply all of its deltas."""
+        restore_snapshot(sim, segment.keyframe)
+        if not segment.deltas:
+            return
+
+        rng_at: tuple[bytes, int] | None = None
+        allocator_at: tuple[bytes, int] | None = None
+        for delta in segment.deltas:
+            dt, advanced, has_rng, has_allocator = _DELTA.unpack_from(delta, 0)
+            # Only the last delta's core block matters
+            offset = _DELTA.size + core_size(delta, _DELTA.size)
+            if has_rng:
+                rng_at = (delta, offset)
+                offset += RNG_SIZE
+            for component_type, _, unpack, revision in ENTITY_STORES:
+                store = sim.registry.store(component_type)
+                items = store.items
+                owners = store.owners
+                if advanced:
+                    for entity in items:
+                        entity.update(dt)
+                (prefix,) = _INDEX_COUNT.unpack_from(delta, offset)
+                (count,) = _INDEX_COUNT.unpack_from(delta, offset + _INDEX_COUNT.size)
+                offset += 2 * _INDEX_COUNT.size
+                sources = struct.unpack_from(f"<{count}H", delta, offset)
+                offset += count * _INDEX_COUNT.size
+                changed: tuple[int, ...] = ()
+                replacements: list = []
+                if revision is not None:
+                    (n,) = _INDEX_COUNT.unpack_from(delta, offset)
+                    offset += _INDEX_COUNT.size
+                    changed = struct.unpack_from(f"<{n}H", delta, offset)
+                    offset += n * _INDEX_COUNT.size
+                    replacements, offset = unpack(delta, offset)
+                added, offset = unpack(delta, offset)
+                added_owners, offset = unpack_handles(delta, offset)
+
+                if count or prefix != len(items):
+                    new_items = items[:prefix]
+                    new_owners = owners[:prefix]
+                    fresh = iter(zip(added, added_owners))
+                    for src in sources:
+                        if src == _NEW:
+                            entity, handle = next(fresh)
+                        else:
+                            entity, handle = items[src], owners[src]
+                        new_items.append(entity)
+                        new_owners.append(handle)
+                    store.reset(new_items, new_owners)
+                    items = new_items
+                for index, entity in zip(changed, replacements):
+                    items[index] = entity
+
+            bullets = sim.bullets
+            (count,) = _BULLET_COUNT.unpack_from(delta, offset)
+            offset += _BULLET_COUNT.size
+            if count:
+                removed = np.frombuffer(delta, _BULLET_INDEX, count, offset)
+                offset += count * _BULLET_INDEX.itemsize
+                bullets.remove(removed)
+            if advanced:
+                bullets.advance(dt)
+            offset = unpack_bullets_into(bullets, delta, offset)
+            pending_at = (delta, offset)
+            offset = unpack_enemies(delta, offset)[1]
+            if has_allocator:
+                allocator_at = (delta, offset)
+
+        unpack_core(sim, segment.deltas[-1], _DELTA.size)
+        unpack_pending(sim, *pending_at)
+        if rng_at is not None:
+            unpack_rng(sim.rng, *rng_at)
+        if allocator_at is not None:
+            unpack_allocator(sim.registry, *allocator_at)
+        sim.events = []
+
+    def _remember(self, sim: Simulation, rng_state: tuple) -> None:
+        """Keep this tick's store orders and revisions for the next delta."""
+        registry = sim.registry
+        self._previous = {}
+        self._previous_revisions = {}
+        for component_type, _, _, revision in ENTITY_STORES:
+            store = registry.store(component_type)
+            self._previous[component_type] = list(store.owners)
+            if revision is not None:
+                self._previous_revisions[component_type] = [
+                    revision(e) for e in store.items
+                ]
+        self._previous_bullets = sim.bullets.ids[: sim.bullets.count].copy()
+        self._previous_state = sim.state
+        self._previous_rng = rng_state
+        self._previous_allocator = (registry, registry.version)
+
+
+def _common_prefix(a: list[int], b: list[int]) -> int:
+    """Length of the shared leading run of two handle lists."""
+    n = min(len(a), len(b))
+    i = 0
+    while i < n and a[i] == b[i]:
+        i += 1
+    return i
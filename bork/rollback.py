@@ -0,0 +1,292 @@
+"""Rollback session: two-player co-op kept in lockstep over an unreliable link.
+
+Both peers run the same seeded Simulation with two ships. Each frame the
+local player's input is scheduled `input_delay` frames ahead and sent to
+the peer; the remote player's input for a frame it has not arrived for
+yet is predicted (it repeats the last one received). When a real input
+turns out to differ from what was predicted, the session restores the
+snapshot taken before that frame and resimulates up to the present with
+the corrected inputs, so the game never waits on the network unless the
+peer falls more than `max_rollback` frames behind.
+
+Snapshots are kept only for frames that used a prediction (and for
+checksum frames). Once every input before a checksum frame is confirmed,
+its snapshot is final on both peers; the CRC32 of it goes out with the
+input packets and a mismatch with the peer's sets `desync_frame`.
+
+Events of frames that get resimulated are dropped: `sim.events` always
+holds the newest frame's events only.
+"""
+
+import time
+import zlib
+from collections.abc import Callable
+from typing import Protocol
+
+from bork.constants import (
+    ACTION_DOWN,
+    ACTION_FIRE,
+    ACTION_LEFT,
+    ACTION_RIGHT,
+    ACTION_UP,
+    NETPLAY_CHECKSUM_INTERVAL,
+    NETPLAY_HELLO_INTERVAL,
+    NETPLAY_INPUT_DELAY,
+    NETPLAY_MAX_INPUTS,
+    NETPLAY_MAX_ROLLBACK,
+    NETPLAY_TIMEOUT,
+    TARGET_FPS,
+)
+from bork.net import Hello, InputPacket, decode_packet, encode_packet
+from bork.simulation import Simulation
+from bork.snapshot import restore_snapshot, take_snapshot
+
+# Action -> bit in the one-byte input sent for each frame
+ACTION_BITS = {
+    ACTION_UP: 1,
+    ACTION_DOWN: 2,
+    ACTION_LEFT: 4,
+    ACTION_RIGHT: 8,
+    ACTION_FIRE: 16,
+}
+
+
+def encode_actions(actions: set[str]) -> int:
+    """Pack an action set into a bitmask (unknown actions are ignored)."""
+    bits = 0
+    for action in actions:
+        bits |= ACTION_BITS.get(action, 0)
+    return bits
+
+
+def decode_actions(bits: int) -> set[str]:
+    """Unpack a bitmask from encode_actions."""
+    return {action for action, bit in ACTION_BITS.items() if bits & bit}
+
+
+class Transport(Protocol):
+    """Anything that moves datagrams to and from the peer."""
+
+    def send(self, data: bytes) -> None: ...
+
+    def receive(self) -> list[bytes]: ...
+
+
+class RollbackStats:
+    """Rollback and stall counts for the debug overlay and tests."""
+
+    def __init__(self) -> None:
+        self.rollbacks = 0
+        self.resimulated = 0  # frames simulated again after a misprediction
+        self.max_depth = 0  # most frames rolled back at once
+        self.stalls = 0  # advance() calls that waited on the peer
+        self.checks = 0  # checksums compared with the peer
+
+
+class RollbackSession:
+    """Steps a two-player Simulation for the local player `local` (0 or 1)."""
+
+    def __init__(
+        self,
+        sim: Simulation,
+        local: int,
+        transport: Transport,
+        seed: int,
+        input_delay: int = NETPLAY_INPUT_DELAY,
+        max_rollback: int = NETPLAY_MAX_ROLLBACK,
+        checksum_interval: int = NETPLAY_CHECKSUM_INTERVAL,
+        dt: float = 1.0 / TARGET_FPS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if len(sim.players) != 2:
+            raise ValueError("a rollback session needs a two-player simulation")
+        self.sim = sim
+        self.local = local
+        self.remote = 1 - local
+        self.transport = transport
+        self.seed = seed
+        self.input_delay = input_delay
+        self.max_rollback = max_rollback
+        self.checksum_interval = checksum_interval
+        self.dt = dt
+        self.clock = clock
+        self.frame = 0  # next frame to simulate
+        # Confirmed input bitmasks per player, indexed by frame; the first
+        # input_delay frames have no input
+        self.inputs: list[list[int]] = [[0] * input_delay, [0] * input_delay]
+        self.peer_ack = 0  # first local input frame the peer still needs
+        self.predicted: dict[int, int] = {}  # frame -> remote input guessed
+        self.states: dict[int, bytes] = {}  # frame -> snapshot before it
+        self.checksums: dict[int, int] = {}  # final frame -> crc32, local
+        self.remote_checksums: dict[int, int] = {}  # not yet compared
+        self.remote_checksum_frame = 0  # newest frame the peer checksummed
+        self.desync_frame: int | None = None
+        self.connected = False
+        self.last_heard = clock()
+        self.stats = RollbackStats()
+
+    @property
+    def remote_confirmed(self) -> int:
+        """Frames of remote input received (the next one still missing)."""
+        return len(self.inputs[self.remote])
+
+    @property
+    def frames_ahead(self) -> int:
+        """Frames simulated past the last confirmed remote input."""
+        return max(0, self.frame - self.remote_confirmed)
+
+    def connect(self, timeout: float = NETPLAY_TIMEOUT) -> None:
+        """Handshake with the peer, resending HELLO until it answers."""
+        hello = encode_packet(Hello(self.local, self.seed, self.input_delay))
+        deadline = self.clock() + timeout
+        while not self.connected:
+            if self.clock() > deadline:
+                raise TimeoutError("no answer from the netplay peer")
+            self.transport.send(hello)
+            wait = self.clock() + NETPLAY_HELLO_INTERVAL
+            while not self.connected and self.clock() < wait:
+                self._poll()
+                time.sleep(0.002)
+        # The peer may have missed ours; this one lets it finish too
+        self.transport.send(hello)
+
+    def advance(self, actions: set[str]) -> bool:
+        """Step one frame with the local player's actions.
+
+        Returns False (and steps nothing) while the peer's inputs are too
+        far behind to keep predicting.
+        """
+        self._poll()
+        if self.frame - self.remote_confirmed >= self.max_rollback:
+            self.stats.stalls += 1
+            self._send()
+            if self.clock() - self.last_heard > NETPLAY_TIMEOUT:
+                raise TimeoutError("lost contact with the netplay peer")
+            return False
+        self.inputs[self.local].append(encode_actions(actions))
+        self._send()
+        self._step(self.frame)
+        self.frame += 1
+        self._finalize()
+        return True
+
+    def idle(self) -> None:
+        """Exchange packets without stepping (waiting or shutting down)."""
+        self._poll()
+        self._send()
+        self._finalize()
+
+    def settled(self, frames: int) -> bool:
+        """True once both peers hold every input for the first `frames`."""
+        return self.remote_confirmed >= frames and self.peer_ack >= frames
+
+    def checksum(self) -> int:
+        """CRC32 of the current simulation state."""
+        return zlib.crc32(take_snapshot(self.sim))
+
+    def _step(self, frame: int) -> None:
+        """Simulate `frame` with confirmed or predicted remote input."""
+        remote_inputs = self.inputs[self.remote]
+        if frame < len(remote_inputs):
+            remote = remote_inputs[frame]
+            self.predicted.pop(frame, None)
+        else:
+            remote = remote_inputs[-1] if remote_inputs else 0
+            self.predicted[frame] = remote
+        if frame in self.predicted or frame % self.checksum_interval == 0:
+            self.states[frame] = take_snapshot(self.sim)
+        bits = [0, 0]
+        bits[self.local] = self.inputs[self.local][frame]
+        bits[self.remote] = remote
+        self.sim.update_players(self.dt, [decode_actions(b) for b in bits])
+
+    def _poll(self) -> None:
+        """Take in the peer's packets, rolling back on a misprediction."""
+        rollback_to: int | None = None
+        for data in self.transport.receive():
+            packet = decode_packet(data)
+            if packet is None:
+                continue
+            self.connected = True
+            self.last_heard = self.clock()
+            if isinstance(packet, Hello):
+                self._check_hello(packet)
+                continue
+            mismatch = self._receive_inputs(packet)
+            if mismatch is not None and (rollback_to is None or mismatch < rollback_to):
+                rollback_to = mismatch
+        if rollback_to is not None:
+            self._rollback(rollback_to)
+
+    def _check_hello(self, hello: Hello) -> None:
+        """Refuse a peer playing the same ship or with other settings."""
+        if hello.player != self.remote:
+            raise ValueError(f"peer is player {hello.player + 1} too")
+        if hello.seed != self.seed or hello.input_delay != self.input_delay:
+            raise ValueError("peer uses a different seed or input delay")
+
+    def _receive_inputs(self, packet: InputPacket) -> int | None:
+        """Record new remote inputs; the first mispredicted frame, if any."""
+        self.peer_ack = max(self.peer_ack, packet.ack)
+        if packet.checksum_frame > self.remote_checksum_frame:
+            self.remote_checksum_frame = packet.checksum_frame
+            self.remote_checksums[packet.checksum_frame] = packet.checksum
+        remote_inputs = self.inputs[self.remote]
+        if packet.start > len(remote_inputs):
+            return None  # a gap; the peer resends from our ack
+        mismatch = None
+        for bits in packet.inputs[len(remote_inputs) - packet.start :]:
+            frame = len(remote_inputs)
+            remote_inputs.append(bits)
+            guess = self.predicted.pop(frame, None)
+            if guess is not None and guess != bits and mismatch is None:
+                mismatch = frame
+        return mismatch
+
+    def _rollback(self, frame: int) -> None:
+        """Restore the state before `frame` and simulate back to the present."""
+        depth = self.frame - frame
+        restore_snapshot(self.sim, self.states[frame])
+        for f in range(frame, self.frame):
+            self._step(f)
+        self.stats.rollbacks += 1
+        self.stats.resimulated += depth
+        self.stats.max_depth = max(self.stats.max_depth, depth)
+
+    def _send(self) -> None:
+        """Send every local input the peer has not acknowledged."""
+        local_inputs = self.inputs[self.local]
+        start = self.peer_ack
+        pending = bytes(local_inputs[start : start + NETPLAY_MAX_INPUTS])
+        checksum_frame = max(self.checksums, default=0)
+        self.transport.send(
+            encode_packet(
+                InputPacket(
+                    self.remote_confirmed,
+                    checksum_frame,
+                    self.checksums.get(checksum_frame, 0),
+                    start,
+                    pending,
+                )
+            )
+        )
+
+    def _finalize(self) -> None:
+        """Checksum frames that became final, compare, drop old snapshots."""
+        final = min(self.remote_confirmed, self.frame)
+        for frame in sorted(self.states):
+            if frame > final:
+                break
+            if frame and frame % self.checksum_interval == 0:
+                self.checksums.setdefault(frame, zlib.crc32(self.states[frame]))
+        for frame in [f for f in self.states if f < final]:
+            del self.states[frame]
+        for frame in [f for f in self.remote_checksums if f in self.checksums]:
+            self.stats.checks += 1
+            mismatch = self.remote_checksums.pop(frame) != self.checksums[frame]
+            if mismatch and self.desync_frame is None:
+                self.desync_frame = frame
+        # The peer only ever sends its newest checksum, so older ones of
+        # ours can no longer be compared
+        for frame in [f for f in self.checksums if f < self.remote_checksum_frame]:
+            del self.checksums[frame]
@@ -0,0 +1,320 @@
+"""High scores: an append-only record log with a compact index.
+
+Every finished game is one record appended to the log:
+
+    u32 crc32(payload) | u16 payload length | payload
+    payload = i64 score | f64 unix time | u32 ticks | utf-8 player name
+
+Records are never rewritten, so a crash can at worst leave a torn record
+at the end; the next load truncates the log back to the last good
+record. A record damaged anywhere else is skipped and counted, and the
+log is left as it is. The index holds the top HIGH_SCORE_TOP_N and
+each player's best score and game count, plus how many log bytes it
+covers. Loading reads the index and only the log bytes past what it
+covers (records whose index update never landed); the full history is
+read only when asked for.
+
+Disk writes happen on a writer thread. `submit()` updates the in-memory
+index and returns at once, so game over never waits on the disk.
+"""
+
+import getpass
+import json
+import os
+import queue
+import struct
+import threading
+import zlib
+from pathlib import Path
+
+from bork.constants import (
+    HIGH_SCORE_DIR,
+    HIGH_SCORE_INDEX,
+    HIGH_SCORE_LOG,
+    HIGH_SCORE_TOP_N,
+)
+
+_HEADER = struct.Struct("<IH")  # crc32, payload length
+_FIELDS = struct.Struct("<qdI")  # score, unix time, ticks
+MAX_NAME_BYTES = 0xFFFF - _FIELDS.size
+
+
+class ScoreRecord:
+    """One finished game."""
+
+    def __init__(self, name: str, score: int, time: float, ticks: int) -> None:
+        self.name = name
+        self.score = score
+        self.time = time  # unix time the game ended
+        self.ticks = ticks  # simulation ticks played
+
+    def to_list(self) -> list:
+        """JSON-friendly form, for the index."""
+        return [self.name, self.score, self.time, self.ticks]
+
+
+def encode_record(record: ScoreRecord) -> bytes:
+    """A record as it is appended to the log."""
+    name = record.name.encode()[:MAX_NAME_BYTES]
+    payload = _FIELDS.pack(record.score, record.time, record.ticks) + name
+    return _HEADER.pack(zlib.crc32(payload), len(payload)) + payload
+
+
+def _record_at(data: bytes, offset: int) -> ScoreRecord | None:
+    """The intact record starting at `offset`, or None."""
+    if offset + _HEADER.size > len(data):
+        return None
+    crc, length = _HEADER.unpack_from(data, offset)
+    start = offset + _HEADER.size
+    payload = data[start : start + length]
+    if len(payload) != length or length < _FIELDS.size or zlib.crc32(payload) != crc:
+        return None
+    score, time, ticks = _FIELDS.unpack_from(payload)
+    name = payload[_FIELDS.size :].decode(errors="replace")
+    return ScoreRecord(name, score, time, ticks)
+
+
+def _record_size(data: bytes, offset: int) -> int:
+    """Header plus declared payload length of the record at `offset`."""
+    return _HEADER.size + _HEADER.unpack_from(data, offset)[1]
+
+
+def decode_records(data: bytes) -> tuple[list[ScoreRecord], int, int]:
+    """Records in `data`, where the decodable data ends, and bytes skipped.
+
+    A damaged record followed by intact ones is skipped (found by its
+    declared length, else by scanning for the next record that checks
+    out) and its bytes counted. Only a torn tail, a record whose header
+    or declared length runs past the end with nothing intact after it,
+    is left out of the returned end.
+    """
+    records: list[ScoreRecord] = []
+    offset = 0
+    damaged = 0
+    while offset + _HEADER.size <= len(data):
+        record = _record_at(data, offset)
+        if record is not None:
+            records.append(record)
+            offset += _record_size(data, offset)
+            continue
+        skip = offset + _record_size(data, offset)
+        if skip > len(data) or (skip < len(data) and _record_at(data, skip) is None):
+            # The declared length is no help: look for the next good record
+            skip = next(
+                (
+                    at
+                    for at in range(offset + 1, len(data) - _HEADER.size + 1)
+                    if _record_at(data, at) is not None
+                ),
+                None,
+            )
+            if skip is None:
+                if offset + _record_size(data, offset) > len(data):
+                    return records, offset, damaged  # torn tail
+                skip = len(data)
+        damaged += skip - offset
+        offset = skip
+    return records, offset, damaged
+
+
+class ScoreIndex:
+    """Top scores and per-player bests, and how much of the log they cover."""
+
+    def __init__(self, top_n: int = HIGH_SCORE_TOP_N) -> None:
+        self.top_n = top_n
+        self.top: list[ScoreRecord] = []  # best first
+        self.players: dict[str, list[int]] = {}  # name -> [best, games]
+        self.log_size = 0  # log bytes already folded in
+
+    def add(self, record: ScoreRecord) -> int | None:
+        """Fold in a record; returns its rank (1 = best) if it made the top."""
+        entry = self.players.setdefault(record.name, [record.score, 0])
+        entry[0] = max(entry[0], record.score)
+        entry[1] += 1
+        # Ties keep the earlier score ahead
+        rank = sum(1 for other in self.top if other.score >= record.score)
+        if rank >= self.top_n:
+            return None
+        self.top.insert(rank, record)
+        del self.top[self.top_n :]
+        return rank + 1
+
+    def best(self, name: str) -> int | None:
+        """A player's best score, or None if they have never finished a game."""
+        entry = self.players.get(name)
+        return entry[0] if entry else None
+
+    def games(self, name: str) -> int:
+        """How many games a player has finished."""
+        entry = self.players.get(name)
+        return entry[1] if entry else 0
+
+    def copy(self) -> "ScoreIndex":
+        """An independent copy (the writer thread keeps its own)."""
+        return ScoreIndex.from_json(self.to_json())
+
+    def to_json(self) -> str:
+        """Serialized index."""
+        return json.dumps(
+            {
+                "top_n": self.top_n,
+                "top": [record.to_list() for record in self.top],
+                "players": self.players,
+                "log_size": self.log_size,
+            }
+        )
+
+    @classmethod
+    def from_json(cls, text: str) -> "ScoreIndex":
+        """Parse a serialized index (raises ValueError/KeyError if damaged)."""
+        data = json.loads(text)
+        index = cls(data["top_n"])
+        index.top = [ScoreRecord(*fields) for fields in data["top"]]
+        index.players = {name: list(entry) for name, entry in data["players"].items()}
+        index.log_size = data["log_size"]
+        return index
+
+
+def data_dir() -> Path:
+    """Directory high scores are kept in."""
+    return Path(os.environ.get("BORK_DATA_DIR", HIGH_SCORE_DIR)).expanduser()
+
+
+def player_name() -> str:
+    """Who is playing: BORK_PLAYER, else the login name."""
+    name = os.environ.get("BORK_PLAYER")
+    if name:
+        return name
+    try:
+        return getpass.getuser()
+    except (OSError, KeyError):
+        return "PLAYER"
+
+
+class HighScores:
+    """The in-memory index plus a writer thread that persists new records."""
+
+    def __init__(
+        self, directory: Path | None = None, top_n: int = HIGH_SCORE_TOP_N
+    ) -> None:
+        directory = data_dir() if directory is None else directory
+        self.log_path = directory / HIGH_SCORE_LOG
+        self.index_path = directory / HIGH_SCORE_INDEX
+        self.index = ScoreIndex(top_n)
+        self.written = 0  # records persisted by the writer
+        self.write_errors = 0  # records lost to an unwritable directory
+        self.replayed = 0  # log records past the index at load time
+        self.damaged = 0  # log bytes skipped as corrupt at load time
+        self._queue: queue.Queue[ScoreRecord | None] = queue.Queue()
+        self._disk: ScoreIndex | None = None  # writer thread's copy
+        self._thread: threading.Thread | None = None
+
+    def load(self) -> None:
+        """Read the index, then fold in any log records it does not cover."""
+        top_n = self.index.top_n
+        try:
+            index = ScoreIndex.from_json(self.index_path.read_text())
+            if index.top_n != top_n:
+                raise ValueError("index kept a different number of scores")
+        except (OSError, ValueError, KeyError, TypeError):
+            index = ScoreIndex(top_n)  # missing or damaged: rebuild from the log
+        try:
+            with open(self.log_path, "rb") as log:
+                size = log.seek(0, os.SEEK_END)
+                if index.log_size > size:  # the log was replaced: start over
+                    index = ScoreIndex(top_n)
+                log.seek(index.log_size)
+                tail = log.read()
+        except OSError:
+            self.index = ScoreIndex(top_n)
+            return
+        records, good, damaged = decode_records(tail)
+        for record in records:
+            index.add(record)
+        index.log_size += good
+        self.replayed = len(records)
+        self.damaged = damaged
+        if good < len(tail):
+            self._truncate(index.log_size)
+        self.index = index
+
+    def _truncate(self, size: int) -> None:
+        """Cut a torn record off the end of the log."""
+        try:
+            with open(self.log_path, "r+b") as log:
+                log.truncate(size)
+        except OSError:
+            pass
+
+    def submit(self, record: ScoreRecord) -> int | None:
+        """Record a finished game; returns its top rank. Never blocks on disk."""
+        if self._thread is None:
+            if self._disk is None:
+                self._disk = self.index.copy()
+            self._thread = threading.Thread(
+                target=self._run, name="bork-scores", daemon=True
+            )
+            self._thread.start()
+        rank = self.index.add(record)
+        self._queue.put(record)
+        return rank
+
+    def _run(self) -> None:
+        """Writer thread: append each record, then rewrite the index."""
+        while True:
+            record = self._queue.get()
+            try:
+                if record is None:
+                    return
+                self._write(record)
+            finally:
+                self._queue.task_done()
+
+    def _write(self, record: ScoreRecord) -> None:
+        """Append one record durably and publish the updated index."""
+        data = encode_record(record)
+        try:
+            self.log_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.log_path, "ab") as log:
+                offset = log.tell()
+                log.write(data)
+                log.flush()
+                os.fsync(log.fileno())
+            disk = self._disk
+            if offset > disk.log_size:  # another instance appended: catch up
+                with open(self.log_path, "rb") as log:
+                    log.seek(disk.log_size)
+                    missed, _, _ = decode_records(log.read(offset - disk.log_size))
+                for other in missed:
+                    disk.add(other)
+            disk.add(record)
+            disk.log_size = offset + len(data)
+            partial = self.index_path.with_suffix(".tmp")
+            partial.write_text(disk.to_json())
+            os.replace(partial, self.index_path)
+            self.written += 1
+        except OSError:
+            self.write_errors += 1
+
+    def flush(self) -> None:
+        """Wait until every submitted record is on disk."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def close(self) -> None:
+        """Flush and stop the writer thread."""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+    def history(self, name: str | None = None) -> list[ScoreRecord]:
+        """Every intact record in the log, optionally for one player."""
+        try:
+            data = self.log_path.read_bytes()
+        except OSError:
+            return []
+        records, _, _ = decode_records(data)
+        if name is None:
+            return records
+        return [record for record in records if record.name == name]
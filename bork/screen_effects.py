@@ -2,20 +2,23 @@
 
 import random
 
-import arcade
-
-from bork.constants import SCREEN_HEIGHT, SCREEN_WIDTH
+from bork.constants import SCREEN_FLASH_PEAK_ALPHA
 
 
 class ScreenFlash:
     """A full-screen color flash that fades out."""
 
     def __init__(
-        self, color: tuple[int, int, int], duration: float, fade: float
+        self,
+        color: tuple[int, int, int],
+        duration: float,
+        fade: float,
+        peak_alpha: int = SCREEN_FLASH_PEAK_ALPHA,
     ) -> None:
         self.color = color
         self.duration = duration  # full-brightness phase
         self.fade = fade  # fade-out phase
+        self.peak_alpha = peak_alpha
         self.timer = 0.0
 
     @property
@@ -27,17 +30,15 @@ class ScreenFlash:
         """Advance the flash timer."""
         self.timer += dt
 
-    def draw(self) -> None:
-        """Draw the flash overlay."""
+    @property
+    def alpha(self) -> int:
+        """Current flash strength (0-255), applied at composite time."""
         if self.is_done:
-            return
+            return 0
         if self.timer < self.duration:
-            alpha = 180  # strong but not fully opaque
-        else:
-            fade_progress = (self.timer - self.duration) / self.fade
-            alpha = int(180 * (1.0 - fade_progress))
-        color = (*self.color, max(0, alpha))
-        arcade.draw_lrbt_rectangle_filled(0, SCREEN_WIDTH, 0, SCREEN_HEIGHT, color)
+            return self.peak_alpha
+        fade_progress = (self.timer - self.duration) / self.fade
+        return max(0, int(self.peak_alpha * (1.0 - fade_progress)))
 
 
 class ScreenShake:
@@ -0,0 +1,484 @@
+"""Gameplay simulation: entities, spawning, collisions, scoring and lives.
+
+The simulation owns every piece of state that affects gameplay and can be
+stepped without a window. Cosmetic reactions (particles, popups, flash,
+shake, HUD milestones) are left to the presentation layer, which reads the
+GameEvents emitted during each update.
+
+Projectiles, enemies and powerups are components in an ecs.Registry; the
+`projectiles`, `enemies` and `powerups` properties are the dense component
+lists (read-only views). Add entities with `spawn()` and remove them by
+handle with `despawn()`. Enemies go through `spawn_queue`, which
+activates a bounded number per tick.
+
+A co-op simulation has one ship per player in `players` (`player` is the
+first), stepped with one action set each; the players share lives and
+score. Enemies aim at the nearest ship.
+"""
+
+import math
+import random
+from collections.abc import Sequence
+
+from bork.boss import BOSS_RADIUS, Boss
+from bork.boss_collision import (
+    check_boss_player_collisions,
+    check_projectile_boss_collisions,
+    spawn_due_boss,
+    update_bosses,
+)
+from bork.bullets import BulletStore
+from bork.collision import CollisionWorld, circle_circle
+from bork.constants import (
+    ACTION_FIRE,
+    DEFAULT_WEAPON,
+    ENEMY_BULLET_SPEED,
+    ENEMY_SIZE,
+    LAYER_BOSS,
+    LAYER_ENEMY,
+    LAYER_PLAYER,
+    LAYER_PLAYER_SHOT,
+    LAYER_POWERUP,
+    PLAYER_BULLET_HITBOX,
+    PLAYER_SHIP_SIZE,
+    POINTS_BASIC_ENEMY,
+    POWERUP_KINDS,
+    POWERUP_SIZE,
+    POWERUP_SPAWN_DELAY,
+    POWERUP_SPAWN_Y,
+    RESPAWN_INVULNERABLE_TIME,
+    SCREEN_HEIGHT,
+    SCREEN_WIDTH,
+    SPEED_BOOST_MULTIPLIER,
+    STARTING_LIVES,
+    STATE_GAME_OVER,
+    STATE_PLAYING,
+    WEAPONS,
+)
+from bork.ecs import ComponentStore, Registry
+from bork.enemy import Enemy
+from bork.events import (
+    EVENT_ENEMY_KILLED,
+    EVENT_GAME_OVER,
+    EVENT_PLAYER_FIRED,
+    EVENT_PLAYER_HIT,
+    EVENT_POWERUP_COLLECTED,
+    GameEvent,
+)
+from bork.player import Player, new_players, player_start
+from bork.powerup import Powerup
+from bork.projectile import Projectile
+from bork.scoring import ScoringSystem
+from bork.spatial import SpatialGrid
+from bork.spawn_queue import SpawnQueue
+from bork.wave_spawner import WaveSpawner
+from bork.weapons import fire_volley
+
+
+class Simulation:
+    """All gameplay state, stepped independently of rendering."""
+
+    def __init__(self, seed: int | None = None, players: int = 1) -> None:
+        self.rng = random.Random(seed)
+        self.players: list[Player] = new_players(players)
+        self.registry: Registry = new_registry()
+        self.bullets: BulletStore = BulletStore()
+        self.wave_spawner: WaveSpawner = WaveSpawner()
+        self.spawn_queue: SpawnQueue = SpawnQueue()
+        self.powerup_spawn_timer: float = 0.0
+        self.scoring: ScoringSystem = ScoringSystem()
+        self.lives: int = STARTING_LIVES
+        self.state: str = STATE_PLAYING
+        self.tick: int = 0
+        self.events: list[GameEvent] = []
+        self.collision_world: CollisionWorld = CollisionWorld()
+        self.entities_updated: int = 0  # for benchmarks/tests
+        self.boss_tests: int = 0  # hit-tree circle tests, for benchmarks/tests
+        self.grid_rebuilds: int = 0  # past the first in a tick, for benchmarks/tests
+        self._enemy_grid: SpatialGrid = SpatialGrid()
+        self._enemy_grid_key: tuple = (-1, None, -1)
+
+    def setup(self) -> None:
+        """Reset to the start of a new game (the RNG keeps running)."""
+        self.players = new_players(len(self.players))
+        self.registry = new_registry()
+        self.bullets = BulletStore()
+        self.wave_spawner = WaveSpawner()
+        self.spawn_queue.pending.clear()
+        self.powerup_spawn_timer = 0.0
+        self.scoring = ScoringSystem()
+        self.lives = STARTING_LIVES
+        self.state = STATE_PLAYING
+        self.tick = 0
+        self.events = []
+
+    @property
+    def player(self) -> Player:
+        """The first (or only) player's ship."""
+        return self.players[0]
+
+    @property
+    def projectiles(self) -> list[Projectile]:
+        """Live projectiles (dense store order; do not modify)."""
+        return self.registry.store(Projectile).items
+
+    @property
+    def enemies(self) -> list[Enemy]:
+        """Live enemies (dense store order; do not modify)."""
+        return self.registry.store(Enemy).items
+
+    @property
+    def powerups(self) -> list[Powerup]:
+        """Live powerups (dense store order; do not modify)."""
+        return self.registry.store(Powerup).items
+
+    @property
+    def bosses(self) -> list[Boss]:
+        """Live bosses (dense store order; do not modify)."""
+        return self.registry.store(Boss).items
+
+    def spawn(self, component: Projectile | Enemy | Powerup | Boss) -> int:
+        """Add an entity; returns its handle."""
+        return self.registry.spawn(component)
+
+    def despawn(self, handle: int) -> bool:
+        """Remove an entity in O(1). False if it was already gone."""
+        return self.registry.destroy(handle)
+
+    def _despawn_where(self, store: ComponentStore, predicate) -> None:
+        """Despawn every entity whose component matches the predicate.
+
+        Walks the dense list backwards, so the component swapped into a
+        freed position has already been checked.
+        """
+        items = store.items
+        owners = store.owners
+        for i in range(len(items) - 1, -1, -1):
+            if predicate(items[i]):
+                self.registry.destroy(owners[i])
+
+    def update(self, dt: float, actions: set[str]) -> None:
+        """Advance a one-player simulation by one tick."""
+        self.update_players(dt, (actions,))
+
+    def update_players(self, dt: float, inputs: Sequence[set[str]]) -> None:
+        """Advance by one tick with each player's actions, in player order.
+
+        Events land in `self.events`.
+        """
+        self.events = []
+        self.tick += 1
+
+        # Scoring decays even during game over
+        self.scoring.update(dt)
+
+        if self.state != STATE_PLAYING:
+            return
+
+        for player, actions in zip(self.players, inputs, strict=True):
+            player.update(dt, actions)
+            player.shoot_timer -= dt
+        self.entities_updated += len(self.players)
+
+        # Update projectiles and remove off-screen ones
+        projectiles = self.registry.store(Projectile)
+        self.entities_updated += len(projectiles.items)
+        for proj in projectiles.items:
+            proj.update(dt)
+        self._despawn_where(projectiles, Projectile.is_off_screen)
+
+        self._spawn_enemies(dt)
+
+        # Move enemy bullets and drop off-screen ones
+        self.bullets.update(dt)
+
+        # Update enemies (firing once on screen) and remove off-screen ones
+        enemies = self.registry.store(Enemy)
+        self.entities_updated += len(enemies.items)
+        for e in enemies.items:
+            if e.update(dt) and e.x < SCREEN_WIDTH:
+                self._fire_at_player(e.x, e.y)
+        self._despawn_where(enemies, Enemy.is_off_screen)
+
+        update_bosses(self, dt)
+
+        # Powerup spawn signal from wave spawner
+        if self.wave_spawner.powerup_spawn_due:
+            self.powerup_spawn_timer = POWERUP_SPAWN_DELAY
+            self.wave_spawner.powerup_spawn_due = False
+
+        # Powerup spawn timer
+        if self.powerup_spawn_timer > 0:
+            self.powerup_spawn_timer -= dt
+            if self.powerup_spawn_timer <= 0:
+                self.spawn(
+                    Powerup(
+                        SCREEN_WIDTH + POWERUP_SIZE,
+                        SCREEN_HEIGHT * POWERUP_SPAWN_Y,
+                        self.rng.choice(POWERUP_KINDS),
+                    )
+                )
+
+        # Update powerups and remove off-screen ones
+        powerups = self.registry.store(Powerup)
+        self.entities_updated += len(powerups.items)
+        for p in powerups.items:
+            p.update(dt)
+        self._despawn_where(powerups, Powerup.is_off_screen)
+
+        # Continuous shooting while fire is held
+        for player, actions in zip(self.players, inputs):
+            if ACTION_FIRE in actions:
+                self._try_shoot(player)
+
+        # Broad phase for shots, enemies, player and powerups in one sweep
+        self._sweep_collisions()
+
+        # Collision: projectiles vs enemies, then vs boss parts
+        self._check_projectile_enemy_collisions()
+        check_projectile_boss_collisions(self)
+
+        # Collision: enemies, boss parts, enemy bullets and powerups vs
+        # player, stopping once the last life is lost
+        for check in (
+            Simulation._check_enemy_player_collisions,
+            check_boss_player_collisions,
+            Simulation._check_bullet_player_collisions,
+            Simulation._check_powerup_player_collisions,
+        ):
+            if self.state != STATE_PLAYING:
+                break
+            check(self)
+
+    def _sweep_collisions(self) -> None:
+        """Register every collidable entity with the world and find contacts."""
+        self.collision_world.update(
+            (
+                (
+                    self.players,
+                    LAYER_PLAYER,
+                    LAYER_ENEMY | LAYER_BOSS | LAYER_POWERUP,
+                    PLAYER_SHIP_SIZE,
+                ),
+                (
+                    self.projectiles,
+                    LAYER_PLAYER_SHOT,
+                    LAYER_ENEMY | LAYER_BOSS,
+                    0.0,
+                ),
+                (
+                    self.enemies,
+                    LAYER_ENEMY,
+                    LAYER_PLAYER | LAYER_PLAYER_SHOT,
+                    ENEMY_SIZE,
+                ),
+                (self.powerups, LAYER_POWERUP, LAYER_PLAYER, POWERUP_SIZE),
+                # The whole-boss circle; parts are resolved by the hit tree
+                (
+                    self.bosses,
+                    LAYER_BOSS,
+                    LAYER_PLAYER | LAYER_PLAYER_SHOT,
+                    BOSS_RADIUS,
+                ),
+            )
+        )
+
+    def _check_projectile_enemy_collisions(self) -> None:
+        """Remove projectiles and enemies that collide, award score.
+
+        Contacts are resolved in store order (each projectile against the
+        enemies it touches, earliest first), as a nested scan would. A
+        piercing shot keeps flying until its pierce count runs out; its hit
+        set (enemy handles) stops it from hitting the same enemy twice.
+        Dead entities are despawned afterwards, each in O(1).
+        """
+        contacts = self.collision_world.contacts(LAYER_PLAYER_SHOT, LAYER_ENEMY)
+        if not contacts:
+            return
+        projectiles = self.registry.store(Projectile)
+        enemies = self.registry.store(Enemy)
+        enemy_index = {id(e): i for i, e in enumerate(enemies.items)}
+        touching: dict[int, list[int]] = {}
+        for proj, enemy in contacts:
+            touching.setdefault(id(proj), []).append(enemy_index[id(enemy)])
+
+        dead: list[int] = []
+        hit_enemies: set[int] = set()
+
+        for pi, proj in enumerate(projectiles.items):
+            for ei in sorted(touching.get(id(proj), ())):
+                if ei in hit_enemies:
+                    continue
+                enemy = enemies.items[ei]
+                handle = enemies.owners[ei]
+                if proj.hits is not None and handle in proj.hits:
+                    continue
+                hit_enemies.add(ei)
+                dead.append(handle)
+                points = self.scoring.register_kill(POINTS_BASIC_ENEMY)
+                self.events.append(
+                    GameEvent(
+                        EVENT_ENEMY_KILLED,
+                        enemy.x,
+                        enemy.y,
+                        points,
+                        self.scoring.combo,
+                    )
+                )
+                if proj.register_hit(handle):
+                    dead.append(projectiles.owners[pi])
+                    break
+
+        for handle in dead:
+            self.registry.destroy(handle)
+
+    def _check_enemy_player_collisions(self) -> None:
+        """Check if any enemy that survived this tick's shots touches a ship."""
+        contacts = self.collision_world.contacts(LAYER_PLAYER, LAYER_ENEMY)
+        if not contacts:
+            return
+        alive = {id(e) for e in self.enemies}
+        for player in self.players:
+            if player.is_invulnerable:
+                continue
+            if any(p is player and id(enemy) in alive for p, enemy in contacts):
+                self._hit_player(player)
+
+    def _check_bullet_player_collisions(self) -> None:
+        """Test all enemy bullets against each ship's hitbox in one pass."""
+        for player in self.players:
+            if player.is_invulnerable or not self.bullets.count:
+                continue
+            hits = self.bullets.hits_circle(player.x, player.y, PLAYER_BULLET_HITBOX)
+            if len(hits):
+                self.bullets.remove(hits)
+                self._hit_player(player)
+
+    def _hit_player(self, player: Player) -> None:
+        """Lose a shared life; respawn the ship or end the game."""
+        if self.state != STATE_PLAYING:
+            return  # another hit this tick already ended the game
+        self.events.append(GameEvent(EVENT_PLAYER_HIT, player.x, player.y))
+        self.lives -= 1
+        if self.lives <= 0:
+            self.state = STATE_GAME_OVER
+            self.events.append(
+                GameEvent(
+                    EVENT_GAME_OVER,
+                    player.x,
+                    player.y,
+                    points=self.scoring.score,
+                )
+            )
+        else:
+            # Respawn at the ship's starting position
+            index = self.players.index(player)
+            player.x, player.y = player_start(index, len(self.players))
+            player.vx = 0.0
+            player.vy = 0.0
+            player.invulnerable_timer = RESPAWN_INVULNERABLE_TIME
+
+    def _spawn_enemies(self, dt: float) -> None:
+        """Run the wave spawner and activate queued enemies within the budget.
+
+        The waves hold while a boss is up; the queue keeps draining.
+        """
+        queue = self.spawn_queue
+        spawner = self.wave_spawner
+        start = queue.clock()
+        if not self.bosses:
+            enemy = spawner.update(dt)
+            if enemy is not None:
+                queue.push(enemy)
+            spawner.prewarm()
+            spawn_due_boss(self)
+        spawned = queue.activate(self.registry)
+        queue.stats.record(len(spawned), queue.clock() - start, len(queue.pending))
+
+    def _fire_at_player(self, x: float, y: float) -> None:
+        """Fire one enemy bullet from (x, y), aimed at the nearest ship."""
+        target = min(
+            self.players, key=lambda p: (p.x - x) * (p.x - x) + (p.y - y) * (p.y - y)
+        )
+        dx = target.x - x
+        dy = target.y - y
+        distance = math.hypot(dx, dy) or 1.0
+        speed = ENEMY_BULLET_SPEED / distance
+        self.bullets.spawn(x, y, dx * speed, dy * speed)
+
+    def _check_powerup_player_collisions(self) -> None:
+        """Give each touched powerup to the first ship still touching it.
+
+        Sweep contacts are re-checked at the ship's current position, since
+        a hit earlier in the tick respawns the ship elsewhere.
+        """
+        contacts = self.collision_world.contacts(LAYER_PLAYER, LAYER_POWERUP)
+        if not contacts:
+            return
+        touched = {(id(player), id(p)) for player, p in contacts}
+        powerups = self.registry.store(Powerup)
+        collected: list[int] = []
+        for p, handle in zip(powerups.items, powerups.owners):
+            for player in self.players:
+                if (id(player), id(p)) not in touched or not circle_circle(
+                    p.x, p.y, POWERUP_SIZE, player.x, player.y, PLAYER_SHIP_SIZE
+                ):
+                    continue
+                if p.kind == "speed":
+                    # Apply effect (no stacking)
+                    if player.speed_multiplier <= 1.0:
+                        player.speed_multiplier = SPEED_BOOST_MULTIPLIER
+                else:
+                    player.weapon = p.kind
+                self.events.append(GameEvent(EVENT_POWERUP_COLLECTED, p.x, p.y))
+                collected.append(handle)
+                break
+        for handle in collected:
+            self.registry.destroy(handle)
+
+    def _try_shoot(self, player: Player) -> None:
+        """Fire a volley from the ship's weapon if its cooldown allows."""
+        if player.can_shoot():
+            nose_x = player.x + PLAYER_SHIP_SIZE
+            name = player.weapon
+            self.registry.spawn_many(fire_volley(name, nose_x, player.y))
+            self.events.append(GameEvent(EVENT_PLAYER_FIRED, nose_x, player.y))
+            player.reset_shoot_timer(WEAPONS[name]["cooldown"])
+
+    def enemy_grid(self) -> SpatialGrid:
+        """Spatial index of enemies for homing and tracking queries.
+
+        The grid is rebuilt when the tick advances or the enemy store changes
+        (spawns, kills, despawns, restores), so any number of homing queries
+        in a tick share one rebuild.
+        """
+        store = self.registry.store(Enemy)
+        key = (self.tick, store, store.version)
+        if key != self._enemy_grid_key:
+            if key[0] == self._enemy_grid_key[0]:
+                self.grid_rebuilds += 1
+            self._enemy_grid.rebuild(store.items)
+            self._enemy_grid_key = key
+        return self._enemy_grid
+
+    @property
+    def last_enemy_grid(self) -> SpatialGrid:
+        """The grid as enemy_grid() last left it, without rebuilding."""
+        return self._enemy_grid
+
+    def active_powerups(self) -> list[str]:
+        """Build list of active powerup names for HUD display."""
+        powerups: list[str] = []
+        if self.player.speed_multiplier > 1.0:
+            powerups.append("speed")
+        if self.player.weapon != DEFAULT_WEAPON:
+            powerups.append(WEAPONS[self.player.weapon]["label"])
+        return powerups
+
+
+def new_registry() -> Registry:
+    """A registry with the gameplay component stores created in a fixed order."""
+    registry = Registry()
+    for component_type in (Projectile, Enemy, Powerup, Boss):
+        registry.store(component_type)
+    return registry
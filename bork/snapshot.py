@@ -0,0 +1,443 @@
+"""Compact, versioned binary snapshots of the whole Simulation.
+
+A snapshot captures everything that affects gameplay: players, projectiles,
+enemies, bosses, enemy bullets, wave spawner and queued enemies, powerups
+and their timer, scoring/combo, lives, game state, tick and RNG state.
+Floats are stored as IEEE doubles, so restoring a snapshot reproduces the
+simulation bit-for-bit.
+
+Layout (little-endian): header, core block (fixed size for a given number of
+players), RNG state, the entity allocator (slot generations and free list),
+then per component store a count-prefixed record block followed by the owning
+handles, the bullet columns, and the enemies waiting in the spawn queue. The
+block helpers are shared with the rewind buffer's per-tick deltas.
+"""
+
+import random
+import struct
+
+import numpy as np
+
+from bork.boss import HIT_TREE, Boss
+from bork.bullets import BulletStore
+from bork.constants import POWERUP_KINDS, STATE_GAME_OVER, STATE_PLAYING, WEAPONS
+from bork.ecs import Registry
+from bork.enemy import Enemy
+from bork.player import Player
+from bork.powerup import Powerup
+from bork.projectile import Projectile
+from bork.scoring import ScoringSystem
+from bork.simulation import Simulation, new_registry
+from bork.wave_spawner import WaveSpawner
+
+SNAPSHOT_MAGIC = b"BORK"
+SNAPSHOT_VERSION = 7
+
+# String fields are stored as indices into these tables
+STATES = (STATE_PLAYING, STATE_GAME_OVER)
+ENEMY_PATTERNS = ("straight", "sine")
+WEAPON_NAMES = tuple(WEAPONS)
+
+_HEADER = struct.Struct("<4sH")
+# tick, state, lives, powerup_spawn_timer, players
+_SIM = struct.Struct("<IBhdB")
+# x, y, vx, vy, shoot_timer, speed_multiplier, invulnerable_timer, weapon
+_PLAYER = struct.Struct("<7dB")
+# score, multiplier, combo, time_since_kill, has_killed
+_SCORING = struct.Struct("<qdid?")
+# wave_index, timer, spawned_in_wave, wave_active, powerup_spawn_due, cycles,
+# boss_due
+_SPAWNER = struct.Struct("<Hdh??I?")
+# MT19937 version, 625-word state, has gauss_next, gauss_next
+_RNG = struct.Struct("<i625I?d")
+_COUNT = struct.Struct("<I")
+# x, y, vx, vy, base_y, time_alive, wave_amplitude, wave_frequency, pierce
+_PROJECTILE = struct.Struct("<8dH")
+# Pierced enemies follow the projectile records as (projectile index, handle)
+_PROJECTILE_HIT = struct.Struct("<IQ")
+_ENEMY = struct.Struct("<5dB")  # x, y, base_y, time_alive, fire_timer, pattern
+_POWERUP = struct.Struct("<3dB")  # x, y, time_alive, kind
+# x, y, base_y, time_alive, fire_timer, then hit points per part
+_BOSS = struct.Struct(f"<5d{len(HIT_TREE.parts)}h")
+# Bullet columns x, y, vx, vy are stored as little-endian double arrays
+_BULLET_DTYPE = np.dtype("<f8")
+
+RNG_SIZE = _RNG.size
+
+
+def core_size(blob: bytes, offset: int) -> int:
+    """Length of the core block starting at `offset`."""
+    players = _SIM.unpack_from(blob, offset)[-1]
+    return _SIM.size + players * _PLAYER.size + _SCORING.size + _SPAWNER.size
+
+
+def take_snapshot(sim: Simulation) -> bytes:
+    """Serialize the simulation into a versioned binary blob."""
+    return b"".join(
+        (
+            _HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION),
+            pack_core(sim),
+            pack_rng(sim.rng),
+            pack_allocator(sim.registry),
+            *(
+                pack(store.items) + pack_handles(store.owners)
+                for store, pack, _ in _component_blocks(sim.registry)
+            ),
+            pack_bullets(sim.bullets),
+            pack_enemies(sim.spawn_queue.pending),
+        )
+    )
+
+
+def restore_snapshot(sim: Simulation, blob: bytes) -> None:
+    """Overwrite the simulation's state with a snapshot from take_snapshot."""
+    magic, version = _HEADER.unpack_from(blob, 0)
+    if magic != SNAPSHOT_MAGIC:
+        raise ValueError("not a B.O.R.K. snapshot")
+    if version != SNAPSHOT_VERSION:
+        raise ValueError(f"unsupported snapshot version {version}")
+    offset = unpack_core(sim, blob, _HEADER.size)
+    offset = unpack_rng(sim.rng, blob, offset)
+    registry = new_registry()
+    offset = unpack_allocator(registry, blob, offset)
+    for store, _, unpack in _component_blocks(registry):
+        items, offset = unpack(blob, offset)
+        owners, offset = unpack_handles(blob, offset)
+        store.reset(items, owners)
+    sim.registry = registry
+    sim.bullets, offset = unpack_bullets(blob, offset)
+    unpack_pending(sim, blob, offset)
+    sim.events = []
+
+
+def pack_core(sim: Simulation) -> bytes:
+    """Pack the core state: sim counters, players, scoring and spawner."""
+    s = sim.scoring
+    w = sim.wave_spawner
+    return b"".join(
+        (
+            _SIM.pack(
+                sim.tick,
+                STATES.index(sim.state),
+                sim.lives,
+                sim.powerup_spawn_timer,
+                len(sim.players),
+            ),
+            *(
+                _PLAYER.pack(
+                    p.x,
+                    p.y,
+                    p.vx,
+                    p.vy,
+                    p.shoot_timer,
+                    p.speed_multiplier,
+                    p.invulnerable_timer,
+                    WEAPON_NAMES.index(p.weapon),
+                )
+                for p in sim.players
+            ),
+            _SCORING.pack(
+                s.score, s.multiplier, s.combo, s.time_since_kill, s.has_killed
+            ),
+            _SPAWNER.pack(
+                w.wave_index,
+                w.timer,
+                w.spawned_in_wave,
+                w.wave_active,
+                w.powerup_spawn_due,
+                w.cycles,
+                w.boss_due,
+            ),
+        )
+    )
+
+
+def unpack_core(sim: Simulation, blob: bytes, offset: int) -> int:
+    """Restore the block written by pack_core; returns the new offset."""
+    tick, state, lives, powerup_timer, count = _SIM.unpack_from(blob, offset)
+    offset += _SIM.size
+    sim.tick = tick
+    sim.state = STATES[state]
+    sim.lives = lives
+    sim.powerup_spawn_timer = powerup_timer
+
+    players = []
+    for _ in range(count):
+        values = _PLAYER.unpack_from(blob, offset)
+        offset += _PLAYER.size
+        player = Player(values[0], values[1])
+        (
+            player.vx,
+            player.vy,
+            player.shoot_timer,
+            player.speed_multiplier,
+            player.invulnerable_timer,
+        ) = values[2:7]
+        player.weapon = WEAPON_NAMES[values[7]]
+        players.append(player)
+    sim.players = players
+
+    scoring = ScoringSystem()
+    (
+        scoring.score,
+        scoring.multiplier,
+        scoring.combo,
+        scoring.time_since_kill,
+        scoring.has_killed,
+    ) = _SCORING.unpack_from(blob, offset)
+    offset += _SCORING.size
+    sim.scoring = scoring
+
+    spawner = WaveSpawner()
+    (
+        spawner.wave_index,
+        spawner.timer,
+        spawner.spawned_in_wave,
+        spawner.wave_active,
+        spawner.powerup_spawn_due,
+        spawner.cycles,
+        spawner.boss_due,
+    ) = _SPAWNER.unpack_from(blob, offset)
+    offset += _SPAWNER.size
+    sim.wave_spawner = spawner
+    return offset
+
+
+def pack_rng(rng: random.Random) -> bytes:
+    """Pack the full Mersenne Twister state."""
+    version, words, gauss = rng.getstate()
+    return _RNG.pack(version, *words, gauss is not None, gauss or 0.0)
+
+
+def unpack_rng(rng: random.Random, blob: bytes, offset: int) -> int:
+    """Restore the block written by pack_rng; returns the new offset."""
+    values = _RNG.unpack_from(blob, offset)
+    rng.setstate((values[0], values[1:626], values[627] if values[626] else None))
+    return offset + _RNG.size
+
+
+def pack_allocator(registry: Registry) -> bytes:
+    """Pack the entity allocator: per-slot generations and the free list."""
+    generations = registry.generations
+    free = registry.free
+    return b"".join(
+        (
+            _COUNT.pack(len(generations)),
+            struct.pack(f"<{len(generations)}I", *generations),
+            _COUNT.pack(len(free)),
+            struct.pack(f"<{len(free)}I", *free),
+        )
+    )
+
+
+def unpack_allocator(registry: Registry, blob: bytes, offset: int) -> int:
+    """Restore the block written by pack_allocator; returns the new offset."""
+    lists = []
+    for _ in range(2):
+        (count,) = _COUNT.unpack_from(blob, offset)
+        offset += _COUNT.size
+        lists.append(list(struct.unpack_from(f"<{count}I", blob, offset)))
+        offset += count * 4
+    registry.generations, registry.free = lists
+    return offset
+
+
+def pack_handles(handles: list[int]) -> bytes:
+    """Pack a count-prefixed list of entity handles."""
+    return _COUNT.pack(len(handles)) + struct.pack(f"<{len(handles)}Q", *handles)
+
+
+def unpack_handles(blob: bytes, offset: int) -> tuple[list[int], int]:
+    """Unpack a handle list; returns the handles and the new offset."""
+    (count,) = _COUNT.unpack_from(blob, offset)
+    offset += _COUNT.size
+    handles = list(struct.unpack_from(f"<{count}Q", blob, offset))
+    return handles, offset + count * 8
+
+
+def pack_projectiles(projectiles: list[Projectile]) -> bytes:
+    """Pack a count-prefixed projectile block followed by their hit sets."""
+    records = _pack_list(
+        _PROJECTILE,
+        [
+            (
+                pr.x,
+                pr.y,
+                pr.vx,
+                pr.vy,
+                pr.base_y,
+                pr.time_alive,
+                pr.wave_amplitude,
+                pr.wave_frequency,
+                pr.pierce,
+            )
+            for pr in projectiles
+        ],
+    )
+    hits = [
+        (i, handle)
+        for i, pr in enumerate(projectiles)
+        if pr.hits
+        for handle in sorted(pr.hits)
+    ]
+    return records + _pack_list(_PROJECTILE_HIT, hits)
+
+
+def unpack_projectiles(blob: bytes, offset: int) -> tuple[list[Projectile], int]:
+    """Unpack a projectile block; returns the projectiles and the new offset."""
+    rows, offset = _unpack_list(_PROJECTILE, blob, offset)
+    projectiles = []
+    for x, y, vx, vy, base_y, time_alive, amplitude, frequency, pierce in rows:
+        projectile = Projectile(x, y, vx, vy, pierce, amplitude, frequency)
+        projectile.base_y = base_y
+        projectile.time_alive = time_alive
+        projectiles.append(projectile)
+    hits, offset = _unpack_list(_PROJECTILE_HIT, blob, offset)
+    for index, handle in hits:
+        projectile = projectiles[index]
+        if projectile.hits is None:
+            projectile.hits = set()
+        projectile.hits.add(handle)
+    return projectiles, offset
+
+
+def pack_enemies(enemies: list[Enemy]) -> bytes:
+    """Pack a count-prefixed enemy block."""
+    return _pack_list(
+        _ENEMY,
+        [
+            (
+                e.x,
+                e.y,
+                e.base_y,
+                e.time_alive,
+                e.fire_timer,
+                ENEMY_PATTERNS.index(e.pattern),
+            )
+            for e in enemies
+        ],
+    )
+
+
+def unpack_enemies(blob: bytes, offset: int) -> tuple[list[Enemy], int]:
+    """Unpack an enemy block; returns the enemies and the new offset."""
+    rows, offset = _unpack_list(_ENEMY, blob, offset)
+    enemies = []
+    for x, y, base_y, time_alive, fire_timer, pattern in rows:
+        enemy = Enemy(x, y, ENEMY_PATTERNS[pattern], base_y)
+        enemy.time_alive = time_alive
+        enemy.fire_timer = fire_timer
+        enemies.append(enemy)
+    return enemies, offset
+
+
+def unpack_pending(sim: Simulation, blob: bytes, offset: int) -> int:
+    """Refill the spawn queue from an enemy block; returns the new offset."""
+    pending, offset = unpack_enemies(blob, offset)
+    sim.spawn_queue.pending.clear()
+    sim.spawn_queue.extend(pending)
+    return offset
+
+
+def pack_powerups(powerups: list[Powerup]) -> bytes:
+    """Pack a count-prefixed powerup block."""
+    return _pack_list(
+        _POWERUP,
+        [(pu.x, pu.y, pu.time_alive, POWERUP_KINDS.index(pu.kind)) for pu in powerups],
+    )
+
+
+def unpack_powerups(blob: bytes, offset: int) -> tuple[list[Powerup], int]:
+    """Unpack a powerup block; returns the powerups and the new offset."""
+    rows, offset = _unpack_list(_POWERUP, blob, offset)
+    powerups = []
+    for x, y, time_alive, kind in rows:
+        powerup = Powerup(x, y, POWERUP_KINDS[kind])
+        powerup.time_alive = time_alive
+        powerups.append(powerup)
+    return powerups, offset
+
+
+def pack_bosses(bosses: list[Boss]) -> bytes:
+    """Pack a count-prefixed boss block."""
+    return _pack_list(
+        _BOSS,
+        [(b.x, b.y, b.base_y, b.time_alive, b.fire_timer, *b.hp) for b in bosses],
+    )
+
+
+def unpack_bosses(blob: bytes, offset: int) -> tuple[list[Boss], int]:
+    """Unpack a boss block; returns the bosses and the new offset."""
+    rows, offset = _unpack_list(_BOSS, blob, offset)
+    bosses = []
+    for x, y, base_y, time_alive, fire_timer, *hp in rows:
+        boss = Boss(x, y)
+        boss.base_y = base_y
+        boss.time_alive = time_alive
+        boss.fire_timer = fire_timer
+        boss.hp = hp
+        boss.live = boss.tree.live_counts(hp)
+        bosses.append(boss)
+    return bosses, offset
+
+
+# Component types with their record packers, in snapshot order
+COMPONENT_BLOCKS = (
+    (Projectile, pack_projectiles, unpack_projectiles),
+    (Enemy, pack_enemies, unpack_enemies),
+    (Powerup, pack_powerups, unpack_powerups),
+    (Boss, pack_bosses, unpack_bosses),
+)
+
+
+def pack_bullets(bullets: BulletStore, start: int = 0) -> bytes:
+    """Pack bullets from index `start` on as a count and four double columns."""
+    n = bullets.count
+    columns = (bullets.x, bullets.y, bullets.vx, bullets.vy)
+    return _COUNT.pack(n - start) + b"".join(
+        column[start:n].astype(_BULLET_DTYPE, copy=False).tobytes()
+        for column in columns
+    )
+
+
+def unpack_bullets(blob: bytes, offset: int) -> tuple[BulletStore, int]:
+    """Unpack a bullet block into a new store; returns it and the new offset."""
+    store = BulletStore()
+    offset = unpack_bullets_into(store, blob, offset)
+    return store, offset
+
+
+def unpack_bullets_into(store: BulletStore, blob: bytes, offset: int) -> int:
+    """Append a bullet block to an existing store; returns the new offset."""
+    (count,) = _COUNT.unpack_from(blob, offset)
+    offset += _COUNT.size
+    columns = []
+    for _ in range(4):
+        columns.append(np.frombuffer(blob, _BULLET_DTYPE, count, offset))
+        offset += count * _BULLET_DTYPE.itemsize
+    store.spawn_many(*columns)
+    return offset
+
+
+def _component_blocks(registry: Registry) -> list[tuple]:
+    """(store, pack, unpack) for each gameplay component, in snapshot order."""
+    return [
+        (registry.store(component_type), pack, unpack)
+        for component_type, pack, unpack in COMPONENT_BLOCKS
+    ]
+
+
+def _pack_list(record: struct.Struct, rows: list[tuple]) -> bytes:
+    """Pack a count prefix followed by fixed-size records."""
+    return _COUNT.pack(len(rows)) + b"".join(record.pack(*row) for row in rows)
+
+
+def _unpack_list(
+    record: struct.Struct, blob: bytes, offset: int
+) -> tuple[list[tuple], int]:
+    """Unpack a count-prefixed record block; returns rows and the new offset."""
+    (count,) = _COUNT.unpack_from(blob, offset)
+    offset += _COUNT.size
+    end = offset + count * record.size
+    rows = list(record.iter_unpack(memoryview(blob)[offset:end]))
+    return rows, end
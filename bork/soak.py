@@ -0,0 +1,318 @@
+"""Soak test: run the autopilot game for hours, watching for leaks and drift.
+
+The game runs headless (or in a window with --window), driven by the
+autopilot and restarted via `setup()` a moment after each game over.
+Every sample interval the runner records RSS, tracemalloc's traced total
+and the allocation sites that grew most since the first sample, entity
+and effect counts, and frame-time percentiles for the frames since the
+last sample. At the end, any metric that rose monotonically across the
+trailing samples is flagged, and the exit status is 1. Samples from the
+warm-up period (while e.g. the rewind buffer fills to its cap) are shown
+but not judged.
+
+Run from the repository root:
+
+    python -m bork.soak --hours 4 [--interval 60] [--report soak.txt]
+"""
+
+import argparse
+import itertools
+import math
+import os
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+from bork.constants import (
+    SOAK_GROWTH_MIN,
+    SOAK_GROWTH_WINDOW,
+    SOAK_RESTART_DELAY,
+    SOAK_SAMPLE_INTERVAL,
+    SOAK_TOP_ALLOCATORS,
+    SOAK_TRACEMALLOC_FRAMES,
+    SOAK_WARMUP,
+    STATE_GAME_OVER,
+    TARGET_FPS,
+)
+
+if TYPE_CHECKING:
+    from bork.game import BorkGame
+
+# Report columns: metric key, header, format
+COLUMNS = (
+    ("rss_mb", "rss MB", "{:8.1f}"),
+    ("traced_mb", "heap MB", "{:8.1f}"),
+    ("frame_p50_ms", "p50 ms", "{:7.2f}"),
+    ("frame_p95_ms", "p95 ms", "{:7.2f}"),
+    ("frame_p99_ms", "p99 ms", "{:7.2f}"),
+    ("frame_max_ms", "max ms", "{:7.2f}"),
+    ("projectiles", "proj", "{:5.0f}"),
+    ("enemies", "enem", "{:5.0f}"),
+    ("powerups", "pwr", "{:4.0f}"),
+    ("bullets", "bull", "{:5.0f}"),
+    ("particles", "part", "{:5.0f}"),
+    ("popups", "pop", "{:4.0f}"),
+    ("rewind_kb", "rewindKB", "{:9.0f}"),
+    ("entity_slots", "slots", "{:6.0f}"),
+)
+# Single-frame spikes are not drift; everything else is checked for growth
+UNCHECKED_METRICS = ("frame_max_ms",)
+
+
+class SoakSample:
+    """Metrics captured at one sample point."""
+
+    def __init__(
+        self,
+        elapsed: float,
+        frames: int,
+        games: int,
+        metrics: dict[str, float],
+        top_allocators: list[str],
+    ) -> None:
+        self.elapsed = elapsed  # wall seconds since the run started
+        self.frames = frames
+        self.games = games
+        self.metrics = metrics
+        self.top_allocators = top_allocators
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """Nearest-rank percentile (q in 0..100) of an ascending list."""
+    if not sorted_values:
+        return 0.0
+    rank = math.ceil(q / 100 * len(sorted_values)) - 1
+    return sorted_values[max(0, min(len(sorted_values) - 1, rank))]
+
+
+def growth_flags(
+    samples: list[SoakSample],
+    window: int = SOAK_GROWTH_WINDOW,
+    min_growth: float = SOAK_GROWTH_MIN,
+) -> list[str]:
+    """Describe metrics that never fell across the trailing `window` samples
+    and grew by more than `min_growth` overall."""
+    if len(samples) < window:
+        return []
+    tail = samples[-window:]
+    flags = []
+    for key in tail[0].metrics:
+        if key in UNCHECKED_METRICS:
+            continue
+        values = [s.metrics[key] for s in tail]
+        first, last = values[0], values[-1]
+        rising = all(b >= a for a, b in itertools.pairwise(values))
+        if rising and last - first > min_growth * max(abs(first), 1.0):
+            flags.append(
+                f"{key} grew monotonically over {window} samples: {first:g} -> {last:g}"
+            )
+    return flags
+
+
+def rss_bytes() -> int:
+    """Current resident set size (peak RSS where /proc is unavailable)."""
+    try:
+        with open("/proc/self/statm") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+class SoakRunner:
+    """Drives a BorkGame with the autopilot and collects SoakSamples."""
+
+    def __init__(
+        self,
+        game: "BorkGame",
+        interval: float = SOAK_SAMPLE_INTERVAL,
+        paced: bool = False,
+        trace: bool = True,
+    ) -> None:
+        self.game = game
+        self.interval = interval
+        self.paced = paced
+        self.trace = trace
+        self.samples: list[SoakSample] = []
+        self.frames = 0
+        self.games = 1
+        self._frame_times: list[float] = []
+        self._baseline: tracemalloc.Snapshot | None = None
+        self._start = 0.0
+
+    def run(
+        self, seconds: float, log: Callable[[str], None] = print
+    ) -> list[SoakSample]:
+        """Play for `seconds` of wall time, sampling every interval."""
+        from bork.autopilot import autopilot_actions
+
+        game = self.game
+        game.autopilot = autopilot_actions
+        game.finish_loading()
+        game.setup()
+        if self.trace:
+            tracemalloc.start(SOAK_TRACEMALLOC_FRAMES)
+        dt = 1 / TARGET_FPS
+        over_for = 0.0
+        self._start = time.perf_counter()
+        next_sample = self._start
+        try:
+            while True:
+                start = time.perf_counter()
+                if start >= next_sample:
+                    self.samples.append(self.sample())
+                    log(self.format_row(self.samples[-1]))
+                    next_sample += self.interval
+                    if start - self._start >= seconds:
+                        break
+                game.on_update(dt)
+                game.on_draw()
+                self._frame_times.append(time.perf_counter() - start)
+                self.frames += 1
+
+                if game.sim.state == STATE_GAME_OVER:
+                    over_for += dt
+                    if over_for >= SOAK_RESTART_DELAY:
+                        game.setup()
+                        self.games += 1
+                        over_for = 0.0
+                if self.paced:
+                    delay = self._start + self.frames * dt - time.perf_counter()
+                    if delay > 0:
+                        time.sleep(delay)
+        finally:
+            if self.trace:
+                tracemalloc.stop()
+        return self.samples
+
+    def sample(self) -> SoakSample:
+        """Capture the current metrics and reset the frame-time window."""
+        game = self.game
+        sim = game.sim
+        times = sorted(self._frame_times)
+        self._frame_times = []
+        metrics = {
+            "rss_mb": rss_bytes() / 2**20,
+            "traced_mb": 0.0,
+            "frame_p50_ms": percentile(times, 50) * 1000,
+            "frame_p95_ms": percentile(times, 95) * 1000,
+            "frame_p99_ms": percentile(times, 99) * 1000,
+            "frame_max_ms": (times[-1] if times else 0.0) * 1000,
+            "projectiles": len(sim.projectiles),
+            "enemies": len(sim.enemies),
+            "powerups": len(sim.powerups),
+            "bullets": sim.bullets.count,
+            "particles": game.particle_system.count,
+            "popups": len(game.score_popups.popups),
+            "rewind_kb": game.rewind.size / 1024,
+            "entity_slots": len(sim.registry.generations),
+        }
+        top: list[str] = []
+        if self.trace and tracemalloc.is_tracing():
+            metrics["traced_mb"] = tracemalloc.get_traced_memory()[0] / 2**20
+            top = self._top_allocators()
+        return SoakSample(
+            time.perf_counter() - self._start, self.frames, self.games, metrics, top
+        )
+
+    def _top_allocators(self) -> list[str]:
+        """Allocation sites that grew most since the first sample."""
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            (
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap*"),
+            )
+        )
+        if self._baseline is None:
+            self._baseline = snapshot
+            stats = snapshot.statistics("lineno")[:SOAK_TOP_ALLOCATORS]
+            return [
+                f"{s.size / 1024:10.1f} KB {s.count:8d} blocks  {s.traceback[0]}"
+                for s in stats
+            ]
+        stats = snapshot.compare_to(self._baseline, "lineno")[:SOAK_TOP_ALLOCATORS]
+        return [
+            f"{s.size_diff / 1024:+10.1f} KB {s.count_diff:+8d} blocks  {s.traceback[0]}"
+            for s in stats
+        ]
+
+    @staticmethod
+    def format_header() -> str:
+        """Column headers for sample rows."""
+        names = "".join(f"{header:>{len(fmt.format(0))}}" for _, header, fmt in COLUMNS)
+        return f"{'elapsed':>9}{'frames':>9}{'games':>6}{names}"
+
+    @staticmethod
+    def format_row(sample: SoakSample) -> str:
+        """One sample as a table row."""
+        values = "".join(fmt.format(sample.metrics[key]) for key, _, fmt in COLUMNS)
+        minutes = sample.elapsed / 60
+        return f"{minutes:8.1f}m{sample.frames:>9}{sample.games:>6}{values}"
+
+    def flags(self) -> list[str]:
+        """Growth flags over the samples taken after the warm-up period."""
+        return growth_flags([s for s in self.samples if s.elapsed >= SOAK_WARMUP])
+
+    def report(self) -> str:
+        """Full text report: sample table, allocation growth and growth flags."""
+        lines = ["B.O.R.K. soak report"]
+        if self.samples:
+            last = self.samples[-1]
+            lines.append(
+                f"{last.elapsed / 3600:.2f} h, {last.frames} frames, {last.games} games"
+            )
+        lines += ["", self.format_header()]
+        lines += [self.format_row(s) for s in self.samples]
+        if self.samples and self.samples[-1].top_allocators:
+            lines += ["", "Top allocation growth since first sample:"]
+            lines += [f"  {line}" for line in self.samples[-1].top_allocators]
+        judged = sum(s.elapsed >= SOAK_WARMUP for s in self.samples)
+        lines += ["", f"Growth flags ({judged} samples after warm-up):"]
+        if judged < SOAK_GROWTH_WINDOW:
+            lines.append(f"  too few samples to judge (need {SOAK_GROWTH_WINDOW})")
+        else:
+            lines += [f"  {flag}" for flag in self.flags()] or ["  none"]
+        return "\n".join(lines)
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hours", type=float, default=1.0)
+    parser.add_argument("--interval", type=float, default=SOAK_SAMPLE_INTERVAL)
+    parser.add_argument("--report", help="also write the report to this file")
+    parser.add_argument(
+        "--paced", action="store_true", help="run at TARGET_FPS instead of flat out"
+    )
+    parser.add_argument("--window", action="store_true", help="open a visible window")
+    parser.add_argument(
+        "--no-tracemalloc", action="store_true", help="skip allocation tracing"
+    )
+    args = parser.parse_args()
+
+    if not args.window:
+        # Must be set before arcade/pyglet are imported
+        os.environ.setdefault("ARCADE_HEADLESS", "1")
+    from bork.game import BorkGame
+
+    runner = SoakRunner(
+        BorkGame(), args.interval, args.paced, trace=not args.no_tracemalloc
+    )
+    print(runner.format_header(), flush=True)
+    runner.run(args.hours * 3600, log=lambda row: print(row, flush=True))
+    report = runner.report()
+    print()
+    print(report)
+    if args.report:
+        with open(args.report, "w") as f:
+            f.write(report + "\n")
+    sys.exit(1 if runner.flags() else 0)
+
+
+if __name__ == "__main__":
+    main()
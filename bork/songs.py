@@ -0,0 +1,50 @@
+"""Song data for the chiptune engine (see bork.music for the notation).
+
+Sixteen rows per pattern, four rows per beat.
+"""
+
+_DRUMS = "x . x . o . x . x . x . o . x x"
+_DRUMS_FILL = "x . x . o . x . o . o x o o o o"
+
+THEME = {
+    "tempo": 140,
+    "rows_per_beat": 4,
+    "patterns": {
+        "intro": {
+            "pulse1": "- . . . . . . . . . . . . . . .",
+            "pulse2": "A3 C4 E4 A4 A3 C4 E4 A4 G3 B3 D4 G4 G3 B3 D4 G4",
+            "triangle": "A2 . . . A2 . E2 . G2 . . . G2 . D2 .",
+            "noise": _DRUMS,
+        },
+        "verse": {
+            "pulse1": "A4 . C5 . E5 . A5 . G5 . . E5 . . D5 E5",
+            "pulse2": "A3 C4 E4 A4 A3 C4 E4 A4 G3 B3 D4 G4 G3 B3 D4 G4",
+            "triangle": "A2 . . . A2 . E2 . G2 . . . G2 . D2 .",
+            "noise": _DRUMS,
+        },
+        "answer": {
+            "pulse1": "F5 . E5 . D5 . C5 . B4 . . G#4 . . A4 .",
+            "pulse2": "F3 A3 C4 F4 F3 A3 C4 F4 E3 G#3 B3 E4 E3 G#3 B3 E4",
+            "triangle": "F2 . . . F2 . C3 . E2 . . . E2 . B2 .",
+            "noise": _DRUMS,
+        },
+        "turnaround": {
+            "pulse1": "A4 . . . . . . . G#4 . . . . . - .",
+            "pulse2": "F3 A3 C4 F4 F3 A3 C4 F4 E3 G#3 B3 E4 E3 G#3 B3 E4",
+            "triangle": "F2 . F2 . F2 . F2 . E2 . E2 . E2 . E2 .",
+            "noise": _DRUMS_FILL,
+        },
+    },
+    "order": [
+        "intro",
+        "intro",
+        "verse",
+        "answer",
+        "verse",
+        "turnaround",
+        "verse",
+        "answer",
+        "verse",
+        "turnaround",
+    ],
+}
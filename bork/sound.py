@@ -0,0 +1,199 @@
+"""SoundManager: decoded-once sound effects with voice limiting.
+
+Nothing plays a sound directly. Callers `trigger()` a sound by name during
+the frame, and `update()` starts at most one voice per name however many
+triggers landed (a burst of kills is one louder explosion, not twenty).
+Each sound has a voice cap: when it is full the oldest voice is stolen,
+or the trigger is dropped for sounds that should not cut themselves off.
+When all SOUND_MAX_VOICES are busy, a trigger steals the oldest voice of
+the lowest priority below its own, or is dropped.
+
+Playback goes through a backend. ArcadeBackend plays through pyglet;
+NullBackend plays nothing and needs no audio stack, for tests and tools.
+"""
+
+from bork.constants import (
+    SOUND_MAX_VOICES,
+    SOUND_MAX_VOLUME,
+    SOUND_MERGE_GAIN,
+    SOUND_NULL_DURATION,
+    SOUNDS,
+)
+
+
+class NullBackend:
+    """Silent backend: every sample lasts a fixed duration."""
+
+    def __init__(self, duration: float = SOUND_NULL_DURATION) -> None:
+        self.duration = duration
+        self.loads = 0  # decode calls, to check the cache
+        self.playing: dict[int, tuple[str, float]] = {}  # voice -> (path, volume)
+        self._next_voice = 0
+
+    def load(self, path: str) -> str:
+        """'Decode' a file (the sample is just its path)."""
+        self.loads += 1
+        return path
+
+    def length(self, sample: str) -> float:
+        """Duration of a sample in seconds."""
+        return self.duration
+
+    def play(self, sample: str, volume: float) -> int:
+        """Start a voice and return its handle."""
+        self._next_voice += 1
+        self.playing[self._next_voice] = (sample, volume)
+        return self._next_voice
+
+    def stop(self, voice: int) -> None:
+        """Stop a voice and release it."""
+        self.playing.pop(voice, None)
+
+
+class ArcadeBackend:
+    """Plays through arcade; samples are decoded fully into memory."""
+
+    def __init__(self) -> None:
+        import arcade
+
+        self._arcade = arcade
+
+    def load(self, path: str) -> object:
+        """Decode a file into a static (non-streaming) sound."""
+        return self._arcade.load_sound(path, streaming=False)
+
+    def length(self, sample: object) -> float:
+        """Duration of a sample in seconds."""
+        return sample.get_length()
+
+    def play(self, sample: object, volume: float) -> object:
+        """Start a voice and return its player."""
+        return sample.play(volume=volume)
+
+    def stop(self, voice: object) -> None:
+        """Stop a voice and release its player."""
+        self._arcade.stop_sound(voice)
+
+
+class Voice:
+    """One playing instance of a sound."""
+
+    def __init__(self, name: str, handle: object, priority: int, ends: float) -> None:
+        self.name = name
+        self.handle = handle  # backend voice
+        self.priority = priority
+        self.ends = ends  # manager time at which playback finishes
+
+
+class SoundManager:
+    """Caches decoded samples and arbitrates voices for triggered sounds."""
+
+    def __init__(
+        self,
+        backend: NullBackend | ArcadeBackend,
+        sounds: dict[str, dict] = SOUNDS,
+        max_voices: int = SOUND_MAX_VOICES,
+    ) -> None:
+        self.backend = backend
+        self.sounds = sounds
+        self.max_voices = max_voices
+        self.voices: list[Voice] = []  # oldest first
+        self.time = 0.0
+        self._cache: dict[str, object] = {}  # file -> decoded sample
+        self._pending: dict[str, int] = {}  # name -> triggers this frame
+        self.played: dict[str, int] = dict.fromkeys(sounds, 0)
+        self.merged: dict[str, int] = dict.fromkeys(sounds, 0)
+        self.dropped: dict[str, int] = dict.fromkeys(sounds, 0)
+        self.stolen: dict[str, int] = dict.fromkeys(sounds, 0)
+
+    def files(self) -> list[str]:
+        """Every distinct sound file, in definition order."""
+        return list(dict.fromkeys(spec["file"] for spec in self.sounds.values()))
+
+    def store(self, path: str, sample: object) -> None:
+        """Cache a sample decoded elsewhere (the asset loader's workers)."""
+        self._cache[path] = sample
+
+    def load_all(self) -> None:
+        """Decode every sound up front so the first trigger doesn't stall."""
+        for name in self.sounds:
+            self._sample(name)
+
+    def _sample(self, name: str) -> object:
+        """The decoded sample for a sound, decoding its file on first use."""
+        path = self.sounds[name]["file"]
+        sample = self._cache.get(path)
+        if sample is None:
+            sample = self._cache[path] = self.backend.load(path)
+        return sample
+
+    def trigger(self, name: str) -> None:
+        """Request a sound this frame; repeats before `update()` merge."""
+        if name not in self.sounds:
+            raise KeyError(f"unknown sound {name!r}")
+        self._pending[name] = self._pending.get(name, 0) + 1
+
+    def update(self, dt: float) -> None:
+        """Release finished voices, then start this frame's triggers.
+
+        Voices end by the manager's clock, and finished ones are stopped
+        explicitly, so backend players are freed even when no event loop
+        is dispatching end-of-stream (soak runs drive frames by hand).
+        """
+        self.time += dt
+        for voice in [v for v in self.voices if v.ends <= self.time]:
+            self._release(voice)
+        pending = sorted(
+            self._pending.items(), key=lambda item: -self.sounds[item[0]]["priority"]
+        )
+        self._pending = {}
+        for name, count in pending:
+            self.merged[name] += count - 1
+            self._start(name, count)
+
+    def _start(self, name: str, count: int) -> None:
+        """Start one voice of a sound if the voice caps allow it."""
+        spec = self.sounds[name]
+        own = [v for v in self.voices if v.name == name]
+        if len(own) >= spec["voices"]:
+            if spec["steal"] != "oldest":
+                self.dropped[name] += 1
+                return
+            self._steal(own[0])
+        elif len(self.voices) >= self.max_voices:
+            lower = [v for v in self.voices if v.priority < spec["priority"]]
+            if not lower:
+                self.dropped[name] += 1
+                return
+            self._steal(min(lower, key=lambda v: v.priority))
+
+        sample = self._sample(name)
+        volume = min(
+            SOUND_MAX_VOLUME, spec["volume"] * (1 + SOUND_MERGE_GAIN * (count - 1))
+        )
+        handle = self.backend.play(sample, volume)
+        ends = self.time + self.backend.length(sample)
+        self.voices.append(Voice(name, handle, spec["priority"], ends))
+        self.played[name] += 1
+
+    def _steal(self, voice: Voice) -> None:
+        """Cut a voice short to make room."""
+        self._release(voice)
+        self.stolen[voice.name] += 1
+
+    def _release(self, voice: Voice) -> None:
+        """Stop a voice and forget it."""
+        self.backend.stop(voice.handle)
+        self.voices.remove(voice)
+
+    def stop_all(self) -> None:
+        """Silence everything, including triggers not yet started."""
+        for voice in list(self.voices):
+            self._release(voice)
+        self._pending = {}
+
+    def reset_counters(self) -> None:
+        """Zero the played/merged/dropped/stolen counters."""
+        for counters in (self.played, self.merged, self.dropped, self.stolen):
+            for name in counters:
+                counters[name] = 0
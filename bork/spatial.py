@@ -0,0 +1,166 @@
+"""Uniform-grid spatial index for radius and k-nearest target queries.
+
+Entities are bucketed by position into square cells. Radius queries scan
+only the cells overlapping the query circle; k-nearest queries search
+outward ring by ring and stop once no unvisited cell can hold anything
+closer than the k-th best found so far.
+"""
+
+import math
+from collections.abc import Sequence
+from typing import Protocol
+
+from bork.constants import SPATIAL_CELL_SIZE
+
+
+class Positioned(Protocol):
+    """Anything with an x/y position."""
+
+    x: float
+    y: float
+
+
+class SpatialGrid:
+    """Hash grid over a list of positioned entities, rebuilt per frame."""
+
+    def __init__(self, cell_size: float = SPATIAL_CELL_SIZE) -> None:
+        self.cell_size = cell_size
+        self.cells: dict[tuple[int, int], list[Positioned]] = {}
+        self.size = 0
+        self.rebuilds = 0
+        self.candidates_checked = 0  # distance tests, for benchmarks/tests
+        self._bounds = (0, 0, -1, -1)  # min cx, min cy, max cx, max cy
+
+    def rebuild(self, entities: Sequence[Positioned]) -> None:
+        """Re-bucket all entities at their current positions."""
+        cs = self.cell_size
+        cells: dict[tuple[int, int], list[Positioned]] = {}
+        for e in entities:
+            key = (int(e.x // cs), int(e.y // cs))
+            bucket = cells.get(key)
+            if bucket is None:
+                cells[key] = [e]
+            else:
+                bucket.append(e)
+        self.cells = cells
+        self.size = len(entities)
+        self.rebuilds += 1
+        if cells:
+            xs = [cx for cx, _ in cells]
+            ys = [cy for _, cy in cells]
+            self._bounds = (min(xs), min(ys), max(xs), max(ys))
+        else:
+            self._bounds = (0, 0, -1, -1)
+
+    def query_radius(
+        self, x: float, y: float, radius: float, ahead: bool = False
+    ) -> list[Positioned]:
+        """Entities within `radius` of (x, y); `ahead` keeps only those at >= x."""
+        cs = self.cell_size
+        r2 = radius * radius
+        min_x = x if ahead else x - radius
+        result: list[Positioned] = []
+        checked = 0
+        cells = self.cells
+        for cx in range(int(min_x // cs), int((x + radius) // cs) + 1):
+            for cy in range(int((y - radius) // cs), int((y + radius) // cs) + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    continue
+                checked += len(bucket)
+                for e in bucket:
+                    dx = e.x - x
+                    dy = e.y - y
+                    if dx * dx + dy * dy <= r2 and (not ahead or dx >= 0):
+                        result.append(e)
+        self.candidates_checked += checked
+        return result
+
+    def nearest(
+        self,
+        x: float,
+        y: float,
+        k: int = 1,
+        max_radius: float = math.inf,
+        ahead: bool = False,
+    ) -> list[Positioned]:
+        """Up to `k` entities closest to (x, y), nearest first."""
+        if k <= 0 or not self.cells:
+            return []
+        cs = self.cell_size
+        pcx = int(x // cs)
+        pcy = int(y // cs)
+        min_cx, min_cy, max_cx, max_cy = self._bounds
+        # Rings beyond this cannot contain any occupied cell
+        last_ring = max(pcx - min_cx, max_cx - pcx, pcy - min_cy, max_cy - pcy)
+        cells = self.cells
+
+        found: list[tuple[float, int, Positioned]] = []
+        bound = max_radius * max_radius  # k-th best distance once k are found
+        checked = 0
+        serial = 0  # tie-breaker so entities are never compared
+        for ring in range(max(0, last_ring) + 1):
+            if (ring - 1) * cs > max_radius:
+                break
+            for ox, oy in _ring_offsets(ring):
+                if ahead and ox < 0:
+                    continue
+                bucket = cells.get((pcx + ox, pcy + oy))
+                if bucket is None:
+                    continue
+                checked += len(bucket)
+                for e in bucket:
+                    dx = e.x - x
+                    dy = e.y - y
+                    d2 = dx * dx + dy * dy
+                    if d2 <= bound and (not ahead or dx >= 0):
+                        found.append((d2, serial, e))
+                        serial += 1
+            if len(found) >= k:
+                found.sort()
+                del found[k:]
+                bound = found[-1][0]
+                # Anything in later rings is at least `ring * cs` away
+                reach = ring * cs
+                if bound <= reach * reach:
+                    break
+        self.candidates_checked += checked
+        found.sort()
+        return [e for _, _, e in found]
+
+    def nearest_many(
+        self,
+        points: Sequence[tuple[float, float]],
+        k: int = 1,
+        max_radius: float = math.inf,
+        ahead: bool = False,
+    ) -> list[list[Positioned]]:
+        """Batched `nearest` for every homing entity in one call."""
+        nearest = self.nearest
+        return [nearest(x, y, k, max_radius, ahead) for x, y in points]
+
+    def query_radius_many(
+        self,
+        points: Sequence[tuple[float, float]],
+        radius: float,
+        ahead: bool = False,
+    ) -> list[list[Positioned]]:
+        """Batched `query_radius` for every point in one call."""
+        query = self.query_radius
+        return [query(x, y, radius, ahead) for x, y in points]
+
+
+_RING_OFFSETS: list[list[tuple[int, int]]] = []
+
+
+def _ring_offsets(ring: int) -> list[tuple[int, int]]:
+    """Cell offsets at Chebyshev distance exactly `ring` (cached)."""
+    while len(_RING_OFFSETS) <= ring:
+        n = len(_RING_OFFSETS)
+        if n == 0:
+            offsets = [(0, 0)]
+        else:
+            offsets = [(x, y) for x in (-n, n) for y in range(-n, n + 1)]
+            offsets += [(x, y) for x in range(-n + 1, n) for y in (-n, n)]
+        _RING_OFFSETS.append(offsets)
+    return _RING_OFFSETS[ring]
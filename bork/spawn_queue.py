@@ -0,0 +1,87 @@
+"""Spawn queue: enemies are activated a few per tick, never all at once.
+
+Anything that creates enemies pushes them here, and the simulation
+activates at most SPAWN_BUDGET of them per tick in the order they were
+pushed. A burst of dozens (a formation, a boss's minions) is spread over
+a few ticks instead of landing in one. Queued enemies should be placed
+off screen: one held for k ticks enters k ticks late, which is invisible
+until it crosses the edge.
+
+SpawnStats records how much spawning each tick did and the worst tick
+seen, so spikes show up in the debug overlay and the spawn benchmark.
+"""
+
+import time
+from collections import deque
+from collections.abc import Callable, Iterable
+
+from bork.constants import ENEMY_SIZE, SCREEN_WIDTH, SPAWN_BUDGET
+from bork.ecs import Registry
+from bork.enemy import Enemy
+
+
+class SpawnStats:
+    """Per-tick spawn counts and time, with the worst tick so far."""
+
+    def __init__(self) -> None:
+        self.ticks = 0
+        self.spawned = 0  # enemies activated in total
+        self.last_count = 0
+        self.last_time = 0.0
+        self.worst_count = 0  # most enemies activated in one tick
+        self.worst_time = 0.0  # longest spawn work in one tick, seconds
+        self.peak_pending = 0  # longest the queue has been at the end of a tick
+
+    def record(self, count: int, elapsed: float, pending: int) -> None:
+        """Add one tick's spawn work."""
+        self.ticks += 1
+        self.spawned += count
+        self.last_count = count
+        self.last_time = elapsed
+        self.worst_count = max(self.worst_count, count)
+        self.worst_time = max(self.worst_time, elapsed)
+        self.peak_pending = max(self.peak_pending, pending)
+
+
+class SpawnQueue:
+    """Enemies waiting to enter the registry, activated within a budget."""
+
+    def __init__(
+        self,
+        budget: int = SPAWN_BUDGET,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self.budget = budget  # activations per tick
+        self.clock = clock  # only used for the stats
+        self.pending: deque[Enemy] = deque()
+        self.stats = SpawnStats()
+
+    def push(self, enemy: Enemy) -> None:
+        """Queue one enemy."""
+        self.pending.append(enemy)
+
+    def extend(self, enemies: Iterable[Enemy]) -> None:
+        """Queue a burst; it enters over the next few ticks."""
+        self.pending.extend(enemies)
+
+    def activate(self, registry: Registry) -> list[int]:
+        """Spawn up to `budget` queued enemies; returns their handles."""
+        pending = self.pending
+        return [
+            registry.spawn(pending.popleft())
+            for _ in range(min(self.budget, len(pending)))
+        ]
+
+
+def offscreen_formation(
+    count: int, y: float, pattern: str = "straight", rows: int = 5
+) -> list[Enemy]:
+    """A block of enemies just past the right edge, centred on y."""
+    spacing = 3 * ENEMY_SIZE
+    enemies = []
+    for i in range(count):
+        column, row = divmod(i, rows)
+        x = SCREEN_WIDTH + ENEMY_SIZE + column * spacing
+        row_y = y + (row - (min(rows, count) - 1) / 2) * spacing
+        enemies.append(Enemy(x, row_y, pattern, row_y))
+    return enemies
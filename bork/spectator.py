@@ -0,0 +1,386 @@
+"""Spectators: fan the state stream out over TCP and draw it elsewhere.
+
+SpectatorFeed is the game's side: it encodes each tick once and passes
+the frame to a SpectatorServer, which hands it to a sender thread, so the game's cost per tick is the same however
+many spectators are connected. The thread keeps the latest keyframe and
+the deltas after it; a new client gets that backlog first. A client whose
+unsent data exceeds SPECTATOR_CLIENT_BUFFER is resynced: its queue is
+replaced by the backlog, so a stalled spectator costs bounded memory and
+never slows the others.
+
+SpectatorClient reads frames, decodes them and draws SPECTATOR_INTERP_DELAY
+ticks behind the newest one, interpolating between the two ticks around
+the display time.
+
+Run a spectator window from the repository root, while the game runs with
+`--spectators`:
+
+    python -m bork.spectator [--host 127.0.0.1] [--port 7430]
+"""
+
+import argparse
+import queue
+import socket
+import struct
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+
+import arcade
+
+from bork.atlas import load_atlas
+from bork.constants import (
+    COLOR_BACKGROUND,
+    SCREEN_HEIGHT,
+    SCREEN_TITLE,
+    SCREEN_WIDTH,
+    SPECTATOR_CLIENT_BUFFER,
+    SPECTATOR_HISTORY,
+    SPECTATOR_INTERP_DELAY,
+    SPECTATOR_PORT,
+    STATE_GAME_OVER,
+    TARGET_FPS,
+)
+from bork.hud import HUD
+from bork.renderers import (
+    SpriteBatch,
+    draw_enemies,
+    draw_players,
+    draw_powerups,
+    draw_projectile,
+    load_textures,
+)
+from bork.simulation import Simulation
+from bork.stream import (
+    FLAG_KEYFRAME,
+    StreamDecoder,
+    StreamEncoder,
+    StreamState,
+    StreamView,
+)
+
+_LENGTH = struct.Struct("<I")  # frame length prefix
+_POLL = 0.05  # seconds the sender waits for a frame between accepts
+_RETRY = 0.002  # seconds before retrying a client whose socket was full
+
+
+class Spectator:
+    """One connected client and the messages still to send it."""
+
+    def __init__(self, sock: socket.socket) -> None:
+        self.sock = sock
+        self.messages: deque[bytes] = deque()
+        self.offset = 0  # bytes of messages[0] already sent
+        self.queued = 0  # bytes in messages not yet sent
+
+    def queue(self, message: bytes) -> None:
+        """Append one length-prefixed frame."""
+        self.messages.append(message)
+        self.queued += len(message)
+
+    def offer(self, message: bytes, backlog: list[bytes], limit: int) -> bool:
+        """Queue a frame, or resync to the backlog if that would exceed limit.
+
+        Returns True when the client was resynced.
+        """
+        if self.queued + len(message) > limit:
+            self.restart(backlog)
+            return True
+        self.queue(message)
+        return False
+
+    def restart(self, messages: list[bytes]) -> None:
+        """Drop unsent frames (finishing one already begun) and queue these."""
+        head = self.messages[0] if self.offset else None
+        self.messages.clear()
+        self.queued = 0
+        if head is not None:
+            self.queue(head)
+            self.queued -= self.offset
+        for message in messages:
+            self.queue(message)
+
+
+class SpectatorServer:
+    """Accepts spectators and streams frames to them on a background thread."""
+
+    def __init__(
+        self,
+        port: int = SPECTATOR_PORT,
+        host: str = "127.0.0.1",
+        client_buffer: int = SPECTATOR_CLIENT_BUFFER,
+    ) -> None:
+        self.listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.listener.bind((host, port))
+        self.listener.listen()
+        self.listener.setblocking(False)
+        self.client_buffer = client_buffer
+        self.clients: list[Spectator] = []
+        # Length-prefixed latest keyframe and the deltas after it
+        self.backlog: list[bytes] = []
+        self.sent = 0  # bytes written to sockets
+        self.resyncs = 0  # clients that fell behind and restarted at a keyframe
+        self._frames: queue.SimpleQueue[bytes | None] = queue.SimpleQueue()
+        self._thread = threading.Thread(
+            target=self._run, name="bork-spectators", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def port(self) -> int:
+        """The bound port (useful after binding port 0)."""
+        return self.listener.getsockname()[1]
+
+    def publish(self, frame: bytes) -> None:
+        """Queue one frame for every spectator (never blocks)."""
+        self._frames.put(frame)
+
+    def close(self) -> None:
+        """Stop the sender thread and drop every client."""
+        self._frames.put(None)
+        self._thread.join()
+        for client in self.clients:
+            client.sock.close()
+        self.listener.close()
+
+    def _run(self) -> None:
+        """Sender thread: take frames, accept, write what sockets accept."""
+        while True:
+            backed_up = any(client.queued for client in self.clients)
+            frames = []
+            try:
+                frames.append(self._frames.get(timeout=_RETRY if backed_up else _POLL))
+                while True:
+                    frames.append(self._frames.get_nowait())
+            except queue.Empty:
+                pass
+            for frame in frames:
+                if frame is None:
+                    return
+                self._fan_out(frame)
+            self._accept()
+            self._flush()
+
+    def _accept(self) -> None:
+        """Take new connections and give each the backlog."""
+        while True:
+            try:
+                sock, _ = self.listener.accept()
+            except BlockingIOError:
+                return
+            sock.setblocking(False)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            client = Spectator(sock)
+            client.restart(self.backlog)
+            self.clients.append(client)
+
+    def _fan_out(self, frame: bytes) -> None:
+        """Record the frame in the backlog and queue it for every client."""
+        message = _LENGTH.pack(len(frame)) + frame
+        if frame[0] & FLAG_KEYFRAME:
+            self.backlog = []
+        self.backlog.append(message)
+        for client in self.clients:
+            self.resyncs += client.offer(message, self.backlog, self.client_buffer)
+
+    def _flush(self) -> None:
+        """Write as much of each queue as its socket takes; drop dead clients."""
+        for client in list(self.clients):
+            messages = client.messages
+            try:
+                while messages:
+                    view = memoryview(messages[0])[client.offset :]
+                    written = client.sock.send(view)
+                    self.sent += written
+                    client.queued -= written
+                    if written < len(view):
+                        client.offset += written
+                        break
+                    messages.popleft()
+                    client.offset = 0
+            except BlockingIOError:
+                continue
+            except OSError:
+                client.sock.close()
+                self.clients.remove(client)
+
+
+class SpectatorFeed:
+    """Encodes each game tick once and streams it through a server."""
+
+    def __init__(self, server: SpectatorServer) -> None:
+        self.server = server
+        self.encoder = StreamEncoder()
+
+    def publish(self, sim: Simulation) -> None:
+        """Send this tick (one encode however many spectators watch)."""
+        self.server.publish(self.encoder.encode(sim))
+
+    def debug_line(self) -> str:
+        """Stream size, encode time and audience for the debug overlay."""
+        stream = self.encoder.stats
+        return (
+            f"Stream {stream.last_bytes} B/tick (peak {stream.peak_bytes}"
+            f" encode {stream.worst_time * 1000:.2f} ms)"
+            f" to {len(self.server.clients)} spectators"
+            f" (resyncs {self.server.resyncs})"
+        )
+
+    def close(self) -> None:
+        """Stop the server."""
+        self.server.close()
+
+
+def add_feed_arguments(parser: argparse.ArgumentParser) -> None:
+    """The game's --spectators option."""
+    parser.add_argument(
+        "--spectators",
+        type=int,
+        nargs="?",
+        const=SPECTATOR_PORT,
+        metavar="PORT",
+        help="stream the game to spectator clients (python -m bork.spectator)",
+    )
+
+
+def feed_from_args(args: argparse.Namespace) -> SpectatorFeed | None:
+    """A feed on the --spectators port, or None without the option."""
+    if args.spectators is None:
+        return None
+    return SpectatorFeed(SpectatorServer(args.spectators))
+
+
+class SpectatorClient:
+    """Receives the stream and yields interpolated views to draw."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = SPECTATOR_PORT,
+        delay: int = SPECTATOR_INTERP_DELAY,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.sock = socket.create_connection((host, port))
+        self.sock.setblocking(False)
+        self.delay = delay
+        self.clock = clock
+        self.decoder = StreamDecoder()
+        self.history: deque[StreamState] = deque(maxlen=SPECTATOR_HISTORY)
+        self.received = 0  # bytes read
+        self.closed = False
+        self._buffer = bytearray()
+        self._base: float | None = None  # clock time of tick 0 on screen
+
+    def poll(self) -> int:
+        """Read and decode everything waiting; returns frames decoded."""
+        while not self.closed:
+            try:
+                data = self.sock.recv(65536)
+            except BlockingIOError:
+                break
+            if not data:
+                self.closed = True
+                break
+            self._buffer += data
+            self.received += len(data)
+        decoded = 0
+        buffer = self._buffer
+        while len(buffer) >= _LENGTH.size:
+            (size,) = _LENGTH.unpack_from(buffer)
+            if len(buffer) < _LENGTH.size + size:
+                break
+            frame = bytes(buffer[_LENGTH.size : _LENGTH.size + size])
+            del buffer[: _LENGTH.size + size]
+            state = self.decoder.apply(frame)
+            if state is None:
+                continue
+            if state.reset:
+                self.history.clear()
+                self._base = None
+            self.history.append(state)
+            decoded += 1
+        return decoded
+
+    def view(self) -> StreamView | None:
+        """The scene at the current display time, or None before any frame."""
+        if not self.history:
+            return None
+        oldest = self.history[0].tick
+        newest = self.history[-1].tick
+        now = self.clock()
+        if self._base is None:
+            self._base = now - (newest - self.delay) / TARGET_FPS
+        target = (now - self._base) * TARGET_FPS
+        # Starved or far behind: jump back to `delay` ticks behind the newest
+        if target > newest or target < newest - 2 * self.delay - 1:
+            target = max(oldest, newest - self.delay)
+            self._base = now - target / TARGET_FPS
+        before = after = self.history[-1]
+        for state in self.history:
+            if state.tick <= target:
+                before = state
+            else:
+                after = state
+                break
+        if after is before or after.tick == before.tick:
+            return StreamView(before, before, 1.0)
+        alpha = (target - before.tick) / (after.tick - before.tick)
+        return StreamView(before, after, alpha)
+
+    def close(self) -> None:
+        """Disconnect."""
+        self.sock.close()
+        self.closed = True
+
+
+class SpectatorWindow(arcade.Window):
+    """Draws a SpectatorClient's interpolated view with the game's renderers."""
+
+    def __init__(self, client: SpectatorClient) -> None:
+        super().__init__(SCREEN_WIDTH, SCREEN_HEIGHT, f"{SCREEN_TITLE} (spectator)")
+        arcade.set_background_color(COLOR_BACKGROUND)
+        self.client = client
+        self.textures = load_textures(load_atlas())
+        self.batches = {
+            name: SpriteBatch(self.textures)
+            for name in ("enemies", "powerups", "players")
+        }
+        self.hud = HUD(self.textures)
+
+    def on_update(self, dt: float) -> None:
+        """Take in whatever frames arrived."""
+        self.client.poll()
+        self.hud.update(dt)
+
+    def on_draw(self) -> None:
+        """Draw the scene at the client's display time."""
+        self.clear()
+        view = self.client.view()
+        if view is None:
+            return
+        draw_enemies(view.enemies, self.batches["enemies"])
+        draw_powerups(view.powerups, self.batches["powerups"])
+        draw_players(view.players, self.batches["players"])
+        for proj in view.projectiles:
+            draw_projectile(proj)
+        state = view.state
+        self.hud.draw(state.score, state.multiplier, state.combo, state.lives, [])
+        if state.state == STATE_GAME_OVER:
+            self.hud.draw_game_over(state.score)
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=SPECTATOR_PORT)
+    args = parser.parse_args()
+
+    SpectatorWindow(SpectatorClient(args.host, args.port))
+    arcade.run()
+
+
+if __name__ == "__main__":
+    main()
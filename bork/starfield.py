@@ -2,10 +2,7 @@
 
 import random
 
-import arcade
-
 from bork.constants import (
-    COLOR_STAR,
     SCREEN_HEIGHT,
     SCREEN_WIDTH,
     STAR_COLORS_ALPHA,
@@ -19,28 +16,55 @@ class Star:
     """A single star in the parallax field."""
 
     def __init__(
-        self, x: float, y: float, speed: float, size: float, alpha: int
+        self,
+        x: float,
+        y: float,
+        speed: float,
+        size: float,
+        alpha: int,
+        layer: int = 0,
     ) -> None:
         self.x = x
         self.y = y
         self.speed = speed
         self.size = size
         self.alpha = alpha
+        self.layer = layer
 
 
 class Starfield:
     """Multi-layer parallax scrolling starfield."""
 
-    def __init__(self) -> None:
+    def __init__(self, density: float = 1.0) -> None:
         self.stars: list[Star] = []
-        for layer in range(len(STAR_COUNTS)):
-            speed = STAR_SPEEDS[layer]
-            size = STAR_SIZES[layer]
-            alpha = STAR_COLORS_ALPHA[layer]
-            for _ in range(STAR_COUNTS[layer]):
-                x = random.uniform(0, SCREEN_WIDTH)
-                y = random.uniform(0, SCREEN_HEIGHT)
-                self.stars.append(Star(x, y, speed, size, alpha))
+        self.density = 1.0
+        self.set_density(density)
+
+    def set_density(self, density: float) -> None:
+        """Scale each layer to `density` * STAR_COUNTS, keeping existing stars."""
+        self.density = density
+        by_layer: list[list[Star]] = [[] for _ in STAR_COUNTS]
+        for star in self.stars:
+            by_layer[star.layer].append(star)
+        stars: list[Star] = []
+        for layer, count in enumerate(STAR_COUNTS):
+            target = round(count * density)
+            kept = by_layer[layer][:target]
+            for _ in range(target - len(kept)):
+                kept.append(self._make_star(layer))
+            stars.extend(kept)
+        self.stars = stars
+
+    def _make_star(self, layer: int) -> Star:
+        """Create a star for a layer at a random on-screen position."""
+        return Star(
+            random.uniform(0, SCREEN_WIDTH),
+            random.uniform(0, SCREEN_HEIGHT),
+            STAR_SPEEDS[layer],
+            STAR_SIZES[layer],
+            STAR_COLORS_ALPHA[layer],
+            layer,
+        )
 
     def update(self, dt: float) -> None:
         """Move stars leftward; wrap at left edge."""
@@ -49,9 +73,3 @@ class Starfield:
             if star.x < 0:
                 star.x = SCREEN_WIDTH + random.uniform(0, 20)
                 star.y = random.uniform(0, SCREEN_HEIGHT)
-
-    def draw(self) -> None:
-        """Draw each star as a filled circle."""
-        for star in self.stars:
-            color = (*COLOR_STAR, star.alpha)
-            arcade.draw_circle_filled(star.x, star.y, star.size, color)
@@ -0,0 +1,388 @@
+"""Spectator state stream: quantized keyframes and per-tick deltas.
+
+The stream carries what a spectator draws: ship, enemy, projectile and
+powerup positions plus the scoring state. It does not carry the full
+simulation. Positions are quantized to SPECTATOR_QUANTUM pixels. Each
+entity is keyed by the low 32 bits of its handle; live entities never
+share a slot, so these keys are unique.
+
+Every frame starts with flags and the tick:
+
+    scoring    score, multiplier, combo, lives, state (when it changed,
+               and in every keyframe)
+    players    x, y and invulnerable ticks of every ship (always in full)
+    per kind   keyframe: every entity
+               delta:    positions in the previous frame's order of the
+                         entities that went, an int8 step (dx, dy) for
+                         each that stayed, then the new entities in full
+
+Deltas carry no ids for moving entities, only their order, so most
+entities cost two bytes a tick. An entity that moved too far for int8 is
+sent as removed and added again, which puts it at the end of the order.
+A keyframe is sent every SPECTATOR_KEYFRAME_INTERVAL ticks. One is also
+sent with the reset flag when the tick does not move forward (a restart
+or rewind); decoders must not interpolate across a reset. A netplay
+rollback ends on the next tick, so it is just a larger delta.
+
+The encoder diffs against the quantized values it last sent, so decoded
+positions never drift from the encoder's.
+"""
+
+import math
+import struct
+import time
+from collections.abc import Callable
+
+from bork.constants import (
+    POWERUP_KINDS,
+    SPECTATOR_KEYFRAME_INTERVAL,
+    SPECTATOR_QUANTUM,
+    STATE_GAME_OVER,
+    STATE_PLAYING,
+    TARGET_FPS,
+)
+from bork.enemy import Enemy
+from bork.powerup import Powerup
+from bork.projectile import Projectile
+from bork.simulation import Simulation
+
+FLAG_KEYFRAME = 1
+FLAG_RESET = 2
+FLAG_SCORING = 4
+
+STATES = (STATE_PLAYING, STATE_GAME_OVER)
+
+_FRAME = struct.Struct("<BI")  # flags, tick
+_SCORING = struct.Struct("<IfHBB")  # score, multiplier, combo, lives, state
+_PLAYER = struct.Struct("<hhB")  # x, y, invulnerable ticks
+_COUNT = struct.Struct("<H")
+_STEP = struct.Struct("<bb")  # dx, dy in quanta
+_ENTITY = struct.Struct("<Ihh")  # id, x, y
+_POWERUP = struct.Struct("<IhhB")  # id, x, y, kind
+
+# Streamed component types and their entity records
+KINDS = (("enemies", Enemy), ("projectiles", Projectile), ("powerups", Powerup))
+_RECORDS = {"enemies": _ENTITY, "projectiles": _ENTITY, "powerups": _POWERUP}
+
+# id -> (x, y) in quanta, plus the kind index for powerups
+Entities = dict[int, tuple[int, ...]]
+
+
+_PER_UNIT = 1 / SPECTATOR_QUANTUM
+
+
+def quantize(value: float) -> int:
+    """A coordinate in whole quanta, clamped to int16."""
+    quanta = round(value * _PER_UNIT)
+    return quanta if -32768 <= quanta <= 32767 else max(-32768, min(32767, quanta))
+
+
+def _entities(sim: Simulation, name: str, component: type) -> Entities:
+    """Quantized records of one component store."""
+    store = sim.registry.store(component)
+    q = quantize  # local lookup; this runs for every entity every tick
+    if name == "powerups":
+        index = POWERUP_KINDS.index
+        return {
+            handle & 0xFFFFFFFF: (q(p.x), q(p.y), index(p.kind))
+            for p, handle in zip(store.items, store.owners)
+        }
+    return {
+        handle & 0xFFFFFFFF: (q(e.x), q(e.y))
+        for e, handle in zip(store.items, store.owners)
+    }
+
+
+class StreamStats:
+    """Bytes and encode time per frame, for the debug overlay and tests."""
+
+    def __init__(self) -> None:
+        self.frames = 0
+        self.keyframes = 0
+        self.bytes = 0  # total sent
+        self.last_bytes = 0
+        self.peak_bytes = 0
+        self.last_time = 0.0  # seconds to encode the last frame
+        self.worst_time = 0.0
+
+    def record(self, size: int, elapsed: float, keyframe: bool) -> None:
+        """Fold in one encoded frame."""
+        self.frames += 1
+        self.keyframes += keyframe
+        self.bytes += size
+        self.last_bytes = size
+        self.peak_bytes = max(self.peak_bytes, size)
+        self.last_time = elapsed
+        self.worst_time = max(self.worst_time, elapsed)
+
+    @property
+    def mean_bytes(self) -> float:
+        """Average frame size so far."""
+        return self.bytes / self.frames if self.frames else 0.0
+
+
+class StreamEncoder:
+    """Turns simulation ticks into stream frames."""
+
+    def __init__(
+        self,
+        keyframe_interval: int = SPECTATOR_KEYFRAME_INTERVAL,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self.keyframe_interval = keyframe_interval
+        self.clock = clock
+        self.stats = StreamStats()
+        self._tick: int | None = None  # tick of the last frame
+        self._since_keyframe = 0
+        self._scoring: tuple | None = None
+        self._sent: dict[str, Entities] = {name: {} for name, _ in KINDS}
+
+    def encode(self, sim: Simulation) -> bytes:
+        """The frame for the simulation's current tick."""
+        start = self.clock()
+        flags = 0
+        if self._tick is None or sim.tick <= self._tick:
+            flags |= FLAG_KEYFRAME | FLAG_RESET
+        elif self._since_keyframe + 1 >= self.keyframe_interval:
+            flags |= FLAG_KEYFRAME
+        keyframe = bool(flags & FLAG_KEYFRAME)
+        self._tick = sim.tick
+        self._since_keyframe = 0 if keyframe else self._since_keyframe + 1
+
+        scoring = sim.scoring
+        state = (
+            min(scoring.score, 0xFFFFFFFF),
+            scoring.multiplier,
+            min(scoring.combo, 0xFFFF),
+            max(0, min(sim.lives, 255)),
+            STATES.index(sim.state),
+        )
+        if keyframe or state != self._scoring:
+            flags |= FLAG_SCORING
+            self._scoring = state
+        parts = [_FRAME.pack(flags, sim.tick)]
+        if flags & FLAG_SCORING:
+            parts.append(_SCORING.pack(*state))
+        parts.append(bytes([len(sim.players)]))
+        for player in sim.players:
+            invulnerable = math.ceil(max(0.0, player.invulnerable_timer) * TARGET_FPS)
+            parts.append(
+                _PLAYER.pack(
+                    quantize(player.x), quantize(player.y), min(invulnerable, 255)
+                )
+            )
+        for name, component in KINDS:
+            current = _entities(sim, name, component)
+            if keyframe:
+                parts.append(_pack_rows(_RECORDS[name], current))
+            else:
+                delta, current = _delta(_RECORDS[name], self._sent[name], current)
+                parts.extend(delta)
+            self._sent[name] = current
+        frame = b"".join(parts)
+        self.stats.record(len(frame), self.clock() - start, keyframe)
+        return frame
+
+
+def _pack_rows(record: struct.Struct, entities: Entities) -> bytes:
+    """Count-prefixed full records."""
+    return _COUNT.pack(len(entities)) + b"".join(
+        record.pack(entity_id, *values) for entity_id, values in entities.items()
+    )
+
+
+def _delta(
+    record: struct.Struct, sent: Entities, current: Entities
+) -> tuple[list[bytes], Entities]:
+    """The delta from `sent` to `current`, and the entities in wire order."""
+    removed: list[int] = []
+    steps = bytearray()
+    kept: Entities = {}
+    for index, (entity_id, old) in enumerate(sent.items()):
+        new = current.get(entity_id)
+        if new is not None:
+            dx = new[0] - old[0]
+            dy = new[1] - old[1]
+            if -128 <= dx <= 127 and -128 <= dy <= 127:
+                steps += _STEP.pack(dx, dy)
+                kept[entity_id] = new
+                continue
+        removed.append(index)
+    added = {i: values for i, values in current.items() if i not in kept}
+    kept.update(added)
+    parts = [
+        _COUNT.pack(len(removed)),
+        struct.pack(f"<{len(removed)}H", *removed),
+        bytes(steps),
+        _pack_rows(record, added),
+    ]
+    return parts, kept
+
+
+class StreamState:
+    """One decoded tick: scoring, ships and every streamed entity."""
+
+    def __init__(
+        self,
+        tick: int,
+        reset: bool,
+        scoring: tuple,
+        players: list[tuple[int, int, int]],
+        entities: dict[str, Entities],
+        born: dict[int, int],
+    ) -> None:
+        self.tick = tick
+        self.reset = reset  # do not interpolate from the state before this
+        self.score, self.multiplier, self.combo, self.lives, state = scoring
+        self.state = STATES[state]
+        self.players = players  # (x, y, invulnerable ticks) in quanta
+        self.entities = entities
+        self.born = born  # powerup id -> tick it first appeared
+
+
+class StreamDecoder:
+    """Applies frames in order; each frame yields a new StreamState.
+
+    Deltas that arrive before the first keyframe are skipped (None).
+    """
+
+    def __init__(self) -> None:
+        self.state: StreamState | None = None
+
+    def apply(self, frame: bytes) -> StreamState | None:
+        """Decode one frame on top of the current state."""
+        flags, tick = _FRAME.unpack_from(frame)
+        offset = _FRAME.size
+        keyframe = bool(flags & FLAG_KEYFRAME)
+        previous = self.state
+        if previous is None and not keyframe:
+            return None
+        if flags & FLAG_SCORING:
+            scoring = _SCORING.unpack_from(frame, offset)
+            offset += _SCORING.size
+        else:
+            scoring = (
+                previous.score,
+                previous.multiplier,
+                previous.combo,
+                previous.lives,
+                STATES.index(previous.state),
+            )
+        count = frame[offset]
+        offset += 1
+        players = [
+            _PLAYER.unpack_from(frame, offset + i * _PLAYER.size) for i in range(count)
+        ]
+        offset += count * _PLAYER.size
+        entities: dict[str, Entities] = {}
+        for name, _ in KINDS:
+            record = _RECORDS[name]
+            if keyframe:
+                current, offset = _unpack_rows(record, frame, offset)
+            else:
+                current, offset = _apply_delta(
+                    record, frame, offset, previous.entities[name]
+                )
+            entities[name] = current
+        born = {} if previous is None or flags & FLAG_RESET else previous.born
+        powerups = entities["powerups"]
+        born = {entity_id: born.get(entity_id, tick) for entity_id in powerups}
+        self.state = StreamState(
+            tick, bool(flags & FLAG_RESET), scoring, players, entities, born
+        )
+        return self.state
+
+
+def _unpack_rows(
+    record: struct.Struct, frame: bytes, offset: int
+) -> tuple[Entities, int]:
+    """Read count-prefixed full records."""
+    (count,) = _COUNT.unpack_from(frame, offset)
+    offset += _COUNT.size
+    rows: Entities = {}
+    for _ in range(count):
+        entity_id, *values = record.unpack_from(frame, offset)
+        rows[entity_id] = tuple(values)
+        offset += record.size
+    return rows, offset
+
+
+def _apply_delta(
+    record: struct.Struct, frame: bytes, offset: int, previous: Entities
+) -> tuple[Entities, int]:
+    """The entities after a delta on `previous`, and the new offset."""
+    (count,) = _COUNT.unpack_from(frame, offset)
+    offset += _COUNT.size
+    removed = set(struct.unpack_from(f"<{count}H", frame, offset))
+    offset += 2 * count
+    survivors = [
+        item for index, item in enumerate(previous.items()) if index not in removed
+    ]
+    steps = struct.unpack_from(f"<{2 * len(survivors)}b", frame, offset)
+    offset += 2 * len(survivors)
+    entities: Entities = {}
+    for i, (entity_id, (x, y, *rest)) in enumerate(survivors):
+        entities[entity_id] = (x + steps[2 * i], y + steps[2 * i + 1], *rest)
+    added, offset = _unpack_rows(record, frame, offset)
+    entities.update(added)
+    return entities, offset
+
+
+class StreamEntity:
+    """A drawable stand-in for a ship, enemy, projectile or powerup."""
+
+    def __init__(self, x: float, y: float) -> None:
+        self.x = x
+        self.y = y
+        self.vx = 1.0  # direction of travel (projectiles)
+        self.vy = 0.0
+        self.kind = ""  # powerup kind
+        self.time_alive = 0.0
+        self.invulnerable_timer = 0.0
+
+    @property
+    def is_invulnerable(self) -> bool:
+        """Whether the ship blinks."""
+        return self.invulnerable_timer > 0
+
+
+class StreamView:
+    """Everything a spectator draws for one moment between two ticks."""
+
+    def __init__(self, a: StreamState, b: StreamState, alpha: float) -> None:
+        if b.reset:
+            a, alpha = b, 1.0
+        q = SPECTATOR_QUANTUM
+        self.state = b
+        same_ships = len(a.players) == len(b.players)
+        self.players: list[StreamEntity] = []
+        for i, new in enumerate(b.players):
+            ship = _lerp(a.players[i] if same_ships else new, new, alpha)
+            ship.invulnerable_timer = new[2] / TARGET_FPS
+            self.players.append(ship)
+        self.enemies: list[StreamEntity] = []
+        self.projectiles: list[StreamEntity] = []
+        self.powerups: list[StreamEntity] = []
+        for name, _ in KINDS:
+            before = a.entities[name]
+            out = getattr(self, name)
+            for entity_id, values in b.entities[name].items():
+                old = before.get(entity_id, values)
+                entity = _lerp(old, values, alpha)
+                if name == "projectiles" and (values[0], values[1]) != old[:2]:
+                    entity.vx = (values[0] - old[0]) * q
+                    entity.vy = (values[1] - old[1]) * q
+                elif name == "powerups":
+                    entity.kind = POWERUP_KINDS[values[2]]
+                    age = b.tick - b.born.get(entity_id, b.tick) + alpha - 1
+                    entity.time_alive = max(0.0, age / TARGET_FPS)
+                out.append(entity)
+
+
+def _lerp(old: tuple, new: tuple, alpha: float) -> StreamEntity:
+    """An entity between two quantized positions."""
+    q = SPECTATOR_QUANTUM
+    return StreamEntity(
+        (old[0] + (new[0] - old[0]) * alpha) * q,
+        (old[1] + (new[1] - old[1]) * alpha) * q,
+    )
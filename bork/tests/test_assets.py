@@ -0,0 +1,127 @@
+"""Tests for the background asset loader and the startup timeline."""
+
+import threading
+
+import pytest
+
+from bork.assets import AssetLoader, StartupTimeline
+
+
+def _loader(budget: float = 1.0) -> AssetLoader:
+    return AssetLoader(StartupTimeline(), workers=2, budget=budget)
+
+
+def _wait_for_decodes(loader: AssetLoader) -> None:
+    for asset in loader.assets:
+        asset.future.exception()
+
+
+def test_decodes_on_workers_and_finishes_on_caller() -> None:
+    loader = _loader()
+    threads: dict[str, str] = {}
+    results: dict[str, object] = {}
+
+    def decode() -> int:
+        threads["decode"] = threading.current_thread().name
+        return 42
+
+    def finish(value: int) -> None:
+        threads["finish"] = threading.current_thread().name
+        results["value"] = value
+
+    loader.add("answer", decode, finish)
+    loader.start()
+    _wait_for_decodes(loader)
+    assert loader.update()
+    assert results == {"value": 42}
+    assert threads["decode"].startswith("bork-assets")
+    assert threads["finish"] == threading.current_thread().name
+
+
+def test_budget_spreads_finish_steps_over_frames() -> None:
+    loader = _loader(budget=0.0)
+    finished: list[str] = []
+    for name in ("a", "b", "c"):
+        loader.add(name, lambda name=name: name, finished.append)
+    loader.start()
+    _wait_for_decodes(loader)
+    assert loader.progress == 0.5  # decoded, nothing finished
+
+    assert not loader.update()
+    assert finished == ["a"]
+    assert loader.progress == pytest.approx(4 / 6)
+    assert not loader.update()
+    assert loader.update()
+    assert finished == ["a", "b", "c"]
+    assert loader.frames == 3
+    assert loader.progress == 1.0
+
+
+def test_progress_is_weighted() -> None:
+    loader = _loader()
+    gate = threading.Event()
+    loader.add("big", lambda: None, weight=3.0)
+    loader.add("small", gate.wait)
+    loader.start()
+    loader.assets[0].future.result()
+    loader.update()
+    assert loader.progress == 0.75
+    gate.set()
+    loader.wait()
+    assert loader.progress == 1.0
+
+
+def test_failed_decode_raises_on_main_thread() -> None:
+    loader = _loader()
+
+    def broken() -> None:
+        raise OSError("missing.wav")
+
+    loader.add("broken", broken)
+    loader.start()
+    _wait_for_decodes(loader)
+    with pytest.raises(OSError, match="missing.wav"):
+        loader.update()
+
+
+def test_wait_loads_everything_and_marks_timeline() -> None:
+    loader = _loader(budget=0.0)
+    for name in ("a", "b"):
+        loader.add(name, lambda: None, lambda _: None)
+    loader.wait()
+    assert loader.done
+    timeline = loader.timeline
+    assert loader.loaded_at == timeline.first("assets loaded").start
+    labels = {entry.label for entry in timeline.entries}
+    assert {"decode a", "decode b", "finish a", "finish b"} <= labels
+    for entry in timeline.entries:
+        assert entry.end >= entry.start >= 0
+
+
+def test_empty_loader_is_done_at_once() -> None:
+    loader = _loader()
+    assert loader.update()
+    assert loader.progress == 1.0
+    assert loader.loaded_at is not None
+
+
+def test_assets_must_be_added_before_start() -> None:
+    loader = _loader()
+    loader.start()
+    with pytest.raises(RuntimeError):
+        loader.add("late", lambda: None)
+    loader.wait()
+
+
+def test_timeline_orders_entries_by_start() -> None:
+    ticks = iter([0.0, 0.5, 0.2, 0.3, 0.4])
+    timeline = StartupTimeline(clock=lambda: next(ticks))
+    timeline.mark("late")  # at 0.5
+    start = timeline.now()  # 0.2
+    timeline.span("early", start)  # ends at 0.3
+    timeline.mark("late")  # at 0.4
+    assert timeline.first("late").start == 0.4
+    assert timeline.first("missing") is None
+    rows = timeline.format().splitlines()
+    assert rows[1].endswith("early")
+    assert "100.0" in rows[1]  # took 100 ms
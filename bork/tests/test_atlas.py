@@ -0,0 +1,92 @@
+"""Tests for the shape atlas and its disk cache."""
+
+from pathlib import Path
+
+from PIL import Image
+
+from bork.atlas import atlas_key, atlas_specs, build_atlas, load_atlas, pack
+from bork.constants import ATLAS_PADDING, ATLAS_WIDTH, ENEMY_COLOR, POWERUP_LABELS
+
+
+def _overlaps(a: tuple, b: tuple) -> bool:
+    ax, ay, aw, ah = a
+    bx, by, bw, bh = b
+    return ax < bx + bw and bx < ax + aw and ay < by + bh and by < ay + ah
+
+
+def test_every_shape_has_a_region() -> None:
+    specs = atlas_specs()
+    assert {f"powerup_{kind}" for kind in POWERUP_LABELS} <= set(specs)
+    assert {"player", "enemy", "circle", "square", "triangle", "chevron"} <= set(specs)
+    atlas = build_atlas(specs)
+    assert set(atlas.regions) == set(specs)
+    for name, spec in specs.items():
+        assert atlas.crop(name).size == tuple(spec["size"])
+
+
+def test_regions_are_padded_and_disjoint() -> None:
+    sizes = {f"s{i}": (20 + 7 * i, 10 + 3 * (i % 5)) for i in range(20)}
+    regions, height = pack(sizes)
+    padded = {
+        name: (x - 1, y - 1, w + 2, h + 2) for name, (x, y, w, h) in regions.items()
+    }
+    names = sorted(regions)
+    for i, a in enumerate(names):
+        x, y, w, h = regions[a]
+        assert x >= ATLAS_PADDING and y >= ATLAS_PADDING
+        assert x + w + ATLAS_PADDING <= ATLAS_WIDTH
+        assert y + h + ATLAS_PADDING <= height
+        for b in names[i + 1 :]:
+            assert not _overlaps(padded[a], padded[b])
+
+
+def test_shapes_are_filled_with_transparent_corners() -> None:
+    atlas = build_atlas(atlas_specs())
+    enemy = atlas.crop("enemy")
+    w, h = enemy.size
+    assert enemy.getpixel((w // 2, h // 2)) == (*ENEMY_COLOR, 255)
+    assert enemy.getpixel((0, 0))[3] == 0
+
+
+def test_second_load_comes_from_cache(tmp_path: Path) -> None:
+    first = load_atlas(tmp_path)
+    second = load_atlas(tmp_path)
+    assert not first.from_cache
+    assert second.from_cache
+    assert second.regions == first.regions
+    assert list(second.image.getdata()) == list(first.image.getdata())
+
+
+def test_changed_constants_replace_stale_cache(tmp_path: Path) -> None:
+    specs = atlas_specs()
+    old = load_atlas(tmp_path, specs)
+    specs["enemy"]["color"] = (1, 2, 3)
+    new = load_atlas(tmp_path, specs)
+    assert new.key != old.key
+    assert not new.from_cache
+    assert [p.name for p in tmp_path.iterdir()] == [f"atlas-{new.key}.png"]
+
+
+def test_key_depends_on_content_only() -> None:
+    assert atlas_key(atlas_specs()) == atlas_key(atlas_specs())
+    specs = atlas_specs()
+    specs["player"]["size"] = [10, 10]
+    assert atlas_key(specs) != atlas_key(atlas_specs())
+
+
+def test_corrupt_cache_is_regenerated(tmp_path: Path) -> None:
+    atlas = load_atlas(tmp_path)
+    path = tmp_path / f"atlas-{atlas.key}.png"
+    path.write_bytes(b"not a png")
+    again = load_atlas(tmp_path)
+    assert not again.from_cache
+    with Image.open(path) as image:
+        assert image.text["key"] == atlas.key
+
+
+def test_unwritable_cache_still_builds(tmp_path: Path) -> None:
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    atlas = load_atlas(blocker / "cache")
+    assert not atlas.from_cache
+    assert atlas.regions
@@ -0,0 +1,39 @@
+"""Tests for the scripted autopilot player."""
+
+from bork.autopilot import autopilot_actions
+from bork.constants import ACTION_DOWN, ACTION_FIRE, ACTION_UP
+from bork.enemy import Enemy
+from bork.simulation import Simulation
+
+DT = 1 / 60
+
+
+def test_fires_and_lines_up_with_enemy_ahead() -> None:
+    sim = Simulation(seed=1)
+    player = sim.player
+    sim.spawn(Enemy(player.x + 300, player.y + 100, "straight", player.y + 100))
+    assert autopilot_actions(sim) == {ACTION_FIRE, ACTION_UP}
+
+    sim = Simulation(seed=1)
+    player = sim.player
+    sim.spawn(Enemy(player.x + 300, player.y - 100, "straight", player.y - 100))
+    assert autopilot_actions(sim) == {ACTION_FIRE, ACTION_DOWN}
+
+
+def test_weaves_without_target() -> None:
+    sim = Simulation(seed=1)
+    actions = {frozenset(autopilot_actions(sim))}
+    for _ in range(100):
+        sim.tick += 1
+        actions.add(frozenset(autopilot_actions(sim)))
+    assert actions == {
+        frozenset({ACTION_FIRE, ACTION_UP}),
+        frozenset({ACTION_FIRE, ACTION_DOWN}),
+    }
+
+
+def test_autopilot_scores() -> None:
+    sim = Simulation(seed=3)
+    for _ in range(1800):
+        sim.update(DT, autopilot_actions(sim))
+    assert sim.scoring.score > 0
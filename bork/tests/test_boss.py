@@ -0,0 +1,99 @@
+"""Tests for the boss entity and its hit-zone tree."""
+
+import math
+
+from bork.boss import BOSS_RADIUS, HIT_TREE, Boss, part_specs
+from bork.constants import (
+    BOSS_FIRE_DELAY,
+    BOSS_GROUPS,
+    BOSS_STOP_X,
+    SCREEN_WIDTH,
+)
+
+DT = 1 / 60
+
+
+def _contains(outer, x: float, y: float, radius: float) -> bool:
+    return math.hypot(x - outer.x, y - outer.y) + radius <= outer.radius + 1e-9
+
+
+def test_tree_is_boss_then_groups_then_parts() -> None:
+    root = HIT_TREE.root
+    assert (root.x, root.y, root.radius) == (0.0, 0.0, BOSS_RADIUS)
+    assert len(root.children) == len(BOSS_GROUPS)
+    leaves = [leaf for group in root.children for leaf in group.children]
+    assert sorted(leaf.part for leaf in leaves) == list(range(len(part_specs())))
+    for group in root.children:
+        assert _contains(root, group.x, group.y, group.radius)
+        for leaf in group.children:
+            assert leaf.children == []
+            assert _contains(group, leaf.x, leaf.y, leaf.radius)
+
+
+def test_animated_parts_stay_inside_their_bounds() -> None:
+    boss = Boss(BOSS_STOP_X, 270)
+    nodes = HIT_TREE.nodes
+    for _ in range(300):
+        boss.update(DT)
+        for part, path in enumerate(HIT_TREE.paths):
+            x, y = boss.part_offset(part)
+            radius = HIT_TREE.parts[part]["radius"]
+            for node_id in path:
+                assert _contains(nodes[node_id], x, y, radius)
+
+
+def test_hit_part_finds_the_part_under_a_point() -> None:
+    boss = Boss(600, 300)
+    for part in range(len(boss.hp)):
+        x, y = boss.part_position(part)
+        assert boss.hit_part(x, y, 0.0) == part
+    assert boss.hit_part(600, 300 + BOSS_RADIUS + 1, 0.0) is None
+    assert boss.hit_part(600 + 150, 300, 0.0) is None
+
+
+def test_query_descends_only_into_overlapping_nodes() -> None:
+    boss = Boss(600, 300)
+    x, y = boss.part_position(HIT_TREE.core)
+    before = boss.tests
+    assert boss.hit_part(x, y, 0.0) == HIT_TREE.core
+    assert boss.tests - before < len(boss.hp)
+
+
+def test_destroyed_parts_leave_queries() -> None:
+    boss = Boss(600, 300)
+    turret = HIT_TREE.turrets[0]
+    x, y = boss.part_position(turret)
+    for _ in range(HIT_TREE.parts[turret]["hp"] - 1):
+        assert not boss.damage(turret)
+    assert boss.damage(turret)
+    assert boss.hit_part(x, y, 0.0) is None
+    assert turret not in boss.live_turrets()
+    assert boss.live[HIT_TREE.root.id] == len(boss.hp) - 1
+
+
+def test_dead_group_is_skipped_without_testing_its_parts() -> None:
+    boss = Boss(600, 300)
+    group = next(g for g in HIT_TREE.root.children if len(g.children) > 1)
+    for leaf in group.children:
+        boss.destroy_part(leaf.part)
+    assert boss.live[group.id] == 0
+    before = boss.tests
+    assert boss.hit_part(600 + group.x, 300 + group.y, 0.0) is None
+    # The root and the other groups' bounds; nothing inside the dead group
+    assert boss.tests - before <= len(HIT_TREE.root.children)
+
+
+def test_destroying_the_core_defeats_the_boss() -> None:
+    boss = Boss(600, 300)
+    assert not boss.defeated
+    boss.destroy_part(HIT_TREE.core)
+    assert boss.defeated
+
+
+def test_boss_enters_then_stops_and_fires() -> None:
+    boss = Boss(SCREEN_WIDTH + BOSS_RADIUS, 270)
+    volleys = 0
+    for _ in range(int((BOSS_FIRE_DELAY + 10) * 60)):
+        volleys += boss.update(DT)
+    assert boss.x == BOSS_STOP_X
+    assert volleys >= 2
@@ -0,0 +1,67 @@
+"""Tests for the enemy bullet store."""
+
+import numpy as np
+
+from bork.bullets import BulletStore
+from bork.constants import ENEMY_BULLET_RADIUS, SCREEN_WIDTH
+
+DT = 1 / 60
+
+
+def test_spawn_and_advance() -> None:
+    store = BulletStore()
+    store.spawn(100, 200, -60, 30)
+    store.update(DT)
+    assert len(store) == 1
+    assert store.x[0] == 100 - 60 * DT
+    assert store.y[0] == 200 + 30 * DT
+
+
+def test_store_grows_past_capacity() -> None:
+    store = BulletStore(capacity=2)
+    for i in range(5):
+        store.spawn(i, 0, 0, 0)
+    store.spawn_many(np.full(10, 7.0), np.zeros(10), np.zeros(10), np.zeros(10))
+    assert len(store) == 15
+    assert list(store.x[:5]) == [0, 1, 2, 3, 4]
+    assert list(store.ids[:15]) == list(range(15))
+
+
+def test_cull_removes_off_screen_bullets_in_order() -> None:
+    store = BulletStore()
+    store.spawn(100, 100, 0, 0)
+    store.spawn(-10, 100, 0, 0)
+    store.spawn(SCREEN_WIDTH + 10, 100, 0, 0)
+    store.spawn(200, 100, 0, 0)
+    store.cull()
+    assert list(store.x[: store.count]) == [100, 200]
+    assert list(store.ids[: store.count]) == [0, 3]
+
+
+def test_hits_circle_matches_brute_force() -> None:
+    rng = np.random.default_rng(4)
+    store = BulletStore()
+    n = 3000
+    store.spawn_many(
+        rng.uniform(0, 960, n), rng.uniform(0, 540, n), np.zeros(n), np.zeros(n)
+    )
+    cx, cy, r = 480.0, 270.0, 40.0
+    reach = r + ENEMY_BULLET_RADIUS
+    d2 = (store.x[:n] - cx) ** 2 + (store.y[:n] - cy) ** 2
+    expected = np.flatnonzero(d2 <= reach * reach)
+    assert len(expected) > 0
+    assert list(store.hits_circle(cx, cy, r)) == list(expected)
+
+
+def test_box_corner_is_not_a_hit() -> None:
+    store = BulletStore()
+    store.spawn(110, 110, 0, 0)  # inside the AABB, outside the circle
+    assert len(store.hits_circle(100, 100, 10)) == 0
+
+
+def test_remove_keeps_remaining_order() -> None:
+    store = BulletStore()
+    for i in range(6):
+        store.spawn(i * 10, 0, 0, 0)
+    store.remove(np.array([1, 4]))
+    assert list(store.x[: store.count]) == [0, 20, 30, 50]
@@ -1,6 +1,6 @@
 """Tests for collision detection."""
 
-from bork.collision import circle_circle, point_in_circle
+from bork.collision import CollisionWorld, circle_circle, point_in_circle
 
 
 def test_circle_circle_overlap() -> None:
@@ -26,3 +26,65 @@ def test_point_in_circle_outside() -> None:
 
 def test_point_in_circle_on_edge() -> None:
     assert point_in_circle(10, 0, 0, 0, 10)
+
+
+class _Dot:
+    def __init__(self, x: float, y: float) -> None:
+        self.x = x
+        self.y = y
+
+
+def test_world_reports_contacts_only_between_masked_layers() -> None:
+    world = CollisionWorld()
+    player, enemy, shot, other_shot = (
+        _Dot(100, 100),
+        _Dot(105, 100),
+        _Dot(103, 100),
+        _Dot(104, 101),
+    )
+    world.update(
+        (
+            ([player], 1, 4, 10.0),
+            ([shot, other_shot], 2, 4, 0.0),
+            ([enemy], 4, 1 | 2, 10.0),
+        )
+    )
+    assert world.contacts(1, 4) == [(player, enemy)]
+    assert world.contacts(4, 1) == [(enemy, player)]
+    assert sorted(id(s) for s, _ in world.contacts(2, 4)) == sorted(
+        [id(shot), id(other_shot)]
+    )
+    assert world.contacts(1, 2) == []
+    assert world.contacts(2, 2) == []
+
+
+def test_world_skips_far_apart_pairs_along_x() -> None:
+    world = CollisionWorld()
+    shots = [_Dot(x, 100) for x in range(0, 1000, 50)]
+    enemies = [_Dot(x + 500, 100) for x in range(0, 1000, 50)]
+    world.update(((shots, 2, 4, 0.0), (enemies, 4, 2, 10.0)))
+    assert world.pairs_tested < len(shots) * len(enemies) // 4
+
+
+def test_world_tracks_moves_spawns_and_removals() -> None:
+    world = CollisionWorld()
+    a, b, c = _Dot(0, 0), _Dot(300, 0), _Dot(600, 0)
+    world.update((([a, b, c], 1, 1, 5.0),))
+    assert world.contacts(1, 1) == []
+    b.x = 3
+    d = _Dot(900, 0)
+    world.update((([a, b, d], 1, 1, 5.0),))
+    assert world.contacts(1, 1) == [(a, b)]
+    assert [body.entity for body in world.bodies] == [a, b, d]
+
+
+def test_world_resorts_nearly_sorted_bodies_cheaply() -> None:
+    world = CollisionWorld()
+    dots = [_Dot(x * 10.0, 0) for x in range(100)]
+    world.update(((dots, 1, 0, 1.0),))
+    dots[10].x, dots[11].x = dots[11].x, dots[10].x
+    swaps = world.swaps
+    world.update(((dots, 1, 0, 1.0),))
+    assert world.swaps - swaps == 1
+    xs = [body.min_x for body in world.bodies]
+    assert xs == sorted(xs)
@@ -0,0 +1,52 @@
+"""Tests for the compositor's virtual resolution helpers."""
+
+import argparse
+
+import pytest
+
+from bork.compositor import add_resolution_arguments, integer_viewport, parse_resolution
+from bork.constants import RETRO_RESOLUTION, SCREEN_HEIGHT, SCREEN_WIDTH
+
+
+def test_native_size_fills_the_target() -> None:
+    assert integer_viewport((960, 540), (960, 540)) == (0, 0, 960, 540)
+
+
+def test_retro_scales_by_whole_pixels() -> None:
+    assert integer_viewport(RETRO_RESOLUTION, (SCREEN_WIDTH, SCREEN_HEIGHT)) == (
+        0,
+        0,
+        SCREEN_WIDTH,
+        SCREEN_HEIGHT,
+    )
+    assert integer_viewport((480, 270), (3840, 2160)) == (0, 0, 3840, 2160)
+
+
+def test_odd_targets_are_letterboxed() -> None:
+    # 1366x768 fits 480x270 twice, centred
+    assert integer_viewport((480, 270), (1366, 768)) == (203, 114, 960, 540)
+    # The tighter axis decides the scale
+    assert integer_viewport((320, 180), (1920, 600)) == (480, 30, 960, 540)
+
+
+def test_larger_source_is_drawn_one_to_one() -> None:
+    assert integer_viewport((960, 540), (800, 450)) == (-80, -45, 960, 540)
+
+
+def test_parse_resolution() -> None:
+    assert parse_resolution("native") is None
+    assert parse_resolution("retro") == RETRO_RESOLUTION
+    assert parse_resolution("320x180") == (320, 180)
+    for bad in ("320", "0x180", "320x-1", "axb", "1x2x3"):
+        with pytest.raises(ValueError):
+            parse_resolution(bad)
+
+
+def test_resolution_options() -> None:
+    parser = argparse.ArgumentParser()
+    add_resolution_arguments(parser)
+    args = parser.parse_args(["--resolution", "retro", "--virtual-hud"])
+    assert (args.resolution, args.virtual_hud) == (RETRO_RESOLUTION, True)
+    assert parser.parse_args([]).resolution is None
+    with pytest.raises(SystemExit):
+        parser.parse_args(["--resolution", "0x180"])
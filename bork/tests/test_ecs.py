@@ -0,0 +1,88 @@
+"""Tests for the entity-component store."""
+
+import pytest
+
+from bork.ecs import ComponentStore, Registry, handle_generation, handle_index
+from bork.enemy import Enemy
+from bork.projectile import Projectile
+
+
+def test_handles_are_unique_and_alive() -> None:
+    registry = Registry()
+    a = registry.create()
+    b = registry.create()
+    assert a != b
+    assert registry.alive(a)
+    assert registry.alive(b)
+
+
+def test_destroyed_slot_is_reused_with_new_generation() -> None:
+    registry = Registry()
+    a = registry.create()
+    assert registry.destroy(a)
+    b = registry.create()
+    assert handle_index(b) == handle_index(a)
+    assert handle_generation(b) == handle_generation(a) + 1
+    assert not registry.alive(a)
+    assert not registry.destroy(a)
+
+
+def test_stale_handle_does_not_resolve_to_new_entity() -> None:
+    registry = Registry()
+    old = registry.spawn(Enemy(1, 2, "straight", 2))
+    registry.destroy(old)
+    registry.spawn(Enemy(3, 4, "straight", 4))
+    assert registry.get(old, Enemy) is None
+    assert old not in registry.store(Enemy)
+
+
+def test_swap_remove_keeps_store_dense() -> None:
+    store: ComponentStore[str] = ComponentStore()
+    for handle, name in enumerate("abcd"):
+        store.add(handle, name)
+    assert store.remove(1) == "b"
+    assert store.items == ["a", "d", "c"]
+    assert store.owners == [0, 3, 2]
+    assert store.get(3) == "d"
+    assert store.remove(2) == "c"
+    assert store.items == ["a", "d"]
+    assert store.remove(2) is None
+
+
+def test_add_twice_raises() -> None:
+    store: ComponentStore[str] = ComponentStore()
+    store.add(0, "a")
+    with pytest.raises(ValueError):
+        store.add(0, "b")
+
+
+def test_destroy_removes_every_component() -> None:
+    registry = Registry()
+    handle = registry.spawn(Enemy(1, 2, "straight", 2), Projectile(5, 6))
+    registry.destroy(handle)
+    assert len(registry.store(Enemy)) == 0
+    assert len(registry.store(Projectile)) == 0
+
+
+def test_view_yields_entities_with_all_components() -> None:
+    registry = Registry()
+    enemy = Enemy(1, 2, "straight", 2)
+    proj = Projectile(5, 6)
+    both = registry.spawn(enemy, proj)
+    registry.spawn(Enemy(3, 4, "straight", 4))
+    assert list(registry.view(Enemy, Projectile)) == [(both, enemy, proj)]
+    assert len(list(registry.view(Enemy))) == 2
+
+
+def test_spawn_many_extends_the_store_once() -> None:
+    registry = Registry()
+    store = registry.store(Projectile)
+    volley = [Projectile(1, 2), Projectile(1, 3), Projectile(1, 4)]
+    handles = registry.spawn_many(volley)
+    assert store.version == 1
+    assert store.items == volley and store.owners == handles
+    assert [registry.get(h, Projectile) for h in handles] == volley
+    assert registry.created == 3
+    assert registry.spawn_many([]) == []
+    with pytest.raises(ValueError):
+        store.extend([handles[0]], [Projectile(0, 0)])
@@ -1,6 +1,11 @@
 """Tests for the enemy entity."""
 
-from bork.constants import ENEMY_SIZE, SCREEN_WIDTH
+from bork.constants import (
+    ENEMY_FIRE_DELAY,
+    ENEMY_FIRE_INTERVAL,
+    ENEMY_SIZE,
+    SCREEN_WIDTH,
+)
 from bork.enemy import Enemy
 
 DT = 1 / 60
@@ -36,3 +41,13 @@ def test_enemy_off_screen_left() -> None:
 def test_enemy_not_off_screen_when_visible() -> None:
     e = Enemy(SCREEN_WIDTH / 2, 200, "straight", 200)
     assert not e.is_off_screen()
+
+
+def test_enemy_fires_when_timer_comes_due() -> None:
+    e = Enemy(SCREEN_WIDTH / 2, 200, "straight", 200)
+    ticks = 1
+    while not e.update(DT):
+        ticks += 1
+    assert abs(ticks * DT - ENEMY_FIRE_DELAY) <= DT
+    assert not e.update(DT)
+    assert e.fire_timer > ENEMY_FIRE_INTERVAL - 2 * DT
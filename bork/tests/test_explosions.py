@@ -2,6 +2,8 @@
 
 from bork.constants import (
     ENEMY_EXPLOSION_COUNT,
+    PARTICLE_PRIORITY_HIGH,
+    PARTICLE_PRIORITY_LOW,
     PLAYER_EXPLOSION_COUNT,
     POWERUP_BURST_COUNT,
 )
@@ -57,3 +59,18 @@ def test_powerup_burst_uses_provided_color() -> None:
     particles = create_powerup_burst(100, 200, color)
     for p in particles:
         assert p.color_start == color
+
+
+def test_explosion_priorities() -> None:
+    assert all(
+        p.priority == PARTICLE_PRIORITY_LOW for p in create_enemy_explosion(0, 0)
+    )
+    assert all(
+        p.priority == PARTICLE_PRIORITY_HIGH for p in create_player_explosion(0, 0)
+    )
+
+
+def test_explosion_scale_reduces_count() -> None:
+    particles = create_player_explosion(100, 200, scale=0.1)
+    assert len(particles) <= round(PLAYER_EXPLOSION_COUNT[1] * 0.1)
+    assert len(particles) >= 1
@@ -33,3 +33,8 @@ def test_milestone_timer_stops_at_zero() -> None:
     # Tick well past duration
     hud.update(COMBO_MILESTONE_DURATION + 1.0)
     assert hud.milestone_timer == 0.0
+
+
+def test_hud_text_effects_enabled_by_default() -> None:
+    hud = HUD()
+    assert hud.text_effects is True
@@ -0,0 +1,24 @@
+"""Tests for keyboard-to-action bindings."""
+
+import arcade
+
+from bork.constants import ACTION_DOWN, ACTION_FIRE, ACTION_RIGHT, ACTION_UP
+from bork.input import actions_for
+
+
+def test_arrow_keys_and_wasd_map_to_same_action() -> None:
+    assert actions_for({arcade.key.RIGHT}) == {ACTION_RIGHT}
+    assert actions_for({arcade.key.D}) == {ACTION_RIGHT}
+
+
+def test_space_fires() -> None:
+    assert actions_for({arcade.key.SPACE, arcade.key.UP}) == {ACTION_FIRE, ACTION_UP}
+
+
+def test_unbound_keys_are_ignored() -> None:
+    assert actions_for({arcade.key.F3, arcade.key.R}) == set()
+
+
+def test_custom_bindings() -> None:
+    bindings = {arcade.key.J: ACTION_DOWN}
+    assert actions_for({arcade.key.J, arcade.key.DOWN}, bindings) == {ACTION_DOWN}
@@ -0,0 +1,159 @@
+"""Tests for input latency tracking and frame pacing."""
+
+import pytest
+
+from bork.constants import ACTION_FIRE, ACTION_UP, PACING_SAFETY, PACING_SPIN_MARGIN
+from bork.events import EVENT_PLAYER_FIRED, GameEvent
+from bork.latency import FramePacer, FrameTiming, LatencyTracker, percentile
+
+
+class FakeClock:
+    """A clock that only moves when told to (or a tick per read, to spin)."""
+
+    def __init__(self, step: float = 0.0) -> None:
+        self.now = 0.0
+        self.step = step
+        self.slept: list[float] = []
+
+    def __call__(self) -> float:
+        self.now += self.step
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+def test_percentile() -> None:
+    assert percentile([], 0.5) == 0.0
+    assert percentile([3.0, 1.0, 2.0], 0.5) == 2.0
+    assert percentile(range(100), 0.99) == 99
+
+
+def test_press_is_timed_to_the_tick_and_the_swap() -> None:
+    clock = FakeClock()
+    tracker = LatencyTracker(clock=clock)
+    tracker.press(ACTION_FIRE)
+    clock.now = 0.010
+    tracker.consumed({ACTION_UP})
+    assert not tracker.to_tick
+    clock.now = 0.012
+    tracker.consumed({ACTION_FIRE, ACTION_UP})
+    clock.now = 0.020
+    tracker.presented()
+    assert list(tracker.to_tick) == [pytest.approx(0.012)]
+    assert list(tracker.to_photon) == [pytest.approx(0.020)]
+    # Held keys are not measured again
+    tracker.consumed({ACTION_FIRE})
+    tracker.presented()
+    assert len(tracker.to_photon) == 1
+
+
+def test_press_released_before_any_tick_is_missed() -> None:
+    tracker = LatencyTracker(clock=FakeClock())
+    tracker.press(ACTION_FIRE)
+    tracker.release(ACTION_FIRE)
+    tracker.consumed({ACTION_FIRE})
+    assert tracker.missed == 1
+    assert not tracker.to_tick
+
+
+def test_frame_timing_follows_keys_ticks_and_swaps() -> None:
+    clock = FakeClock()
+    timing = FrameTiming(
+        FramePacer(clock=clock, sleep=clock.sleep),
+        {32: ACTION_FIRE, 87: ACTION_UP, 38: ACTION_UP},
+        LatencyTracker(clock=clock),
+    )
+    timing.key_pressed(32)
+    timing.key_pressed(87)
+    timing.key_pressed(1)  # unbound
+    # Up is still held through the other key
+    timing.key_released(87, {ACTION_UP})
+    assert set(timing.latency.pending) == {ACTION_FIRE, ACTION_UP}
+    timing.key_released(87, set())
+    clock.now = 0.005
+    timing.ticked({ACTION_FIRE}, [])  # weapon cooling down: no shot yet
+    assert ACTION_FIRE in timing.latency.pending
+    clock.now = 0.010
+    timing.ticked({ACTION_FIRE}, [GameEvent(EVENT_PLAYER_FIRED, 0, 0)])
+    flipped = []
+    timing.swap(lambda: flipped.append(clock.now))
+    assert flipped == [0.010]
+    assert list(timing.latency.to_photon) == [pytest.approx(0.010)]
+    assert timing.latency.missed == 1
+    assert timing.pacer.present_at is not None
+    assert "scheduled" in timing.debug_line()
+
+
+def test_scheduled_pacing_never_waits() -> None:
+    clock = FakeClock()
+    pacer = FramePacer("scheduled", clock=clock, sleep=clock.sleep)
+    polled = []
+    for _ in range(3):
+        assert pacer.begin_frame(0.016, lambda: polled.append(1)) == 0.016
+        clock.now += 0.004
+        pacer.before_swap()
+        pacer.after_swap()
+    assert clock.slept == [] and polled == []
+
+
+def test_late_pacing_samples_just_before_the_present_time() -> None:
+    clock = FakeClock()
+    pacer = FramePacer("late", "sleep", interval=0.016, clock=clock, sleep=clock.sleep)
+    sampled = []
+    for _ in range(3):
+        pacer.begin_frame(0.016, lambda: sampled.append(clock.now))
+        clock.now += 0.004  # work
+        pacer.before_swap()
+        pacer.after_swap()
+    lead = 0.004 + PACING_SAFETY
+    assert sampled[1] == pytest.approx(0.004 + 0.016 - lead)
+    assert sampled[2] - sampled[1] == pytest.approx(0.016)
+
+
+def test_late_pacing_follows_the_vsync_swap() -> None:
+    clock = FakeClock()
+    pacer = FramePacer(
+        "late", "sleep", vsync=True, interval=0.016, clock=clock, sleep=clock.sleep
+    )
+    pacer.begin_frame(0.016)
+    clock.now += 0.004
+    pacer.before_swap()
+    clock.now = 0.016  # the swap blocked until the vblank
+    pacer.after_swap()
+    assert pacer.present_at == pytest.approx(0.032)
+    dt = pacer.begin_frame(0.016)
+    assert clock.now == pytest.approx(0.032 - 0.004 - PACING_SAFETY)
+    assert dt == pytest.approx(clock.now)
+
+
+def test_late_pacing_rebases_when_behind() -> None:
+    clock = FakeClock()
+    pacer = FramePacer("late", interval=0.016, clock=clock, sleep=clock.sleep)
+    pacer.begin_frame(0.016)
+    pacer.before_swap()
+    pacer.after_swap()
+    clock.now = 0.100  # a long hitch
+    pacer.begin_frame(0.016)
+    pacer.before_swap()
+    pacer.after_swap()
+    assert pacer.present_at == pytest.approx(0.116)
+
+
+def test_hybrid_wait_sleeps_then_spins_the_margin() -> None:
+    clock = FakeClock(step=0.0001)
+    pacer = FramePacer("late", "hybrid", clock=clock, sleep=clock.sleep)
+    pacer.wait_until(0.010)
+    assert clock.slept[0] == pytest.approx(0.010 - PACING_SPIN_MARGIN, abs=0.001)
+    assert 0.010 <= clock.now < 0.0102
+    spin = FramePacer("late", "spin", clock=clock, sleep=clock.sleep)
+    spin.wait_until(0.020)
+    assert len(clock.slept) == 1
+
+
+def test_unknown_pacing_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        FramePacer("eager")
+    with pytest.raises(ValueError):
+        FramePacer("late", "yield")
@@ -0,0 +1,144 @@
+"""Tests for the chiptune synthesizer and background streamer."""
+
+import time
+
+import numpy as np
+import pytest
+
+from bork.constants import MUSIC_VOICES
+from bork.music import (
+    MusicStreamer,
+    PatternCache,
+    note_frequency,
+    render_pattern,
+    row_samples,
+    to_pcm16,
+)
+from bork.songs import THEME
+
+RATE = 8000
+
+
+def _song(*patterns: dict[str, str], order: list[str] | None = None) -> dict:
+    names = [f"p{i}" for i in range(len(patterns))]
+    return {
+        "tempo": 120,
+        "rows_per_beat": 4,
+        "patterns": dict(zip(names, patterns)),
+        "order": order or names,
+    }
+
+
+def test_note_frequency() -> None:
+    assert note_frequency("A4") == pytest.approx(440.0)
+    assert note_frequency("A5") == pytest.approx(880.0)
+    assert note_frequency("C4") == pytest.approx(261.63, abs=0.01)
+    assert note_frequency("C#4") == pytest.approx(277.18, abs=0.01)
+
+
+def test_pattern_length_follows_tempo() -> None:
+    pattern = {"pulse1": "A4 . . . - . . ."}
+    song = _song(pattern)
+    samples = render_pattern(pattern, song, RATE)
+    assert row_samples(song, RATE) == 1000  # 120 bpm, 4 rows per beat
+    assert len(samples) == 8 * 1000
+    assert samples.dtype == np.float32
+
+
+def test_hold_sustains_and_rest_silences() -> None:
+    pattern = {"triangle": "A3 . - ."}
+    samples = render_pattern(pattern, _song(pattern), RATE)
+    step = row_samples(_song(pattern), RATE)
+    assert np.abs(samples[: 2 * step - 100]).max() > 0.1
+    assert not samples[2 * step :].any()
+
+
+def test_noise_is_deterministic() -> None:
+    pattern = {"noise": "x . o ."}
+    first = render_pattern(pattern, _song(pattern), RATE)
+    second = render_pattern(pattern, _song(pattern), RATE)
+    assert np.array_equal(first, second)
+    assert first.any()
+
+
+def test_repeated_and_identical_patterns_render_once() -> None:
+    a = {"pulse1": "A4 C5 E5 ."}
+    b = dict(a)  # same content, different name
+    c = {"pulse1": "G4 . . ."}
+    song = _song(a, b, c, order=["p0", "p1", "p0", "p2", "p0"])
+    cache = PatternCache()
+    for name in song["order"]:
+        cache.render(song["patterns"][name], song, RATE)
+    assert cache.misses == 2
+    assert cache.hits == 3
+
+
+def test_cache_evicts_least_recently_used() -> None:
+    patterns = [{"pulse1": f"{note}4 . . ."} for note in "CDE"]
+    song = _song(*patterns)
+    cache = PatternCache(max_entries=2)
+    for pattern in (*patterns, patterns[2]):
+        cache.render(pattern, song, RATE)
+    assert len(cache.entries) == 2
+    assert cache.misses == 3
+    assert cache.hits == 1
+
+
+def test_pcm_is_clipped_16_bit() -> None:
+    pcm = to_pcm16(np.array([2.0, -2.0, 0.0], dtype=np.float32))
+    assert np.frombuffer(pcm, "<i2").tolist() == [32767, -32767, 0]
+
+
+def test_read_pads_with_silence_on_underrun() -> None:
+    streamer = MusicStreamer(THEME, RATE)
+    data = streamer.read(100)
+    assert data == bytes(100)
+    assert streamer.underruns == 1
+
+
+def test_read_spans_chunks_in_order() -> None:
+    pattern = {"pulse1": "A4 . . ."}
+    streamer = MusicStreamer(_song(pattern), RATE, volume=1.0)
+    streamer.fill()
+    streamer.fill()
+    expected = to_pcm16(render_pattern(pattern, streamer.song, RATE)) * 2
+    out = b"".join(streamer.read(777) for _ in range(len(expected) // 777 + 1))
+    assert out[: len(expected)] == expected
+    assert streamer.underruns == 1  # only the final, short read
+    assert streamer.buffered_seconds == 0
+
+
+def test_thread_fills_lookahead_and_stops() -> None:
+    streamer = MusicStreamer(THEME, RATE, lookahead=2.0)
+    streamer.start()
+    deadline = time.monotonic() + 5.0
+    while streamer.buffered_seconds < 2.0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    streamer.stop()
+    assert streamer.buffered_seconds >= 2.0
+    # Stays bounded: one pattern past the look-ahead at most
+    pattern_seconds = 16 * row_samples(THEME, RATE) / RATE
+    assert streamer.buffered_seconds < 2.0 + pattern_seconds + 1e-9
+
+
+def test_reading_wakes_the_thread() -> None:
+    streamer = MusicStreamer(THEME, RATE, lookahead=1.0)
+    streamer.start()
+    try:
+        time.sleep(0.2)
+        rendered = streamer.cache.hits + streamer.cache.misses
+        streamer.read(int(streamer.buffered_seconds * RATE) * 2)
+        deadline = time.monotonic() + 5.0
+        while streamer.buffered_seconds < 1.0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert streamer.cache.hits + streamer.cache.misses > rendered
+    finally:
+        streamer.stop()
+
+
+def test_theme_patterns_are_well_formed() -> None:
+    for name, pattern in THEME["patterns"].items():
+        assert set(pattern) <= set(MUSIC_VOICES), name
+        assert {len(row.split()) for row in pattern.values()} == {16}, name
+        render_pattern(pattern, THEME, RATE)
+    assert set(THEME["order"]) <= set(THEME["patterns"])
@@ -0,0 +1,98 @@
+"""Tests for the netplay packet format and transports."""
+
+import time
+
+from bork.net import (
+    Hello,
+    InputPacket,
+    LossyTransport,
+    UdpTransport,
+    decode_packet,
+    encode_packet,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class Recorder:
+    def __init__(self) -> None:
+        self.sent: list[bytes] = []
+
+    def send(self, data: bytes) -> None:
+        self.sent.append(data)
+
+    def receive(self) -> list[bytes]:
+        return []
+
+
+def _udp_pair() -> tuple[UdpTransport, UdpTransport]:
+    a = UdpTransport(0, ("127.0.0.1", 0))
+    b = UdpTransport(0, ("127.0.0.1", a.port))
+    a.peer = ("127.0.0.1", b.port)
+    return a, b
+
+
+def test_hello_round_trips() -> None:
+    hello = decode_packet(encode_packet(Hello(1, 2**40 + 5, 3)))
+    assert isinstance(hello, Hello)
+    assert (hello.player, hello.seed, hello.input_delay) == (1, 2**40 + 5, 3)
+
+
+def test_input_packet_round_trips() -> None:
+    packet = decode_packet(
+        encode_packet(InputPacket(12, 30, 0xDEADBEEF, 9, b"\x01\x10"))
+    )
+    assert isinstance(packet, InputPacket)
+    assert (packet.ack, packet.checksum_frame, packet.checksum) == (12, 30, 0xDEADBEEF)
+    assert (packet.start, packet.inputs) == (9, b"\x01\x10")
+
+
+def test_malformed_packets_are_ignored() -> None:
+    data = encode_packet(InputPacket(0, 0, 0, 0, b"\x01\x02\x03"))
+    assert decode_packet(data[:-1]) is None
+    assert decode_packet(b"XXXX" + data[4:]) is None
+    assert decode_packet(b"BK") is None
+
+
+def test_lossy_transport_holds_packets_for_the_latency() -> None:
+    clock = FakeClock()
+    inner = Recorder()
+    lossy = LossyTransport(inner, latency=0.05, clock=clock)
+    lossy.send(b"a")
+    assert inner.sent == []
+    clock.now = 0.06
+    lossy.receive()
+    assert inner.sent == [b"a"]
+
+
+def test_lossy_transport_drops_reproducibly() -> None:
+    runs = []
+    for _ in range(2):
+        inner = Recorder()
+        lossy = LossyTransport(inner, loss=0.5, seed=4, clock=FakeClock())
+        for i in range(100):
+            lossy.send(bytes([i]))
+        runs.append(inner.sent)
+        assert lossy.dropped == 100 - len(inner.sent)
+    assert runs[0] == runs[1]
+    assert 25 < len(runs[0]) < 75
+
+
+def test_udp_transport_delivers_on_loopback() -> None:
+    a, b = _udp_pair()
+    try:
+        a.send(b"ping")
+        deadline = time.monotonic() + 2
+        received: list[bytes] = []
+        while not received and time.monotonic() < deadline:
+            received = b.receive()
+        assert received == [b"ping"]
+    finally:
+        a.close()
+        b.close()
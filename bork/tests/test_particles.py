@@ -1,5 +1,11 @@
 """Tests for the particle system."""
 
+from bork.constants import (
+    PARTICLE_PRIORITY_BUDGET,
+    PARTICLE_PRIORITY_HIGH,
+    PARTICLE_PRIORITY_LOW,
+    PARTICLE_PRIORITY_NORMAL,
+)
 from bork.particles import Particle, ParticleSystem
 
 DT = 1 / 60
@@ -80,14 +86,83 @@ def test_particle_system_removes_dead() -> None:
     p1 = _make_particle(lifetime=0.01)
     p2 = _make_particle(lifetime=10.0)
     ps.add([p1, p2])
-    assert len(ps.particles) == 2
+    assert ps.count == 2
     # Tick enough to kill p1
     ps.update(0.1)
-    assert len(ps.particles) == 1
+    assert ps.count == 1
 
 
 def test_particle_system_respects_pool_limit() -> None:
     ps = ParticleSystem(max_particles=5)
     particles = [_make_particle() for _ in range(10)]
     ps.add(particles)
-    assert len(ps.particles) == 5
+    assert ps.count == 5
+
+
+def test_particle_default_priority_is_normal() -> None:
+    p = _make_particle()
+    assert p.priority == PARTICLE_PRIORITY_NORMAL
+
+
+def test_low_priority_class_capped_at_budget_share() -> None:
+    ps = ParticleSystem(max_particles=100)
+    ps.add([_make_particle(priority=PARTICLE_PRIORITY_LOW) for _ in range(40)])
+    ps.add([_make_particle(priority=PARTICLE_PRIORITY_LOW) for _ in range(40)])
+    low_limit = int(100 * PARTICLE_PRIORITY_BUDGET[PARTICLE_PRIORITY_LOW])
+    assert len(ps.pools[PARTICLE_PRIORITY_LOW]) <= low_limit
+    assert ps.dropped[PARTICLE_PRIORITY_LOW] + ps.thinned[PARTICLE_PRIORITY_LOW] > 0
+
+
+def test_high_priority_evicts_lower_classes_when_full() -> None:
+    ps = ParticleSystem(max_particles=20)
+    ps.add([_make_particle() for _ in range(20)])
+    ps.add([_make_particle(priority=PARTICLE_PRIORITY_HIGH) for _ in range(8)])
+    assert len(ps.pools[PARTICLE_PRIORITY_HIGH]) == 8
+    assert ps.count == 20
+    assert ps.evicted[PARTICLE_PRIORITY_NORMAL] == 8
+
+
+def test_eviction_takes_oldest_and_particles_iterate_low_first() -> None:
+    ps = ParticleSystem(max_particles=4)
+    low = [_make_particle(priority=PARTICLE_PRIORITY_LOW) for _ in range(2)]
+    ps.add(low)
+    normal = [_make_particle() for _ in range(3)]
+    ps.add(normal)
+    assert list(ps.pools[PARTICLE_PRIORITY_LOW]) == low[1:]
+    assert list(ps.particles) == [low[1], *normal]
+    high = _make_particle(priority=PARTICLE_PRIORITY_HIGH)
+    ps.add([high])
+    assert ps.evicted[PARTICLE_PRIORITY_LOW] == 2
+    assert list(ps.particles) == [*normal, high]
+
+
+def test_low_priority_never_evicts_high() -> None:
+    ps = ParticleSystem(max_particles=10)
+    ps.add([_make_particle(priority=PARTICLE_PRIORITY_HIGH) for _ in range(10)])
+    ps.add([_make_particle(priority=PARTICLE_PRIORITY_LOW) for _ in range(5)])
+    assert len(ps.pools[PARTICLE_PRIORITY_HIGH]) == 10
+    assert len(ps.pools[PARTICLE_PRIORITY_LOW]) == 0
+
+
+def test_low_priority_burst_thinned_near_capacity() -> None:
+    ps = ParticleSystem(max_particles=100)
+    ps.add([_make_particle() for _ in range(80)])
+    ps.add([_make_particle(priority=PARTICLE_PRIORITY_LOW) for _ in range(10)])
+    added = len(ps.pools[PARTICLE_PRIORITY_LOW])
+    assert 0 < added < 10
+    assert ps.thinned[PARTICLE_PRIORITY_LOW] == 10 - added
+
+
+def test_low_priority_burst_not_thinned_when_pool_empty() -> None:
+    ps = ParticleSystem(max_particles=100)
+    ps.add([_make_particle(priority=PARTICLE_PRIORITY_LOW) for _ in range(10)])
+    assert len(ps.pools[PARTICLE_PRIORITY_LOW]) == 10
+    assert ps.thinned[PARTICLE_PRIORITY_LOW] == 0
+
+
+def test_reset_counters() -> None:
+    ps = ParticleSystem(max_particles=5)
+    ps.add([_make_particle() for _ in range(10)])
+    assert ps.dropped[PARTICLE_PRIORITY_NORMAL] == 5
+    ps.reset_counters()
+    assert ps.dropped[PARTICLE_PRIORITY_NORMAL] == 0
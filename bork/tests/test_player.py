@@ -2,9 +2,10 @@
 
 import math
 
-import arcade
-
 from bork.constants import (
+    ACTION_LEFT,
+    ACTION_RIGHT,
+    ACTION_UP,
     PLAYER_MAX_SPEED,
     PLAYER_SHIP_SIZE,
     PLAYER_START_X,
@@ -30,32 +31,25 @@ def test_player_initial_position() -> None:
 
 def test_player_accelerates_right() -> None:
     p = Player(100, 100)
-    keys = {arcade.key.RIGHT}
+    keys = {ACTION_RIGHT}
     p.update(DT, keys)
     assert p.vx > 0
 
 
 def test_player_accelerates_left() -> None:
     p = Player(100, 100)
-    keys = {arcade.key.LEFT}
+    keys = {ACTION_LEFT}
     p.update(DT, keys)
     assert p.vx < 0
 
 
 def test_player_accelerates_up() -> None:
     p = Player(100, 100)
-    keys = {arcade.key.UP}
+    keys = {ACTION_UP}
     p.update(DT, keys)
     assert p.vy > 0
 
 
-def test_player_accelerates_with_wasd() -> None:
-    p = Player(100, 100)
-    keys = {arcade.key.D}
-    p.update(DT, keys)
-    assert p.vx > 0
-
-
 def test_player_decelerates_without_input() -> None:
     p = Player(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2)
     p.vx = 200.0
@@ -109,7 +103,7 @@ def test_player_shoot_cooldown() -> None:
 
 def test_player_diagonal_movement() -> None:
     p = Player(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2)
-    keys = {arcade.key.RIGHT, arcade.key.UP}
+    keys = {ACTION_RIGHT, ACTION_UP}
     p.update(DT, keys)
     assert p.vx > 0
     assert p.vy > 0
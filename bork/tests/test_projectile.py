@@ -27,3 +27,29 @@ def test_projectile_off_screen_detection() -> None:
 def test_projectile_not_off_screen_when_visible() -> None:
     p = Projectile(SCREEN_WIDTH / 2, 200)
     assert not p.is_off_screen()
+
+
+def test_projectile_follows_its_velocity() -> None:
+    p = Projectile(100, 200, 300, -120)
+    p.update(0.5)
+    assert p.x == 250
+    assert p.y == 140
+
+
+def test_wave_projectile_wobbles_around_its_path() -> None:
+    p = Projectile(100, 200, wave_amplitude=20, wave_frequency=1)
+    p.update(0.25)
+    assert p.y == 220
+    assert p.base_y == 200
+
+
+def test_piercing_projectile_counts_down_hits() -> None:
+    p = Projectile(100, 200, pierce=1)
+    assert not p.register_hit(7)
+    assert p.hits == {7}
+    assert p.register_hit(8)
+
+
+def test_projectile_off_screen_below() -> None:
+    p = Projectile(SCREEN_WIDTH / 2, -PROJECTILE_LENGTH - 1)
+    assert p.is_off_screen()
@@ -0,0 +1,82 @@
+"""Tests for the adaptive quality governor."""
+
+from bork.constants import (
+    QUALITY_CHANGE_COOLDOWN,
+    QUALITY_TIERS,
+    QUALITY_UPGRADE_HOLD,
+)
+from bork.quality import QualityGovernor
+
+DT = 1 / 60
+BUDGET = 1 / 60
+
+
+def _feed(gov: QualityGovernor, frame_time: float, seconds: float) -> int:
+    """Feed constant frame times for a duration, returning tier changes."""
+    changes = 0
+    for _ in range(int(seconds * 60)):
+        if gov.record(frame_time, DT):
+            changes += 1
+    return changes
+
+
+def test_governor_starts_at_best_tier() -> None:
+    gov = QualityGovernor()
+    assert gov.tier_index == 0
+    assert gov.tier is QUALITY_TIERS[0]
+
+
+def test_no_change_before_window_fills() -> None:
+    gov = QualityGovernor(budget=BUDGET, window=30)
+    for _ in range(29):
+        assert gov.record(BUDGET * 3, DT) is False
+    assert gov.tier_index == 0
+
+
+def test_steps_down_when_over_budget() -> None:
+    gov = QualityGovernor(budget=BUDGET, window=30)
+    _feed(gov, BUDGET * 2, 1.0)
+    assert gov.tier_index == 1
+
+
+def test_cooldown_limits_step_rate() -> None:
+    gov = QualityGovernor(budget=BUDGET, window=30)
+    changes = _feed(gov, BUDGET * 2, QUALITY_CHANGE_COOLDOWN * 0.9)
+    assert changes == 1
+
+
+def test_steps_down_to_lowest_and_stops() -> None:
+    gov = QualityGovernor(budget=BUDGET, window=10)
+    _feed(gov, BUDGET * 2, 30.0)
+    assert gov.tier_index == len(QUALITY_TIERS) - 1
+
+
+def test_steps_up_after_sustained_headroom() -> None:
+    gov = QualityGovernor(budget=BUDGET, window=10)
+    gov._set_tier(1)
+    _feed(gov, BUDGET * 0.1, QUALITY_CHANGE_COOLDOWN + QUALITY_UPGRADE_HOLD + 1.0)
+    assert gov.tier_index == 0
+
+
+def test_no_step_up_in_hysteresis_band() -> None:
+    gov = QualityGovernor(budget=BUDGET, window=10)
+    gov._set_tier(1)
+    # Between the upgrade and downgrade thresholds: hold the current tier
+    _feed(gov, BUDGET * 0.7, 30.0)
+    assert gov.tier_index == 1
+
+
+def test_brief_headroom_does_not_step_up() -> None:
+    gov = QualityGovernor(budget=BUDGET, window=10)
+    gov._set_tier(1)
+    _feed(gov, BUDGET * 0.1, QUALITY_CHANGE_COOLDOWN + QUALITY_UPGRADE_HOLD * 0.5)
+    _feed(gov, BUDGET * 0.7, 0.5)
+    _feed(gov, BUDGET * 0.1, QUALITY_UPGRADE_HOLD * 0.5)
+    assert gov.tier_index == 1
+
+
+def test_disabled_governor_pins_tier() -> None:
+    gov = QualityGovernor(budget=BUDGET, window=10)
+    gov.enabled = False
+    _feed(gov, BUDGET * 3, 5.0)
+    assert gov.tier_index == 0
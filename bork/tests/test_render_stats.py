@@ -0,0 +1,148 @@
+"""Tests for the per-section render counters."""
+
+import arcade
+import pytest
+from arcade.gl import Framebuffer, Geometry
+
+from bork.render_stats import RenderStats
+
+BLEND = 0x0BE2
+
+
+class FakeContext:
+    """Records enable/disable calls instead of touching GL."""
+
+    BLEND = BLEND
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, tuple[int, ...]]] = []
+
+    def enable(self, *flags: int) -> None:
+        self.calls.append(("enable", flags))
+
+    def disable(self, *flags: int) -> None:
+        self.calls.append(("disable", flags))
+
+
+class FakeWindow:
+    """Just the parts of a window RenderStats wraps."""
+
+    def __init__(self) -> None:
+        self.ctx = FakeContext()
+        self._projection = None
+
+    @property
+    def projection(self):
+        return self._projection
+
+    @projection.setter
+    def projection(self, matrix) -> None:
+        self._projection = matrix
+
+
+class FakeGeometry:
+    num_vertices = 6
+
+
+class FakeVertexList:
+    count = 16  # four glyph quads
+
+
+class FakeLabel:
+    _vertex_lists = (FakeVertexList(),)
+
+
+class FakeText:
+    text = "BORK"
+    _label = FakeLabel()
+
+
+@pytest.fixture
+def drawn(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Stand-ins for the GL entry points, logging what reached them."""
+    log: list[str] = []
+    monkeypatch.setattr(Geometry, "render", lambda *a, **kw: log.append("render"))
+    monkeypatch.setattr(arcade.Text, "draw", lambda text: log.append("text"))
+    monkeypatch.setattr(Framebuffer, "use", lambda *a, **kw: log.append("fbo"))
+    return log
+
+
+def _draw_some(window: FakeWindow, vertices: int | None = None) -> None:
+    """One geometry render, one text label, a blend toggle and a bind."""
+    Geometry.render(FakeGeometry(), None, vertices=vertices)
+    arcade.Text.draw(FakeText())
+    window.ctx.enable(window.ctx.BLEND)
+    window.ctx.disable(window.ctx.BLEND)
+    window.ctx.enable(1)  # not blending
+    Framebuffer.use(object())
+    window.projection = "matrix"
+
+
+def test_install_and_uninstall_restore_every_patch(drawn: list[str]) -> None:
+    window = FakeWindow()
+    originals = (
+        Geometry.render,
+        arcade.Text.draw,
+        Framebuffer.use,
+        vars(FakeWindow)["projection"],
+    )
+    stats = RenderStats()
+    stats.install(window)
+    stats.install(window)  # a second install is ignored
+    assert Geometry.render is not originals[0]
+    assert vars(window.ctx).keys() >= {"enable", "disable"}
+    assert vars(FakeWindow)["projection"] is not originals[3]
+    stats.uninstall()
+    assert not stats.installed
+    assert (
+        Geometry.render,
+        arcade.Text.draw,
+        Framebuffer.use,
+        vars(FakeWindow)["projection"],
+    ) == originals
+    assert "enable" not in vars(window.ctx) and "disable" not in vars(window.ctx)
+
+
+def test_draws_are_counted_per_section(drawn: list[str]) -> None:
+    window = FakeWindow()
+    stats = RenderStats()
+    stats.install(window)
+    stats.begin_frame()
+    stats.section("world")
+    _draw_some(window)
+    stats.section("hud")
+    _draw_some(window, vertices=3)
+    stats.section("world")  # back to a section already counted this frame
+    Geometry.render(FakeGeometry(), None)
+    stats.end_frame()
+    stats.uninstall()
+
+    assert list(stats.last_frame) == ["other", "world", "hud"]
+    world = stats.last_frame["world"]
+    assert (world.draw_calls, world.vertices) == (3, 6 + 16 + 6)
+    assert (world.blend_changes, world.framebuffer_binds) == (2, 1)
+    assert world.projection_changes == 1
+    hud = stats.last_frame["hud"]
+    assert (hud.draw_calls, hud.vertices) == (2, 3 + 16)
+    total = stats.totals()
+    assert (total.draw_calls, total.vertices) == (5, 47)
+    assert (total.blend_changes, total.framebuffer_binds) == (4, 2)
+    assert total.projection_changes == 2
+    assert total.cpu_time >= 0.0 and total.gpu_time == 0.0
+    # The wrapped calls still reach the originals
+    assert drawn.count("render") == 3 and drawn.count("fbo") == 2
+    assert window.ctx.calls.count(("enable", (BLEND,))) == 2
+    assert window.projection == "matrix"
+
+
+def test_uninstalled_stats_count_nothing(drawn: list[str]) -> None:
+    window = FakeWindow()
+    stats = RenderStats()
+    stats.begin_frame()
+    stats.section("world")
+    _draw_some(window)
+    stats.end_frame()
+    assert stats.current is None
+    assert stats.last_frame == {} and stats.sections == {}
+    assert stats.totals().draw_calls == 0
+    assert drawn == ["render", "text", "fbo"]
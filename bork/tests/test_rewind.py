@@ -0,0 +1,196 @@
+"""Tests for the rewind history buffer."""
+
+import numpy as np
+
+from bork.boss import HIT_TREE, Boss
+from bork.constants import ACTION_DOWN, ACTION_FIRE, ACTION_UP
+from bork.enemy import Enemy
+from bork.projectile import Projectile
+from bork.rewind import RewindBuffer
+from bork.simulation import Simulation
+from bork.snapshot import take_snapshot
+from bork.spawn_queue import offscreen_formation
+
+DT = 1 / 60
+
+
+def _keys(tick: int) -> set[int]:
+    """Scripted input: fire constantly, weave up and down."""
+    direction = ACTION_UP if (tick // 45) % 2 else ACTION_DOWN
+    return {ACTION_FIRE, direction}
+
+
+def _play(
+    sim: Simulation, buffer: RewindBuffer, ticks: int, history: list[bytes]
+) -> None:
+    for _ in range(ticks):
+        sim.update(DT, _keys(sim.tick))
+        buffer.record(sim, DT)
+        history.append(take_snapshot(sim))
+
+
+def test_rewind_restores_exact_earlier_state() -> None:
+    for ticks in (0, 1, 29, 30, 31, 250):
+        sim = Simulation(seed=3)
+        buffer = RewindBuffer(keyframe_interval=30)
+        history: list[bytes] = []
+        _play(sim, buffer, 400, history)
+        assert buffer.rewind(sim, ticks) == ticks
+        assert take_snapshot(sim) == history[-1 - ticks]
+
+
+def test_rewind_discards_newer_history_and_keeps_recording() -> None:
+    sim = Simulation(seed=3)
+    buffer = RewindBuffer(keyframe_interval=30)
+    history: list[bytes] = []
+    _play(sim, buffer, 300, history)
+    assert buffer.rewind(sim, 100) == 100
+    assert buffer.frames == 200
+    assert take_snapshot(sim) == history[199]
+
+    # Replaying the same inputs after a rewind reproduces the same states
+    replay: list[bytes] = []
+    _play(sim, buffer, 100, replay)
+    assert replay == history[200:]
+    assert buffer.rewind(sim, 50) == 50
+    assert take_snapshot(sim) == history[249]
+
+
+def test_rewind_is_limited_to_stored_history() -> None:
+    sim = Simulation(seed=3)
+    buffer = RewindBuffer()
+    history: list[bytes] = []
+    _play(sim, buffer, 20, history)
+    assert buffer.rewind(sim, 1000) == 19
+    assert take_snapshot(sim) == history[0]
+
+
+def test_rewind_empty_buffer_does_nothing() -> None:
+    sim = Simulation(seed=3)
+    assert RewindBuffer().rewind(sim, 10) == 0
+
+
+def test_deltas_are_much_smaller_than_keyframes() -> None:
+    sim = Simulation(seed=3)
+    for i in range(50):
+        sim.spawn(Enemy(900 - i, 100 + i * 5, "sine", 100 + i * 5))
+    buffer = RewindBuffer()
+    buffer.record(sim, DT)
+    sim.update(DT, set())
+    buffer.record(sim, DT)
+    segment = buffer.segments[0]
+    assert len(segment.deltas[0]) * 10 < len(segment.keyframe)
+
+
+def test_dead_enemy_recorded_as_swap_remove() -> None:
+    sim = Simulation(seed=3)
+    handles = [sim.spawn(Enemy(800, 100 + i * 40, "straight", 100)) for i in range(5)]
+    buffer = RewindBuffer()
+    buffer.record(sim, DT)
+    sim.despawn(handles[2])
+    for enemy in sim.enemies:
+        enemy.update(DT)
+    expected = [(e.x, e.y) for e in sim.enemies]
+    buffer.record(sim, DT)
+    sim.enemies[0].x = 0.0  # corrupt live state; rewind must rebuild it
+    buffer.rewind(sim, 0)
+    assert [(e.x, e.y) for e in sim.enemies] == expected
+    assert len(buffer.segments[0].deltas[0]) < 256
+
+
+def test_memory_ceiling_evicts_oldest_keyframes() -> None:
+    sim = Simulation(seed=3)
+    buffer = RewindBuffer(max_bytes=40_000, keyframe_interval=30)
+    history: list[bytes] = []
+    _play(sim, buffer, 600, history)
+    assert buffer.size <= 40_000
+    assert buffer.frames < 600
+    oldest = buffer.frames - 1
+    assert buffer.rewind(sim, oldest) == oldest
+    assert take_snapshot(sim) == history[-1 - oldest]
+
+
+def test_clear_drops_history() -> None:
+    sim = Simulation(seed=3)
+    buffer = RewindBuffer()
+    _play(sim, buffer, 10, [])
+    buffer.clear()
+    assert buffer.frames == 0
+    assert buffer.size == 0
+
+
+def test_rewind_restores_bullets_removed_by_hits() -> None:
+    sim = Simulation(seed=3)
+    buffer = RewindBuffer()
+    for i in range(8):
+        sim.bullets.spawn(500 + i * 10, 100, -50, 0)
+    buffer.record(sim, DT)
+    history = [take_snapshot(sim)]
+    sim.update(DT, set())
+    sim.bullets.remove(np.array([0, 3, 4]))
+    buffer.record(sim, DT)
+    history.append(take_snapshot(sim))
+    sim.bullets.spawn(300, 300, 10, 10)
+    sim.update(DT, set())
+    buffer.record(sim, DT)
+    assert buffer.rewind(sim, 1) == 1
+    assert take_snapshot(sim) == history[1]
+    assert buffer.rewind(sim, 1) == 1
+    assert take_snapshot(sim) == history[0]
+
+
+def test_rewind_restores_pierce_spent_by_survivors() -> None:
+    sim = Simulation(seed=3)
+    buffer = RewindBuffer()
+    sim.player.weapon = "piercer"
+    sim._try_shoot(sim.player)
+    buffer.record(sim, DT)
+    history = [take_snapshot(sim)]
+    proj = sim.projectiles[0]
+    handle = sim.spawn(Enemy(proj.x + 20, proj.y, "straight", proj.y))
+    sim.update(DT, set())
+    assert proj.hits == {handle}
+    buffer.record(sim, DT)
+    history.append(take_snapshot(sim))
+    sim.update(DT, set())
+    buffer.record(sim, DT)
+    assert buffer.rewind(sim, 1) == 1
+    assert take_snapshot(sim) == history[1]
+    assert buffer.rewind(sim, 1) == 1
+    assert take_snapshot(sim) == history[0]
+
+
+def test_rewind_restores_boss_part_damage() -> None:
+    sim = Simulation(seed=3)
+    buffer = RewindBuffer()
+    sim.wave_spawner.timer = 1000.0  # no wave spawns
+    boss = Boss(700, 300)
+    boss.fire_timer = 1000.0
+    sim.spawn(boss)
+    buffer.record(sim, DT)
+    history = [take_snapshot(sim)]
+    x, y = boss.part_position(HIT_TREE.core)
+    sim.spawn(Projectile(x - 5, y))
+    sim.update(DT, set())
+    assert sim.bosses[0].hp[HIT_TREE.core] < HIT_TREE.parts[HIT_TREE.core]["hp"]
+    buffer.record(sim, DT)
+    history.append(take_snapshot(sim))
+    sim.update(DT, set())
+    buffer.record(sim, DT)
+    assert buffer.rewind(sim, 1) == 1
+    assert take_snapshot(sim) == history[1]
+    assert buffer.rewind(sim, 1) == 1
+    assert take_snapshot(sim) == history[0]
+
+
+def test_rewind_restores_a_burst_still_in_the_queue() -> None:
+    sim = Simulation(seed=4)
+    buffer = RewindBuffer()
+    history: list[bytes] = []
+    _play(sim, buffer, 10, history)
+    sim.spawn_queue.extend(offscreen_formation(20, 270))
+    _play(sim, buffer, 6, history)
+    assert not sim.spawn_queue.pending
+    assert buffer.rewind(sim, 4) == 4
+    assert take_snapshot(sim) == history[-5]
+    assert len(sim.spawn_queue.pending) > 0
@@ -0,0 +1,235 @@
+"""Tests for the rollback netplay session."""
+
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from bork.autopilot import autopilot_actions
+from bork.constants import ACTION_DOWN, ACTION_FIRE, ACTION_LEFT, ACTION_UP
+from bork.net import Hello, LossyTransport, UdpTransport, encode_packet
+from bork.netplay import SessionStepper
+from bork.rollback import RollbackSession, decode_actions, encode_actions
+from bork.simulation import Simulation
+from bork.snapshot import take_snapshot
+
+DT = 1 / 60
+
+
+class Link:
+    """One end of an in-memory link that drops and delays by ticks."""
+
+    def __init__(self, rng: random.Random, loss: float, max_delay: int) -> None:
+        self.rng = rng
+        self.loss = loss
+        self.max_delay = max_delay
+        self.tick = 0
+        self.peer: Link | None = None
+        self.inbox: list[tuple[int, bytes]] = []
+
+    def send(self, data: bytes) -> None:
+        if self.rng.random() >= self.loss:
+            due = self.tick + self.rng.randint(0, self.max_delay)
+            self.peer.inbox.append((due, data))
+
+    def receive(self) -> list[bytes]:
+        ready = [data for due, data in self.inbox if due <= self.tick]
+        self.inbox = [(due, data) for due, data in self.inbox if due > self.tick]
+        return ready
+
+
+def _sessions(
+    a: object, b: object, seed: int = 5
+) -> tuple[RollbackSession, RollbackSession]:
+    return (
+        RollbackSession(Simulation(seed=seed, players=2), 0, a, seed),
+        RollbackSession(Simulation(seed=seed, players=2), 1, b, seed),
+    )
+
+
+def _play(
+    sessions: tuple[RollbackSession, ...],
+    frames: int,
+    rng: random.Random,
+    before_tick: object = None,
+) -> None:
+    """Step both peers with jittery autopilot input until both settle."""
+    for _ in range(100_000):
+        if all(s.frame >= frames and s.settled(frames) for s in sessions):
+            return
+        if before_tick is not None:
+            before_tick()
+        for session in sessions:
+            if session.frame < frames:
+                actions = autopilot_actions(session.sim, session.local)
+                if rng.random() < 0.3:
+                    actions = {ACTION_FIRE, ACTION_UP} if rng.random() < 0.5 else set()
+                session.advance(actions)
+            else:
+                session.idle()
+    raise AssertionError("sessions never settled")
+
+
+def _linked(loss: float, max_delay: int) -> tuple[Link, Link, random.Random]:
+    rng = random.Random(1)
+    a, b = Link(rng, loss, max_delay), Link(rng, loss, max_delay)
+    a.peer, b.peer = b, a
+    return a, b, rng
+
+
+def test_actions_round_trip_through_bits() -> None:
+    actions = {ACTION_UP, ACTION_LEFT, ACTION_FIRE}
+    assert decode_actions(encode_actions(actions)) == actions
+    assert encode_actions(set()) == 0
+    assert encode_actions({ACTION_UP}) != encode_actions({ACTION_DOWN})
+
+
+def test_session_needs_two_players() -> None:
+    with pytest.raises(ValueError):
+        RollbackSession(Simulation(seed=1), 0, Link(random.Random(), 0, 0), 1)
+
+
+def test_rollback_matches_a_run_with_the_true_inputs() -> None:
+    a, b, rng = _linked(loss=0.2, max_delay=6)
+    first, second = _sessions(a, b)
+
+    def tick() -> None:
+        a.tick += 1
+        b.tick += 1
+
+    _play((first, second), 600, rng, tick)
+    assert first.stats.rollbacks > 0
+    assert first.inputs[0][:600] == second.inputs[0][:600]
+    assert first.inputs[1][:600] == second.inputs[1][:600]
+    reference = Simulation(seed=5, players=2)
+    for frame in range(600):
+        reference.update_players(
+            DT, [decode_actions(first.inputs[p][frame]) for p in (0, 1)]
+        )
+    assert take_snapshot(first.sim) == take_snapshot(reference)
+    assert take_snapshot(second.sim) == take_snapshot(reference)
+    assert first.desync_frame is None and second.desync_frame is None
+    assert first.stats.checks > 0
+    # Every guess is settled once the real input arrives, right or wrong
+    assert not first.predicted and not second.predicted
+
+
+def test_session_stalls_when_the_peer_goes_quiet() -> None:
+    a, _, _ = _linked(loss=1.0, max_delay=0)
+    session = RollbackSession(Simulation(seed=1, players=2), 0, a, 1)
+    steps = [session.advance(set()) for _ in range(20)]
+    assert steps.count(True) == session.input_delay + session.max_rollback
+    assert session.stats.stalls == 20 - steps.count(True)
+
+
+def test_stepper_runs_whole_ticks_of_frame_time() -> None:
+    a, _, _ = _linked(loss=1.0, max_delay=0)
+    session = RollbackSession(Simulation(seed=1, players=2), 0, a, 1)
+    stepper = SessionStepper(session)
+    assert len(list(stepper.advance(2.5 * session.dt, set()))) == 2
+    assert stepper.pending == pytest.approx(0.5 * session.dt)
+    # A long frame owes at most max_rollback ticks; stalled ones stay owed
+    ticks = len(list(stepper.advance(1.0, set())))
+    assert session.frame == session.input_delay + session.max_rollback
+    assert ticks == session.frame - 2
+    assert stepper.pending <= session.max_rollback * session.dt
+
+
+def test_perturbed_simulation_is_reported_as_a_desync() -> None:
+    a, b, rng = _linked(loss=0.0, max_delay=2)
+    first, second = _sessions(a, b)
+
+    def tick() -> None:
+        a.tick += 1
+        b.tick += 1
+        if second.frame == 40:
+            second.sim.scoring.score += 1
+
+    _play((first, second), 120, rng, tick)
+    assert first.desync_frame is not None
+    assert second.desync_frame is not None
+
+
+def test_hello_from_the_same_player_is_refused() -> None:
+    a, b, _ = _linked(loss=0.0, max_delay=0)
+    session = RollbackSession(Simulation(seed=1, players=2), 0, a, 1)
+    b.send(encode_packet(Hello(0, 1, session.input_delay)))
+    with pytest.raises(ValueError):
+        session.idle()
+
+
+def test_sessions_stay_in_sync_over_a_lossy_loopback() -> None:
+    sockets = [UdpTransport(0, ("127.0.0.1", 0)) for _ in range(2)]
+    sockets[0].peer = ("127.0.0.1", sockets[1].port)
+    sockets[1].peer = ("127.0.0.1", sockets[0].port)
+    shims = [
+        LossyTransport(t, loss=0.15, latency=0.02, jitter=0.01, seed=i)
+        for i, t in enumerate(sockets)
+    ]
+    try:
+        first, second = _sessions(*shims)
+
+        # A shim only delivers held packets while its owner polls, so the
+        # second peer handshakes on a thread and keeps polling after it
+        def handshake() -> None:
+            second.connect(timeout=5)
+            while not first.connected:
+                second.idle()
+                time.sleep(0.001)
+
+        handshake = threading.Thread(target=handshake)
+        handshake.start()
+        first.connect(timeout=5)
+        handshake.join()
+        _play((first, second), 300, random.Random(2), lambda: time.sleep(0.001))
+        assert first.checksum() == second.checksum()
+        assert first.desync_frame is None and second.desync_frame is None
+    finally:
+        for shim in shims:
+            shim.close()
+
+
+def _free_base_port() -> int:
+    """A port p with p and p + 1 both free on loopback."""
+    for _ in range(50):
+        probe = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        probe.bind(("127.0.0.1", 0))
+        base = probe.getsockname()[1]
+        probe.close()
+        if base >= 65535:
+            continue
+        try:
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+                s.bind(("127.0.0.1", base))
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+                s.bind(("127.0.0.1", base + 1))
+        except OSError:
+            continue
+        return base
+    raise RuntimeError("no free port pair")
+
+
+def test_two_processes_agree_over_loopback() -> None:
+    root = Path(__file__).resolve().parents[2]
+    base = _free_base_port()
+    common = ["--headless", "--unpaced", "--frames", "240", "--port", str(base)]
+    common += ["--loss", "0.1", "--latency", "0.02", "--seed", "3"]
+    peers = [
+        subprocess.Popen(
+            [sys.executable, "-m", "bork.netplay", "--player", str(p), *common],
+            cwd=root,
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        for p in (1, 2)
+    ]
+    outputs = [peer.communicate(timeout=60)[0] for peer in peers]
+    assert [peer.returncode for peer in peers] == [0, 0]
+    finals = [out.split()[:4] for out in outputs]
+    assert finals[0] == finals[1]
+    assert finals[0][:2] == ["frame", "240"]
@@ -0,0 +1,159 @@
+"""Tests for the high-score log, index and writer thread."""
+
+from pathlib import Path
+
+from bork.scores import (
+    HighScores,
+    ScoreIndex,
+    ScoreRecord,
+    decode_records,
+    encode_record,
+)
+
+
+def _record(name: str, score: int) -> ScoreRecord:
+    return ScoreRecord(name, score, 1_700_000_000.0, 3600)
+
+
+def _submit(directory: Path, *records: ScoreRecord, top_n: int = 3) -> HighScores:
+    scores = HighScores(directory, top_n)
+    scores.load()
+    for record in records:
+        scores.submit(record)
+    scores.close()
+    return scores
+
+
+def test_records_round_trip() -> None:
+    data = encode_record(_record("ada", 1200)) + encode_record(_record("bö", -1))
+    records, end, damaged = decode_records(data)
+    assert (end, damaged) == (len(data), 0)
+    assert [(r.name, r.score, r.ticks) for r in records] == [
+        ("ada", 1200, 3600),
+        ("bö", -1, 3600),
+    ]
+
+
+def test_decode_stops_at_a_torn_tail() -> None:
+    good = encode_record(_record("ada", 1))
+    records, end, damaged = decode_records(good + good[:-1])
+    assert (len(records), end, damaged) == (1, len(good), 0)
+    records, end, damaged = decode_records(good + good[:3])
+    assert (len(records), end, damaged) == (1, len(good), 0)
+
+
+def test_decode_skips_a_corrupt_record() -> None:
+    good = encode_record(_record("ada", 1))
+    corrupt = bytearray(good)
+    corrupt[-1] ^= 0xFF
+    data = good + bytes(corrupt) + good
+    records, end, damaged = decode_records(data)
+    assert (len(records), end, damaged) == (2, len(data), len(good))
+    # A damaged length is no guide; the next intact record is found anyway
+    corrupt = bytearray(good)
+    corrupt[4] ^= 0x01
+    records, end, damaged = decode_records(good + bytes(corrupt) + good)
+    assert (len(records), end, damaged) == (2, len(data), len(good))
+    # A complete but corrupt last record is skipped, not cut
+    records, end, damaged = decode_records(good + bytes(corrupt))
+    assert (len(records), end, damaged) == (1, 2 * len(good), len(good))
+
+
+def test_index_ranks_top_scores_and_tracks_players() -> None:
+    index = ScoreIndex(top_n=3)
+    assert index.add(_record("ada", 100)) == 1
+    assert index.add(_record("bob", 300)) == 1
+    assert index.add(_record("ada", 200)) == 2
+    assert index.add(_record("bob", 200)) == 3  # ties rank after earlier scores
+    assert index.add(_record("cyd", 50)) is None
+    assert [r.score for r in index.top] == [300, 200, 200]
+    assert [r.name for r in index.top] == ["bob", "ada", "bob"]
+    assert (index.best("ada"), index.games("ada")) == (200, 2)
+    assert (index.best("cyd"), index.games("cyd")) == (50, 1)
+    assert (index.best("nobody"), index.games("nobody")) == (None, 0)
+
+
+def test_submitted_scores_survive_a_restart(tmp_path: Path) -> None:
+    scores = _submit(tmp_path, _record("ada", 100), _record("bob", 300))
+    assert scores.written == 2
+    reloaded = HighScores(tmp_path, top_n=3)
+    reloaded.load()
+    assert [r.score for r in reloaded.index.top] == [300, 100]
+    assert reloaded.index.best("bob") == 300
+    assert reloaded.replayed == 0
+    assert [r.score for r in reloaded.history("ada")] == [100]
+
+
+def test_load_reads_the_index_not_the_history(tmp_path: Path) -> None:
+    _submit(tmp_path, _record("ada", 100), _record("bob", 300))
+    # Damage the first record: only a full replay would notice
+    log = tmp_path / "scores.log"
+    data = bytearray(log.read_bytes())
+    data[0] ^= 0xFF
+    log.write_bytes(bytes(data))
+    scores = HighScores(tmp_path, top_n=3)
+    scores.load()
+    assert [r.score for r in scores.index.top] == [300, 100]
+
+
+def test_records_past_the_index_are_replayed(tmp_path: Path) -> None:
+    _submit(tmp_path, _record("ada", 100))
+    # A crash after the log append but before the index was rewritten
+    with open(tmp_path / "scores.log", "ab") as log:
+        log.write(encode_record(_record("bob", 500)))
+    scores = HighScores(tmp_path, top_n=3)
+    scores.load()
+    assert scores.replayed == 1
+    assert [r.score for r in scores.index.top] == [500, 100]
+    scores.submit(_record("ada", 200))
+    scores.close()
+    reloaded = HighScores(tmp_path, top_n=3)
+    reloaded.load()
+    assert reloaded.replayed == 0
+    assert [r.score for r in reloaded.index.top] == [500, 200, 100]
+
+
+def test_torn_tail_is_truncated(tmp_path: Path) -> None:
+    _submit(tmp_path, _record("ada", 100))
+    log = tmp_path / "scores.log"
+    size = log.stat().st_size
+    with open(log, "ab") as f:
+        f.write(encode_record(_record("bob", 500))[:-3])
+    scores = HighScores(tmp_path, top_n=3)
+    scores.load()
+    assert log.stat().st_size == size
+    assert [r.score for r in scores.index.top] == [100]
+
+
+def test_corrupt_middle_record_keeps_the_rest_of_the_log(tmp_path: Path) -> None:
+    _submit(tmp_path, *(_record(name, score) for name, score in zip("abcde", range(5))))
+    log = tmp_path / "scores.log"
+    data = bytearray(log.read_bytes())
+    data[30] ^= 0xFF  # inside the second record
+    log.write_bytes(data)
+    (tmp_path / "scores.idx").unlink()
+    scores = HighScores(tmp_path, top_n=3)
+    scores.load()
+    assert log.read_bytes() == data
+    assert scores.replayed == 4
+    assert scores.damaged == len(encode_record(_record("b", 1)))
+    assert [r.score for r in scores.index.top] == [4, 3, 2]
+
+
+def test_missing_index_is_rebuilt_from_the_log(tmp_path: Path) -> None:
+    _submit(tmp_path, _record("ada", 100), _record("bob", 300), _record("cyd", 5))
+    (tmp_path / "scores.idx").unlink()
+    scores = HighScores(tmp_path, top_n=2)
+    scores.load()
+    assert scores.replayed == 3
+    assert [r.name for r in scores.index.top] == ["bob", "ada"]
+    assert scores.index.best("cyd") == 5
+
+
+def test_unwritable_directory_loses_scores_quietly(tmp_path: Path) -> None:
+    blocker = tmp_path / "file"
+    blocker.write_text("not a directory")
+    scores = _submit(blocker, _record("ada", 100))
+    assert scores.written == 0
+    assert scores.write_errors == 1
+    assert scores.index.best("ada") == 100  # still shown this session
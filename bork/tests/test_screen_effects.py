@@ -42,3 +42,16 @@ def test_screen_shake_offset_within_intensity() -> None:
         ox, oy = s.get_offset()
         assert -10.0 <= ox <= 10.0
         assert -10.0 <= oy <= 10.0
+
+
+def test_screen_flash_alpha_full_then_fades() -> None:
+    f = ScreenFlash((255, 255, 255), duration=0.1, fade=0.2, peak_alpha=200)
+    assert f.alpha == 200
+    f.update(0.2)  # halfway through fade
+    assert 0 < f.alpha < 200
+
+
+def test_screen_flash_alpha_zero_when_done() -> None:
+    f = ScreenFlash((255, 255, 255), duration=0.1, fade=0.2)
+    f.update(0.5)
+    assert f.alpha == 0
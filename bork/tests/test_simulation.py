@@ -0,0 +1,392 @@
+"""Tests for the gameplay simulation."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from bork.boss import HIT_TREE, Boss
+from bork.boss_collision import (
+    check_boss_player_collisions,
+    check_projectile_boss_collisions,
+)
+from bork.constants import (
+    ACTION_FIRE,
+    COOP_PLAYER_SPACING,
+    ENEMY_BULLET_SPEED,
+    ENEMY_FIRE_DELAY,
+    LAYER_BOSS,
+    LAYER_PLAYER,
+    PLAYER_SHIP_SIZE,
+    PLAYER_START_X,
+    PLAYER_START_Y,
+    POINTS_BASIC_ENEMY,
+    SPEED_BOOST_MULTIPLIER,
+    STARTING_LIVES,
+    STATE_GAME_OVER,
+    WAVE_START_DELAY,
+    WEAPONS,
+)
+from bork.enemy import Enemy
+from bork.events import (
+    EVENT_BOSS_KILLED,
+    EVENT_BOSS_PART_DESTROYED,
+    EVENT_ENEMY_KILLED,
+    EVENT_GAME_OVER,
+    EVENT_PLAYER_FIRED,
+    EVENT_PLAYER_HIT,
+    EVENT_POWERUP_COLLECTED,
+)
+from bork.player import player_start
+from bork.powerup import Powerup
+from bork.projectile import Projectile
+from bork.simulation import Simulation
+
+DT = 1 / 60
+
+
+def _kinds(sim: Simulation) -> list[str]:
+    return [e.kind for e in sim.events]
+
+
+def test_simulation_initial_state() -> None:
+    sim = Simulation(seed=1)
+    assert sim.lives == STARTING_LIVES
+    assert sim.player.x == PLAYER_START_X
+    assert sim.player.y == PLAYER_START_Y
+    assert sim.enemies == []
+    assert sim.tick == 0
+
+
+def test_update_advances_tick_and_spawns_enemies() -> None:
+    sim = Simulation(seed=1)
+    for _ in range(int((WAVE_START_DELAY + 0.5) * 60)):
+        sim.update(DT, set())
+    assert sim.tick > 0
+    assert len(sim.enemies) > 0
+
+
+def test_space_fires_projectile() -> None:
+    sim = Simulation(seed=1)
+    sim.update(DT, {ACTION_FIRE})
+    assert len(sim.projectiles) == 1
+
+
+def test_projectile_kills_enemy_and_scores() -> None:
+    sim = Simulation(seed=1)
+    sim.spawn(Enemy(500, 300, "straight", 300))
+    sim.spawn(Projectile(500, 300))
+    sim._sweep_collisions()
+    sim._check_projectile_enemy_collisions()
+    assert sim.enemies == []
+    assert sim.projectiles == []
+    assert sim.scoring.score == POINTS_BASIC_ENEMY
+    assert _kinds(sim) == [EVENT_ENEMY_KILLED]
+    assert sim.events[0].points == POINTS_BASIC_ENEMY
+
+
+def test_one_projectile_hits_one_enemy() -> None:
+    sim = Simulation(seed=1)
+    sim.spawn(Enemy(500, 300, "straight", 300))
+    sim.spawn(Enemy(502, 300, "straight", 300))
+    sim.spawn(Projectile(501, 300))
+    sim._sweep_collisions()
+    sim._check_projectile_enemy_collisions()
+    assert len(sim.enemies) == 1
+
+
+def test_enemy_contact_costs_life_and_respawns() -> None:
+    sim = Simulation(seed=1)
+    sim.player.x, sim.player.y = 300, 300
+    sim.spawn(Enemy(300, 300, "straight", 300))
+    sim._sweep_collisions()
+    sim._check_enemy_player_collisions()
+    assert sim.lives == STARTING_LIVES - 1
+    assert sim.player.x == PLAYER_START_X
+    assert sim.player.is_invulnerable
+    assert _kinds(sim) == [EVENT_PLAYER_HIT]
+
+
+def test_invulnerable_player_ignores_contact() -> None:
+    sim = Simulation(seed=1)
+    sim.player.invulnerable_timer = 1.0
+    sim.spawn(Enemy(sim.player.x, sim.player.y, "straight", 0))
+    sim._sweep_collisions()
+    sim._check_enemy_player_collisions()
+    assert sim.lives == STARTING_LIVES
+
+
+def test_last_life_ends_game() -> None:
+    sim = Simulation(seed=1)
+    sim.lives = 1
+    sim.spawn(Enemy(sim.player.x, sim.player.y, "straight", 0))
+    sim._sweep_collisions()
+    sim._check_enemy_player_collisions()
+    assert sim.state == STATE_GAME_OVER
+    assert _kinds(sim) == [EVENT_PLAYER_HIT, EVENT_GAME_OVER]
+    tick = sim.tick
+    sim.update(DT, {ACTION_FIRE})
+    assert sim.tick == tick + 1
+    assert sim.projectiles == []
+
+
+def test_powerup_collection_applies_boost() -> None:
+    sim = Simulation(seed=1)
+    sim.spawn(Powerup(sim.player.x, sim.player.y, "speed"))
+    sim._sweep_collisions()
+    sim._check_powerup_player_collisions()
+    assert sim.powerups == []
+    assert sim.player.speed_multiplier == SPEED_BOOST_MULTIPLIER
+    assert _kinds(sim) == [EVENT_POWERUP_COLLECTED]
+    assert sim.active_powerups() == ["speed"]
+
+
+def test_weapon_powerup_switches_weapon() -> None:
+    sim = Simulation(seed=1)
+    sim.spawn(Powerup(sim.player.x, sim.player.y, "spread5"))
+    sim._sweep_collisions()
+    sim._check_powerup_player_collisions()
+    assert sim.player.weapon == "spread5"
+    assert sim.player.speed_multiplier == 1.0
+    assert sim.active_powerups() == [WEAPONS["spread5"]["label"]]
+
+
+def test_spread_weapon_fires_whole_volley() -> None:
+    sim = Simulation(seed=1)
+    sim.player.weapon = "spread3"
+    sim._try_shoot(sim.player)
+    assert len(sim.projectiles) == 3
+    assert sim.player.shoot_timer == WEAPONS["spread3"]["cooldown"]
+    # One event per volley, however many projectiles it has
+    assert [e.kind for e in sim.events] == [EVENT_PLAYER_FIRED]
+
+
+def test_piercing_shot_kills_several_enemies_once_each() -> None:
+    sim = Simulation(seed=1)
+    sim.player.weapon = "piercer"
+    sim._try_shoot(sim.player)
+    sim.events = []
+    (proj,) = sim.projectiles
+    handles = {sim.spawn(Enemy(proj.x, proj.y, "straight", proj.y)) for _ in range(2)}
+    sim._sweep_collisions()
+    sim._check_projectile_enemy_collisions()
+    assert _kinds(sim) == [EVENT_ENEMY_KILLED] * 2
+    assert sim.projectiles == [proj]
+    assert proj.hits == handles
+    assert proj.pierce == WEAPONS["piercer"]["pierce"] - 2
+
+
+def test_setup_resets_state() -> None:
+    sim = Simulation(seed=1)
+    sim.lives = 1
+    sim.spawn(Enemy(100, 100, "straight", 100))
+    sim.setup()
+    assert sim.lives == STARTING_LIVES
+    assert sim.enemies == []
+
+
+def test_simulation_imports_without_arcade() -> None:
+    code = (
+        "import sys; sys.modules['arcade'] = sys.modules['pyglet'] = None; "
+        "import bork.simulation, bork.snapshot, bork.rewind, bork.explosions, "
+        "bork.screen_effects, bork.starfield, bork.quality, bork.autopilot, "
+        "bork.atlas, bork.music, bork.sound, bork.assets, bork.scores, "
+        "bork.boss, bork.spawn_queue, bork.work, bork.net, bork.rollback, "
+        "bork.stream, bork.latency"
+    )
+    root = Path(__file__).resolve().parents[2]
+    subprocess.run([sys.executable, "-c", code], cwd=root, check=True)
+
+
+def test_enemy_fires_aimed_bullet_after_delay() -> None:
+    sim = Simulation(seed=1)
+    sim.wave_spawner.timer = 1000.0  # no wave spawns
+    sim.spawn(Enemy(600, sim.player.y, "straight", sim.player.y))
+    for _ in range(int(ENEMY_FIRE_DELAY * 60) + 1):
+        sim.update(DT, set())
+    assert sim.bullets.count == 1
+    assert sim.bullets.vx[0] == -ENEMY_BULLET_SPEED
+    assert sim.bullets.vy[0] == 0
+
+
+def test_bullet_hit_costs_life_and_removes_bullet() -> None:
+    sim = Simulation(seed=1)
+    sim.bullets.spawn(sim.player.x + 3, sim.player.y, -100, 0)
+    sim.bullets.spawn(sim.player.x + 200, sim.player.y, -100, 0)
+    sim._check_bullet_player_collisions()
+    assert sim.lives == STARTING_LIVES - 1
+    assert sim.bullets.count == 1
+    assert _kinds(sim) == [EVENT_PLAYER_HIT]
+
+
+def test_last_life_ends_the_game_once() -> None:
+    sim = Simulation(seed=1)
+    sim.wave_spawner.timer = 1000.0
+    sim.lives = 1
+    sim.spawn(Enemy(sim.player.x, sim.player.y, "straight", sim.player.y))
+    sim.bullets.spawn(sim.player.x, sim.player.y, 0, 0)
+    sim.update(DT, set())
+    assert _kinds(sim) == [EVENT_PLAYER_HIT, EVENT_GAME_OVER]
+    assert sim.lives == 0
+    assert sim.state == STATE_GAME_OVER
+
+
+def test_coop_ships_hit_together_end_the_game_once() -> None:
+    sim = Simulation(seed=1, players=2)
+    sim.wave_spawner.timer = 1000.0
+    sim.lives = 1
+    for player in sim.players:
+        sim.spawn(Enemy(player.x, player.y, "straight", player.y))
+    sim.update_players(DT, (set(), set()))
+    assert _kinds(sim).count(EVENT_GAME_OVER) == 1
+    assert sim.lives == 0
+
+
+def test_invulnerable_player_ignores_bullets() -> None:
+    sim = Simulation(seed=1)
+    sim.player.invulnerable_timer = 1.0
+    sim.bullets.spawn(sim.player.x, sim.player.y, 0, 0)
+    sim._check_bullet_player_collisions()
+    assert sim.lives == STARTING_LIVES
+    assert sim.bullets.count == 1
+
+
+def test_handle_stays_valid_while_other_entities_die() -> None:
+    sim = Simulation(seed=1)
+    handles = [sim.spawn(Enemy(500 + i, 300, "straight", 300)) for i in range(4)]
+    sim.despawn(handles[0])
+    survivor = sim.registry.get(handles[3], Enemy)
+    assert survivor is not None
+    assert survivor.x == 503
+    assert len(sim.enemies) == 3
+
+
+def _boss_sim() -> tuple[Simulation, Boss, int]:
+    sim = Simulation(seed=1)
+    sim.wave_spawner.timer = 1000.0  # no wave spawns
+    boss = Boss(700, 300)
+    boss.fire_timer = 1000.0
+    return sim, boss, sim.spawn(boss)
+
+
+def test_boss_due_spawns_boss_and_holds_waves() -> None:
+    sim = Simulation(seed=1)
+    sim.wave_spawner.boss_due = True
+    sim.update(DT, set())
+    assert len(sim.bosses) == 1
+    assert not sim.wave_spawner.boss_due
+    timer = sim.wave_spawner.timer
+    sim.update(DT, set())
+    assert sim.wave_spawner.timer == timer
+
+
+def test_shot_damages_the_part_it_reaches() -> None:
+    sim, boss, _ = _boss_sim()
+    turret = HIT_TREE.turrets[0]
+    x, y = boss.part_position(turret)
+    sim.spawn(Projectile(x, y, vx=0.0))
+    sim._sweep_collisions()
+    check_projectile_boss_collisions(sim)
+    assert boss.hp[turret] == HIT_TREE.parts[turret]["hp"] - 1
+    assert sim.projectiles == []
+
+
+def test_boss_hit_tests_are_counted_per_simulation() -> None:
+    sim, boss, _ = _boss_sim()
+    other, _, _ = _boss_sim()
+    sim.spawn(Projectile(*boss.part_position(HIT_TREE.core), vx=0.0))
+    sim._sweep_collisions()
+    check_projectile_boss_collisions(sim)
+    assert sim.boss_tests == boss.tests > 0
+    assert other.boss_tests == 0
+
+
+def test_piercing_shot_hits_a_boss_once() -> None:
+    sim, boss, handle = _boss_sim()
+    x, y = boss.part_position(HIT_TREE.core)
+    sim.spawn(Projectile(x, y, vx=0.0, pierce=3))
+    for _ in range(2):
+        sim._sweep_collisions()
+        check_projectile_boss_collisions(sim)
+    assert boss.hp[HIT_TREE.core] == HIT_TREE.parts[HIT_TREE.core]["hp"] - 1
+    assert sim.projectiles[0].hits == {handle}
+
+
+def test_destroying_core_kills_boss_and_every_part() -> None:
+    sim, boss, _ = _boss_sim()
+    boss.hp[HIT_TREE.core] = 1
+    x, y = boss.part_position(HIT_TREE.core)
+    sim.spawn(Projectile(x, y, vx=0.0))
+    sim._sweep_collisions()
+    check_projectile_boss_collisions(sim)
+    assert sim.bosses == []
+    kinds = _kinds(sim)
+    assert kinds.count(EVENT_BOSS_PART_DESTROYED) == len(HIT_TREE.parts)
+    assert kinds[-1] == EVENT_BOSS_KILLED
+    assert sim.events[0].points == HIT_TREE.parts[HIT_TREE.core]["points"]
+
+
+def test_player_touching_a_boss_part_is_hit() -> None:
+    sim, boss, _ = _boss_sim()
+    sim.player.x, sim.player.y = boss.part_position(0)
+    sim._sweep_collisions()
+    check_boss_player_collisions(sim)
+    assert sim.lives == STARTING_LIVES - 1
+
+
+def test_player_inside_boss_circle_but_clear_of_parts_is_safe() -> None:
+    sim, boss, _ = _boss_sim()
+    # Above the core, between the shield and the upper hull
+    sim.player.x, sim.player.y = boss.x - 60, boss.y + 90
+    assert boss.hit_part(sim.player.x, sim.player.y, PLAYER_SHIP_SIZE) is None
+    sim._sweep_collisions()
+    assert sim.collision_world.contacts(LAYER_PLAYER, LAYER_BOSS)
+    check_boss_player_collisions(sim)
+    assert sim.lives == STARTING_LIVES
+
+
+def test_boss_turrets_fire_aimed_volleys() -> None:
+    sim, boss, _ = _boss_sim()
+    boss.fire_timer = DT / 2
+    sim.update(DT, set())
+    assert sim.bullets.count == len(HIT_TREE.turrets)
+
+
+def test_coop_ships_start_apart_and_move_independently() -> None:
+    sim = Simulation(seed=1, players=2)
+    first, second = sim.players
+    assert sim.player is first
+    assert (first.x, first.y) == player_start(0, 2)
+    assert (second.x, second.y) == player_start(1, 2)
+    assert first.y - second.y == COOP_PLAYER_SPACING
+    sim.update_players(DT, ({ACTION_FIRE}, set()))
+    assert len(sim.projectiles) == 1
+    assert sim.projectiles[0].y == first.y
+
+
+def test_coop_hit_costs_a_shared_life_and_respawns_that_ship() -> None:
+    sim = Simulation(seed=1, players=2)
+    first, second = sim.players
+    second.x, second.y = 300, 300
+    sim.spawn(Enemy(300, 300, "straight", 300))
+    sim._sweep_collisions()
+    sim._check_enemy_player_collisions()
+    assert sim.lives == STARTING_LIVES - 1
+    assert (second.x, second.y) == player_start(1, 2)
+    assert second.is_invulnerable
+    assert not first.is_invulnerable
+
+
+def test_enemies_aim_at_the_nearest_ship() -> None:
+    sim = Simulation(seed=1, players=2)
+    sim.players[1].x, sim.players[1].y = 500, 100
+    sim._fire_at_player(600, 100)
+    assert sim.bullets.vx[0] == pytest.approx(-ENEMY_BULLET_SPEED)
+    assert sim.bullets.vy[0] == 0
+
+
+def test_setup_keeps_the_player_count() -> None:
+    sim = Simulation(seed=1, players=2)
+    sim.setup()
+    assert len(sim.players) == 2
@@ -0,0 +1,144 @@
+"""Tests for simulation snapshot and restore."""
+
+import pytest
+
+from bork.boss import HIT_TREE, Boss
+from bork.constants import ACTION_DOWN, ACTION_FIRE, ACTION_RIGHT, ACTION_UP
+from bork.enemy import Enemy
+from bork.powerup import Powerup
+from bork.simulation import Simulation
+from bork.snapshot import SNAPSHOT_MAGIC, restore_snapshot, take_snapshot
+from bork.spawn_queue import offscreen_formation
+
+DT = 1 / 60
+
+
+def _played_sim(frames: int = 400) -> Simulation:
+    """A simulation advanced through a few waves with the fire button held."""
+    sim = Simulation(seed=42)
+    keys = {ACTION_FIRE, ACTION_UP}
+    for i in range(frames):
+        if i == 120:
+            keys = {ACTION_FIRE, ACTION_DOWN}
+        sim.update(DT, keys)
+    sim.spawn(Powerup(700, 300, "speed"))
+    sim.powerups[0].time_alive = 0.25
+    sim.bullets.spawn(640, 200, -120.5, 33.25)
+    sim.rng.random()
+    return sim
+
+
+def test_snapshot_starts_with_magic() -> None:
+    blob = take_snapshot(Simulation(seed=1))
+    assert blob[:4] == SNAPSHOT_MAGIC
+
+
+def test_snapshot_round_trips_exactly() -> None:
+    sim = _played_sim()
+    blob = take_snapshot(sim)
+    other = Simulation(seed=99)
+    restore_snapshot(other, blob)
+    assert take_snapshot(other) == blob
+    assert other.player.x == sim.player.x
+    assert other.scoring.score == sim.scoring.score
+    assert [e.x for e in other.enemies] == [e.x for e in sim.enemies]
+    assert other.powerups[0].time_alive == 0.25
+    assert other.bullets.count == sim.bullets.count
+    assert list(other.bullets.vx[: other.bullets.count]) == list(
+        sim.bullets.vx[: sim.bullets.count]
+    )
+
+
+def test_restored_simulation_evolves_identically() -> None:
+    sim = _played_sim()
+    other = Simulation()
+    restore_snapshot(other, take_snapshot(sim))
+    keys = {ACTION_FIRE, ACTION_RIGHT}
+    for _ in range(300):
+        sim.update(DT, keys)
+        other.update(DT, keys)
+    assert take_snapshot(other) == take_snapshot(sim)
+
+
+def test_restore_restores_rng_state() -> None:
+    sim = Simulation(seed=5)
+    blob = take_snapshot(sim)
+    expected = [sim.rng.random() for _ in range(3)]
+    restore_snapshot(sim, blob)
+    assert [sim.rng.random() for _ in range(3)] == expected
+
+
+def test_snapshot_preserves_enemy_pattern() -> None:
+    sim = Simulation(seed=1)
+    sim.spawn(Enemy(400, 200, "sine", 250))
+    other = Simulation()
+    restore_snapshot(other, take_snapshot(sim))
+    assert other.enemies[0].pattern == "sine"
+    assert other.enemies[0].base_y == 250
+
+
+def test_snapshot_preserves_weapon_and_piercing_shots() -> None:
+    sim = Simulation(seed=1)
+    sim.player.weapon = "piercer"
+    sim._try_shoot(sim.player)
+    sim.projectiles[0].register_hit(4)
+    other = Simulation()
+    restore_snapshot(other, take_snapshot(sim))
+    assert other.player.weapon == "piercer"
+    assert other.projectiles[0].hits == {4}
+    assert other.projectiles[0].pierce == sim.projectiles[0].pierce
+
+
+def test_snapshot_preserves_boss_damage() -> None:
+    sim = Simulation(seed=5)
+    boss = Boss(700, 300)
+    sim.spawn(boss)
+    sim.update(DT, set())
+    turret = HIT_TREE.turrets[1]
+    boss.destroy_part(turret)
+    boss.damage(HIT_TREE.core)
+    other = Simulation()
+    restore_snapshot(other, take_snapshot(sim))
+    (restored,) = other.bosses
+    assert restored.hp == boss.hp
+    assert restored.live == boss.live
+    assert restored.time_alive == boss.time_alive
+    assert restored.hit_part(*boss.part_position(turret), 0.0) is None
+
+
+def test_snapshot_preserves_queued_enemies() -> None:
+    sim = Simulation(seed=2)
+    sim.spawn_queue.extend(offscreen_formation(9, 300))
+    sim.update(DT, set())
+    other = Simulation()
+    restore_snapshot(other, take_snapshot(sim))
+    pending = other.spawn_queue.pending
+    assert len(pending) == len(sim.spawn_queue.pending) > 0
+    assert [(e.x, e.y) for e in pending] == [
+        (e.x, e.y) for e in sim.spawn_queue.pending
+    ]
+
+
+def test_coop_snapshot_round_trips_every_ship() -> None:
+    sim = Simulation(seed=3, players=2)
+    for _ in range(200):
+        sim.update_players(DT, ({ACTION_FIRE, ACTION_UP}, {ACTION_RIGHT}))
+    blob = take_snapshot(sim)
+    other = Simulation(seed=99)
+    restore_snapshot(other, blob)
+    assert len(other.players) == 2
+    assert take_snapshot(other) == blob
+    assert other.players[1].x == sim.players[1].x
+
+
+def test_restore_rejects_bad_magic() -> None:
+    blob = b"NOPE" + take_snapshot(Simulation())[4:]
+    with pytest.raises(ValueError):
+        restore_snapshot(Simulation(), blob)
+
+
+def test_restore_rejects_unknown_version() -> None:
+    blob = bytearray(take_snapshot(Simulation()))
+    blob[4] = 0xFF
+    with pytest.raises(ValueError):
+        restore_snapshot(Simulation(), bytes(blob))
@@ -0,0 +1,83 @@
+"""Tests for the soak-test sampling and growth detection."""
+
+from bork.constants import SOAK_GROWTH_WINDOW, SOAK_WARMUP
+from bork.soak import (
+    COLUMNS,
+    SoakRunner,
+    SoakSample,
+    growth_flags,
+    percentile,
+)
+
+
+def _samples(**series: list[float]) -> list[SoakSample]:
+    length = len(next(iter(series.values())))
+    samples = []
+    for i in range(length):
+        metrics = {key: 0.0 for key, _, _ in COLUMNS}
+        metrics.update({key: values[i] for key, values in series.items()})
+        samples.append(SoakSample(i * 60.0, i * 3600, 1, metrics, []))
+    return samples
+
+
+def test_percentile_nearest_rank() -> None:
+    values = [float(v) for v in range(1, 101)]
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 99) == 99.0
+    assert percentile(values, 100) == 100.0
+    assert percentile([3.0], 95) == 3.0
+    assert percentile([], 50) == 0.0
+
+
+def test_monotonic_growth_is_flagged() -> None:
+    samples = _samples(rss_mb=[100.0 + 5 * i for i in range(8)])
+    flags = growth_flags(samples, window=6)
+    assert len(flags) == 1
+    assert flags[0].startswith("rss_mb")
+
+
+def test_noisy_or_flat_series_not_flagged() -> None:
+    samples = _samples(
+        rss_mb=[100.0, 104.0, 101.0, 106.0, 103.0, 108.0],
+        enemies=[4.0] * 6,
+        frame_p95_ms=[5.0, 5.0, 5.01, 5.01, 5.02, 5.02],  # rising but tiny
+    )
+    assert growth_flags(samples, window=6) == []
+
+
+def test_only_trailing_window_is_judged() -> None:
+    # Grows while warming up, then plateaus
+    samples = _samples(rewind_kb=[0.0, 900.0, 1800.0, 2700.0] + [3000.0] * 6)
+    assert growth_flags(samples, window=6) == []
+
+
+def test_too_few_samples_not_judged() -> None:
+    samples = _samples(rss_mb=[100.0, 200.0, 300.0])
+    assert growth_flags(samples, window=6) == []
+
+
+def test_frame_spikes_are_not_drift() -> None:
+    samples = _samples(frame_max_ms=[10.0 * (i + 1) for i in range(6)])
+    assert growth_flags(samples, window=6) == []
+
+
+def test_runner_ignores_warmup_samples() -> None:
+    runner = SoakRunner(game=None)
+    runner.samples = _samples(rss_mb=[100.0 + 5 * i for i in range(8)])
+    assert runner.flags() == []
+    for sample in runner.samples:
+        sample.elapsed += SOAK_WARMUP
+    assert runner.flags()
+
+
+def test_report_lists_rows_and_flags() -> None:
+    runner = SoakRunner(game=None)
+    runner.samples = _samples(traced_mb=[1.0 + i for i in range(SOAK_GROWTH_WINDOW)])
+    for sample in runner.samples:
+        sample.elapsed += SOAK_WARMUP
+    report = runner.report()
+    assert runner.format_header() in report
+    assert all(runner.format_row(s) in report for s in runner.samples)
+    assert "traced_mb grew monotonically" in report
+    header, row = runner.format_header(), runner.format_row(runner.samples[0])
+    assert len(header) == len(row)
@@ -0,0 +1,160 @@
+"""Tests for the SoundManager voice arbitration."""
+
+import pytest
+
+from bork.constants import SOUND_MAX_VOLUME, SOUNDS
+from bork.sound import NullBackend, SoundManager
+
+DT = 1 / 60
+
+
+def _spec(file: str, voices: int, priority: int, steal: str = "oldest") -> dict:
+    return {
+        "file": file,
+        "volume": 0.5,
+        "voices": voices,
+        "priority": priority,
+        "steal": steal,
+    }
+
+
+def _manager(max_voices: int = 8, duration: float = 0.5) -> SoundManager:
+    sounds = {
+        "shot": _spec("laser.wav", 3, 0),
+        "boom": _spec("boom.wav", 2, 1),
+        "pickup": _spec("pickup.wav", 1, 2, steal="drop"),
+        "alarm": _spec("boom.wav", 1, 3),
+    }
+    return SoundManager(NullBackend(duration), sounds, max_voices)
+
+
+def test_each_file_decoded_once() -> None:
+    sound = _manager()
+    sound.load_all()
+    assert sound.backend.loads == 3  # boom.wav is shared
+    for _ in range(10):
+        sound.trigger("boom")
+        sound.update(DT)
+    assert sound.backend.loads == 3
+
+
+def test_stored_samples_are_not_decoded_again() -> None:
+    sound = _manager()
+    assert sound.files() == ["laser.wav", "boom.wav", "pickup.wav"]
+    for path in sound.files():
+        sound.store(path, path)
+    sound.load_all()
+    sound.trigger("alarm")
+    sound.update(DT)
+    assert sound.backend.loads == 0
+    assert sound.played["alarm"] == 1
+
+
+def test_same_frame_triggers_merge_into_one_louder_voice() -> None:
+    sound = _manager()
+    for _ in range(5):
+        sound.trigger("boom")
+    sound.update(DT)
+    assert len(sound.voices) == 1
+    assert sound.merged["boom"] == 4
+    ((_, volume),) = sound.backend.playing.values()
+    assert 0.5 < volume <= SOUND_MAX_VOLUME
+
+
+def test_separate_frames_are_separate_voices() -> None:
+    sound = _manager()
+    sound.trigger("boom")
+    sound.update(DT)
+    sound.trigger("boom")
+    sound.update(DT)
+    assert len(sound.voices) == 2
+    assert sound.merged["boom"] == 0
+
+
+def test_full_sound_steals_its_oldest_voice() -> None:
+    sound = _manager()
+    handles = []
+    for _ in range(3):
+        sound.trigger("shot")
+        sound.update(DT)
+        handles.append(sound.voices[-1].handle)
+    sound.trigger("shot")
+    sound.update(DT)
+    assert [v.name for v in sound.voices].count("shot") == 3
+    assert handles[0] not in sound.backend.playing
+    assert sound.stolen["shot"] == 1
+
+
+def test_drop_policy_keeps_playing_voice() -> None:
+    sound = _manager()
+    sound.trigger("pickup")
+    sound.update(DT)
+    first = sound.voices[0].handle
+    sound.trigger("pickup")
+    sound.update(DT)
+    assert [v.handle for v in sound.voices] == [first]
+    assert sound.dropped["pickup"] == 1
+
+
+def test_global_cap_steals_lowest_priority() -> None:
+    sound = _manager(max_voices=3)
+    for name in ("boom", "shot", "boom"):
+        sound.trigger(name)
+        sound.update(DT)
+    sound.trigger("pickup")
+    sound.update(DT)
+    assert sorted(v.name for v in sound.voices) == ["boom", "boom", "pickup"]
+    assert sound.stolen["shot"] == 1
+
+
+def test_global_cap_never_steals_equal_or_higher_priority() -> None:
+    sound = _manager(max_voices=2)
+    for name in ("boom", "pickup"):
+        sound.trigger(name)
+        sound.update(DT)
+    sound.trigger("shot")
+    sound.update(DT)
+    assert sorted(v.name for v in sound.voices) == ["boom", "pickup"]
+    assert sound.dropped["shot"] == 1
+
+
+def test_higher_priority_starts_first_in_a_frame() -> None:
+    sound = _manager(max_voices=1)
+    sound.trigger("shot")
+    sound.trigger("alarm")
+    sound.update(DT)
+    assert [v.name for v in sound.voices] == ["alarm"]
+    assert sound.dropped["shot"] == 1
+
+
+def test_finished_voices_are_released() -> None:
+    sound = _manager(duration=0.1)
+    sound.trigger("boom")
+    sound.update(DT)
+    for _ in range(10):
+        sound.update(DT)
+    assert sound.voices == []
+    assert sound.backend.playing == {}
+
+
+def test_stop_all_clears_voices_and_pending() -> None:
+    sound = _manager()
+    sound.trigger("boom")
+    sound.update(DT)
+    sound.trigger("shot")
+    sound.stop_all()
+    sound.update(DT)
+    assert sound.voices == []
+    assert sound.backend.playing == {}
+
+
+def test_unknown_sound_raises() -> None:
+    with pytest.raises(KeyError):
+        _manager().trigger("kazoo")
+
+
+def test_default_sounds_valid() -> None:
+    for spec in SOUNDS.values():
+        assert spec["voices"] >= 1
+        assert spec["steal"] in ("oldest", "drop")
+        assert 0 < spec["volume"] <= SOUND_MAX_VOLUME
@@ -0,0 +1,110 @@
+"""Tests for the spatial grid index."""
+
+import math
+import random
+
+from bork.enemy import Enemy
+from bork.simulation import Simulation
+from bork.spatial import SpatialGrid
+
+DT = 1 / 60
+
+
+class Point:
+    def __init__(self, x: float, y: float) -> None:
+        self.x = x
+        self.y = y
+
+
+def _scatter(n: int, seed: int = 7) -> list[Point]:
+    rng = random.Random(seed)
+    return [Point(rng.uniform(-50, 1000), rng.uniform(-50, 600)) for _ in range(n)]
+
+
+def _dist(p: Point, x: float, y: float) -> float:
+    return math.hypot(p.x - x, p.y - y)
+
+
+def test_empty_grid_returns_nothing() -> None:
+    grid = SpatialGrid()
+    grid.rebuild([])
+    assert grid.nearest(100, 100) == []
+    assert grid.query_radius(100, 100, 500) == []
+
+
+def test_radius_query_matches_brute_force() -> None:
+    points = _scatter(400)
+    grid = SpatialGrid(cell_size=50)
+    grid.rebuild(points)
+    for x, y, r in ((0, 0, 120), (480, 270, 75), (900, 500, 300), (-40, 10, 30)):
+        expected = {id(p) for p in points if _dist(p, x, y) <= r}
+        assert {id(p) for p in grid.query_radius(x, y, r)} == expected
+
+
+def test_nearest_matches_brute_force() -> None:
+    points = _scatter(300)
+    grid = SpatialGrid(cell_size=40)
+    grid.rebuild(points)
+    rng = random.Random(1)
+    for _ in range(50):
+        x, y = rng.uniform(-200, 1200), rng.uniform(-200, 800)
+        expected = sorted(points, key=lambda p: _dist(p, x, y))[:5]
+        assert grid.nearest(x, y, k=5) == expected
+
+
+def test_nearest_ahead_only_returns_targets_to_the_right() -> None:
+    points = [Point(90, 100), Point(200, 100), Point(130, 300)]
+    grid = SpatialGrid()
+    grid.rebuild(points)
+    assert grid.nearest(100, 100) == [points[0]]
+    assert grid.nearest(100, 100, ahead=True) == [points[1]]
+    assert grid.nearest(100, 100, k=3, ahead=True) == [points[1], points[2]]
+
+
+def test_nearest_respects_max_radius() -> None:
+    points = [Point(0, 0), Point(500, 0)]
+    grid = SpatialGrid()
+    grid.rebuild(points)
+    assert grid.nearest(400, 0, k=2, max_radius=150) == [points[1]]
+    assert grid.nearest(250, 300, max_radius=100) == []
+
+
+def test_batched_queries_match_single_queries() -> None:
+    points = _scatter(200)
+    grid = SpatialGrid()
+    grid.rebuild(points)
+    homers = [(p.x, p.y) for p in _scatter(30, seed=3)]
+    assert grid.nearest_many(homers, k=2, ahead=True) == [
+        grid.nearest(x, y, k=2, ahead=True) for x, y in homers
+    ]
+    assert grid.query_radius_many(homers, 80) == [
+        grid.query_radius(x, y, 80) for x, y in homers
+    ]
+
+
+def test_nearest_checks_far_fewer_candidates_than_a_scan() -> None:
+    points = _scatter(1000)
+    grid = SpatialGrid()
+    grid.rebuild(points)
+    grid.nearest_many([(p.x, p.y) for p in _scatter(100, seed=2)])
+    assert grid.candidates_checked < 100 * 1000 // 10
+
+
+def test_simulation_grid_rebuilds_once_per_tick() -> None:
+    sim = Simulation(seed=1)
+    sim.spawn(Enemy(500, 300, "straight", 300))
+    grid = sim.enemy_grid()
+    sim.enemy_grid()
+    assert grid.rebuilds == 1
+    assert grid.nearest(400, 300) == sim.enemies
+
+    sim.spawn(Enemy(450, 300, "straight", 300))
+    assert sim.enemy_grid().nearest(400, 300) == [sim.enemies[1]]
+    assert grid.rebuilds == 2
+    assert sim.grid_rebuilds == 1  # the second rebuild within tick 0
+
+    sim.update(DT, set())
+    sim.enemy_grid()
+    sim.enemy_grid()
+    assert grid.rebuilds == 3
+    assert sim.grid_rebuilds == 1
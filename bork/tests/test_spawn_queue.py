@@ -0,0 +1,48 @@
+"""Tests for the budgeted spawn queue."""
+
+from bork.constants import ENEMY_SIZE, SCREEN_WIDTH, SPAWN_BUDGET
+from bork.simulation import Simulation, new_registry
+from bork.spawn_queue import SpawnQueue, SpawnStats, offscreen_formation
+
+DT = 1 / 60
+
+
+def test_activate_respects_budget_in_push_order() -> None:
+    queue = SpawnQueue(budget=3)
+    burst = offscreen_formation(7, 270)
+    queue.extend(burst)
+    registry = new_registry()
+    counts = [len(queue.activate(registry)) for _ in range(4)]
+    assert counts == [3, 3, 1, 0]
+    store = registry.store(type(burst[0]))
+    assert store.items == burst
+
+
+def test_simulation_spreads_a_burst_over_ticks() -> None:
+    sim = Simulation(seed=1)
+    sim.wave_spawner.timer = 1000.0  # no wave spawns
+    sim.spawn_queue.extend(offscreen_formation(10, 270))
+    seen = []
+    for _ in range(4):
+        sim.update(DT, set())
+        seen.append(len(sim.enemies))
+    assert seen == [SPAWN_BUDGET, 2 * SPAWN_BUDGET, 10, 10]
+    stats = sim.spawn_queue.stats
+    assert stats.worst_count == SPAWN_BUDGET
+    assert stats.spawned == 10
+    assert stats.peak_pending == 10 - SPAWN_BUDGET
+
+
+def test_stats_keep_the_worst_tick() -> None:
+    stats = SpawnStats()
+    stats.record(4, 0.002, 6)
+    stats.record(1, 0.0005, 0)
+    assert (stats.worst_count, stats.worst_time, stats.peak_pending) == (4, 0.002, 6)
+    assert (stats.last_count, stats.last_time) == (1, 0.0005)
+
+
+def test_formation_starts_off_screen() -> None:
+    enemies = offscreen_formation(12, 270, "sine", rows=4)
+    assert all(e.x >= SCREEN_WIDTH + ENEMY_SIZE for e in enemies)
+    assert len({e.y for e in enemies}) == 4
+    assert sum(e.y for e in enemies[:4]) / 4 == 270
@@ -0,0 +1,169 @@
+"""Tests for the spectator server and client."""
+
+import socket
+import struct
+import time
+from collections.abc import Callable
+
+import pytest
+
+from bork.autopilot import autopilot_actions
+from bork.constants import SPECTATOR_INTERP_DELAY, TARGET_FPS
+from bork.simulation import Simulation
+from bork.spectator import (
+    Spectator,
+    SpectatorClient,
+    SpectatorFeed,
+    SpectatorServer,
+)
+from bork.stream import (
+    FLAG_KEYFRAME,
+    KINDS,
+    StreamDecoder,
+    StreamEncoder,
+    StreamView,
+    _entities,
+)
+
+DT = 1 / 60
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _wait_for(condition: Callable[[], bool], timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.005)
+
+
+def _play(
+    sim: Simulation, encoder: StreamEncoder, server: SpectatorServer, ticks: int
+) -> None:
+    for _ in range(ticks):
+        sim.update(DT, autopilot_actions(sim))
+        server.publish(encoder.encode(sim))
+
+
+def _caught_up(client: SpectatorClient, sim: Simulation) -> Callable[[], bool]:
+    def check() -> bool:
+        client.poll()
+        return bool(client.history) and client.history[-1].tick == sim.tick
+
+    return check
+
+
+def test_every_spectator_sees_the_same_game() -> None:
+    server = SpectatorServer(0)
+    clients = [SpectatorClient(port=server.port) for _ in range(4)]
+    try:
+        _wait_for(lambda: len(server.clients) == 4)
+        sim = Simulation(seed=3)
+        encoder = StreamEncoder()
+        _play(sim, encoder, server, 300)
+        for client in clients:
+            _wait_for(_caught_up(client, sim))
+            state = client.history[-1]
+            for name, component in KINDS:
+                assert state.entities[name] == _entities(sim, name, component)
+            assert state.score == sim.scoring.score
+    finally:
+        for client in clients:
+            client.close()
+        server.close()
+
+
+def test_feed_encodes_each_tick_once_for_the_server() -> None:
+    feed = SpectatorFeed(SpectatorServer(0))
+    client = SpectatorClient(port=feed.server.port)
+    try:
+        _wait_for(lambda: len(feed.server.clients) == 1)
+        sim = Simulation(seed=3)
+        for _ in range(30):
+            sim.update(DT, autopilot_actions(sim))
+            feed.publish(sim)
+        _wait_for(_caught_up(client, sim))
+        assert feed.encoder.stats.frames == 30
+        assert "to 1 spectators" in feed.debug_line()
+    finally:
+        client.close()
+        feed.close()
+
+
+def test_late_spectator_starts_from_the_last_keyframe() -> None:
+    server = SpectatorServer(0)
+    sim = Simulation(seed=3)
+    encoder = StreamEncoder()
+    _play(sim, encoder, server, 90)
+    client = SpectatorClient(port=server.port)
+    try:
+        _wait_for(_caught_up(client, sim))
+        # Just the latest keyframe and the deltas after it
+        assert client.received == sum(len(message) for message in server.backlog)
+        for name, component in KINDS:
+            assert client.history[-1].entities[name] == _entities(sim, name, component)
+    finally:
+        client.close()
+        server.close()
+
+
+def test_stalled_spectator_is_resynced_to_the_backlog() -> None:
+    ours, theirs = socket.socketpair()
+    try:
+        stalled = Spectator(ours)
+        sim = Simulation(seed=3)
+        encoder = StreamEncoder()
+        backlog: list[bytes] = []
+        resyncs = 0
+        for _ in range(300):
+            sim.update(DT, autopilot_actions(sim))
+            frame = encoder.encode(sim)
+            message = struct.pack("<I", len(frame)) + frame
+            if frame[0] & FLAG_KEYFRAME:
+                backlog = []
+            backlog.append(message)
+            resyncs += stalled.offer(message, backlog, 2048)
+            assert stalled.queued <= max(2048, sum(map(len, backlog)))
+        assert resyncs > 0
+        # What it is finally sent still decodes to the live game
+        decoder = StreamDecoder()
+        for message in stalled.messages:
+            state = decoder.apply(message[4:])
+        for name, component in KINDS:
+            assert state.entities[name] == _entities(sim, name, component)
+    finally:
+        ours.close()
+        theirs.close()
+
+
+def test_client_draws_behind_the_newest_tick_and_interpolates() -> None:
+    server = SpectatorServer(0)
+    clock = FakeClock()
+    client = SpectatorClient(port=server.port, clock=clock)
+    try:
+        sim = Simulation(seed=3)
+        encoder = StreamEncoder()
+        _play(sim, encoder, server, 10)
+        _wait_for(_caught_up(client, sim))
+        states = {state.tick: state for state in client.history}
+        shown = sim.tick - SPECTATOR_INTERP_DELAY
+        a, b = states[shown], states[shown + 1]
+
+        def ships(view: StreamView) -> list[float]:
+            return [value for ship in view.players for value in (ship.x, ship.y)]
+
+        assert ships(client.view()) == pytest.approx(ships(StreamView(a, b, 0.0)))
+        clock.now += 0.5 / TARGET_FPS
+        assert ships(client.view()) == pytest.approx(ships(StreamView(a, b, 0.5)))
+        # Starved: jumps back to the delay behind the newest tick
+        clock.now += 1.0
+        assert ships(client.view()) == pytest.approx(ships(StreamView(a, b, 0.0)))
+    finally:
+        client.close()
+        server.close()
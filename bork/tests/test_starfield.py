@@ -33,3 +33,17 @@ def test_star_wraps_when_off_screen_left() -> None:
     field.stars = [star]
     field.update(1 / 60)
     assert star.x > SCREEN_WIDTH
+
+
+def test_starfield_density_scales_layers() -> None:
+    field = Starfield(density=0.5)
+    assert len(field.stars) == sum(round(c * 0.5) for c in STAR_COUNTS)
+
+
+def test_set_density_keeps_existing_stars() -> None:
+    field = Starfield()
+    first = field.stars[0]
+    field.set_density(0.5)
+    assert first in field.stars
+    field.set_density(1.0)
+    assert len(field.stars) == sum(STAR_COUNTS)
@@ -0,0 +1,146 @@
+"""Tests for the spectator state stream."""
+
+from bork.autopilot import autopilot_actions
+from bork.constants import (
+    SCREEN_HEIGHT,
+    SPECTATOR_FRAME_BUDGET,
+    SPECTATOR_KEYFRAME_INTERVAL,
+    SPECTATOR_QUANTUM,
+)
+from bork.enemy import Enemy
+from bork.powerup import Powerup
+from bork.simulation import Simulation
+from bork.spawn_queue import offscreen_formation
+from bork.stream import (
+    FLAG_KEYFRAME,
+    FLAG_RESET,
+    KINDS,
+    StreamDecoder,
+    StreamEncoder,
+    StreamView,
+    _entities,
+)
+
+DT = 1 / 60
+
+
+def _decoded_keyframe(sim: Simulation) -> dict:
+    """What a fresh keyframe of the simulation decodes to."""
+    return StreamDecoder().apply(StreamEncoder().encode(sim)).entities
+
+
+def test_keyframe_carries_quantized_positions_and_scoring() -> None:
+    sim = Simulation(seed=1)
+    sim.spawn(Enemy(500.3, 200.1, "straight", 200))
+    sim.spawn(Powerup(600, 300, "spread3"))
+    sim.scoring.score = 1234
+    state = StreamDecoder().apply(StreamEncoder().encode(sim))
+    (x, y), *_ = state.entities["enemies"].values()
+    assert abs(x * SPECTATOR_QUANTUM - 500.3) <= SPECTATOR_QUANTUM / 2
+    assert abs(y * SPECTATOR_QUANTUM - 200.1) <= SPECTATOR_QUANTUM / 2
+    assert state.score == 1234
+    assert state.reset
+    view = StreamView(state, state, 1.0)
+    assert view.powerups[0].kind == "spread3"
+    assert view.players[0].x == sim.player.x
+
+
+def test_deltas_track_the_simulation_exactly() -> None:
+    sim = Simulation(seed=7)
+    encoder = StreamEncoder()
+    decoder = StreamDecoder()
+    for _ in range(600):
+        sim.update(DT, autopilot_actions(sim))
+        state = decoder.apply(encoder.encode(sim))
+        for name, component in KINDS:
+            assert state.entities[name] == _entities(sim, name, component)
+        assert state.score == sim.scoring.score
+        assert state.lives == sim.lives
+    assert encoder.stats.keyframes == 600 // SPECTATOR_KEYFRAME_INTERVAL
+
+
+def test_delta_is_much_smaller_than_a_keyframe() -> None:
+    sim = Simulation(seed=1)
+    sim.wave_spawner.timer = 1e9
+    sim.spawn_queue.extend(offscreen_formation(60, SCREEN_HEIGHT / 2))
+    encoder = StreamEncoder()
+    for _ in range(20):
+        sim.update(DT, set())
+    keyframe = len(StreamEncoder().encode(sim))
+    encoder.encode(sim)
+    sim.update(DT, set())
+    assert len(encoder.encode(sim)) < keyframe / 2
+
+
+def test_large_jump_is_sent_as_an_add() -> None:
+    sim = Simulation(seed=1)
+    sim.wave_spawner.timer = 1e9
+    sim.spawn(Enemy(500, 200, "straight", 200))
+    encoder = StreamEncoder()
+    decoder = StreamDecoder()
+    decoder.apply(encoder.encode(sim))
+    sim.enemies[0].x = 100
+    sim.update(DT, set())
+    state = decoder.apply(encoder.encode(sim))
+    assert state.entities["enemies"] == _entities(sim, "enemies", Enemy)
+
+
+def test_restart_sends_a_reset_keyframe() -> None:
+    sim = Simulation(seed=1)
+    encoder = StreamEncoder()
+    for _ in range(5):
+        sim.update(DT, set())
+        encoder.encode(sim)
+    sim.setup()
+    sim.update(DT, set())
+    flags = encoder.encode(sim)[0]
+    assert flags & FLAG_KEYFRAME and flags & FLAG_RESET
+
+
+def test_decoder_waits_for_a_keyframe() -> None:
+    sim = Simulation(seed=1)
+    encoder = StreamEncoder()
+    encoder.encode(sim)
+    sim.update(DT, set())
+    assert StreamDecoder().apply(encoder.encode(sim)) is None
+
+
+def test_view_interpolates_between_ticks() -> None:
+    sim = Simulation(seed=1)
+    sim.wave_spawner.timer = 1e9
+    sim.spawn(Enemy(500, 200, "straight", 200))
+    encoder = StreamEncoder()
+    decoder = StreamDecoder()
+    a = decoder.apply(encoder.encode(sim))
+    sim.update(DT, {"fire"})
+    b = decoder.apply(encoder.encode(sim))
+    view = StreamView(a, b, 0.5)
+    start = _entities(sim, "enemies", Enemy)
+    (x, _), *_ = a.entities["enemies"].values()
+    (x2, _), *_ = start.values()
+    assert view.enemies[0].x == (x + x2) / 2 * SPECTATOR_QUANTUM
+    assert len(view.projectiles) == 1
+
+
+def test_view_does_not_interpolate_across_a_reset() -> None:
+    sim = Simulation(seed=1)
+    encoder = StreamEncoder()
+    decoder = StreamDecoder()
+    sim.player.x = 400
+    a = decoder.apply(encoder.encode(sim))
+    sim.setup()
+    b = decoder.apply(encoder.encode(sim))
+    assert StreamView(a, b, 0.5).players[0].x == sim.player.x
+
+
+def test_crowd_stays_under_the_frame_budget() -> None:
+    sim = Simulation(seed=7)
+    sim.wave_spawner.timer = 1e9
+    sim.player.weapon = "spread5"
+    sim.spawn_queue.extend(offscreen_formation(100, SCREEN_HEIGHT / 2, rows=10))
+    encoder = StreamEncoder()
+    for _ in range(600):
+        sim.update(DT, {"fire"})
+        encoder.encode(sim)
+    assert encoder.stats.peak_bytes <= SPECTATOR_FRAME_BUDGET
+    assert encoder.stats.mean_bytes < SPECTATOR_FRAME_BUDGET / 4
@@ -1,6 +1,7 @@
 """Tests for the wave spawner."""
 
 from bork.constants import (
+    BOSS_EVERY_CYCLES,
     ENEMIES_PER_WAVE,
     ENEMY_SPAWN_SPACING,
     SCREEN_HEIGHT,
@@ -10,7 +11,7 @@ from bork.constants import (
     WAVE_START_DELAY,
     WAVE_TOP_Y,
 )
-from bork.wave_spawner import WaveSpawner
+from bork.wave_spawner import WAVE_DEFS, WaveSpawner
 
 DT = 1 / 60
 
@@ -153,3 +154,29 @@ def test_powerup_spawn_due_resets() -> None:
     s.powerup_spawn_due = True
     s.reset()
     assert s.powerup_spawn_due is False
+
+
+def test_boss_due_after_every_few_rounds_of_waves() -> None:
+    s = WaveSpawner()
+    round_time = len(WAVE_DEFS) * (WAVE_PAUSE + ENEMIES_PER_WAVE * ENEMY_SPAWN_SPACING)
+    _tick(s, WAVE_START_DELAY + (BOSS_EVERY_CYCLES - 1) * round_time)
+    assert not s.boss_due
+    _tick(s, round_time)
+    assert s.cycles == BOSS_EVERY_CYCLES
+    assert s.boss_due
+    s.reset()
+    assert (s.cycles, s.boss_due) == (0, False)
+
+
+def test_prewarm_builds_the_next_wave_during_the_pause() -> None:
+    s = WaveSpawner()
+    while len(s.ready) < ENEMIES_PER_WAVE:
+        s.update(DT)
+        s.prewarm()
+    built = list(s.ready)
+    assert s.prewarm() == 0  # the wave is fully built
+    enemies = _tick(s, WAVE_START_DELAY + ENEMIES_PER_WAVE * ENEMY_SPAWN_SPACING)
+    assert sorted(map(id, enemies)) == sorted(map(id, built))
+    assert s.ready == []
+    s.wave_active = True
+    assert s.prewarm() == 0
@@ -0,0 +1,38 @@
+"""Tests for data-driven weapon volleys."""
+
+import math
+
+import pytest
+
+from bork.constants import PROJECTILE_SPEED, WEAPONS
+from bork.weapons import fire_volley, volley_velocities
+
+
+def test_blaster_fires_one_straight_shot() -> None:
+    (shot,) = fire_volley("blaster", 100, 200)
+    assert (shot.x, shot.y) == (100, 200)
+    assert shot.vx == PROJECTILE_SPEED
+    assert shot.vy == 0.0
+    assert shot.pierce == 0
+
+
+@pytest.mark.parametrize("name", sorted(WEAPONS))
+def test_volley_matches_weapon_definition(name: str) -> None:
+    weapon = WEAPONS[name]
+    volley = fire_volley(name, 0, 0)
+    assert len(volley) == len(weapon["angles"])
+    for shot, angle in zip(volley, weapon["angles"]):
+        assert math.hypot(shot.vx, shot.vy) == pytest.approx(weapon["speed"])
+        assert math.degrees(math.atan2(shot.vy, shot.vx)) == pytest.approx(angle)
+        assert shot.pierce == weapon["pierce"]
+
+
+def test_spread_fans_out_symmetrically() -> None:
+    vys = sorted(vy for _, vy in volley_velocities("spread5"))
+    assert vys[2] == pytest.approx(0.0)
+    assert vys[0] == pytest.approx(-vys[4])
+    assert vys[1] == pytest.approx(-vys[3])
+
+
+def test_velocities_are_computed_once() -> None:
+    assert volley_velocities("spread3") is volley_velocities("spread3")
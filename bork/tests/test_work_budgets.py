@@ -0,0 +1,194 @@
+"""Work budgets: seeded scenarios must stay under recorded work counts.
+
+Counts are exact, so these fail the same way on every machine. When a
+change legitimately shifts a count, re-measure with
+`python -m bork.tests.test_work_budgets` and update BUDGETS (keep about
+25% headroom over the measured values).
+"""
+
+import random
+
+import pytest
+
+import bork.boss
+import bork.collision
+import bork.simulation
+from bork.autopilot import autopilot_actions
+from bork.boss import Boss
+from bork.collision import CollisionWorld, circle_circle
+from bork.constants import ACTION_FIRE, BOSS_STOP_X, ENEMY_SIZE, SCREEN_HEIGHT
+from bork.enemy import Enemy
+from bork.events import EVENT_ENEMY_KILLED, EVENT_PLAYER_HIT
+from bork.explosions import create_enemy_explosion, create_player_explosion
+from bork.particles import ParticleSystem
+from bork.simulation import Simulation
+from bork.spawn_queue import offscreen_formation
+from bork.work import WORK_COUNTERS, WorkMeter
+
+DT = 1 / 60
+
+
+def _waves(sim: Simulation) -> tuple[int, str | None]:
+    """Normal play on autopilot for 30 seconds."""
+    return 1800, None
+
+
+def _crowd(sim: Simulation) -> tuple[int, str | None]:
+    """A hundred enemies in one formation against a five-way spread."""
+    sim.wave_spawner.timer = 1e9
+    sim.player.weapon = "spread5"
+    sim.spawn_queue.extend(offscreen_formation(100, SCREEN_HEIGHT / 2, rows=10))
+    return 600, None
+
+
+def _boss(sim: Simulation) -> tuple[int, str | None]:
+    """A boss on station taking piercing fire."""
+    sim.wave_spawner.timer = 1e9
+    sim.player.weapon = "piercer"
+    sim.spawn(Boss(BOSS_STOP_X, SCREEN_HEIGHT / 2))
+    return 900, ACTION_FIRE
+
+
+SCENARIOS = {"waves": _waves, "crowd": _crowd, "boss": _boss}
+
+# Scenario -> counter -> (peak per tick, run total)
+BUDGETS: dict[str, dict[str, tuple[int, int]]] = {
+    "waves": {
+        "narrow_tests": (5, 1213),
+        "sort_swaps": (3, 615),
+        "grid_checks": (4, 2523),
+        "bullet_tests": (13, 5872),
+        "entities_updated": (20, 18084),
+        "particles_integrated": (85, 22240),
+        "list_rebuilds": (3, 552),
+        "allocations": (52, 1113),
+        "circle_calls": (5, 1213),
+    },
+    "crowd": {
+        "narrow_tests": (60, 8428),
+        "sort_swaps": (38, 3650),
+        "grid_checks": (25, 5204),
+        "bullet_tests": (125, 24073),
+        "entities_updated": (153, 48340),
+        "particles_integrated": (179, 49653),
+        "list_rebuilds": (4, 729),
+        "allocations": (53, 2394),
+        "circle_calls": (60, 8428),
+    },
+    "boss": {
+        "narrow_tests": (20, 3628),
+        "sort_swaps": (2, 44),
+        "grid_checks": (0, 0),
+        "bullet_tests": (23, 4545),
+        "entities_updated": (8, 4312),
+        "particles_integrated": (59, 7005),
+        "list_rebuilds": (3, 122),
+        "allocations": (59, 244),
+        "circle_calls": (20, 3628),
+    },
+}
+
+
+def _count_circle_tests(monkeypatch: pytest.MonkeyPatch | None) -> list[int]:
+    """Count every circle_circle call from gameplay code (even bypassing paths)."""
+    calls = [0]
+
+    def counted(*args: float) -> bool:
+        calls[0] += 1
+        return circle_circle(*args)
+
+    for module in (bork.collision, bork.simulation, bork.boss):
+        if monkeypatch is None:
+            module.circle_circle = counted
+        else:
+            monkeypatch.setattr(module, "circle_circle", counted)
+    return calls
+
+
+def measure(
+    name: str, monkeypatch: pytest.MonkeyPatch | None = None
+) -> dict[str, tuple[int, int]]:
+    """Replay a scenario; (peak per tick, total) for every counter."""
+    random.seed(0)  # explosion particles
+    sim = Simulation(seed=7)
+    particles = ParticleSystem()
+    ticks, fixed_actions = SCENARIOS[name](sim)
+    meter = WorkMeter(sim, particles)
+    calls = _count_circle_tests(monkeypatch)
+    circle_peak = circle_total = 0
+    for _ in range(ticks):
+        before = calls[0]
+        actions = {fixed_actions} if fixed_actions else autopilot_actions(sim)
+        sim.update(DT, actions)
+        for event in sim.events:
+            if event.kind == EVENT_ENEMY_KILLED:
+                particles.add(create_enemy_explosion(event.x, event.y))
+            elif event.kind == EVENT_PLAYER_HIT:
+                particles.add(create_player_explosion(event.x, event.y))
+        particles.update(DT)
+        meter.tick()
+        circle_peak = max(circle_peak, calls[0] - before)
+        circle_total += calls[0] - before
+    work = {
+        counter: (meter.peak[counter], meter.total[counter])
+        for counter in WORK_COUNTERS
+    }
+    work["circle_calls"] = (circle_peak, circle_total)
+    return work
+
+
+@pytest.mark.parametrize("name", list(SCENARIOS))
+def test_work_stays_under_budget(name: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    work = measure(name, monkeypatch)
+    over = {
+        counter: (work[counter], budget)
+        for counter, budget in BUDGETS[name].items()
+        if work[counter][0] > budget[0] or work[counter][1] > budget[1]
+    }
+    assert not over, f"{name}: (measured, budget) {over}"
+
+
+def test_budget_catches_a_nested_collision_scan(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def nested_scan(sim: Simulation) -> None:
+        for proj in list(sim.projectiles):
+            for enemy, handle in zip(
+                list(sim.enemies), list(sim.registry.store(Enemy).owners)
+            ):
+                if bork.simulation.circle_circle(
+                    proj.x, proj.y, 0.0, enemy.x, enemy.y, ENEMY_SIZE
+                ):
+                    sim.despawn(handle)
+                    break
+
+    monkeypatch.setattr(Simulation, "_check_projectile_enemy_collisions", nested_scan)
+    peak, total = measure("crowd", monkeypatch)["circle_calls"]
+    budget = BUDGETS["crowd"]["circle_calls"]
+    assert peak > budget[0] and total > budget[1]
+
+
+def test_budget_catches_an_all_pairs_sweep(monkeypatch: pytest.MonkeyPatch) -> None:
+    def all_pairs(world: CollisionWorld) -> None:
+        bodies = world.bodies
+        contacts: dict[tuple[int, int], list[tuple]] = {}
+        for i, a in enumerate(bodies):
+            for b in bodies[i + 1 :]:
+                if not (a.layer & b.mask or b.layer & a.mask):
+                    continue
+                world.pairs_tested += 1
+                if circle_circle(a.x, a.y, a.radius, b.x, b.y, b.radius):
+                    low, high = (a, b) if a.layer <= b.layer else (b, a)
+                    contacts.setdefault((low.layer, high.layer), []).append(
+                        (low.entity, high.entity)
+                    )
+        world._contacts = contacts
+
+    monkeypatch.setattr(CollisionWorld, "_sweep", all_pairs)
+    peak, _ = measure("crowd", monkeypatch)["narrow_tests"]
+    assert peak > BUDGETS["crowd"]["narrow_tests"][0]
+
+
+if __name__ == "__main__":
+    for scenario in SCENARIOS:
+        print(scenario, measure(scenario))
@@ -1,11 +1,19 @@
-"""Wave spawner that manages timed enemy waves."""
+"""Wave spawner that manages timed enemy waves.
+
+During the pause before a wave the spawner builds that wave's enemies a
+few per tick (`prewarm()`), so the wave itself only hands them out. The
+pre-built enemies are identical to ones built on demand and are not part
+of the saved state; a restored spawner simply builds them again.
+"""
 
 from bork.constants import (
+    BOSS_EVERY_CYCLES,
     ENEMIES_PER_WAVE,
     ENEMY_SIZE,
     ENEMY_SPAWN_SPACING,
     SCREEN_HEIGHT,
     SCREEN_WIDTH,
+    SPAWN_PREWARM_PER_TICK,
     WAVE_BOTTOM_Y,
     WAVE_CENTER_Y,
     WAVE_PAUSE,
@@ -31,6 +39,9 @@ class WaveSpawner:
         self.spawned_in_wave = 0
         self.wave_active = False
         self.powerup_spawn_due = False
+        self.cycles = 0  # full rounds of WAVE_DEFS completed
+        self.boss_due = False
+        self.ready: list[Enemy] = []  # pre-built members of the next wave
 
     def update(self, dt: float) -> Enemy | None:
         """Tick the spawner. Returns a new Enemy if one should spawn."""
@@ -56,6 +67,10 @@ class WaveSpawner:
                 self.wave_active = False
                 self.spawned_in_wave = 0
                 self.wave_index = (self.wave_index + 1) % len(WAVE_DEFS)
+                if self.wave_index == 0:
+                    self.cycles += 1
+                    if self.cycles % BOSS_EVERY_CYCLES == 0:
+                        self.boss_due = True
                 self.timer = WAVE_PAUSE
             else:
                 self.timer = ENEMY_SPAWN_SPACING
@@ -64,7 +79,22 @@ class WaveSpawner:
 
         return None
 
+    def prewarm(self, count: int = SPAWN_PREWARM_PER_TICK) -> int:
+        """Build up to `count` members of the coming wave; returns how many."""
+        if self.wave_active:
+            return 0
+        count = min(count, ENEMIES_PER_WAVE - len(self.ready))
+        for _ in range(count):
+            self.ready.append(self._build_enemy())
+        return count
+
     def _spawn_enemy(self) -> Enemy:
+        """The next enemy of the current wave, pre-built if one is ready."""
+        if self.ready:
+            return self.ready.pop()
+        return self._build_enemy()
+
+    def _build_enemy(self) -> Enemy:
         """Create an enemy based on current wave definition."""
         y_frac, pattern = WAVE_DEFS[self.wave_index]
         y = SCREEN_HEIGHT * y_frac
@@ -77,3 +107,6 @@ class WaveSpawner:
         self.spawned_in_wave = 0
         self.wave_active = False
         self.powerup_spawn_due = False
+        self.cycles = 0
+        self.boss_due = False
+        self.ready = []
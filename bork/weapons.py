@@ -0,0 +1,35 @@
+"""Volley emission from the data-driven weapon definitions in constants."""
+
+import math
+
+from bork.constants import WEAPONS
+from bork.projectile import Projectile
+
+# Per-weapon (vx, vy) for each projectile in a volley, computed once
+_VELOCITIES: dict[str, list[tuple[float, float]]] = {}
+
+
+def volley_velocities(name: str) -> list[tuple[float, float]]:
+    """Velocity of every projectile in one volley of weapon `name`."""
+    velocities = _VELOCITIES.get(name)
+    if velocities is None:
+        weapon = WEAPONS[name]
+        speed = weapon["speed"]
+        velocities = [
+            (speed * math.cos(math.radians(a)), speed * math.sin(math.radians(a)))
+            for a in weapon["angles"]
+        ]
+        _VELOCITIES[name] = velocities
+    return velocities
+
+
+def fire_volley(name: str, x: float, y: float) -> list[Projectile]:
+    """Build all projectiles of one volley, ready for a single batched extend."""
+    weapon = WEAPONS[name]
+    pierce = weapon["pierce"]
+    amplitude = weapon["wave_amplitude"]
+    frequency = weapon["wave_frequency"]
+    return [
+        Projectile(x, y, vx, vy, pierce, amplitude, frequency)
+        for vx, vy in volley_velocities(name)
+    ]
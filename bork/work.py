@@ -0,0 +1,89 @@
+"""Work counters: how much algorithmic work each tick did, as plain counts.
+
+The simulation and its subsystems keep cumulative counters of the work
+they do (circle tests, entities stepped, lists rebuilt, objects created).
+A WorkMeter samples them after every tick and keeps the per-tick peak and
+the run total of each. Unlike timings these are exact and repeatable, so
+tests can replay a seeded scenario and hold the counts to a budget; an
+accidental O(n^2) loop fails the same way on every machine.
+
+Counters on objects the simulation replaces (registry, bullets) restart
+with them, so make a new meter after `setup()` or a snapshot restore.
+"""
+
+from collections.abc import Callable
+
+from bork.particles import ParticleSystem
+from bork.simulation import Simulation
+
+
+def _narrow_tests(sim: Simulation, particles: ParticleSystem | None) -> int:
+    """Exact circle tests: sweep pairs plus boss hit-tree nodes."""
+    return sim.collision_world.pairs_tested + sim.boss_tests
+
+
+def _allocations(sim: Simulation, particles: ParticleSystem | None) -> int:
+    """Entities, collision bodies, particles and bullet array growths."""
+    count = (
+        sim.registry.created + sim.collision_world.bodies_created + sim.bullets.grows
+    )
+    if particles is not None:
+        count += particles.admitted
+    return count
+
+
+def _list_rebuilds(sim: Simulation, particles: ParticleSystem | None) -> int:
+    """Lists rebuilt wholesale rather than updated in place.
+
+    Only rebuilds beyond the routine ones count: the enemy grid is rebuilt
+    once per tick by design, so only its extra rebuilds within a tick do.
+    """
+    count = sim.collision_world.rebuilds + sim.grid_rebuilds
+    if particles is not None:
+        count += particles.rebuilds
+    return count
+
+
+# Counter name -> cumulative value for a simulation (and optional particles)
+WORK_COUNTERS: dict[str, Callable[[Simulation, ParticleSystem | None], int]] = {
+    "narrow_tests": _narrow_tests,
+    "sort_swaps": lambda sim, _: sim.collision_world.swaps,
+    "grid_checks": lambda sim, _: sim.last_enemy_grid.candidates_checked,
+    "bullet_tests": lambda sim, _: sim.bullets.tested,
+    "entities_updated": lambda sim, _: sim.entities_updated,
+    "particles_integrated": lambda _, p: 0 if p is None else p.integrated,
+    "list_rebuilds": _list_rebuilds,
+    "allocations": _allocations,
+}
+
+
+def work_totals(
+    sim: Simulation, particles: ParticleSystem | None = None
+) -> dict[str, int]:
+    """Every counter's cumulative value."""
+    return {name: counter(sim, particles) for name, counter in WORK_COUNTERS.items()}
+
+
+class WorkMeter:
+    """Per-tick deltas of the work counters, with peaks and totals."""
+
+    def __init__(
+        self, sim: Simulation, particles: ParticleSystem | None = None
+    ) -> None:
+        self.sim = sim
+        self.particles = particles
+        self.ticks = 0
+        self.last = work_totals(sim, particles)
+        self.peak: dict[str, int] = dict.fromkeys(WORK_COUNTERS, 0)
+        self.total: dict[str, int] = dict.fromkeys(WORK_COUNTERS, 0)
+
+    def tick(self) -> dict[str, int]:
+        """Sample after a tick; returns the work that tick did."""
+        now = work_totals(self.sim, self.particles)
+        delta = {name: now[name] - self.last[name] for name in now}
+        for name, count in delta.items():
+            self.peak[name] = max(self.peak[name], count)
+            self.total[name] += count
+        self.last = now
+        self.ticks += 1
+        return delta